@@ -335,7 +335,7 @@ static PyObject *PyOpengl_draw_elements_indirect(PyObject *self, PyObject *const
 
     GLenum mode, type;
     if (!_PyArg_ParseStack(args, nArgs, "II", &mode, &type))
-        NULL;
+        return NULL;
 
     glDrawElementsIndirect(mode, type, NULL);
 
@@ -349,7 +349,7 @@ static PyObject *PyOpengl_multi_draw_arrays_indirect(PyObject *self, PyObject *c
     GLenum mode;
     GLsizei drawCount, stride;
     if (!_PyArg_ParseStack(args, nArgs, "Iii", &mode, &drawCount, &stride))
-        NULL;
+        return NULL;
 
     glMultiDrawArraysIndirect(mode, NULL, drawCount, stride);
 
@@ -362,10 +362,12 @@ static PyObject *PyOpengl_multi_draw_elements_indirect(PyObject *self, PyObject
 
     GLenum mode, type;
     GLsizei drawCount, stride;
-    if (!_PyArg_ParseStack(args, nArgs, "IIii", &mode, &type, &drawCount, &stride))
-        NULL;
+    // byte offset of the first command in the bound draw indirect buffer
+    Py_ssize_t offset = 0;
+    if (!_PyArg_ParseStack(args, nArgs, "IIii|n", &mode, &type, &drawCount, &stride, &offset))
+        return NULL;
 
-    glMultiDrawElementsIndirect(mode, type, NULL, drawCount, stride);
+    glMultiDrawElementsIndirect(mode, type, (const void *)offset, drawCount, stride);
 
     Py_RETURN_NONE;
 }
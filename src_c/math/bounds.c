@@ -0,0 +1,643 @@
+#include "bounds.h"
+#include "vector.h"
+#include "vectorUtils.h"
+#include "matrix.h"
+#include "mathArray.h"
+
+static PyObject *NewBounds(PyTypeObject *type)
+{
+    PyObject *new = (PyObject *)PyObject_New(PyObject, type);
+    return PyObject_Init(new, type);
+}
+
+// planes point inwards, so an object is culled once it lies entirely on the negative side of any plane
+static bool SphereInFrustum(vec4 *planes, const float *center, float radius)
+{
+    for (int i = 0; i < 6; i++)
+    {
+        const float *p = planes[i];
+        if (p[0] * center[0] + p[1] * center[1] + p[2] * center[2] + p[3] < -radius)
+            return false;
+    }
+
+    return true;
+}
+
+static bool AABBInFrustum(vec4 *planes, const float *min, const float *max)
+{
+    for (int i = 0; i < 6; i++)
+    {
+        // test only the box corner furthest along the plane normal
+        const float *p = planes[i];
+        const float x = p[0] > 0.0f ? max[0] : min[0];
+        const float y = p[1] > 0.0f ? max[1] : min[1];
+        const float z = p[2] > 0.0f ? max[2] : min[2];
+        if (p[0] * x + p[1] * y + p[2] * z + p[3] < 0.0f)
+            return false;
+    }
+
+    return true;
+}
+
+static bool AABBIntersectsSphere(vec3 *box, const float *sphere)
+{
+    float distance2 = 0.0f;
+    for (int i = 0; i < 3; i++)
+    {
+        const float value = glm_clamp(sphere[i], box[0][i], box[1][i]) - sphere[i];
+        distance2 += value * value;
+    }
+
+    return distance2 <= sphere[3] * sphere[3];
+}
+
+// acquires writable byte mask for count elements, returning object that should be returned to the caller
+static PyObject *AcquireMask(PyObject *outObj, Py_buffer *buffer, Py_ssize_t count, uint8_t **data)
+{
+    if (outObj == Py_None)
+        return PyMathArray_create_bool_view(count, data);
+
+    if (PyObject_GetBuffer(outObj, buffer, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS) == -1)
+        return NULL;
+
+    if (buffer->itemsize != 1 || buffer->len < count)
+    {
+        PyErr_Format(PyExc_ValueError, "Expected out buffer to hold at least %zd single byte elements.", count);
+        PyBuffer_Release(buffer);
+        return NULL;
+    }
+
+    *data = buffer->buf;
+    return Py_NewRef(outObj);
+}
+
+#pragma region AABB
+static int PyAABB_init(PyAABB *self, PyObject *args, PyObject *kwargs)
+{
+    (void)kwargs;
+
+    PyVector3 *min = NULL, *max = NULL;
+    if (!PyArg_ParseTuple(args, "|O!O!", &PyVector3_Type, &min, &PyVector3_Type, &max))
+        return -1;
+
+    glm_vec3_zero(self->box[0]);
+    glm_vec3_zero(self->box[1]);
+
+    if (min != NULL)
+        glm_vec3_copy(min->data, self->box[0]);
+    if (max != NULL)
+        glm_vec3_copy(max->data, self->box[1]);
+
+    return 0;
+}
+
+static PyObject *PyAABB_str(PyAABB *self)
+{
+    char buffer[192];
+    int size = snprintf(
+        buffer,
+        sizeof(buffer),
+        "<%s min=(%.3f, %.3f, %.3f), max=(%.3f, %.3f, %.3f) at 0x%p>",
+        Py_TYPE(self)->tp_name,
+        self->box[0][0], self->box[0][1], self->box[0][2],
+        self->box[1][0], self->box[1][1], self->box[1][2],
+        (void *)self);
+
+    return PyUnicode_FromStringAndSize(buffer, size);
+}
+
+static PyVector3 *PyAABB_get_min(PyAABB *self, void *closure)
+{
+    (void)closure;
+    return PyVector3_new(self->box[0]);
+}
+
+static int PyAABB_set_min(PyAABB *self, PyObject *value, void *closure)
+{
+    (void)closure;
+    return PyVector3_set(self->box[0], value, "min");
+}
+
+static PyVector3 *PyAABB_get_max(PyAABB *self, void *closure)
+{
+    (void)closure;
+    return PyVector3_new(self->box[1]);
+}
+
+static int PyAABB_set_max(PyAABB *self, PyObject *value, void *closure)
+{
+    (void)closure;
+    return PyVector3_set(self->box[1], value, "max");
+}
+
+static PyAABB *PyAABB_from_points(PyTypeObject *cls, PyObject *pointsObj)
+{
+    Py_buffer points = {0};
+    if (PyMathArray_get_float_buffer(pointsObj, &points, PyBUF_SIMPLE, 3, "points"))
+        return NULL;
+
+    const Py_ssize_t count = points.len / sizeof(vec3);
+    if (count == 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "Cannot create bounding box from an empty set of points.");
+        PyBuffer_Release(&points);
+        return NULL;
+    }
+
+    PyAABB *new = (PyAABB *)NewBounds(cls);
+    const float *data = points.buf;
+    glm_vec3_copy((float *)data, new->box[0]);
+    glm_vec3_copy((float *)data, new->box[1]);
+
+    for (Py_ssize_t i = 1; i < count; i++)
+    {
+        const float *point = &data[i * 3];
+        for (int j = 0; j < 3; j++)
+        {
+            new->box[0][j] = glm_min(new->box[0][j], point[j]);
+            new->box[1][j] = glm_max(new->box[1][j], point[j]);
+        }
+    }
+
+    PyBuffer_Release(&points);
+    return new;
+}
+
+static PyVector3 *PyAABB_center(PyAABB *self, PyObject *args)
+{
+    (void)args;
+
+    vec3 center;
+    glm_aabb_center(self->box, center);
+
+    return PyVector3_new(center);
+}
+
+static PyVector3 *PyAABB_size(PyAABB *self, PyObject *args)
+{
+    (void)args;
+
+    vec3 size;
+    glm_vec3_sub(self->box[1], self->box[0], size);
+
+    return PyVector3_new(size);
+}
+
+static PyObject *PyAABB_contains(PyAABB *self, PyVector3 *point)
+{
+    CHECK_ARG_TYPE(point, &PyVector3_Type, NULL);
+    return PyBool_FromLong(glm_aabb_point(self->box, point->data));
+}
+
+static PyObject *PyAABB_intersects(PyAABB *self, PyObject *other)
+{
+    if (PyObject_IsInstance(other, (PyObject *)&PyAABB_Type))
+        return PyBool_FromLong(glm_aabb_aabb(self->box, ((PyAABB *)other)->box));
+
+    if (PyObject_IsInstance(other, (PyObject *)&PySphere_Type))
+        return PyBool_FromLong(AABBIntersectsSphere(self->box, ((PySphere *)other)->data));
+
+    PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s or %s, got: %s.", PyAABB_Type.tp_name, PySphere_Type.tp_name, Py_TYPE(other)->tp_name);
+    return NULL;
+}
+
+static PyAABB *PyAABB_merged(PyAABB *self, PyAABB *other)
+{
+    CHECK_ARG_TYPE(other, &PyAABB_Type, NULL);
+
+    PyAABB *new = (PyAABB *)NewBounds(&PyAABB_Type);
+    glm_aabb_merge(self->box, other->box, new->box);
+
+    return new;
+}
+
+static PyAABB *PyAABB_transformed(PyAABB *self, PyMatrix4 *matrix)
+{
+    CHECK_ARG_TYPE(matrix, &PyMatrix4_Type, NULL);
+
+    PyAABB *new = (PyAABB *)NewBounds(&PyAABB_Type);
+    glm_aabb_transform(self->box, matrix->data, new->box);
+
+    return new;
+}
+
+static PyObject *PyAABB_richcompare(PyAABB *self, PyObject *other, int func)
+{
+    switch (func)
+    {
+    case Py_EQ:
+    case Py_NE:
+        if (!PyObject_IsInstance(other, (PyObject *)&PyAABB_Type))
+            Py_RETURN_NOTIMPLEMENTED;
+
+        const bool equal = (PyObject *)self == other ||
+                           (glm_vec3_eqv(self->box[0], ((PyAABB *)other)->box[0]) && glm_vec3_eqv(self->box[1], ((PyAABB *)other)->box[1]));
+        return PyBool_FromLong(func == Py_EQ ? equal : !equal);
+    }
+
+    PyErr_SetString(PyExc_TypeError, "AABB does not support less than or greater than comparisons.");
+    return NULL;
+}
+#pragma endregion
+
+#pragma region Sphere
+static int PySphere_init(PySphere *self, PyObject *args, PyObject *kwargs)
+{
+    (void)kwargs;
+
+    PyVector3 *center = NULL;
+    float radius = 0.0f;
+    if (!PyArg_ParseTuple(args, "|O!f", &PyVector3_Type, &center, &radius))
+        return -1;
+
+    glm_vec4_zero(self->data);
+    if (center != NULL)
+        glm_vec3_copy(center->data, self->data);
+
+    self->data[3] = radius;
+
+    return 0;
+}
+
+static PyObject *PySphere_str(PySphere *self)
+{
+    char buffer[128];
+    int size = snprintf(
+        buffer,
+        sizeof(buffer),
+        "<%s center=(%.3f, %.3f, %.3f), radius=%.3f at 0x%p>",
+        Py_TYPE(self)->tp_name,
+        self->data[0], self->data[1], self->data[2], self->data[3],
+        (void *)self);
+
+    return PyUnicode_FromStringAndSize(buffer, size);
+}
+
+static PyVector3 *PySphere_get_center(PySphere *self, void *closure)
+{
+    (void)closure;
+    return PyVector3_new(self->data);
+}
+
+static int PySphere_set_center(PySphere *self, PyObject *value, void *closure)
+{
+    (void)closure;
+    return PyVector3_set(self->data, value, "center");
+}
+
+static PyObject *PySphere_contains(PySphere *self, PyVector3 *point)
+{
+    CHECK_ARG_TYPE(point, &PyVector3_Type, NULL);
+    return PyBool_FromLong(glm_vec3_distance2(self->data, point->data) <= self->data[3] * self->data[3]);
+}
+
+static PyObject *PySphere_intersects(PySphere *self, PyObject *other)
+{
+    if (PyObject_IsInstance(other, (PyObject *)&PySphere_Type))
+    {
+        const float *data = ((PySphere *)other)->data;
+        const float radius = self->data[3] + data[3];
+        return PyBool_FromLong(glm_vec3_distance2(self->data, (float *)data) <= radius * radius);
+    }
+
+    if (PyObject_IsInstance(other, (PyObject *)&PyAABB_Type))
+        return PyBool_FromLong(AABBIntersectsSphere(((PyAABB *)other)->box, self->data));
+
+    PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s or %s, got: %s.", PySphere_Type.tp_name, PyAABB_Type.tp_name, Py_TYPE(other)->tp_name);
+    return NULL;
+}
+#pragma endregion
+
+#pragma region Plane
+static int PyPlane_init(PyPlane *self, PyObject *args, PyObject *kwargs)
+{
+    (void)kwargs;
+
+    PyVector3 *normal = NULL;
+    float distance = 0.0f;
+    if (!PyArg_ParseTuple(args, "|O!f", &PyVector3_Type, &normal, &distance))
+        return -1;
+
+    glm_vec4_zero(self->data);
+    if (normal != NULL)
+        glm_vec3_copy(normal->data, self->data);
+
+    self->data[3] = distance;
+
+    return 0;
+}
+
+static PyObject *PyPlane_str(PyPlane *self)
+{
+    char buffer[128];
+    int size = snprintf(
+        buffer,
+        sizeof(buffer),
+        "<%s normal=(%.3f, %.3f, %.3f), distance=%.3f at 0x%p>",
+        Py_TYPE(self)->tp_name,
+        self->data[0], self->data[1], self->data[2], self->data[3],
+        (void *)self);
+
+    return PyUnicode_FromStringAndSize(buffer, size);
+}
+
+static PyVector3 *PyPlane_get_normal(PyPlane *self, void *closure)
+{
+    (void)closure;
+    return PyVector3_new(self->data);
+}
+
+static int PyPlane_set_normal(PyPlane *self, PyObject *value, void *closure)
+{
+    (void)closure;
+    return PyVector3_set(self->data, value, "normal");
+}
+
+static PyPlane *PyPlane_from_point_normal(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyVector3 *point, *normal;
+    if (!_PyArg_ParseStack(args, nArgs, "O!O!", &PyVector3_Type, &point, &PyVector3_Type, &normal))
+        return NULL;
+
+    PyPlane *new = (PyPlane *)NewBounds(cls);
+    glm_vec3_normalize_to(normal->data, new->data);
+    new->data[3] = -glm_vec3_dot(new->data, point->data);
+
+    return new;
+}
+
+static PyObject *PyPlane_distance_to(PyPlane *self, PyVector3 *point)
+{
+    CHECK_ARG_TYPE(point, &PyVector3_Type, NULL);
+    return PyFloat_FromDouble((double)(glm_vec3_dot(self->data, point->data) + self->data[3]));
+}
+
+static PyObject *PyPlane_normalize(PyPlane *self, PyObject *args)
+{
+    (void)args;
+    glm_plane_normalize(self->data);
+    Py_RETURN_NONE;
+}
+
+static PyPlane *PyPlane_normalized(PyPlane *self, PyObject *args)
+{
+    (void)args;
+
+    PyPlane *new = (PyPlane *)NewBounds(&PyPlane_Type);
+    glm_vec4_copy(self->data, new->data);
+    glm_plane_normalize(new->data);
+
+    return new;
+}
+#pragma endregion
+
+#pragma region Frustum
+static int PyFrustum_init(PyFrustum *self, PyObject *args, PyObject *kwargs)
+{
+    (void)kwargs;
+
+    PyMatrix4 *matrix = NULL;
+    if (!PyArg_ParseTuple(args, "|O!", &PyMatrix4_Type, &matrix))
+        return -1;
+
+    if (matrix != NULL)
+        glm_frustum_planes(matrix->data, self->planes);
+    else
+        memset(self->planes, 0, sizeof(self->planes));
+
+    return 0;
+}
+
+static PyFrustum *PyFrustum_from_matrix(PyTypeObject *cls, PyMatrix4 *matrix)
+{
+    CHECK_ARG_TYPE(matrix, &PyMatrix4_Type, NULL);
+
+    PyFrustum *new = (PyFrustum *)NewBounds(cls);
+    glm_frustum_planes(matrix->data, new->planes);
+
+    return new;
+}
+
+static PyObject *PyFrustum_get_planes(PyFrustum *self, void *closure)
+{
+    (void)closure;
+
+    PyObject *planes = PyTuple_New(6);
+    if (planes == NULL)
+        return NULL;
+
+    for (int i = 0; i < 6; i++)
+    {
+        PyPlane *plane = (PyPlane *)NewBounds(&PyPlane_Type);
+        glm_vec4_copy(self->planes[i], plane->data);
+        PyTuple_SET_ITEM(planes, i, (PyObject *)plane);
+    }
+
+    return planes;
+}
+
+static PyObject *PyFrustum_test_point(PyFrustum *self, PyVector3 *point)
+{
+    CHECK_ARG_TYPE(point, &PyVector3_Type, NULL);
+    return PyBool_FromLong(SphereInFrustum(self->planes, point->data, 0.0f));
+}
+
+static PyObject *PyFrustum_test_sphere(PyFrustum *self, PySphere *sphere)
+{
+    CHECK_ARG_TYPE(sphere, &PySphere_Type, NULL);
+    return PyBool_FromLong(SphereInFrustum(self->planes, sphere->data, sphere->data[3]));
+}
+
+static PyObject *PyFrustum_test_aabb(PyFrustum *self, PyAABB *aabb)
+{
+    CHECK_ARG_TYPE(aabb, &PyAABB_Type, NULL);
+    return PyBool_FromLong(AABBInFrustum(self->planes, aabb->box[0], aabb->box[1]));
+}
+
+static PyObject *PyFrustum_test_spheres(PyFrustum *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyObject *centersObj, *radiiObj, *outObj = Py_None;
+    if (!_PyArg_ParseStack(args, nArgs, "OO|O", &centersObj, &radiiObj, &outObj))
+        return NULL;
+
+    Py_buffer centers = {0}, radii = {0}, out = {0};
+    PyObject *result = NULL;
+    float radius = 0.0f;
+
+    if (PyFloat_Check(radiiObj) || PyLong_Check(radiiObj))
+    {
+        radius = (float)PyFloat_AsDouble(radiiObj);
+        if (PyErr_Occurred())
+            return NULL;
+    }
+    else if (PyMathArray_get_float_buffer(radiiObj, &radii, PyBUF_SIMPLE, 1, "radii"))
+        return NULL;
+
+    if (PyMathArray_get_float_buffer(centersObj, &centers, PyBUF_SIMPLE, 3, "centers"))
+        goto release_radii;
+
+    const Py_ssize_t count = centers.len / sizeof(vec3);
+    if (radii.obj != NULL && radii.len != count * (Py_ssize_t)sizeof(float))
+    {
+        PyErr_Format(PyExc_ValueError, "Expected radii buffer to hold %zd floats, got: %zd.", count, radii.len / (Py_ssize_t)sizeof(float));
+        goto release_centers;
+    }
+
+    uint8_t *mask;
+    result = AcquireMask(outObj, &out, count, &mask);
+    if (result == NULL)
+        goto release_centers;
+
+    const float *centersData = centers.buf;
+    const float *radiiData = radii.buf;
+    for (Py_ssize_t i = 0; i < count; i++)
+        mask[i] = SphereInFrustum(self->planes, &centersData[i * 3], radiiData != NULL ? radiiData[i] : radius);
+
+    if (out.obj != NULL)
+        PyBuffer_Release(&out);
+release_centers:
+    PyBuffer_Release(&centers);
+release_radii:
+    if (radii.obj != NULL)
+        PyBuffer_Release(&radii);
+
+    return result;
+}
+
+static PyObject *PyFrustum_test_aabbs(PyFrustum *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyObject *minsObj, *maxsObj, *outObj = Py_None;
+    if (!_PyArg_ParseStack(args, nArgs, "OO|O", &minsObj, &maxsObj, &outObj))
+        return NULL;
+
+    Py_buffer mins = {0}, maxs = {0}, out = {0};
+    PyObject *result = NULL;
+
+    if (PyMathArray_get_float_buffer(minsObj, &mins, PyBUF_SIMPLE, 3, "mins"))
+        return NULL;
+    if (PyMathArray_get_float_buffer(maxsObj, &maxs, PyBUF_SIMPLE, 3, "maxs"))
+        goto release_mins;
+
+    if (maxs.len != mins.len)
+    {
+        PyErr_SetString(PyExc_ValueError, "Expected mins and maxs to have the same length.");
+        goto release_maxs;
+    }
+
+    const Py_ssize_t count = mins.len / sizeof(vec3);
+    uint8_t *mask;
+    result = AcquireMask(outObj, &out, count, &mask);
+    if (result == NULL)
+        goto release_maxs;
+
+    const float *minsData = mins.buf;
+    const float *maxsData = maxs.buf;
+    for (Py_ssize_t i = 0; i < count; i++)
+        mask[i] = AABBInFrustum(self->planes, &minsData[i * 3], &maxsData[i * 3]);
+
+    if (out.obj != NULL)
+        PyBuffer_Release(&out);
+release_maxs:
+    PyBuffer_Release(&maxs);
+release_mins:
+    PyBuffer_Release(&mins);
+
+    return result;
+}
+#pragma endregion
+
+PyTypeObject PyAABB_Type = {
+    PY_VAR_OBJECT_HEAD_INIT(NULL, 0),
+    .tp_name = "spyke.math.AABB",
+    .tp_basicsize = sizeof(PyAABB),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)PyAABB_init,
+    .tp_str = (reprfunc)PyAABB_str,
+    .tp_richcompare = (richcmpfunc)PyAABB_richcompare,
+    .tp_getset = (PyGetSetDef[]){
+        {"min", (getter)PyAABB_get_min, (setter)PyAABB_set_min, NULL, NULL},
+        {"max", (getter)PyAABB_get_max, (setter)PyAABB_set_max, NULL, NULL},
+        {0},
+    },
+    .tp_methods = (PyMethodDef[]){
+        {"from_points", (PyCFunction)PyAABB_from_points, METH_O | METH_CLASS, NULL},
+        {"center", (PyCFunction)PyAABB_center, METH_NOARGS, NULL},
+        {"size", (PyCFunction)PyAABB_size, METH_NOARGS, NULL},
+        {"contains", (PyCFunction)PyAABB_contains, METH_O, NULL},
+        {"intersects", (PyCFunction)PyAABB_intersects, METH_O, NULL},
+        {"merged", (PyCFunction)PyAABB_merged, METH_O, NULL},
+        {"transformed", (PyCFunction)PyAABB_transformed, METH_O, NULL},
+        {0},
+    },
+};
+
+PyTypeObject PySphere_Type = {
+    PY_VAR_OBJECT_HEAD_INIT(NULL, 0),
+    .tp_name = "spyke.math.Sphere",
+    .tp_basicsize = sizeof(PySphere),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)PySphere_init,
+    .tp_str = (reprfunc)PySphere_str,
+    .tp_members = (PyMemberDef[]){
+        {"radius", Py_T_FLOAT, offsetof(PySphere, data[3]), 0, NULL},
+        {0},
+    },
+    .tp_getset = (PyGetSetDef[]){
+        {"center", (getter)PySphere_get_center, (setter)PySphere_set_center, NULL, NULL},
+        {0},
+    },
+    .tp_methods = (PyMethodDef[]){
+        {"contains", (PyCFunction)PySphere_contains, METH_O, NULL},
+        {"intersects", (PyCFunction)PySphere_intersects, METH_O, NULL},
+        {0},
+    },
+};
+
+PyTypeObject PyPlane_Type = {
+    PY_VAR_OBJECT_HEAD_INIT(NULL, 0),
+    .tp_name = "spyke.math.Plane",
+    .tp_basicsize = sizeof(PyPlane),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)PyPlane_init,
+    .tp_str = (reprfunc)PyPlane_str,
+    .tp_members = (PyMemberDef[]){
+        {"distance", Py_T_FLOAT, offsetof(PyPlane, data[3]), 0, NULL},
+        {0},
+    },
+    .tp_getset = (PyGetSetDef[]){
+        {"normal", (getter)PyPlane_get_normal, (setter)PyPlane_set_normal, NULL, NULL},
+        {0},
+    },
+    .tp_methods = (PyMethodDef[]){
+        {"from_point_normal", (PyCFunction)PyPlane_from_point_normal, METH_FASTCALL | METH_CLASS, NULL},
+        {"distance_to", (PyCFunction)PyPlane_distance_to, METH_O, NULL},
+        {"normalize", (PyCFunction)PyPlane_normalize, METH_NOARGS, NULL},
+        {"normalized", (PyCFunction)PyPlane_normalized, METH_NOARGS, NULL},
+        {0},
+    },
+};
+
+PyTypeObject PyFrustum_Type = {
+    PY_VAR_OBJECT_HEAD_INIT(NULL, 0),
+    .tp_name = "spyke.math.Frustum",
+    .tp_basicsize = sizeof(PyFrustum),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)PyFrustum_init,
+    .tp_getset = (PyGetSetDef[]){
+        {"planes", (getter)PyFrustum_get_planes, NULL, NULL, NULL},
+        {0},
+    },
+    .tp_methods = (PyMethodDef[]){
+        {"from_matrix", (PyCFunction)PyFrustum_from_matrix, METH_O | METH_CLASS, NULL},
+        {"test_point", (PyCFunction)PyFrustum_test_point, METH_O, NULL},
+        {"test_sphere", (PyCFunction)PyFrustum_test_sphere, METH_O, NULL},
+        {"test_aabb", (PyCFunction)PyFrustum_test_aabb, METH_O, NULL},
+        {"test_spheres", (PyCFunction)PyFrustum_test_spheres, METH_FASTCALL, NULL},
+        {"test_aabbs", (PyCFunction)PyFrustum_test_aabbs, METH_FASTCALL, NULL},
+        {0},
+    },
+};
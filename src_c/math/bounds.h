@@ -0,0 +1,36 @@
+#pragma once
+#include <cglm/cglm.h>
+#include "../utils.h"
+
+typedef struct
+{
+    PY_OBJECT_HEAD;
+    // min and max corners
+    vec3 box[2];
+} PyAABB;
+
+typedef struct
+{
+    PY_OBJECT_HEAD;
+    // center stored in xyz, radius in w
+    vec4 data;
+} PySphere;
+
+typedef struct
+{
+    PY_OBJECT_HEAD;
+    // plane equation: dot(normal, point) + distance = 0, normal stored in xyz, distance in w
+    vec4 data;
+} PyPlane;
+
+typedef struct
+{
+    PY_OBJECT_HEAD;
+    // left, right, bottom, top, near, far planes pointing inwards
+    vec4 planes[6];
+} PyFrustum;
+
+extern PyTypeObject PyAABB_Type;
+extern PyTypeObject PySphere_Type;
+extern PyTypeObject PyPlane_Type;
+extern PyTypeObject PyFrustum_Type;
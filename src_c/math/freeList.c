@@ -0,0 +1,51 @@
+#include "freeList.h"
+
+PyObject *PyMathFreeList_alloc(PyMathFreeList *freeList, PyTypeObject *type)
+{
+    PyObject *object;
+
+    if (type == freeList->type && freeList->count > 0)
+    {
+        object = freeList->items[--freeList->count];
+        freeList->hits++;
+    }
+    else
+    {
+        object = PyObject_Malloc(type->tp_basicsize);
+        if (object == NULL)
+            return PyErr_NoMemory();
+
+        freeList->misses++;
+    }
+
+    return PyObject_Init(object, type);
+}
+
+void PyMathFreeList_free(PyMathFreeList *freeList, PyObject *object)
+{
+    if (Py_TYPE(object) == freeList->type && freeList->count < PY_MATH_FREE_LIST_CAPACITY)
+    {
+        freeList->items[freeList->count++] = object;
+        return;
+    }
+
+    PyObject_Free(object);
+}
+
+void PyMathFreeList_clear(PyMathFreeList *freeList)
+{
+    while (freeList->count > 0)
+        PyObject_Free(freeList->items[--freeList->count]);
+
+    freeList->hits = 0;
+    freeList->misses = 0;
+}
+
+PyObject *PyMathFreeList_get_stats(PyMathFreeList *freeList)
+{
+    return Py_BuildValue(
+        "{s:n,s:n,s:n}",
+        "hits", freeList->hits,
+        "misses", freeList->misses,
+        "size", freeList->count);
+}
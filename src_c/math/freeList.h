@@ -0,0 +1,19 @@
+#pragma once
+#include "../utils.h"
+
+// maximum number of released objects kept for reuse per type
+#define PY_MATH_FREE_LIST_CAPACITY 256
+
+typedef struct
+{
+    PyTypeObject *type;
+    PyObject *items[PY_MATH_FREE_LIST_CAPACITY];
+    Py_ssize_t count;
+    Py_ssize_t hits;
+    Py_ssize_t misses;
+} PyMathFreeList;
+
+PyObject *PyMathFreeList_alloc(PyMathFreeList *freeList, PyTypeObject *type);
+void PyMathFreeList_free(PyMathFreeList *freeList, PyObject *object);
+void PyMathFreeList_clear(PyMathFreeList *freeList);
+PyObject *PyMathFreeList_get_stats(PyMathFreeList *freeList);
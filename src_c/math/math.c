@@ -1,6 +1,11 @@
 #include "viewport.h"
 #include "vector.h"
 #include "matrix.h"
+#include "mathArray.h"
+#include "quaternion.h"
+#include "simd.h"
+#include "bounds.h"
+#include "ray.h"
 
 static PyObject *PyMath_deg_to_rad(PyObject *self, PyObject *value)
 {
@@ -20,6 +25,78 @@ static PyObject *PyMath_rad_to_deg(PyObject *self, PyObject *value)
     return PyFloat_FromDouble(glm_deg((float)PyFloat_AS_DOUBLE(valueFloat)));
 }
 
+static PyMathFreeList *s_FreeLists[] = {
+    &PyVector2_FreeList,
+    &PyVector3_FreeList,
+    &PyVector4_FreeList,
+    &PyMatrix2_FreeList,
+    &PyMatrix3_FreeList,
+    &PyMatrix4_FreeList,
+};
+
+static PyObject *PyMath_get_free_list_stats(PyObject *self, PyObject *args)
+{
+    (void)args;
+
+    PyObject *stats = PyDict_New();
+    if (stats == NULL)
+        return NULL;
+
+    for (size_t i = 0; i < sizeof(s_FreeLists) / sizeof(s_FreeLists[0]); i++)
+    {
+        PyObject *typeStats = PyMathFreeList_get_stats(s_FreeLists[i]);
+        if (typeStats == NULL || PyDict_SetItem(stats, (PyObject *)s_FreeLists[i]->type, typeStats))
+        {
+            Py_XDECREF(typeStats);
+            Py_DECREF(stats);
+            return NULL;
+        }
+
+        Py_DECREF(typeStats);
+    }
+
+    return stats;
+}
+
+static PyObject *PyMath_clear_free_lists(PyObject *self, PyObject *args)
+{
+    (void)args;
+
+    for (size_t i = 0; i < sizeof(s_FreeLists) / sizeof(s_FreeLists[0]); i++)
+        PyMathFreeList_clear(s_FreeLists[i]);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *PyMath_get_simd_level(PyObject *self, PyObject *args)
+{
+    (void)args;
+    return PyUnicode_FromString(PyMathSimd_get_level_name(PyMathSimd_get_level()));
+}
+
+static PyObject *PyMath_set_simd_level(PyObject *self, PyObject *name)
+{
+    CHECK_ARG_STRING(name, NULL);
+
+    for (PyMathSimdLevel level = PY_MATH_SIMD_SCALAR; level <= PY_MATH_SIMD_NEON; level++)
+    {
+        if (PyUnicode_CompareWithASCIIString(name, PyMathSimd_get_level_name(level)) != 0)
+            continue;
+
+        if (!PyMathSimd_is_level_supported(level))
+        {
+            PyErr_Format(PyExc_ValueError, "SIMD level %U is not supported on this machine.", name);
+            return NULL;
+        }
+
+        PyMathSimd_set_level(level);
+        Py_RETURN_NONE;
+    }
+
+    PyErr_Format(PyExc_ValueError, "Unknown SIMD level: %U.", name);
+    return NULL;
+}
+
 static PyModuleDef s_ModuleDef = {
     PyModuleDef_HEAD_INIT,
     .m_name = "spyke.math",
@@ -27,6 +104,10 @@ static PyModuleDef s_ModuleDef = {
     .m_methods = (PyMethodDef[]){
         {"deg_to_rad", (PyCFunction)PyMath_deg_to_rad, METH_O, NULL},
         {"rad_to_deg", (PyCFunction)PyMath_rad_to_deg, METH_O, NULL},
+        {"get_free_list_stats", (PyCFunction)PyMath_get_free_list_stats, METH_NOARGS, NULL},
+        {"clear_free_lists", (PyCFunction)PyMath_clear_free_lists, METH_NOARGS, NULL},
+        {"get_simd_level", (PyCFunction)PyMath_get_simd_level, METH_NOARGS, NULL},
+        {"set_simd_level", (PyCFunction)PyMath_set_simd_level, METH_O, NULL},
         {0},
     },
 };
@@ -37,6 +118,8 @@ PyMODINIT_FUNC PyInit_math()
     if (!module)
         return NULL;
 
+    PyMathSimd_set_level(PyMathSimd_detect_level());
+
     ADD_TYPE_OR_FAIL(module, PyViewport2D_Type);
     ADD_TYPE_OR_FAIL(module, PyViewport3D_Type);
 
@@ -50,5 +133,19 @@ PyMODINIT_FUNC PyInit_math()
     ADD_TYPE_OR_FAIL(module, PyMatrix3_Type);
     ADD_TYPE_OR_FAIL(module, PyMatrix4_Type);
 
+    ADD_TYPE_OR_FAIL(module, PyQuaternion_Type);
+
+    ADD_TYPE_OR_FAIL(module, PyAABB_Type);
+    ADD_TYPE_OR_FAIL(module, PySphere_Type);
+    ADD_TYPE_OR_FAIL(module, PyPlane_Type);
+    ADD_TYPE_OR_FAIL(module, PyFrustum_Type);
+    ADD_TYPE_OR_FAIL(module, PyRay_Type);
+
+    ADD_TYPE_OR_FAIL(module, PyVector2Array_Type);
+    ADD_TYPE_OR_FAIL(module, PyVector3Array_Type);
+    ADD_TYPE_OR_FAIL(module, PyVector4Array_Type);
+    ADD_TYPE_OR_FAIL(module, PyMatrix3Array_Type);
+    ADD_TYPE_OR_FAIL(module, PyMatrix4Array_Type);
+
     return module;
 }
@@ -0,0 +1,319 @@
+#include <stdint.h>
+#include "mathArray.h"
+
+int PyMathArray_allocate(PyMathArray *array, Py_ssize_t length, Py_ssize_t elementLength)
+{
+    if (length < 0)
+    {
+        PyErr_Format(PyExc_ValueError, "Array length cannot be negative, got: %zd.", length);
+        return -1;
+    }
+
+    const size_t dataSize = (size_t)(length * elementLength) * sizeof(float);
+    void *allocation = PyMem_Malloc(dataSize + MATH_ARRAY_ALIGNMENT);
+    if (allocation == NULL)
+    {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    array->allocation = allocation;
+    array->data = (float *)(((uintptr_t)allocation + MATH_ARRAY_ALIGNMENT) & ~(uintptr_t)(MATH_ARRAY_ALIGNMENT - 1));
+    array->length = length;
+    memset(array->data, 0, dataSize);
+
+    return 0;
+}
+
+int PyMathArray_check_uninitialized(PyMathArray *array)
+{
+    // views and exported buffers (including __array_interface__ pointers) keep no reference count
+    // of the storage they point to, so it cannot be freed or replaced while the array is alive
+    if (array->allocation != NULL || array->base != NULL || array->external.obj != NULL)
+    {
+        PyErr_Format(PyExc_RuntimeError, "%s is already initialized and cannot be initialized again.", Py_TYPE(array)->tp_name);
+        return -1;
+    }
+
+    return 0;
+}
+
+void PyMathArray_release(PyMathArray *array)
+{
+    if (array->base != NULL)
+        Py_CLEAR(array->base);
+    else if (array->external.obj != NULL)
+        PyBuffer_Release(&array->external);
+    else if (array->allocation != NULL)
+        PyMem_Free(array->allocation);
+
+    array->allocation = NULL;
+    array->data = NULL;
+    array->length = 0;
+}
+
+PyMathArray *PyMathArray_new(PyTypeObject *type, Py_ssize_t length, Py_ssize_t elementLength)
+{
+    PyMathArray *array = PyObject_New(PyMathArray, type);
+    if (array == NULL)
+        return NULL;
+
+    array->data = NULL;
+    array->length = 0;
+    array->base = NULL;
+    array->allocation = NULL;
+    array->external = (Py_buffer){0};
+
+    if (PyMathArray_allocate(array, length, elementLength))
+    {
+        Py_DECREF(array);
+        return NULL;
+    }
+
+    return array;
+}
+
+PyMathArray *PyMathArray_new_view(PyMathArray *base, Py_ssize_t start, Py_ssize_t length, Py_ssize_t elementLength)
+{
+    PyMathArray *view = PyObject_New(PyMathArray, Py_TYPE(base));
+    if (view == NULL)
+        return NULL;
+
+    // always reference the array that owns the memory so chains of views do not keep intermediate objects alive
+    view->base = Py_NewRef(base->base != NULL ? base->base : (PyObject *)base);
+    view->allocation = NULL;
+    view->external = (Py_buffer){0};
+    view->data = base->data + start * elementLength;
+    view->length = length;
+    memcpy(view->shape, base->shape, sizeof(view->shape));
+    memcpy(view->strides, base->strides, sizeof(view->strides));
+    view->shape[0] = length;
+
+    return view;
+}
+
+PyMathArray *PyMathArray_new_wrapper(PyTypeObject *type, PyObject *obj, Py_ssize_t elementLength, size_t alignment)
+{
+    PyMathArray *array = PyObject_New(PyMathArray, type);
+    if (array == NULL)
+        return NULL;
+
+    array->data = NULL;
+    array->length = 0;
+    array->base = NULL;
+    array->allocation = NULL;
+    array->external = (Py_buffer){0};
+
+    Py_buffer buffer = {0};
+    if (PyMathArray_get_float_buffer(obj, &buffer, PyBUF_WRITABLE, elementLength, "wrapped"))
+    {
+        Py_DECREF(array);
+        return NULL;
+    }
+
+    // element operations use aligned SIMD loads
+    if ((uintptr_t)buffer.buf % alignment != 0)
+    {
+        PyErr_Format(PyExc_ValueError, "Expected wrapped buffer memory to be aligned to %zu bytes.", alignment);
+        PyBuffer_Release(&buffer);
+        Py_DECREF(array);
+        return NULL;
+    }
+
+    array->external = buffer;
+    array->data = buffer.buf;
+    array->length = buffer.len / (elementLength * sizeof(float));
+
+    return array;
+}
+
+int PyMathArray_get_slice(PyMathArray *array, PyObject *slice, Py_ssize_t *start, Py_ssize_t *length)
+{
+    Py_ssize_t stop, step;
+    if (PySlice_Unpack(slice, start, &stop, &step))
+        return -1;
+
+    if (step != 1)
+    {
+        PyErr_Format(PyExc_ValueError, "%s slices must be contiguous (step 1), got step: %zd.", Py_TYPE(array)->tp_name, step);
+        return -1;
+    }
+
+    *length = PySlice_AdjustIndices(array->length, start, &stop, step);
+    return 0;
+}
+
+Py_ssize_t PyMathArray_get_index(PyMathArray *array, PyObject *index)
+{
+    Py_ssize_t idx = PyNumber_AsSsize_t(index, PyExc_IndexError);
+    if (idx == -1 && PyErr_Occurred())
+        return -1;
+
+    if (idx < 0)
+        idx += array->length;
+
+    if (idx < 0 || idx >= array->length)
+    {
+        PyErr_Format(PyExc_IndexError, "Index outside of bounds for %s of length %zd.", Py_TYPE(array)->tp_name, array->length);
+        return -1;
+    }
+
+    return idx;
+}
+
+PyObject *PyMathArray_create_float_view(Py_ssize_t count, float **data)
+{
+    PyObject *storage = PyByteArray_FromStringAndSize(NULL, count * sizeof(float));
+    if (storage == NULL)
+        return NULL;
+
+    *data = (float *)PyByteArray_AS_STRING(storage);
+
+    PyObject *bytesView = PyMemoryView_FromObject(storage);
+    Py_DECREF(storage);
+    if (bytesView == NULL)
+        return NULL;
+
+    PyObject *result = PyObject_CallMethod(bytesView, "cast", "s", "f");
+    Py_DECREF(bytesView);
+
+    return result;
+}
+
+PyObject *PyMathArray_create_bool_view(Py_ssize_t count, uint8_t **data)
+{
+    PyObject *storage = PyByteArray_FromStringAndSize(NULL, count);
+    if (storage == NULL)
+        return NULL;
+
+    *data = (uint8_t *)PyByteArray_AS_STRING(storage);
+
+    PyObject *bytesView = PyMemoryView_FromObject(storage);
+    Py_DECREF(storage);
+    if (bytesView == NULL)
+        return NULL;
+
+    PyObject *result = PyObject_CallMethod(bytesView, "cast", "s", "?");
+    Py_DECREF(bytesView);
+
+    return result;
+}
+
+int PyMathArray_get_float_buffer(PyObject *obj, Py_buffer *buffer, int flags, Py_ssize_t elementLength, const char *name)
+{
+    if (PyObject_GetBuffer(obj, buffer, flags | PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == -1)
+        return -1;
+
+    // reinterpreting other formats (e.g. doubles, ints or raw bytes) would silently produce garbage
+    const char *format = buffer->format == NULL ? "B" : buffer->format;
+    if (buffer->itemsize != sizeof(float) || format[strlen(format) - 1] != 'f')
+    {
+        PyErr_Format(PyExc_TypeError, "Expected %s buffer to contain 32-bit floats, got format: %s.", name, format);
+        PyBuffer_Release(buffer);
+        return -1;
+    }
+
+    if (buffer->len % (elementLength * sizeof(float)) != 0)
+    {
+        PyErr_Format(PyExc_ValueError, "Expected %s buffer size to be a multiple of %zd floats.", name, elementLength);
+        PyBuffer_Release(buffer);
+        return -1;
+    }
+
+    return 0;
+}
+
+int PyMathArray_get_element(PyObject *obj, Py_buffer *buffer, int flags, Py_ssize_t index, Py_ssize_t elementLength, float **element)
+{
+    if (PyObject_GetBuffer(obj, buffer, flags | PyBUF_STRIDES | PyBUF_FORMAT) == -1)
+        return -1;
+
+    const char *format = buffer->format == NULL ? "B" : buffer->format;
+    if (buffer->itemsize != sizeof(float) || format[strlen(format) - 1] != 'f')
+    {
+        PyErr_Format(PyExc_TypeError, "Expected buffer to contain 32-bit floats, got format: %s.", format);
+        goto error;
+    }
+
+    Py_ssize_t count, elementStride;
+    if (buffer->ndim <= 1)
+    {
+        const Py_ssize_t nItems = buffer->len / (Py_ssize_t)sizeof(float);
+        if (nItems % elementLength != 0 || (buffer->ndim == 1 && buffer->strides[0] != sizeof(float)))
+        {
+            PyErr_Format(PyExc_ValueError, "Expected flat buffer to be contiguous and hold a multiple of %zd floats.", elementLength);
+            goto error;
+        }
+
+        count = nItems / elementLength;
+        elementStride = elementLength * sizeof(float);
+    }
+    else
+    {
+        // elements are laid along the first axis, each of them has to be contiguous
+        Py_ssize_t expectedStride = sizeof(float);
+        for (int i = buffer->ndim - 1; i > 0; i--)
+        {
+            if (buffer->shape[i] > 1 && buffer->strides[i] != expectedStride)
+            {
+                PyErr_SetString(PyExc_ValueError, "Expected buffer elements to be contiguous.");
+                goto error;
+            }
+
+            expectedStride *= buffer->shape[i];
+        }
+
+        if (expectedStride != elementLength * (Py_ssize_t)sizeof(float))
+        {
+            PyErr_Format(PyExc_ValueError, "Expected buffer elements to hold %zd floats, got: %zd.", elementLength, expectedStride / (Py_ssize_t)sizeof(float));
+            goto error;
+        }
+
+        count = buffer->shape[0];
+        elementStride = buffer->strides[0];
+    }
+
+    if (index < 0)
+        index += count;
+
+    if (index < 0 || index >= count)
+    {
+        PyErr_Format(PyExc_IndexError, "Index outside of bounds for buffer of %zd elements.", count);
+        goto error;
+    }
+
+    *element = (float *)((char *)buffer->buf + index * elementStride);
+    return 0;
+
+error:
+    PyBuffer_Release(buffer);
+    return -1;
+}
+
+PyObject *PyMathArray_create_array_interface(float *data, int ndim, const Py_ssize_t *shape, const Py_ssize_t *strides)
+{
+    PyObject *shapeObj = PyTuple_New(ndim);
+    if (shapeObj == NULL)
+        return NULL;
+
+    PyObject *stridesObj = PyTuple_New(ndim);
+    if (stridesObj == NULL)
+    {
+        Py_DECREF(shapeObj);
+        return NULL;
+    }
+
+    for (int i = 0; i < ndim; i++)
+    {
+        PyTuple_SET_ITEM(shapeObj, i, PyLong_FromSsize_t(shape[i]));
+        PyTuple_SET_ITEM(stridesObj, i, PyLong_FromSsize_t(strides[i]));
+    }
+
+    return Py_BuildValue(
+        "{s:N,s:N,s:s,s:(NO),s:i}",
+        "shape", shapeObj,
+        "strides", stridesObj,
+        "typestr", PY_LITTLE_ENDIAN ? "<f4" : ">f4",
+        "data", PyLong_FromVoidPtr(data), Py_False,
+        "version", 3);
+}
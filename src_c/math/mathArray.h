@@ -0,0 +1,49 @@
+#pragma once
+#include <float.h>
+#include <stdint.h>
+#include "vector.h"
+#include "matrix.h"
+
+// alignment of array storage, large enough for AVX loads of mat4 columns
+#define MATH_ARRAY_ALIGNMENT 32
+
+typedef struct
+{
+    PY_OBJECT_HEAD;
+    float *data;
+    Py_ssize_t length;
+    // array that owns the memory (set for views), NULL if this array owns it
+    PyObject *base;
+    void *allocation;
+    // buffer of external object which memory is wrapped by this array, obj is NULL if not used
+    Py_buffer external;
+    Py_ssize_t shape[3];
+    Py_ssize_t strides[3];
+} PyMathArray;
+
+extern PyTypeObject PyVector2Array_Type;
+extern PyTypeObject PyVector3Array_Type;
+extern PyTypeObject PyVector4Array_Type;
+extern PyTypeObject PyMatrix3Array_Type;
+extern PyTypeObject PyMatrix4Array_Type;
+
+// allocates zeroed storage of an array that does not have any storage yet
+int PyMathArray_allocate(PyMathArray *array, Py_ssize_t length, Py_ssize_t elementLength);
+// raises RuntimeError if array already has storage, as replacing it would invalidate views and exported buffers
+int PyMathArray_check_uninitialized(PyMathArray *array);
+void PyMathArray_release(PyMathArray *array);
+PyMathArray *PyMathArray_new(PyTypeObject *type, Py_ssize_t length, Py_ssize_t elementLength);
+PyMathArray *PyMathArray_new_view(PyMathArray *base, Py_ssize_t start, Py_ssize_t length, Py_ssize_t elementLength);
+// creates array using memory of obj directly, which has to be a writable, C-contiguous buffer of floats
+PyMathArray *PyMathArray_new_wrapper(PyTypeObject *type, PyObject *obj, Py_ssize_t elementLength, size_t alignment);
+int PyMathArray_get_slice(PyMathArray *array, PyObject *slice, Py_ssize_t *start, Py_ssize_t *length);
+Py_ssize_t PyMathArray_get_index(PyMathArray *array, PyObject *index);
+PyObject *PyMathArray_create_float_view(Py_ssize_t count, float **data);
+// creates memoryview of count bools, used as a result mask of batched tests
+PyObject *PyMathArray_create_bool_view(Py_ssize_t count, uint8_t **data);
+// acquires C-contiguous buffer of 32-bit floats which size is a multiple of elementLength floats
+int PyMathArray_get_float_buffer(PyObject *obj, Py_buffer *buffer, int flags, Py_ssize_t elementLength, const char *name);
+// acquires buffer of float elements (flat or with contiguous elements along the first axis) and retrieves pointer to element at index
+int PyMathArray_get_element(PyObject *obj, Py_buffer *buffer, int flags, Py_ssize_t index, Py_ssize_t elementLength, float **element);
+// creates dict used as __array_interface__ of float data
+PyObject *PyMathArray_create_array_interface(float *data, int ndim, const Py_ssize_t *shape, const Py_ssize_t *strides);
@@ -1,6 +1,7 @@
 #pragma once
 #include <cglm/cglm.h>
 #include "../utils.h"
+#include "freeList.h"
 
 typedef struct
 {
@@ -38,3 +39,7 @@ extern PyTypeObject PyMatrixIter_Type;
 extern PyTypeObject PyMatrix2_Type;
 extern PyTypeObject PyMatrix3_Type;
 extern PyTypeObject PyMatrix4_Type;
+
+extern PyMathFreeList PyMatrix2_FreeList;
+extern PyMathFreeList PyMatrix3_FreeList;
+extern PyMathFreeList PyMatrix4_FreeList;
@@ -0,0 +1,2 @@
+#define MAT_LEN 3
+#include "matrixArrayTemplate.h"
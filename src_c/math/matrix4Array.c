@@ -0,0 +1,2 @@
+#define MAT_LEN 4
+#include "matrixArrayTemplate.h"
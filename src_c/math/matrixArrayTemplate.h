@@ -0,0 +1,546 @@
+// Do not add include guard to this file
+#include "mathArray.h"
+#include "matrixUtils.h"
+#include "simd.h"
+
+#ifndef MAT_LEN
+#error "Matrix array template: MAT_LEN not defined"
+#endif
+
+#if MAT_LEN == 4
+#define TOPLEFT_MATRIX_PY_TYPE &PyMatrix3_Type
+#elif MAT_LEN == 3
+#define TOPLEFT_MATRIX_PY_TYPE &PyMatrix2_Type
+#else
+#error "Matrix array template: only 3x3 and 4x4 matrices are supported"
+#endif
+
+#define ELEM_LEN (MAT_LEN * MAT_LEN)
+#define GLM_COLUMN_TYPE MACRO_CONCAT(vec, MAT_LEN)
+#define GLM_MAT_FUNC(func) MACRO_CONCAT(MACRO_CONCAT(glm_mat, MAT_LEN), MACRO_CONCAT(_, func))
+#define PY_ELEMENT_TYPE_NAME MACRO_CONCAT(PyMatrix, MAT_LEN)
+#define PY_ELEMENT_TYPE_OBJECT_NAME MACRO_CONCAT(PY_ELEMENT_TYPE_NAME, _Type)
+#define PY_TYPE_OBJECT_NAME MACRO_CONCAT(MACRO_CONCAT(PyMatrix, MAT_LEN), Array_Type)
+#define AS_GLM_MATRIX(ptr) ((GLM_COLUMN_TYPE *)(ptr))
+// required alignment of wrapped memory, cglm uses aligned SIMD loads for matrix columns
+#define ELEM_ALIGNMENT 16
+
+// 4x4 matrices go through runtime dispatched SIMD kernels
+#if MAT_LEN == 4
+#define MATRIX_MUL(a, b, dest) PyMathSimd_Kernels.mat4_mul((a), (b), (dest))
+#define MATRIX_INV(m, dest) PyMathSimd_Kernels.mat4_inv((m), (dest))
+#define MATRIX_DET(m) PyMathSimd_Kernels.mat4_det(m)
+#else
+#define MATRIX_MUL(a, b, dest) GLM_MAT_FUNC(mul)(AS_GLM_MATRIX(a), AS_GLM_MATRIX(b), AS_GLM_MATRIX(dest))
+#define MATRIX_INV(m, dest) GLM_MAT_FUNC(inv)(AS_GLM_MATRIX(m), AS_GLM_MATRIX(dest))
+#define MATRIX_DET(m) GLM_MAT_FUNC(det)(AS_GLM_MATRIX(m))
+#endif
+
+typedef enum
+{
+    OPERAND_NOT_SUPPORTED = 0,
+    OPERAND_OK = 1,
+    OPERAND_ERROR = -1,
+} OperandResult;
+
+static void InitShape(PyMathArray *self)
+{
+    self->shape[0] = self->length;
+    self->shape[1] = MAT_LEN;
+    self->shape[2] = MAT_LEN;
+    self->strides[0] = ELEM_LEN * sizeof(float);
+    self->strides[1] = MAT_LEN * sizeof(float);
+    self->strides[2] = sizeof(float);
+}
+
+static PyMathArray *CreateArray(Py_ssize_t length)
+{
+    PyMathArray *array = PyMathArray_new(&PY_TYPE_OBJECT_NAME, length, ELEM_LEN);
+    if (array != NULL)
+        InitShape(array);
+
+    return array;
+}
+
+// Resolves operand of element-wise operation. Arrays are used directly and
+// single matrices are broadcast to every element by using element stride of 0.
+static OperandResult GetOperand(Py_ssize_t length, PyObject *other, float **data, Py_ssize_t *stride)
+{
+    if (PyObject_TypeCheck(other, &PY_TYPE_OBJECT_NAME))
+    {
+        PyMathArray *otherArray = (PyMathArray *)other;
+        if (otherArray->length != length)
+        {
+            PyErr_Format(PyExc_ValueError, "Array lengths do not match: %zd and %zd.", length, otherArray->length);
+            return OPERAND_ERROR;
+        }
+
+        *data = otherArray->data;
+        *stride = ELEM_LEN;
+        return OPERAND_OK;
+    }
+
+    if (PyObject_TypeCheck(other, &PY_ELEMENT_TYPE_OBJECT_NAME))
+    {
+        *data = &((PY_ELEMENT_TYPE_NAME *)other)->data[0][0];
+        *stride = 0;
+        return OPERAND_OK;
+    }
+
+    return OPERAND_NOT_SUPPORTED;
+}
+
+static void AddKernel(float *a, Py_ssize_t aStride, float *b, Py_ssize_t bStride, float *out, Py_ssize_t length)
+{
+    for (Py_ssize_t i = 0; i < length; i++)
+        for (Py_ssize_t j = 0; j < ELEM_LEN; j++)
+            out[i * ELEM_LEN + j] = a[i * aStride + j] + b[i * bStride + j];
+}
+
+static void SubtractKernel(float *a, Py_ssize_t aStride, float *b, Py_ssize_t bStride, float *out, Py_ssize_t length)
+{
+    for (Py_ssize_t i = 0; i < length; i++)
+        for (Py_ssize_t j = 0; j < ELEM_LEN; j++)
+            out[i * ELEM_LEN + j] = a[i * aStride + j] - b[i * bStride + j];
+}
+
+static void MultiplyKernel(float *a, Py_ssize_t aStride, float *b, Py_ssize_t bStride, float *out, Py_ssize_t length)
+{
+    for (Py_ssize_t i = 0; i < length; i++)
+        for (Py_ssize_t j = 0; j < ELEM_LEN; j++)
+            out[i * ELEM_LEN + j] = a[i * aStride + j] * b[i * bStride + j];
+}
+
+static void MatrixMultiplyKernel(float *a, Py_ssize_t aStride, float *b, Py_ssize_t bStride, float *out, Py_ssize_t length)
+{
+    for (Py_ssize_t i = 0; i < length; i++)
+        MATRIX_MUL(a + i * aStride, b + i * bStride, out + i * ELEM_LEN);
+}
+
+typedef void (*BinaryKernel)(float *a, Py_ssize_t aStride, float *b, Py_ssize_t bStride, float *out, Py_ssize_t length);
+
+static PyObject *ApplyBinaryKernel(PyObject *self, PyObject *other, BinaryKernel kernel)
+{
+    // either of operands might be a single matrix, length is always taken from the array
+    const Py_ssize_t length = PyObject_TypeCheck(self, &PY_TYPE_OBJECT_NAME)
+                                  ? ((PyMathArray *)self)->length
+                                  : PyObject_TypeCheck(other, &PY_TYPE_OBJECT_NAME) ? ((PyMathArray *)other)->length : 0;
+
+    float *a, *b;
+    Py_ssize_t aStride, bStride;
+    const OperandResult aResult = GetOperand(length, self, &a, &aStride);
+    if (aResult == OPERAND_ERROR)
+        return NULL;
+
+    const OperandResult bResult = GetOperand(length, other, &b, &bStride);
+    if (bResult == OPERAND_ERROR)
+        return NULL;
+
+    if (aResult == OPERAND_NOT_SUPPORTED || bResult == OPERAND_NOT_SUPPORTED)
+        Py_RETURN_NOTIMPLEMENTED;
+
+    PyMathArray *result = CreateArray(length);
+    if (result == NULL)
+        return NULL;
+
+    kernel(a, aStride, b, bStride, result->data, length);
+    return (PyObject *)result;
+}
+
+static PyObject *ApplyBinaryKernelInplace(PyMathArray *self, PyObject *other, BinaryKernel kernel)
+{
+    float *otherData;
+    Py_ssize_t otherStride;
+    switch (GetOperand(self->length, other, &otherData, &otherStride))
+    {
+    case OPERAND_NOT_SUPPORTED:
+        Py_RETURN_NOTIMPLEMENTED;
+    case OPERAND_ERROR:
+        return NULL;
+    default:
+        break;
+    }
+
+    kernel(self->data, ELEM_LEN, otherData, otherStride, self->data, self->length);
+    return Py_NewRef(self);
+}
+
+static int InitFromSequence(PyMathArray *self, PyObject *sequence)
+{
+    const Py_ssize_t length = PySequence_Fast_GET_SIZE(sequence);
+    if (PyMathArray_allocate(self, length, ELEM_LEN))
+        return -1;
+
+    for (Py_ssize_t i = 0; i < length; i++)
+    {
+        if (PyMatrix_init_one_arg(self->data + i * ELEM_LEN, PySequence_Fast_GET_ITEM(sequence, i), (PyObject *)TOPLEFT_MATRIX_PY_TYPE, MAT_LEN))
+            return -1;
+    }
+
+    return 0;
+}
+
+static int InitFromBuffer(PyMathArray *self, Py_buffer *buffer)
+{
+    // buffer format and size are already validated by PyMathArray_get_float_buffer
+    if (PyMathArray_allocate(self, buffer->len / (ELEM_LEN * sizeof(float)), ELEM_LEN))
+        return -1;
+
+    return PyBuffer_ToContiguous(self->data, buffer, buffer->len, 'C');
+}
+
+static int PyMatrixArray_init(PyMathArray *self, PyObject *args, PyObject *kwargs)
+{
+    (void)kwargs;
+
+    PyObject *arg;
+    if (!PyArg_ParseTuple(args, "O", &arg))
+        return -1;
+
+    if (PyMathArray_check_uninitialized(self))
+        return -1;
+
+    int result = -1;
+    if (PyLong_Check(arg))
+    {
+        const Py_ssize_t length = PyLong_AsSsize_t(arg);
+        if (length == -1 && PyErr_Occurred())
+            return -1;
+
+        result = PyMathArray_allocate(self, length, ELEM_LEN);
+    }
+    else if (PyObject_CheckBuffer(arg))
+    {
+        Py_buffer buffer = {0};
+        if (PyMathArray_get_float_buffer(arg, &buffer, PyBUF_SIMPLE, ELEM_LEN, "source"))
+            return -1;
+
+        result = InitFromBuffer(self, &buffer);
+        PyBuffer_Release(&buffer);
+    }
+    else
+    {
+        PyObject *sequence = PySequence_Fast(arg, "");
+        if (sequence == NULL)
+        {
+            PyErr_Format(PyExc_TypeError, "Expected argument to be either int, t.Sequence[Matrix%d] or support buffer protocol, got: %s.", MAT_LEN, Py_TYPE(arg)->tp_name);
+            return -1;
+        }
+
+        result = InitFromSequence(self, sequence);
+        Py_DECREF(sequence);
+    }
+
+    InitShape(self);
+    return result;
+}
+
+static void PyMatrixArray_dealloc(PyMathArray *self)
+{
+    PyMathArray_release(self);
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject *PyMatrixArray_repr(PyMathArray *self)
+{
+    return PyUnicode_FromFormat("<%s (length: %zd) at %p>", Py_TYPE(self)->tp_name, self->length, (void *)self);
+}
+
+#pragma region tp_as_buffer
+static int PyMatrixArray_bf_getbuffer(PyMathArray *self, Py_buffer *view, int flags)
+{
+    *view = (Py_buffer){
+        .obj = Py_NewRef(self),
+        .buf = self->data,
+        .len = self->length * ELEM_LEN * sizeof(float),
+        .itemsize = sizeof(float),
+        .ndim = 3,
+        .readonly = 0,
+        .format = FLAG_IS_SET(flags, PyBUF_FORMAT) ? "f" : NULL,
+        .shape = FLAG_IS_SET(flags, PyBUF_ND) ? self->shape : NULL,
+        .strides = FLAG_IS_SET(flags, PyBUF_STRIDES) ? self->strides : NULL,
+    };
+
+    return 0;
+}
+#pragma endregion
+
+#pragma region tp_as_mapping
+static Py_ssize_t PyMatrixArray_mp_length(PyMathArray *self)
+{
+    return self->length;
+}
+
+static PyObject *PyMatrixArray_sq_item(PyMathArray *self, Py_ssize_t idx)
+{
+    if (idx < 0 || idx >= self->length)
+    {
+        PyErr_Format(PyExc_IndexError, "Index outside of bounds for %s of length %zd.", Py_TYPE(self)->tp_name, self->length);
+        return NULL;
+    }
+
+    PY_ELEMENT_TYPE_NAME *element = (PY_ELEMENT_TYPE_NAME *)PyMathFreeList_alloc(&MACRO_CONCAT(PY_ELEMENT_TYPE_NAME, _FreeList), &PY_ELEMENT_TYPE_OBJECT_NAME);
+    if (element == NULL)
+        return NULL;
+
+    memcpy(&element->data[0][0], self->data + idx * ELEM_LEN, ELEM_LEN * sizeof(float));
+    return (PyObject *)element;
+}
+
+static PyObject *PyMatrixArray_mp_subscript(PyMathArray *self, PyObject *index)
+{
+    if (PySlice_Check(index))
+    {
+        Py_ssize_t start, length;
+        if (PyMathArray_get_slice(self, index, &start, &length))
+            return NULL;
+
+        return (PyObject *)PyMathArray_new_view(self, start, length, ELEM_LEN);
+    }
+
+    const Py_ssize_t idx = PyMathArray_get_index(self, index);
+    if (idx == -1)
+        return NULL;
+
+    return PyMatrixArray_sq_item(self, idx);
+}
+
+static int PyMatrixArray_mp_ass_subscript(PyMathArray *self, PyObject *index, PyObject *value)
+{
+    if (value == NULL)
+    {
+        PyErr_Format(PyExc_RuntimeError, "%s does not support item deletion.", Py_TYPE(self)->tp_name);
+        return -1;
+    }
+
+    if (PySlice_Check(index))
+    {
+        Py_ssize_t start, length;
+        if (PyMathArray_get_slice(self, index, &start, &length))
+            return -1;
+
+        Py_buffer buffer = {0};
+        if (PyMathArray_get_float_buffer(value, &buffer, PyBUF_SIMPLE, ELEM_LEN, "assigned"))
+            return -1;
+
+        if (buffer.len != (Py_ssize_t)(length * ELEM_LEN * sizeof(float)))
+        {
+            PyErr_Format(PyExc_ValueError, "Expected %zd bytes of data for slice assignment, got: %zd.", length * ELEM_LEN * sizeof(float), buffer.len);
+            PyBuffer_Release(&buffer);
+            return -1;
+        }
+
+        // memmove, source might be a view into the same array
+        memmove(self->data + start * ELEM_LEN, buffer.buf, buffer.len);
+        PyBuffer_Release(&buffer);
+
+        return 0;
+    }
+
+    const Py_ssize_t idx = PyMathArray_get_index(self, index);
+    if (idx == -1)
+        return -1;
+
+    return PyMatrix_init_one_arg(self->data + idx * ELEM_LEN, value, (PyObject *)TOPLEFT_MATRIX_PY_TYPE, MAT_LEN);
+}
+#pragma endregion
+
+#pragma region tp_as_number
+static PyObject *PyMatrixArray_nb_add(PyObject *self, PyObject *other)
+{
+    return ApplyBinaryKernel(self, other, AddKernel);
+}
+
+static PyObject *PyMatrixArray_nb_inplace_add(PyMathArray *self, PyObject *other)
+{
+    return ApplyBinaryKernelInplace(self, other, AddKernel);
+}
+
+static PyObject *PyMatrixArray_nb_subtract(PyObject *self, PyObject *other)
+{
+    return ApplyBinaryKernel(self, other, SubtractKernel);
+}
+
+static PyObject *PyMatrixArray_nb_inplace_subtract(PyMathArray *self, PyObject *other)
+{
+    return ApplyBinaryKernelInplace(self, other, SubtractKernel);
+}
+
+static PyObject *PyMatrixArray_nb_multiply(PyObject *self, PyObject *other)
+{
+    return ApplyBinaryKernel(self, other, MultiplyKernel);
+}
+
+static PyObject *PyMatrixArray_nb_inplace_multiply(PyMathArray *self, PyObject *other)
+{
+    return ApplyBinaryKernelInplace(self, other, MultiplyKernel);
+}
+
+static PyObject *PyMatrixArray_nb_matrix_multiply(PyObject *self, PyObject *other)
+{
+    return ApplyBinaryKernel(self, other, MatrixMultiplyKernel);
+}
+
+static PyObject *PyMatrixArray_nb_inplace_matrix_multiply(PyMathArray *self, PyObject *other)
+{
+    return ApplyBinaryKernelInplace(self, other, MatrixMultiplyKernel);
+}
+#pragma endregion
+
+static PyObject *PyMatrixArray_transpose(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+
+    for (Py_ssize_t i = 0; i < self->length; i++)
+        GLM_MAT_FUNC(transpose)(AS_GLM_MATRIX(self->data + i * ELEM_LEN));
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *PyMatrixArray_transposed(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+
+    PyMathArray *result = CreateArray(self->length);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < self->length; i++)
+        GLM_MAT_FUNC(transpose_to)(AS_GLM_MATRIX(self->data + i * ELEM_LEN), AS_GLM_MATRIX(result->data + i * ELEM_LEN));
+
+    return (PyObject *)result;
+}
+
+static PyObject *PyMatrixArray_inverse(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+
+    for (Py_ssize_t i = 0; i < self->length; i++)
+        MATRIX_INV(self->data + i * ELEM_LEN, self->data + i * ELEM_LEN);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *PyMatrixArray_inversed(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+
+    PyMathArray *result = CreateArray(self->length);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < self->length; i++)
+        MATRIX_INV(self->data + i * ELEM_LEN, result->data + i * ELEM_LEN);
+
+    return (PyObject *)result;
+}
+
+static PyObject *PyMatrixArray_determinant(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+
+    float *resultData;
+    PyObject *result = PyMathArray_create_float_view(self->length, &resultData);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < self->length; i++)
+        resultData[i] = MATRIX_DET(self->data + i * ELEM_LEN);
+
+    return result;
+}
+
+static PyObject *PyMatrixArray_from_buffer(PyTypeObject *cls, PyObject *obj)
+{
+    PyMathArray *array = PyMathArray_new_wrapper(cls, obj, ELEM_LEN, ELEM_ALIGNMENT);
+    if (array != NULL)
+        InitShape(array);
+
+    return (PyObject *)array;
+}
+
+static PyObject *PyMatrixArray_get_array_interface(PyMathArray *self, void *closure)
+{
+    (void)closure;
+    return PyMathArray_create_array_interface(self->data, 3, self->shape, self->strides);
+}
+
+static PyObject *PyMatrixArray_copy(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+
+    PyMathArray *result = CreateArray(self->length);
+    if (result == NULL)
+        return NULL;
+
+    memcpy(result->data, self->data, self->length * ELEM_LEN * sizeof(float));
+    return (PyObject *)result;
+}
+
+static PyObject *PyMatrixArray_identity(PyTypeObject *cls, PyObject *length)
+{
+    (void)cls;
+
+    const Py_ssize_t _length = PyLong_AsSsize_t(length);
+    if (_length == -1 && PyErr_Occurred())
+        return NULL;
+
+    PyMathArray *result = CreateArray(_length);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < _length; i++)
+        for (Py_ssize_t j = 0; j < MAT_LEN; j++)
+            result->data[i * ELEM_LEN + j * MAT_LEN + j] = 1.0f;
+
+    return (PyObject *)result;
+}
+
+PyTypeObject PY_TYPE_OBJECT_NAME = {
+    PY_VAR_OBJECT_HEAD_INIT(NULL, 0),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_basicsize = sizeof(PyMathArray),
+    .tp_name = "spyke.math.Matrix" MACRO_STRINGIFY(MAT_LEN) "Array",
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)PyMatrixArray_init,
+    .tp_dealloc = (destructor)PyMatrixArray_dealloc,
+    .tp_repr = (reprfunc)PyMatrixArray_repr,
+    .tp_as_buffer = &(PyBufferProcs){
+        .bf_getbuffer = (getbufferproc)PyMatrixArray_bf_getbuffer,
+        .bf_releasebuffer = NULL,
+    },
+    .tp_as_sequence = &(PySequenceMethods){
+        .sq_length = (lenfunc)PyMatrixArray_mp_length,
+        .sq_item = (ssizeargfunc)PyMatrixArray_sq_item,
+    },
+    .tp_as_mapping = &(PyMappingMethods){
+        .mp_length = (lenfunc)PyMatrixArray_mp_length,
+        .mp_subscript = (binaryfunc)PyMatrixArray_mp_subscript,
+        .mp_ass_subscript = (objobjargproc)PyMatrixArray_mp_ass_subscript,
+    },
+    .tp_as_number = &(PyNumberMethods){
+        .nb_add = (binaryfunc)PyMatrixArray_nb_add,
+        .nb_inplace_add = (binaryfunc)PyMatrixArray_nb_inplace_add,
+        .nb_subtract = (binaryfunc)PyMatrixArray_nb_subtract,
+        .nb_inplace_subtract = (binaryfunc)PyMatrixArray_nb_inplace_subtract,
+        .nb_multiply = (binaryfunc)PyMatrixArray_nb_multiply,
+        .nb_inplace_multiply = (binaryfunc)PyMatrixArray_nb_inplace_multiply,
+        .nb_matrix_multiply = (binaryfunc)PyMatrixArray_nb_matrix_multiply,
+        .nb_inplace_matrix_multiply = (binaryfunc)PyMatrixArray_nb_inplace_matrix_multiply,
+    },
+    .tp_getset = (PyGetSetDef[]){
+        {"__array_interface__", (getter)PyMatrixArray_get_array_interface, NULL, NULL, NULL},
+        {0},
+    },
+    .tp_methods = (PyMethodDef[]){
+        {"from_buffer", (PyCFunction)PyMatrixArray_from_buffer, METH_O | METH_CLASS, NULL},
+        {"identity", (PyCFunction)PyMatrixArray_identity, METH_O | METH_CLASS, NULL},
+        {"transpose", (PyCFunction)PyMatrixArray_transpose, METH_NOARGS, NULL},
+        {"transposed", (PyCFunction)PyMatrixArray_transposed, METH_NOARGS, NULL},
+        {"inverse", (PyCFunction)PyMatrixArray_inverse, METH_NOARGS, NULL},
+        {"inversed", (PyCFunction)PyMatrixArray_inversed, METH_NOARGS, NULL},
+        {"determinant", (PyCFunction)PyMatrixArray_determinant, METH_NOARGS, NULL},
+        {"copy", (PyCFunction)PyMatrixArray_copy, METH_NOARGS, NULL},
+        {0},
+    },
+};
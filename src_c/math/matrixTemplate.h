@@ -1,7 +1,12 @@
 // Do not add include guard to this file
 #include "matrix.h"
 #include "matrixUtils.h"
+#include "mathArray.h"
+#include "quaternion.h"
+#include "ray.h"
+#include "simd.h"
 #include "vector.h"
+#include "viewport.h"
 
 #ifndef MAT_LEN
 #error "Matrix template: MAT_LEN not defined"
@@ -23,9 +28,44 @@
 #define GLM_ONE MACRO_CONCAT(MACRO_CONCAT(GLM_MAT, MAT_LEN), ONE)
 #define GLM_IDENTITY MACRO_CONCAT(MACRO_CONCAT(GLM_MAT, MAT_LEN), IDENTITY)
 #define MATRIX_INIT_MULTI_ARGS_FUNC MACRO_CONCAT(PY_TYPE_NAME, _init_multiple_args)
+#define FREE_LIST_NAME MACRO_CONCAT(PY_TYPE_NAME, _FreeList)
+#define NEW_OBJECT(type) ((PY_TYPE_NAME *)PyMathFreeList_alloc(&FREE_LIST_NAME, (type)))
+#define PY_VECTOR_TYPE_NAME MACRO_CONCAT(PyVector, MAT_LEN)
+#define PY_VECTOR_TYPE_OBJECT_NAME MACRO_CONCAT(PY_VECTOR_TYPE_NAME, _Type)
+
+// 4x4 matrices go through runtime dispatched SIMD kernels
+#if MAT_LEN == 4
+#define MATRIX_MUL(a, b, dest) PyMathSimd_Kernels.mat4_mul(&(a)[0][0], &(b)[0][0], &(dest)[0][0])
+#define MATRIX_MULV(m, v, dest) PyMathSimd_Kernels.mat4_mulv(&(m)[0][0], (v), (dest))
+#define MATRIX_INV(m, dest) PyMathSimd_Kernels.mat4_inv(&(m)[0][0], &(dest)[0][0])
+#define MATRIX_DET(m) PyMathSimd_Kernels.mat4_det(&(m)[0][0])
+#else
+#define MATRIX_MUL(a, b, dest) GLM_CALL_FUNC(mul, a, b, dest)
+#define MATRIX_MULV(m, v, dest) GLM_CALL_FUNC(mulv, m, v, dest)
+#define MATRIX_INV(m, dest) GLM_CALL_FUNC(inv, m, dest)
+#define MATRIX_DET(m) GLM_CALL_FUNC(det, m)
+#endif
 
 static int MATRIX_INIT_MULTI_ARGS_FUNC(float *matrixData, PyObject *args);
 
+PyMathFreeList FREE_LIST_NAME = {.type = &PY_TYPE_OBJECT_NAME};
+
+static PyObject *PyMatrix_alloc(PyTypeObject *type, Py_ssize_t nItems)
+{
+    (void)nItems;
+
+    PY_TYPE_NAME *new = NEW_OBJECT(type);
+    if (new != NULL)
+        memset(&new->data, 0, sizeof(new->data));
+
+    return (PyObject *)new;
+}
+
+static void PyMatrix_dealloc(PyObject *self)
+{
+    PyMathFreeList_free(&FREE_LIST_NAME, self);
+}
+
 static int PyMatrix_init(PY_TYPE_NAME *self, PyObject *args, PyObject *kwargs)
 {
     (void)kwargs;
@@ -43,25 +83,24 @@ static int PyMatrix_init(PY_TYPE_NAME *self, PyObject *args, PyObject *kwargs)
 #pragma region as_buffer
 static int PyMatrix_bf_getbuffer(PY_TYPE_NAME *self, Py_buffer *view, int flags)
 {
-    view->obj = Py_NewRef(self);
-    view->buf = &self->data[0];
-    view->itemsize = sizeof(float);
-    view->len = sizeof(GLM_TYPE_NAME);
-    view->readonly = !FLAG_IS_SET(flags, PyBUF_WRITABLE);
-    view->format = FLAG_IS_SET(flags, PyBUF_FORMAT) ? "f" : NULL;
-
-    if (FLAG_IS_SET(flags, PyBUF_ANY_CONTIGUOUS))
-    {
-        view->ndim = 1;
-        view->strides = FLAG_IS_SET(flags, PyBUF_STRIDES) ? (Py_ssize_t[]){sizeof(float)} : NULL;
-        view->shape = FLAG_IS_SET(flags, PyBUF_ND) ? (Py_ssize_t[]){MAT_LEN * MAT_LEN} : NULL;
-    }
-    else
-    {
-        view->ndim = 2;
-        view->strides = FLAG_IS_SET(flags, PyBUF_STRIDES) ? (Py_ssize_t[]){sizeof(float), MAT_LEN * sizeof(float)} : NULL;
-        view->shape = FLAG_IS_SET(flags, PyBUF_ND) ? (Py_ssize_t[]){MAT_LEN, MAT_LEN} : NULL;
-    }
+    // shape and strides have to outlive this call, so they cannot be compound literals
+    static Py_ssize_t flatShape[] = {MAT_LEN * MAT_LEN};
+    static Py_ssize_t flatStrides[] = {sizeof(float)};
+    static Py_ssize_t shape[] = {MAT_LEN, MAT_LEN};
+    static Py_ssize_t strides[] = {sizeof(float), MAT_LEN * sizeof(float)};
+
+    const bool flat = FLAG_IS_SET(flags, PyBUF_ANY_CONTIGUOUS);
+    *view = (Py_buffer){
+        .obj = Py_NewRef(self),
+        .buf = &self->data[0],
+        .itemsize = sizeof(float),
+        .len = sizeof(GLM_TYPE_NAME),
+        .readonly = !FLAG_IS_SET(flags, PyBUF_WRITABLE),
+        .format = FLAG_IS_SET(flags, PyBUF_FORMAT) ? "f" : NULL,
+        .ndim = flat ? 1 : 2,
+        .strides = FLAG_IS_SET(flags, PyBUF_STRIDES) ? (flat ? flatStrides : strides) : NULL,
+        .shape = FLAG_IS_SET(flags, PyBUF_ND) ? (flat ? flatShape : shape) : NULL,
+    };
 
     return 0;
 }
@@ -164,16 +203,13 @@ success:
 #pragma region as_number
 static PY_TYPE_NAME *PyMatrix_nb_add(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 {
-    if (!PyObject_IsInstance((PyObject *)self, (PyObject *)&PY_TYPE_OBJECT_NAME))
-    {
-        PyErr_Format(PyExc_RuntimeError, "Cannot add %s and %s.", Py_TYPE(self)->tp_name, Py_TYPE(other)->tp_name);
-        return NULL;
-    }
+    if (!PyObject_TypeCheck((PyObject *)self, &PY_TYPE_OBJECT_NAME) || !PyObject_TypeCheck((PyObject *)other, &PY_TYPE_OBJECT_NAME))
+        return (PY_TYPE_NAME *)Py_NewRef(Py_NotImplemented);
 
     float *data = &self->data[0][0];
     float *otherData = &other->data[0][0];
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
     for (size_t i = 0; i < MAT_LEN * MAT_LEN; i++)
         ((float *)new->data)[i] = data[i] + otherData[i];
 
@@ -182,11 +218,8 @@ static PY_TYPE_NAME *PyMatrix_nb_add(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 
 static PY_TYPE_NAME *PyMatrix_nb_inplace_add(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 {
-    if (!PyObject_IsInstance((PyObject *)self, (PyObject *)&PY_TYPE_OBJECT_NAME))
-    {
-        PyErr_Format(PyExc_RuntimeError, "Cannot add %s and %s.", Py_TYPE(self)->tp_name, Py_TYPE(other)->tp_name);
-        return NULL;
-    }
+    if (!PyObject_TypeCheck((PyObject *)self, &PY_TYPE_OBJECT_NAME) || !PyObject_TypeCheck((PyObject *)other, &PY_TYPE_OBJECT_NAME))
+        return (PY_TYPE_NAME *)Py_NewRef(Py_NotImplemented);
 
     float *data = &self->data[0][0];
     float *otherData = &other->data[0][0];
@@ -199,16 +232,13 @@ static PY_TYPE_NAME *PyMatrix_nb_inplace_add(PY_TYPE_NAME *self, PY_TYPE_NAME *o
 
 static PY_TYPE_NAME *PyMatrix_nb_subtract(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 {
-    if (!PyObject_IsInstance((PyObject *)self, (PyObject *)&PY_TYPE_OBJECT_NAME))
-    {
-        PyErr_Format(PyExc_RuntimeError, "Cannot add %s and %s.", Py_TYPE(self)->tp_name, Py_TYPE(other)->tp_name);
-        return NULL;
-    }
+    if (!PyObject_TypeCheck((PyObject *)self, &PY_TYPE_OBJECT_NAME) || !PyObject_TypeCheck((PyObject *)other, &PY_TYPE_OBJECT_NAME))
+        return (PY_TYPE_NAME *)Py_NewRef(Py_NotImplemented);
 
     float *data = &self->data[0][0];
     float *otherData = &other->data[0][0];
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
     for (size_t i = 0; i < MAT_LEN * MAT_LEN; i++)
         ((float *)new->data)[i] = data[i] - otherData[i];
 
@@ -217,11 +247,8 @@ static PY_TYPE_NAME *PyMatrix_nb_subtract(PY_TYPE_NAME *self, PY_TYPE_NAME *othe
 
 static PY_TYPE_NAME *PyMatrix_nb_inplace_subtract(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 {
-    if (!PyObject_IsInstance((PyObject *)self, (PyObject *)&PY_TYPE_OBJECT_NAME))
-    {
-        PyErr_Format(PyExc_RuntimeError, "Cannot add %s and %s.", Py_TYPE(self)->tp_name, Py_TYPE(other)->tp_name);
-        return NULL;
-    }
+    if (!PyObject_TypeCheck((PyObject *)self, &PY_TYPE_OBJECT_NAME) || !PyObject_TypeCheck((PyObject *)other, &PY_TYPE_OBJECT_NAME))
+        return (PY_TYPE_NAME *)Py_NewRef(Py_NotImplemented);
 
     float *data = &self->data[0][0];
     float *otherData = &other->data[0][0];
@@ -233,16 +260,13 @@ static PY_TYPE_NAME *PyMatrix_nb_inplace_subtract(PY_TYPE_NAME *self, PY_TYPE_NA
 
 static PY_TYPE_NAME *PyMatrix_nb_multiply(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 {
-    if (!PyObject_IsInstance((PyObject *)self, (PyObject *)&PY_TYPE_OBJECT_NAME))
-    {
-        PyErr_Format(PyExc_RuntimeError, "Cannot add %s and %s.", Py_TYPE(self)->tp_name, Py_TYPE(other)->tp_name);
-        return NULL;
-    }
+    if (!PyObject_TypeCheck((PyObject *)self, &PY_TYPE_OBJECT_NAME) || !PyObject_TypeCheck((PyObject *)other, &PY_TYPE_OBJECT_NAME))
+        return (PY_TYPE_NAME *)Py_NewRef(Py_NotImplemented);
 
     float *data = &self->data[0][0];
     float *otherData = &other->data[0][0];
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
     for (size_t i = 0; i < MAT_LEN * MAT_LEN; i++)
         ((float *)new->data)[i] = data[i] * otherData[i];
 
@@ -251,11 +275,8 @@ static PY_TYPE_NAME *PyMatrix_nb_multiply(PY_TYPE_NAME *self, PY_TYPE_NAME *othe
 
 static PY_TYPE_NAME *PyMatrix_nb_inplace_multiply(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 {
-    if (!PyObject_IsInstance((PyObject *)self, (PyObject *)&PY_TYPE_OBJECT_NAME))
-    {
-        PyErr_Format(PyExc_RuntimeError, "Cannot add %s and %s.", Py_TYPE(self)->tp_name, Py_TYPE(other)->tp_name);
-        return NULL;
-    }
+    if (!PyObject_TypeCheck((PyObject *)self, &PY_TYPE_OBJECT_NAME) || !PyObject_TypeCheck((PyObject *)other, &PY_TYPE_OBJECT_NAME))
+        return (PY_TYPE_NAME *)Py_NewRef(Py_NotImplemented);
 
     float *data = &self->data[0][0];
     float *otherData = &other->data[0][0];
@@ -265,29 +286,34 @@ static PY_TYPE_NAME *PyMatrix_nb_inplace_multiply(PY_TYPE_NAME *self, PY_TYPE_NA
     return (PY_TYPE_NAME *)Py_NewRef(self);
 }
 
-static PY_TYPE_NAME *PyMatrix_nb_matrix_multiply(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
+static PyObject *PyMatrix_nb_matrix_multiply(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 {
-    if (!PyObject_IsInstance((PyObject *)self, (PyObject *)&PY_TYPE_OBJECT_NAME))
+    if (!PyObject_TypeCheck((PyObject *)self, &PY_TYPE_OBJECT_NAME))
+        Py_RETURN_NOTIMPLEMENTED;
+
+    if (PyObject_TypeCheck((PyObject *)other, &PY_VECTOR_TYPE_OBJECT_NAME))
     {
-        PyErr_Format(PyExc_RuntimeError, "Cannot add %s and %s.", Py_TYPE(self)->tp_name, Py_TYPE(other)->tp_name);
-        return NULL;
+        PY_VECTOR_TYPE_NAME *vector = (PY_VECTOR_TYPE_NAME *)PyMathFreeList_alloc(&MACRO_CONCAT(PY_VECTOR_TYPE_NAME, _FreeList), &PY_VECTOR_TYPE_OBJECT_NAME);
+        MATRIX_MULV(self->data, ((PY_VECTOR_TYPE_NAME *)other)->data, vector->data);
+
+        return (PyObject *)vector;
     }
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
-    GLM_CALL_FUNC(mul, self->data, other->data, new->data);
+    if (!PyObject_TypeCheck((PyObject *)other, &PY_TYPE_OBJECT_NAME))
+        Py_RETURN_NOTIMPLEMENTED;
 
-    return new;
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
+    MATRIX_MUL(self->data, other->data, new->data);
+
+    return (PyObject *)new;
 }
 
 static PY_TYPE_NAME *PyMatrix_nb_inplace_matrix_multiply(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 {
-    if (!PyObject_IsInstance((PyObject *)self, (PyObject *)&PY_TYPE_OBJECT_NAME))
-    {
-        PyErr_Format(PyExc_RuntimeError, "Cannot add %s and %s.", Py_TYPE(self)->tp_name, Py_TYPE(other)->tp_name);
-        return NULL;
-    }
+    if (!PyObject_TypeCheck((PyObject *)self, &PY_TYPE_OBJECT_NAME) || !PyObject_TypeCheck((PyObject *)other, &PY_TYPE_OBJECT_NAME))
+        return (PY_TYPE_NAME *)Py_NewRef(Py_NotImplemented);
 
-    GLM_CALL_FUNC(mul, self->data, other->data, self->data);
+    MATRIX_MUL(self->data, other->data, self->data);
     return (PY_TYPE_NAME *)Py_NewRef(self);
 }
 #pragma endregion
@@ -303,7 +329,7 @@ static PY_TYPE_NAME *PyMatrix_transposed(PY_TYPE_NAME *self, PyObject *args)
 {
     (void)args;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
     GLM_CALL_FUNC(transpose_to, self->data, new->data);
 
     return new;
@@ -312,7 +338,7 @@ static PY_TYPE_NAME *PyMatrix_transposed(PY_TYPE_NAME *self, PyObject *args)
 static PyObject *PyMatrix_inverse(PY_TYPE_NAME *self, PyObject *args)
 {
     (void)args;
-    GLM_CALL_FUNC(inv, self->data, self->data);
+    MATRIX_INV(self->data, self->data);
     Py_RETURN_NONE;
 }
 
@@ -320,8 +346,8 @@ static PY_TYPE_NAME *PyMatrix_inversed(PY_TYPE_NAME *self, PyObject *args)
 {
     (void)args;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
-    GLM_CALL_FUNC(inv, self->data, new->data);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
+    MATRIX_INV(self->data, new->data);
 
     return new;
 }
@@ -338,7 +364,7 @@ static PY_TYPE_NAME *PyMatrix_inversed_fast(PY_TYPE_NAME *self, PyObject *args)
 {
     (void)args;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
     GLM_CALL_FUNC(inv_fast, self->data, new->data);
 
     return new;
@@ -384,10 +410,16 @@ static PyObject *PyMatrix_rotate(PY_TYPE_NAME *self, PyObject *const *args, Py_s
     }
     else if (nArgs == 1)
     {
+        if (PyObject_IsInstance(args[0], (PyObject *)&PyQuaternion_Type))
+        {
+            glm_quat_rotate(self->data, ((PyQuaternion *)args[0])->data, self->data);
+            Py_RETURN_NONE;
+        }
+
         rotation = (PyVector3 *)args[0];
         if (!PyObject_IsInstance((PyObject *)rotation, (PyObject *)&PyVector3_Type))
         {
-            PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s, got: %s.", PyVector3_Type.tp_name, Py_TYPE(rotation)->tp_name);
+            PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s or %s, got: %s.", PyVector3_Type.tp_name, PyQuaternion_Type.tp_name, Py_TYPE(rotation)->tp_name);
             return NULL;
         }
 
@@ -410,33 +442,161 @@ static PyObject *PyMatrix_perspective_resize(PY_TYPE_NAME *self, PyObject *fov)
     Py_RETURN_NONE;
 }
 
+static void ComposeTransform(mat4 dest, float *translation, float *scale, float *rotation)
+{
+    glm_mat4_identity(dest);
+    glm_translate(dest, translation);
+    glm_rotate_x(dest, rotation[0], dest);
+    glm_rotate_y(dest, rotation[1], dest);
+    glm_rotate_z(dest, rotation[2], dest);
+    glm_scale(dest, scale);
+}
+
+// parses (translation, scale, rotation) arguments shared by Matrix4.transform and Matrix4.set_transform
+static int ComposeTransformFromArgs(mat4 dest, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyVector3 *translation, *scale;
+    PyObject *rotation;
+    if (!_PyArg_ParseStack(args, nArgs, "O!O!O", &PyVector3_Type, &translation, &PyVector3_Type, &scale, &rotation))
+        return -1;
+
+    if (PyObject_IsInstance(rotation, (PyObject *)&PyQuaternion_Type))
+    {
+        glm_mat4_identity(dest);
+        glm_translate(dest, translation->data);
+        glm_quat_rotate(dest, ((PyQuaternion *)rotation)->data, dest);
+        glm_scale(dest, scale->data);
+        return 0;
+    }
+
+    if (!PyObject_IsInstance(rotation, (PyObject *)&PyVector3_Type))
+    {
+        PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s or %s, got: %s.", PyVector3_Type.tp_name, PyQuaternion_Type.tp_name, Py_TYPE(rotation)->tp_name);
+        return -1;
+    }
+
+    ComposeTransform(dest, translation->data, scale->data, ((PyVector3 *)rotation)->data);
+    return 0;
+}
+
 static PY_TYPE_NAME *PyMatrix_transform(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nArgs)
 {
-    PyVector3 *translation, *rotation, *scale;
-    if (!_PyArg_ParseStack(args, nArgs, "O!O!O!", &PyVector3_Type, &translation, &PyVector3_Type, &scale, &PyVector3_Type, &rotation))
+    mat4 transform;
+    if (ComposeTransformFromArgs(transform, args, nArgs))
         return NULL;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
-
-    glm_mat4_identity(new->data);
-    glm_translate(new->data, translation->data);
-    glm_rotate_x(new->data, rotation->data[0], new->data);
-    glm_rotate_y(new->data, rotation->data[1], new->data);
-    glm_rotate_z(new->data, rotation->data[2], new->data);
-    glm_scale(new->data, scale->data);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
+    glm_mat4_copy(transform, new->data);
 
     return new;
 }
 
+static PyObject *PyMatrix_set_transform(PY_TYPE_NAME *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    if (ComposeTransformFromArgs(self->data, args, nArgs))
+        return NULL;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *PyMatrix_transform_many(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nArgs)
+{
+    (void)cls;
+
+    PyObject *translationsObj, *scalesObj, *rotationsObj, *outObj, *dirtyObj = Py_None;
+    if (!_PyArg_ParseStack(args, nArgs, "OOOO|O", &translationsObj, &scalesObj, &rotationsObj, &outObj, &dirtyObj))
+        return NULL;
+
+    Py_buffer translations = {0}, scales = {0}, rotations = {0}, out = {0}, dirty = {0};
+    PyObject *result = NULL;
+
+    if (PyMathArray_get_float_buffer(translationsObj, &translations, PyBUF_SIMPLE, 3, "translations"))
+        return NULL;
+    if (PyMathArray_get_float_buffer(scalesObj, &scales, PyBUF_SIMPLE, 3, "scales"))
+        goto release_translations;
+    if (PyMathArray_get_float_buffer(rotationsObj, &rotations, PyBUF_SIMPLE, 3, "rotations"))
+        goto release_scales;
+    if (PyMathArray_get_float_buffer(outObj, &out, PyBUF_WRITABLE, 16, "out"))
+        goto release_rotations;
+
+    const Py_ssize_t count = translations.len / (3 * sizeof(float));
+    if (scales.len != translations.len || rotations.len != translations.len)
+    {
+        PyErr_SetString(PyExc_ValueError, "Expected translations, scales and rotations to have the same length.");
+        goto release_out;
+    }
+
+    if (out.len < count * (Py_ssize_t)sizeof(mat4))
+    {
+        PyErr_Format(PyExc_ValueError, "Expected out buffer to hold at least %zd matrices, got: %zd.", count, out.len / (Py_ssize_t)sizeof(mat4));
+        goto release_out;
+    }
+
+    float *translationsData = translations.buf;
+    float *scalesData = scales.buf;
+    float *rotationsData = rotations.buf;
+    // external buffers are not guaranteed to be aligned for cglm, so each matrix is composed locally and copied out
+    float *outData = out.buf;
+    mat4 transform;
+    Py_ssize_t nWritten = 0;
+
+    if (dirtyObj == Py_None)
+    {
+        for (Py_ssize_t i = 0; i < count; i++)
+        {
+            ComposeTransform(transform, &translationsData[i * 3], &scalesData[i * 3], &rotationsData[i * 3]);
+            memcpy(&outData[i * 16], transform, sizeof(mat4));
+        }
+
+        nWritten = count;
+    }
+    else
+    {
+        if (PyObject_GetBuffer(dirtyObj, &dirty, PyBUF_C_CONTIGUOUS) == -1)
+            goto release_out;
+
+        if (dirty.itemsize != 1 || dirty.len != count)
+        {
+            PyErr_Format(PyExc_ValueError, "Expected dirty buffer to contain %zd one byte flags, got: %zd bytes.", count, dirty.len);
+            goto release_dirty;
+        }
+
+        const char *dirtyData = dirty.buf;
+        for (Py_ssize_t i = 0; i < count; i++)
+        {
+            if (!dirtyData[i])
+                continue;
+
+            ComposeTransform(transform, &translationsData[i * 3], &scalesData[i * 3], &rotationsData[i * 3]);
+            memcpy(&outData[i * 16], transform, sizeof(mat4));
+            nWritten++;
+        }
+    }
+
+    result = PyLong_FromSsize_t(nWritten);
+
+release_dirty:
+    if (dirty.obj != NULL)
+        PyBuffer_Release(&dirty);
+release_out:
+    PyBuffer_Release(&out);
+release_rotations:
+    PyBuffer_Release(&rotations);
+release_scales:
+    PyBuffer_Release(&scales);
+release_translations:
+    PyBuffer_Release(&translations);
+
+    return result;
+}
+
 static PY_TYPE_NAME *PyMatrix_ortho(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nArgs)
 {
     float l, r, b, t, n, f;
     if (!_PyArg_ParseStack(args, nArgs, "ffffff", &l, &r, &b, &t, &n, &f))
         return NULL;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
 
     glm_ortho(l, r, b, t, n, f, new->data);
 
@@ -449,8 +609,7 @@ static PY_TYPE_NAME *PyMatrix_perspective(PyTypeObject *cls, PyObject *const *ar
     if (!_PyArg_ParseStack(args, nArgs, "ffff", &fov, &aspect, &near, &far))
         return NULL;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
 
     glm_perspective(fov, aspect, near, far, new->data);
 
@@ -463,19 +622,130 @@ static PY_TYPE_NAME *PyMatrix_look_at(PyTypeObject *cls, PyObject *const *args,
     if (!_PyArg_ParseStack(args, nArgs, "O!O!O!", &PyVector3_Type, &eye, &PyVector3_Type, &center, &PyVector3_Type, &up))
         return NULL;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
 
     glm_lookat(eye->data, center->data, up->data, new->data);
 
     return new;
 }
+
+static PyRay *PyMatrix_unproject(PY_TYPE_NAME *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    float x, y;
+    PyObject *viewportObj;
+    if (!_PyArg_ParseStack(args, nArgs, "ffO", &x, &y, &viewportObj))
+        return NULL;
+
+    // Viewport3D starts with the same fields as Viewport2D
+    if (!PyObject_IsInstance(viewportObj, (PyObject *)&PyViewport2D_Type) && !PyObject_IsInstance(viewportObj, (PyObject *)&PyViewport3D_Type))
+    {
+        PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s or %s, got: %s.", PyViewport2D_Type.tp_name, PyViewport3D_Type.tp_name, Py_TYPE(viewportObj)->tp_name);
+        return NULL;
+    }
+
+    PyViewport2D *viewport = (PyViewport2D *)viewportObj;
+    const float width = viewport->right - viewport->left;
+    const float height = viewport->top - viewport->bottom;
+    if (width == 0.0f || height == 0.0f)
+    {
+        PyErr_SetString(PyExc_ValueError, "Viewport cannot have zero width or height.");
+        return NULL;
+    }
+
+    // viewport with top smaller than bottom maps window coordinates with y axis pointing down
+    const float ndcX = (x - viewport->left) / width * 2.0f - 1.0f;
+    const float ndcY = (y - viewport->bottom) / height * 2.0f - 1.0f;
+
+    mat4 inverse;
+    vec4 near = {ndcX, ndcY, -1.0f, 1.0f};
+    vec4 far = {ndcX, ndcY, 1.0f, 1.0f};
+    MATRIX_INV(self->data, inverse);
+    MATRIX_MULV(inverse, near, near);
+    MATRIX_MULV(inverse, far, far);
+    glm_vec3_divs(near, near[3], near);
+    glm_vec3_divs(far, far[3], far);
+
+    vec3 direction;
+    glm_vec3_sub(far, near, direction);
+
+    return PyRay_new(near, direction);
+}
 #endif
 
+static PyObject *PyMatrix_multiply_into(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nArgs)
+{
+    (void)cls;
+
+    PY_TYPE_NAME *a, *b, *out;
+    if (!_PyArg_ParseStack(args, nArgs, "O!O!O!", &PY_TYPE_OBJECT_NAME, &a, &PY_TYPE_OBJECT_NAME, &b, &PY_TYPE_OBJECT_NAME, &out))
+        return NULL;
+
+#if MAT_LEN == 4
+    MATRIX_MUL(a->data, b->data, out->data);
+#else
+    // out may alias either operand
+    GLM_TYPE_NAME result;
+    GLM_CALL_FUNC(mul, a->data, b->data, result);
+    GLM_CALL_FUNC(copy, result, out->data);
+#endif
+
+    Py_RETURN_NONE;
+}
+
 static PyObject *PyMatrix_determinant(PY_TYPE_NAME *self, PyObject *args)
 {
     (void)args;
-    return PyFloat_FromDouble((double)GLM_CALL_FUNC(det, self->data));
+    return PyFloat_FromDouble((double)MATRIX_DET(self->data));
+}
+
+static PY_TYPE_NAME *PyMatrix_from_array(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyObject *arrayObj;
+    Py_ssize_t index;
+    if (!_PyArg_ParseStack(args, nArgs, "On", &arrayObj, &index))
+        return NULL;
+
+    Py_buffer buffer = {0};
+    float *element;
+    if (PyMathArray_get_element(arrayObj, &buffer, PyBUF_SIMPLE, index, MAT_LEN * MAT_LEN, &element))
+        return NULL;
+
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
+    if (new != NULL)
+        memcpy(new->data, element, sizeof(GLM_TYPE_NAME));
+
+    PyBuffer_Release(&buffer);
+    return new;
+}
+
+static PyObject *PyMatrix_write_to(PY_TYPE_NAME *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyObject *arrayObj;
+    Py_ssize_t index;
+    if (!_PyArg_ParseStack(args, nArgs, "On", &arrayObj, &index))
+        return NULL;
+
+    Py_buffer buffer = {0};
+    float *element;
+    if (PyMathArray_get_element(arrayObj, &buffer, PyBUF_WRITABLE, index, MAT_LEN * MAT_LEN, &element))
+        return NULL;
+
+    memcpy(element, self->data, sizeof(GLM_TYPE_NAME));
+    PyBuffer_Release(&buffer);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *PyMatrix_get_array_interface(PY_TYPE_NAME *self, void *closure)
+{
+    (void)closure;
+
+    // same layout as exported through the buffer protocol: rows along the first axis of column-major data
+    return PyMathArray_create_array_interface(
+        &self->data[0][0],
+        2,
+        (Py_ssize_t[]){MAT_LEN, MAT_LEN},
+        (Py_ssize_t[]){sizeof(float), MAT_LEN * sizeof(float)});
 }
 
 static PY_TYPE_NAME *PyMatrix_identity(PyTypeObject *cls, PyObject *args, PyObject *kwargs)
@@ -483,8 +753,7 @@ static PY_TYPE_NAME *PyMatrix_identity(PyTypeObject *cls, PyObject *args, PyObje
     (void)args;
     (void)kwargs;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
     GLM_CALL_FUNC(identity, new->data);
 
     return new;
@@ -495,8 +764,7 @@ static PY_TYPE_NAME *PyMatrix_zero(PyTypeObject *cls, PyObject *args, PyObject *
     (void)args;
     (void)kwargs;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
 
     GLM_CALL_FUNC(zero, new->data);
 
@@ -509,6 +777,8 @@ PyTypeObject PY_TYPE_OBJECT_NAME = {
     .tp_basicsize = sizeof(PY_TYPE_NAME),
     .tp_name = MACRO_CONCAT("spyke.math.Matrix", MACRO_STRINGIFY(MAT_LEN)),
     .tp_new = PyType_GenericNew,
+    .tp_alloc = PyMatrix_alloc,
+    .tp_dealloc = PyMatrix_dealloc,
     .tp_init = (initproc)PyMatrix_init,
     .tp_as_buffer = &(PyBufferProcs){
         .bf_getbuffer = (getbufferproc)PyMatrix_bf_getbuffer,
@@ -528,8 +798,14 @@ PyTypeObject PY_TYPE_OBJECT_NAME = {
         .nb_matrix_multiply = (binaryfunc)PyMatrix_nb_matrix_multiply,
         .nb_inplace_matrix_multiply = (binaryfunc)PyMatrix_nb_inplace_matrix_multiply,
     },
+    .tp_getset = (PyGetSetDef[]){
+        {"__array_interface__", (getter)PyMatrix_get_array_interface, NULL, NULL, NULL},
+        {0},
+    },
     .tp_methods = (PyMethodDef[]){
         {"identity", (PyCFunction)PyMatrix_identity, METH_NOARGS | METH_CLASS, NULL},
+        {"from_array", (PyCFunction)PyMatrix_from_array, METH_FASTCALL | METH_CLASS, NULL},
+        {"write_to", (PyCFunction)PyMatrix_write_to, METH_FASTCALL, NULL},
         {"zero", (PyCFunction)PyMatrix_zero, METH_NOARGS | METH_CLASS, NULL},
         {"transpose", (PyCFunction)PyMatrix_transpose, METH_NOARGS, NULL},
         {"transposed", (PyCFunction)PyMatrix_transposed, METH_NOARGS, NULL},
@@ -543,10 +819,14 @@ PyTypeObject PY_TYPE_OBJECT_NAME = {
         {"scale", (PyCFunction)PyMatrix_scale, METH_O, NULL},
         {"perspective_resize", (PyCFunction)PyMatrix_perspective_resize, METH_O, NULL},
         {"transform", (PyCFunction)PyMatrix_transform, METH_FASTCALL | METH_CLASS, NULL},
+        {"transform_many", (PyCFunction)PyMatrix_transform_many, METH_FASTCALL | METH_CLASS, NULL},
+        {"set_transform", (PyCFunction)PyMatrix_set_transform, METH_FASTCALL, NULL},
         {"ortho", (PyCFunction)PyMatrix_ortho, METH_FASTCALL | METH_CLASS, NULL},
         {"perspective", (PyCFunction)PyMatrix_perspective, METH_FASTCALL | METH_CLASS, NULL},
         {"look_at", (PyCFunction)PyMatrix_look_at, METH_FASTCALL | METH_CLASS, NULL},
+        {"unproject", (PyCFunction)PyMatrix_unproject, METH_FASTCALL, NULL},
 #endif
+        {"multiply_into", (PyCFunction)PyMatrix_multiply_into, METH_FASTCALL | METH_CLASS, NULL},
         {"determinant", (PyCFunction)PyMatrix_determinant, METH_NOARGS, NULL},
         {0},
     },
@@ -0,0 +1,506 @@
+#include "quaternion.h"
+#include "vector.h"
+#include "matrix.h"
+#include "vectorUtils.h"
+#include "mathArray.h"
+
+static PyQuaternion *NewQuaternion(PyTypeObject *type)
+{
+    PyQuaternion *new = PyObject_New(PyQuaternion, type);
+    return (PyQuaternion *)PyObject_Init((PyObject *)new, type);
+}
+
+static bool CheckTypeQuaternion(PyObject *other)
+{
+    if (!PyObject_IsInstance(other, (PyObject *)&PyQuaternion_Type))
+    {
+        PyErr_Format(PyExc_TypeError, "Expected value to be of type %s, got: %s.", PyQuaternion_Type.tp_name, Py_TYPE(other)->tp_name);
+        return false;
+    }
+
+    return true;
+}
+
+static int PyQuaternion_init(PyQuaternion *self, PyObject *args, PyObject *kwargs)
+{
+    (void)kwargs;
+
+    const Py_ssize_t nArgs = PyTuple_GET_SIZE(args);
+
+    if (nArgs == 0)
+    {
+        glm_quat_identity(self->data);
+        return 0;
+    }
+
+    if (nArgs == 1)
+        return PyVector_init_one_arg(self->data, PyTuple_GET_ITEM(args, 0), 4);
+
+    if (nArgs == 4)
+    {
+        if (!PyArg_ParseTuple(args, "ffff", &self->data[0], &self->data[1], &self->data[2], &self->data[3]))
+            return -1;
+
+        return 0;
+    }
+
+    PyErr_Format(PyExc_ValueError, "Expected 0, 1 or 4 arguments, got: %zd.", nArgs);
+    return -1;
+}
+
+static PyObject *PyQuaternion_str(PyQuaternion *self)
+{
+    char buffer[128];
+    int size = snprintf(
+        buffer,
+        sizeof(buffer),
+        "<%s (%.3f, %.3f, %.3f, %.3f) at 0x%p>",
+        Py_TYPE(self)->tp_name,
+        self->data[0],
+        self->data[1],
+        self->data[2],
+        self->data[3],
+        (void *)self);
+
+    return PyUnicode_FromStringAndSize(buffer, size);
+}
+
+#pragma region tp_as_buffer
+static int PyQuaternion_bf_getbuffer(PyQuaternion *self, Py_buffer *view, int flags)
+{
+    // shape and strides have to outlive this call, so they cannot be compound literals
+    static Py_ssize_t shape[] = {4};
+    static Py_ssize_t strides[] = {sizeof(float)};
+
+    *view = (Py_buffer){
+        .obj = Py_NewRef(self),
+        .buf = &self->data[0],
+        .len = sizeof(versor),
+        .itemsize = sizeof(float),
+        .ndim = 1,
+        .readonly = !FLAG_IS_SET(flags, PyBUF_WRITABLE),
+        .format = FLAG_IS_SET(flags, PyBUF_FORMAT) ? "f" : NULL,
+        .shape = FLAG_IS_SET(flags, PyBUF_ND) ? shape : NULL,
+        .strides = FLAG_IS_SET(flags, PyBUF_STRIDES) ? strides : NULL,
+    };
+
+    return 0;
+}
+#pragma endregion
+
+#pragma region tp_as_sequence
+static Py_ssize_t PyQuaternion_sq_length(PyQuaternion *self)
+{
+    (void)self;
+    return 4;
+}
+
+static PyObject *PyQuaternion_sq_item(PyQuaternion *self, Py_ssize_t idx)
+{
+    if (idx >= 4)
+    {
+        PyErr_SetString(PyExc_IndexError, "Index too large.");
+        return NULL;
+    }
+
+    return PyFloat_FromDouble((double)self->data[idx]);
+}
+
+static int PyQuaternion_sq_ass_item(PyQuaternion *self, Py_ssize_t idx, PyObject *value)
+{
+    if (idx >= 4)
+    {
+        PyErr_SetString(PyExc_IndexError, "Index too large.");
+        return -1;
+    }
+
+    if (value == NULL)
+    {
+        PyErr_Format(PyExc_RuntimeError, "%s does not support item deletion.", Py_TYPE(self)->tp_name);
+        return -1;
+    }
+
+    PyObject *floatValue = PyNumber_Float(value);
+    if (floatValue == NULL)
+    {
+        PyErr_Format(PyExc_TypeError, "Expected value to be convertible to float, got: %s.", Py_TYPE(value)->tp_name);
+        return -1;
+    }
+
+    self->data[idx] = (float)PyFloat_AS_DOUBLE(floatValue);
+    Py_DECREF(floatValue);
+
+    return 0;
+}
+#pragma endregion
+
+#pragma region tp_as_number
+static PyObject *PyQuaternion_nb_multiply(PyObject *self, PyObject *other)
+{
+    if (!PyObject_TypeCheck(self, &PyQuaternion_Type) || !PyObject_TypeCheck(other, &PyQuaternion_Type))
+        Py_RETURN_NOTIMPLEMENTED;
+
+    PyQuaternion *new = NewQuaternion(&PyQuaternion_Type);
+    glm_quat_mul(((PyQuaternion *)self)->data, ((PyQuaternion *)other)->data, new->data);
+
+    return (PyObject *)new;
+}
+
+static PyObject *PyQuaternion_nb_inplace_multiply(PyQuaternion *self, PyObject *other)
+{
+    if (!PyObject_TypeCheck(other, &PyQuaternion_Type))
+        Py_RETURN_NOTIMPLEMENTED;
+
+    glm_quat_mul(self->data, ((PyQuaternion *)other)->data, self->data);
+
+    return Py_NewRef(self);
+}
+
+static PyQuaternion *PyQuaternion_nb_negative(PyQuaternion *self)
+{
+    PyQuaternion *new = NewQuaternion(&PyQuaternion_Type);
+    glm_vec4_negate_to(self->data, new->data);
+
+    return new;
+}
+#pragma endregion
+
+static PyQuaternion *PyQuaternion_identity(PyTypeObject *cls, PyObject *args)
+{
+    (void)args;
+
+    PyQuaternion *new = NewQuaternion(cls);
+    glm_quat_identity(new->data);
+
+    return new;
+}
+
+static PyQuaternion *PyQuaternion_from_axis_angle(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nArgs)
+{
+    float angle;
+    PyVector3 *axis;
+    if (!_PyArg_ParseStack(args, nArgs, "fO!", &angle, &PyVector3_Type, &axis))
+        return NULL;
+
+    PyQuaternion *new = NewQuaternion(cls);
+    glm_quatv(new->data, angle, axis->data);
+
+    return new;
+}
+
+static PyQuaternion *PyQuaternion_from_euler(PyTypeObject *cls, PyVector3 *rotation)
+{
+    CHECK_ARG_TYPE(rotation, &PyVector3_Type, NULL);
+
+    // same rotation order as Matrix4.rotate(Vector3): x, then y, then z
+    versor x, y, z;
+    glm_quatv(x, rotation->data[0], (vec3){1.0f, 0.0f, 0.0f});
+    glm_quatv(y, rotation->data[1], (vec3){0.0f, 1.0f, 0.0f});
+    glm_quatv(z, rotation->data[2], (vec3){0.0f, 0.0f, 1.0f});
+
+    PyQuaternion *new = NewQuaternion(cls);
+    glm_quat_mul(x, y, new->data);
+    glm_quat_mul(new->data, z, new->data);
+
+    return new;
+}
+
+static PyQuaternion *PyQuaternion_from_matrix(PyTypeObject *cls, PyObject *matrix)
+{
+    if (PyObject_IsInstance(matrix, (PyObject *)&PyMatrix4_Type))
+    {
+        PyQuaternion *new = NewQuaternion(cls);
+        glm_mat4_quat(((PyMatrix4 *)matrix)->data, new->data);
+        return new;
+    }
+
+    if (PyObject_IsInstance(matrix, (PyObject *)&PyMatrix3_Type))
+    {
+        PyQuaternion *new = NewQuaternion(cls);
+        glm_mat3_quat(((PyMatrix3 *)matrix)->data, new->data);
+        return new;
+    }
+
+    PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s or %s, got: %s.", PyMatrix3_Type.tp_name, PyMatrix4_Type.tp_name, Py_TYPE(matrix)->tp_name);
+    return NULL;
+}
+
+static PyObject *PyQuaternion_slerp_many(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nArgs)
+{
+    (void)cls;
+
+    PyObject *fromObj, *toObj, *amountObj, *outObj;
+    if (!_PyArg_ParseStack(args, nArgs, "OOOO", &fromObj, &toObj, &amountObj, &outObj))
+        return NULL;
+
+    Py_buffer from = {0}, to = {0}, amounts = {0}, out = {0};
+    PyObject *result = NULL;
+    float amount = 0.0f;
+
+    if (PyFloat_Check(amountObj) || PyLong_Check(amountObj))
+    {
+        amount = (float)PyFloat_AsDouble(amountObj);
+        if (PyErr_Occurred())
+            return NULL;
+    }
+    else if (PyMathArray_get_float_buffer(amountObj, &amounts, PyBUF_SIMPLE, 1, "amount"))
+        return NULL;
+
+    if (PyMathArray_get_float_buffer(fromObj, &from, PyBUF_SIMPLE, 4, "from"))
+        goto release_amounts;
+    if (PyMathArray_get_float_buffer(toObj, &to, PyBUF_SIMPLE, 4, "to"))
+        goto release_from;
+    if (PyMathArray_get_float_buffer(outObj, &out, PyBUF_WRITABLE, 4, "out"))
+        goto release_to;
+
+    const Py_ssize_t count = from.len / sizeof(versor);
+    if (to.len != from.len || out.len < from.len)
+    {
+        PyErr_Format(PyExc_ValueError, "Expected from, to and out buffers to hold %zd quaternions.", count);
+        goto release_out;
+    }
+
+    if (amounts.obj != NULL && amounts.len != count * (Py_ssize_t)sizeof(float))
+    {
+        PyErr_Format(PyExc_ValueError, "Expected amount buffer to hold %zd floats, got: %zd.", count, amounts.len / (Py_ssize_t)sizeof(float));
+        goto release_out;
+    }
+
+    // external buffers are not guaranteed to be aligned for cglm, so each element goes through local copies
+    const float *fromData = from.buf;
+    const float *toData = to.buf;
+    const float *amountsData = amounts.buf;
+    float *outData = out.buf;
+    versor a, b, dest;
+
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        memcpy(a, &fromData[i * 4], sizeof(versor));
+        memcpy(b, &toData[i * 4], sizeof(versor));
+        glm_quat_slerp(a, b, amountsData != NULL ? amountsData[i] : amount, dest);
+        memcpy(&outData[i * 4], dest, sizeof(versor));
+    }
+
+    result = Py_NewRef(Py_None);
+
+release_out:
+    PyBuffer_Release(&out);
+release_to:
+    PyBuffer_Release(&to);
+release_from:
+    PyBuffer_Release(&from);
+release_amounts:
+    if (amounts.obj != NULL)
+        PyBuffer_Release(&amounts);
+
+    return result;
+}
+
+static PyObject *PyQuaternion_normalize(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+    glm_quat_normalize(self->data);
+    Py_RETURN_NONE;
+}
+
+static PyQuaternion *PyQuaternion_normalized(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+
+    PyQuaternion *new = NewQuaternion(&PyQuaternion_Type);
+    glm_quat_normalize_to(self->data, new->data);
+
+    return new;
+}
+
+static PyObject *PyQuaternion_conjugate(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+    glm_quat_conjugate(self->data, self->data);
+    Py_RETURN_NONE;
+}
+
+static PyQuaternion *PyQuaternion_conjugated(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+
+    PyQuaternion *new = NewQuaternion(&PyQuaternion_Type);
+    glm_quat_conjugate(self->data, new->data);
+
+    return new;
+}
+
+static PyObject *PyQuaternion_inverse(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+    glm_quat_inv(self->data, self->data);
+    Py_RETURN_NONE;
+}
+
+static PyQuaternion *PyQuaternion_inversed(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+
+    PyQuaternion *new = NewQuaternion(&PyQuaternion_Type);
+    glm_quat_inv(self->data, new->data);
+
+    return new;
+}
+
+static PyObject *PyQuaternion_dot(PyQuaternion *self, PyQuaternion *other)
+{
+    if (!CheckTypeQuaternion((PyObject *)other))
+        return NULL;
+
+    return PyFloat_FromDouble((double)glm_quat_dot(self->data, other->data));
+}
+
+static PyObject *PyQuaternion_length(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+    return PyFloat_FromDouble((double)glm_quat_norm(self->data));
+}
+
+static PyObject *PyQuaternion_angle(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+    return PyFloat_FromDouble((double)glm_quat_angle(self->data));
+}
+
+static PyVector3 *PyQuaternion_axis(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+
+    PyVector3 *axis = (PyVector3 *)PyMathFreeList_alloc(&PyVector3_FreeList, &PyVector3_Type);
+    glm_quat_axis(self->data, axis->data);
+
+    return axis;
+}
+
+static PyQuaternion *PyQuaternion_slerp(PyQuaternion *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyQuaternion *other;
+    float t;
+    if (!_PyArg_ParseStack(args, nArgs, "O!f", &PyQuaternion_Type, &other, &t))
+        return NULL;
+
+    PyQuaternion *new = NewQuaternion(&PyQuaternion_Type);
+    glm_quat_slerp(self->data, other->data, t, new->data);
+
+    return new;
+}
+
+static PyQuaternion *PyQuaternion_nlerp(PyQuaternion *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyQuaternion *other;
+    float t;
+    if (!_PyArg_ParseStack(args, nArgs, "O!f", &PyQuaternion_Type, &other, &t))
+        return NULL;
+
+    PyQuaternion *new = NewQuaternion(&PyQuaternion_Type);
+    glm_quat_nlerp(self->data, other->data, t, new->data);
+
+    return new;
+}
+
+static PyVector3 *PyQuaternion_rotate(PyQuaternion *self, PyVector3 *vector)
+{
+    CHECK_ARG_TYPE(vector, &PyVector3_Type, NULL);
+
+    PyVector3 *new = (PyVector3 *)PyMathFreeList_alloc(&PyVector3_FreeList, &PyVector3_Type);
+    glm_quat_rotatev(self->data, vector->data, new->data);
+
+    return new;
+}
+
+static PyMatrix3 *PyQuaternion_to_matrix3(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+
+    PyMatrix3 *new = (PyMatrix3 *)PyMathFreeList_alloc(&PyMatrix3_FreeList, &PyMatrix3_Type);
+    glm_quat_mat3(self->data, new->data);
+
+    return new;
+}
+
+static PyMatrix4 *PyQuaternion_to_matrix4(PyQuaternion *self, PyObject *args)
+{
+    (void)args;
+
+    PyMatrix4 *new = (PyMatrix4 *)PyMathFreeList_alloc(&PyMatrix4_FreeList, &PyMatrix4_Type);
+    glm_quat_mat4(self->data, new->data);
+
+    return new;
+}
+
+static PyObject *PyQuaternion_richcompare(PyQuaternion *self, PyObject *other, int func)
+{
+    switch (func)
+    {
+    case Py_EQ:
+    case Py_NE:
+        if (!PyObject_IsInstance(other, (PyObject *)&PyQuaternion_Type))
+            Py_RETURN_NOTIMPLEMENTED;
+
+        const bool equal = (PyObject *)self == other || glm_vec4_eqv(self->data, ((PyQuaternion *)other)->data);
+        return PyBool_FromLong(func == Py_EQ ? equal : !equal);
+    }
+
+    PyErr_SetString(PyExc_TypeError, "Quaternion does not support less than or greater than comparisons.");
+    return NULL;
+}
+
+PyTypeObject PyQuaternion_Type = {
+    PY_VAR_OBJECT_HEAD_INIT(NULL, 0),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_basicsize = sizeof(PyQuaternion),
+    .tp_name = "spyke.math.Quaternion",
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)PyQuaternion_init,
+    .tp_str = (reprfunc)PyQuaternion_str,
+    .tp_richcompare = (richcmpfunc)PyQuaternion_richcompare,
+    .tp_as_buffer = &(PyBufferProcs){
+        .bf_getbuffer = (getbufferproc)PyQuaternion_bf_getbuffer,
+        .bf_releasebuffer = NULL,
+    },
+    .tp_as_sequence = &(PySequenceMethods){
+        .sq_length = (lenfunc)PyQuaternion_sq_length,
+        .sq_item = (ssizeargfunc)PyQuaternion_sq_item,
+        .sq_ass_item = (ssizeobjargproc)PyQuaternion_sq_ass_item,
+    },
+    .tp_as_number = &(PyNumberMethods){
+        .nb_multiply = (binaryfunc)PyQuaternion_nb_multiply,
+        .nb_inplace_multiply = (binaryfunc)PyQuaternion_nb_inplace_multiply,
+        .nb_negative = (unaryfunc)PyQuaternion_nb_negative,
+    },
+    .tp_members = (PyMemberDef[]){
+        {"x", Py_T_FLOAT, offsetof(PyQuaternion, data[0]), 0, NULL},
+        {"y", Py_T_FLOAT, offsetof(PyQuaternion, data[1]), 0, NULL},
+        {"z", Py_T_FLOAT, offsetof(PyQuaternion, data[2]), 0, NULL},
+        {"w", Py_T_FLOAT, offsetof(PyQuaternion, data[3]), 0, NULL},
+        {0},
+    },
+    .tp_methods = (PyMethodDef[]){
+        {"identity", (PyCFunction)PyQuaternion_identity, METH_NOARGS | METH_CLASS, NULL},
+        {"from_axis_angle", (PyCFunction)PyQuaternion_from_axis_angle, METH_FASTCALL | METH_CLASS, NULL},
+        {"from_euler", (PyCFunction)PyQuaternion_from_euler, METH_O | METH_CLASS, NULL},
+        {"from_matrix", (PyCFunction)PyQuaternion_from_matrix, METH_O | METH_CLASS, NULL},
+        {"slerp_many", (PyCFunction)PyQuaternion_slerp_many, METH_FASTCALL | METH_CLASS, NULL},
+        {"normalize", (PyCFunction)PyQuaternion_normalize, METH_NOARGS, NULL},
+        {"normalized", (PyCFunction)PyQuaternion_normalized, METH_NOARGS, NULL},
+        {"conjugate", (PyCFunction)PyQuaternion_conjugate, METH_NOARGS, NULL},
+        {"conjugated", (PyCFunction)PyQuaternion_conjugated, METH_NOARGS, NULL},
+        {"inverse", (PyCFunction)PyQuaternion_inverse, METH_NOARGS, NULL},
+        {"inversed", (PyCFunction)PyQuaternion_inversed, METH_NOARGS, NULL},
+        {"dot", (PyCFunction)PyQuaternion_dot, METH_O, NULL},
+        {"length", (PyCFunction)PyQuaternion_length, METH_NOARGS, NULL},
+        {"angle", (PyCFunction)PyQuaternion_angle, METH_NOARGS, NULL},
+        {"axis", (PyCFunction)PyQuaternion_axis, METH_NOARGS, NULL},
+        {"slerp", (PyCFunction)PyQuaternion_slerp, METH_FASTCALL, NULL},
+        {"nlerp", (PyCFunction)PyQuaternion_nlerp, METH_FASTCALL, NULL},
+        {"rotate", (PyCFunction)PyQuaternion_rotate, METH_O, NULL},
+        {"to_matrix3", (PyCFunction)PyQuaternion_to_matrix3, METH_NOARGS, NULL},
+        {"to_matrix4", (PyCFunction)PyQuaternion_to_matrix4, METH_NOARGS, NULL},
+        {0},
+    },
+};
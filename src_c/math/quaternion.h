@@ -0,0 +1,11 @@
+#pragma once
+#include <cglm/cglm.h>
+#include "../utils.h"
+
+typedef struct
+{
+    PY_OBJECT_HEAD;
+    versor data;
+} PyQuaternion;
+
+extern PyTypeObject PyQuaternion_Type;
@@ -0,0 +1,439 @@
+#include "ray.h"
+#include "bounds.h"
+#include "vector.h"
+#include "vectorUtils.h"
+#include "mathArray.h"
+
+// intersection kernels work on unaligned float data coming from external buffers and write distance along the ray on hit
+
+static bool RayAABB(const float *origin, const float *inverseDirection, const float *min, const float *max, float *distance)
+{
+    float near = 0.0f;
+    float far = FLT_MAX;
+    for (int i = 0; i < 3; i++)
+    {
+        // fminf/fmaxf ignore NaN produced by rays parallel to a slab and starting on its boundary
+        const float t1 = (min[i] - origin[i]) * inverseDirection[i];
+        const float t2 = (max[i] - origin[i]) * inverseDirection[i];
+        near = fmaxf(near, fminf(t1, t2));
+        far = fminf(far, fmaxf(t1, t2));
+    }
+
+    *distance = near;
+    return near <= far;
+}
+
+static bool RaySphere(const float *origin, const float *direction, const float *center, float radius, float *distance)
+{
+    const float oc[3] = {origin[0] - center[0], origin[1] - center[1], origin[2] - center[2]};
+    const float b = oc[0] * direction[0] + oc[1] * direction[1] + oc[2] * direction[2];
+    const float c = oc[0] * oc[0] + oc[1] * oc[1] + oc[2] * oc[2] - radius * radius;
+
+    // origin outside of the sphere and pointing away from it
+    if (c > 0.0f && b > 0.0f)
+        return false;
+
+    const float discriminant = b * b - c;
+    if (discriminant < 0.0f)
+        return false;
+
+    *distance = glm_max(-b - sqrtf(discriminant), 0.0f);
+    return true;
+}
+
+static bool RayPlane(const float *origin, const float *direction, const float *plane, float *distance)
+{
+    const float denominator = plane[0] * direction[0] + plane[1] * direction[1] + plane[2] * direction[2];
+    if (fabsf(denominator) < FLT_EPSILON)
+        return false;
+
+    const float t = -(plane[0] * origin[0] + plane[1] * origin[1] + plane[2] * origin[2] + plane[3]) / denominator;
+    if (t < 0.0f)
+        return false;
+
+    *distance = t;
+    return true;
+}
+
+// Moller-Trumbore, triangles are treated as double sided
+static bool RayTriangle(const float *origin, const float *direction, const float *v0, const float *v1, const float *v2, float *distance)
+{
+    vec3 dir, edge1, edge2, p, s, q;
+    memcpy(dir, direction, sizeof(vec3));
+
+    for (int i = 0; i < 3; i++)
+    {
+        edge1[i] = v1[i] - v0[i];
+        edge2[i] = v2[i] - v0[i];
+        s[i] = origin[i] - v0[i];
+    }
+
+    glm_vec3_cross(dir, edge2, p);
+    const float det = glm_vec3_dot(edge1, p);
+    if (fabsf(det) < FLT_EPSILON)
+        return false;
+
+    const float inverseDet = 1.0f / det;
+    const float u = glm_vec3_dot(s, p) * inverseDet;
+    if (u < 0.0f || u > 1.0f)
+        return false;
+
+    glm_vec3_cross(s, edge1, q);
+    const float v = glm_vec3_dot(dir, q) * inverseDet;
+    if (v < 0.0f || u + v > 1.0f)
+        return false;
+
+    const float t = glm_vec3_dot(edge2, q) * inverseDet;
+    if (t < FLT_EPSILON)
+        return false;
+
+    *distance = t;
+    return true;
+}
+
+static void GetInverseDirection(PyRay *ray, float *dest)
+{
+    for (int i = 0; i < 3; i++)
+        dest[i] = 1.0f / ray->direction[i];
+}
+
+static PyObject *DistanceOrNone(bool hit, float distance)
+{
+    if (!hit)
+        Py_RETURN_NONE;
+
+    return PyFloat_FromDouble((double)distance);
+}
+
+// creates (mask, distances) tuple returned by batched intersection queries
+static PyObject *CreateHitResults(Py_ssize_t count, uint8_t **mask, float **distances)
+{
+    PyObject *maskObj = PyMathArray_create_bool_view(count, mask);
+    if (maskObj == NULL)
+        return NULL;
+
+    PyObject *distancesObj = PyMathArray_create_float_view(count, distances);
+    if (distancesObj == NULL)
+    {
+        Py_DECREF(maskObj);
+        return NULL;
+    }
+
+    return Py_BuildValue("(NN)", maskObj, distancesObj);
+}
+
+PyRay *PyRay_new(const float *origin, const float *direction)
+{
+    PyRay *new = PyObject_New(PyRay, &PyRay_Type);
+    new = (PyRay *)PyObject_Init((PyObject *)new, &PyRay_Type);
+
+    memcpy(new->origin, origin, sizeof(vec3));
+    memcpy(new->direction, direction, sizeof(vec3));
+    glm_vec3_normalize(new->direction);
+
+    return new;
+}
+
+static int PyRay_init(PyRay *self, PyObject *args, PyObject *kwargs)
+{
+    (void)kwargs;
+
+    PyVector3 *origin = NULL, *direction = NULL;
+    if (!PyArg_ParseTuple(args, "|O!O!", &PyVector3_Type, &origin, &PyVector3_Type, &direction))
+        return -1;
+
+    glm_vec3_zero(self->origin);
+    if (origin != NULL)
+        glm_vec3_copy(origin->data, self->origin);
+
+    if (direction != NULL)
+        glm_vec3_normalize_to(direction->data, self->direction);
+    else
+        glm_vec3_copy((vec3){0.0f, 0.0f, -1.0f}, self->direction);
+
+    return 0;
+}
+
+static PyObject *PyRay_str(PyRay *self)
+{
+    char buffer[192];
+    int size = snprintf(
+        buffer,
+        sizeof(buffer),
+        "<%s origin=(%.3f, %.3f, %.3f), direction=(%.3f, %.3f, %.3f) at 0x%p>",
+        Py_TYPE(self)->tp_name,
+        self->origin[0], self->origin[1], self->origin[2],
+        self->direction[0], self->direction[1], self->direction[2],
+        (void *)self);
+
+    return PyUnicode_FromStringAndSize(buffer, size);
+}
+
+static PyVector3 *PyRay_get_origin(PyRay *self, void *closure)
+{
+    (void)closure;
+    return PyVector3_new(self->origin);
+}
+
+static int PyRay_set_origin(PyRay *self, PyObject *value, void *closure)
+{
+    (void)closure;
+    return PyVector3_set(self->origin, value, "origin");
+}
+
+static PyVector3 *PyRay_get_direction(PyRay *self, void *closure)
+{
+    (void)closure;
+    return PyVector3_new(self->direction);
+}
+
+static int PyRay_set_direction(PyRay *self, PyObject *value, void *closure)
+{
+    (void)closure;
+
+    if (PyVector3_set(self->direction, value, "direction"))
+        return -1;
+
+    glm_vec3_normalize(self->direction);
+    return 0;
+}
+
+static PyVector3 *PyRay_point_at(PyRay *self, PyObject *distanceObj)
+{
+    const float distance = (float)PyFloat_AsDouble(distanceObj);
+    if (PyErr_Occurred())
+        return NULL;
+
+    vec3 point;
+    glm_vec3_copy(self->origin, point);
+    glm_vec3_muladds(self->direction, distance, point);
+
+    return PyVector3_new(point);
+}
+
+static PyObject *PyRay_intersect_aabb(PyRay *self, PyAABB *aabb)
+{
+    CHECK_ARG_TYPE(aabb, &PyAABB_Type, NULL);
+
+    vec3 inverseDirection;
+    GetInverseDirection(self, inverseDirection);
+
+    float distance;
+    const bool hit = RayAABB(self->origin, inverseDirection, aabb->box[0], aabb->box[1], &distance);
+
+    return DistanceOrNone(hit, distance);
+}
+
+static PyObject *PyRay_intersect_sphere(PyRay *self, PySphere *sphere)
+{
+    CHECK_ARG_TYPE(sphere, &PySphere_Type, NULL);
+
+    float distance;
+    const bool hit = RaySphere(self->origin, self->direction, sphere->data, sphere->data[3], &distance);
+
+    return DistanceOrNone(hit, distance);
+}
+
+static PyObject *PyRay_intersect_plane(PyRay *self, PyPlane *plane)
+{
+    CHECK_ARG_TYPE(plane, &PyPlane_Type, NULL);
+
+    float distance;
+    const bool hit = RayPlane(self->origin, self->direction, plane->data, &distance);
+
+    return DistanceOrNone(hit, distance);
+}
+
+static PyObject *PyRay_intersect_triangle(PyRay *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyVector3 *v0, *v1, *v2;
+    if (!_PyArg_ParseStack(args, nArgs, "O!O!O!", &PyVector3_Type, &v0, &PyVector3_Type, &v1, &PyVector3_Type, &v2))
+        return NULL;
+
+    float distance;
+    const bool hit = RayTriangle(self->origin, self->direction, v0->data, v1->data, v2->data, &distance);
+
+    return DistanceOrNone(hit, distance);
+}
+
+static PyObject *PyRay_intersect_aabbs(PyRay *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyObject *minsObj, *maxsObj;
+    if (!_PyArg_ParseStack(args, nArgs, "OO", &minsObj, &maxsObj))
+        return NULL;
+
+    Py_buffer mins = {0}, maxs = {0};
+    PyObject *result = NULL;
+
+    if (PyMathArray_get_float_buffer(minsObj, &mins, PyBUF_SIMPLE, 3, "mins"))
+        return NULL;
+    if (PyMathArray_get_float_buffer(maxsObj, &maxs, PyBUF_SIMPLE, 3, "maxs"))
+        goto release_mins;
+
+    if (maxs.len != mins.len)
+    {
+        PyErr_SetString(PyExc_ValueError, "Expected mins and maxs to have the same length.");
+        goto release_maxs;
+    }
+
+    const Py_ssize_t count = mins.len / sizeof(vec3);
+    uint8_t *mask;
+    float *distances;
+    result = CreateHitResults(count, &mask, &distances);
+    if (result == NULL)
+        goto release_maxs;
+
+    vec3 inverseDirection;
+    GetInverseDirection(self, inverseDirection);
+
+    const float *minsData = mins.buf;
+    const float *maxsData = maxs.buf;
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        float distance;
+        mask[i] = RayAABB(self->origin, inverseDirection, &minsData[i * 3], &maxsData[i * 3], &distance);
+        distances[i] = mask[i] ? distance : INFINITY;
+    }
+
+release_maxs:
+    PyBuffer_Release(&maxs);
+release_mins:
+    PyBuffer_Release(&mins);
+
+    return result;
+}
+
+static PyObject *PyRay_intersect_spheres(PyRay *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyObject *centersObj, *radiiObj;
+    if (!_PyArg_ParseStack(args, nArgs, "OO", &centersObj, &radiiObj))
+        return NULL;
+
+    Py_buffer centers = {0}, radii = {0};
+    PyObject *result = NULL;
+    float radius = 0.0f;
+
+    if (PyFloat_Check(radiiObj) || PyLong_Check(radiiObj))
+    {
+        radius = (float)PyFloat_AsDouble(radiiObj);
+        if (PyErr_Occurred())
+            return NULL;
+    }
+    else if (PyMathArray_get_float_buffer(radiiObj, &radii, PyBUF_SIMPLE, 1, "radii"))
+        return NULL;
+
+    if (PyMathArray_get_float_buffer(centersObj, &centers, PyBUF_SIMPLE, 3, "centers"))
+        goto release_radii;
+
+    const Py_ssize_t count = centers.len / sizeof(vec3);
+    if (radii.obj != NULL && radii.len != count * (Py_ssize_t)sizeof(float))
+    {
+        PyErr_Format(PyExc_ValueError, "Expected radii buffer to hold %zd floats, got: %zd.", count, radii.len / (Py_ssize_t)sizeof(float));
+        goto release_centers;
+    }
+
+    uint8_t *mask;
+    float *distances;
+    result = CreateHitResults(count, &mask, &distances);
+    if (result == NULL)
+        goto release_centers;
+
+    const float *centersData = centers.buf;
+    const float *radiiData = radii.buf;
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        float distance;
+        mask[i] = RaySphere(self->origin, self->direction, &centersData[i * 3], radiiData != NULL ? radiiData[i] : radius, &distance);
+        distances[i] = mask[i] ? distance : INFINITY;
+    }
+
+release_centers:
+    PyBuffer_Release(&centers);
+release_radii:
+    if (radii.obj != NULL)
+        PyBuffer_Release(&radii);
+
+    return result;
+}
+
+static PyObject *PyRay_intersect_triangles(PyRay *self, PyObject *verticesObj)
+{
+    Py_buffer vertices = {0};
+    if (PyMathArray_get_float_buffer(verticesObj, &vertices, PyBUF_SIMPLE, 9, "vertices"))
+        return NULL;
+
+    const Py_ssize_t count = vertices.len / (9 * sizeof(float));
+    uint8_t *mask;
+    float *distances;
+    PyObject *result = CreateHitResults(count, &mask, &distances);
+    if (result == NULL)
+        goto release_vertices;
+
+    const float *verticesData = vertices.buf;
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        const float *triangle = &verticesData[i * 9];
+        float distance;
+        mask[i] = RayTriangle(self->origin, self->direction, &triangle[0], &triangle[3], &triangle[6], &distance);
+        distances[i] = mask[i] ? distance : INFINITY;
+    }
+
+release_vertices:
+    PyBuffer_Release(&vertices);
+
+    return result;
+}
+
+static PyObject *PyRay_intersect_planes(PyRay *self, PyObject *planesObj)
+{
+    Py_buffer planes = {0};
+    if (PyMathArray_get_float_buffer(planesObj, &planes, PyBUF_SIMPLE, 4, "planes"))
+        return NULL;
+
+    const Py_ssize_t count = planes.len / sizeof(vec4);
+    uint8_t *mask;
+    float *distances;
+    PyObject *result = CreateHitResults(count, &mask, &distances);
+    if (result == NULL)
+        goto release_planes;
+
+    const float *planesData = planes.buf;
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        float distance;
+        mask[i] = RayPlane(self->origin, self->direction, &planesData[i * 4], &distance);
+        distances[i] = mask[i] ? distance : INFINITY;
+    }
+
+release_planes:
+    PyBuffer_Release(&planes);
+
+    return result;
+}
+
+PyTypeObject PyRay_Type = {
+    PY_VAR_OBJECT_HEAD_INIT(NULL, 0),
+    .tp_name = "spyke.math.Ray",
+    .tp_basicsize = sizeof(PyRay),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)PyRay_init,
+    .tp_str = (reprfunc)PyRay_str,
+    .tp_getset = (PyGetSetDef[]){
+        {"origin", (getter)PyRay_get_origin, (setter)PyRay_set_origin, NULL, NULL},
+        {"direction", (getter)PyRay_get_direction, (setter)PyRay_set_direction, NULL, NULL},
+        {0},
+    },
+    .tp_methods = (PyMethodDef[]){
+        {"point_at", (PyCFunction)PyRay_point_at, METH_O, NULL},
+        {"intersect_aabb", (PyCFunction)PyRay_intersect_aabb, METH_O, NULL},
+        {"intersect_sphere", (PyCFunction)PyRay_intersect_sphere, METH_O, NULL},
+        {"intersect_plane", (PyCFunction)PyRay_intersect_plane, METH_O, NULL},
+        {"intersect_triangle", (PyCFunction)PyRay_intersect_triangle, METH_FASTCALL, NULL},
+        {"intersect_aabbs", (PyCFunction)PyRay_intersect_aabbs, METH_FASTCALL, NULL},
+        {"intersect_spheres", (PyCFunction)PyRay_intersect_spheres, METH_FASTCALL, NULL},
+        {"intersect_triangles", (PyCFunction)PyRay_intersect_triangles, METH_O, NULL},
+        {"intersect_planes", (PyCFunction)PyRay_intersect_planes, METH_O, NULL},
+        {0},
+    },
+};
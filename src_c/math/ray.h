@@ -0,0 +1,15 @@
+#pragma once
+#include <cglm/cglm.h>
+#include "../utils.h"
+
+typedef struct
+{
+    PY_OBJECT_HEAD;
+    vec3 origin;
+    // always kept normalized, so hit distances are expressed in world units
+    vec3 direction;
+} PyRay;
+
+extern PyTypeObject PyRay_Type;
+
+PyRay *PyRay_new(const float *origin, const float *direction);
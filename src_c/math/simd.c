@@ -0,0 +1,313 @@
+#include <string.h>
+#include <cglm/cglm.h>
+#include "simd.h"
+
+#if defined(__x86_64__) || defined(_M_X64) || defined(_M_AMD64) || defined(__SSE2__) || (defined(_M_IX86_FP) && _M_IX86_FP >= 2)
+#define SIMD_X86 1
+#include <immintrin.h>
+#if defined(_MSC_VER)
+#include <intrin.h>
+#define TARGET_AVX
+#else
+#define TARGET_AVX __attribute__((target("avx")))
+#endif
+#elif defined(__ARM_NEON) || defined(_M_ARM64)
+#define SIMD_NEON 1
+#include <arm_neon.h>
+#endif
+
+static PyMathSimdLevel s_SimdLevel = PY_MATH_SIMD_SCALAR;
+
+#pragma region scalar
+static void Mat4MulScalar(const float *a, const float *b, float *dest)
+{
+    float result[16];
+    for (int col = 0; col < 4; col++)
+        for (int row = 0; row < 4; row++)
+            result[col * 4 + row] = a[0 * 4 + row] * b[col * 4 + 0] +
+                                    a[1 * 4 + row] * b[col * 4 + 1] +
+                                    a[2 * 4 + row] * b[col * 4 + 2] +
+                                    a[3 * 4 + row] * b[col * 4 + 3];
+
+    memcpy(dest, result, sizeof(result));
+}
+
+static void Mat4MulvScalar(const float *m, const float *v, float *dest)
+{
+    float result[4];
+    for (int row = 0; row < 4; row++)
+        result[row] = m[0 * 4 + row] * v[0] + m[1 * 4 + row] * v[1] + m[2 * 4 + row] * v[2] + m[3 * 4 + row] * v[3];
+
+    memcpy(dest, result, sizeof(result));
+}
+
+// cofactors of the 4x4 matrix, layout independent because inverse(transpose(m)) == transpose(inverse(m))
+static void Mat4Cofactors(const float *m, float *c)
+{
+    c[0] = m[5] * m[10] * m[15] - m[5] * m[11] * m[14] - m[9] * m[6] * m[15] + m[9] * m[7] * m[14] + m[13] * m[6] * m[11] - m[13] * m[7] * m[10];
+    c[4] = -m[4] * m[10] * m[15] + m[4] * m[11] * m[14] + m[8] * m[6] * m[15] - m[8] * m[7] * m[14] - m[12] * m[6] * m[11] + m[12] * m[7] * m[10];
+    c[8] = m[4] * m[9] * m[15] - m[4] * m[11] * m[13] - m[8] * m[5] * m[15] + m[8] * m[7] * m[13] + m[12] * m[5] * m[11] - m[12] * m[7] * m[9];
+    c[12] = -m[4] * m[9] * m[14] + m[4] * m[10] * m[13] + m[8] * m[5] * m[14] - m[8] * m[6] * m[13] - m[12] * m[5] * m[10] + m[12] * m[6] * m[9];
+    c[1] = -m[1] * m[10] * m[15] + m[1] * m[11] * m[14] + m[9] * m[2] * m[15] - m[9] * m[3] * m[14] - m[13] * m[2] * m[11] + m[13] * m[3] * m[10];
+    c[5] = m[0] * m[10] * m[15] - m[0] * m[11] * m[14] - m[8] * m[2] * m[15] + m[8] * m[3] * m[14] + m[12] * m[2] * m[11] - m[12] * m[3] * m[10];
+    c[9] = -m[0] * m[9] * m[15] + m[0] * m[11] * m[13] + m[8] * m[1] * m[15] - m[8] * m[3] * m[13] - m[12] * m[1] * m[11] + m[12] * m[3] * m[9];
+    c[13] = m[0] * m[9] * m[14] - m[0] * m[10] * m[13] - m[8] * m[1] * m[14] + m[8] * m[2] * m[13] + m[12] * m[1] * m[10] - m[12] * m[2] * m[9];
+    c[2] = m[1] * m[6] * m[15] - m[1] * m[7] * m[14] - m[5] * m[2] * m[15] + m[5] * m[3] * m[14] + m[13] * m[2] * m[7] - m[13] * m[3] * m[6];
+    c[6] = -m[0] * m[6] * m[15] + m[0] * m[7] * m[14] + m[4] * m[2] * m[15] - m[4] * m[3] * m[14] - m[12] * m[2] * m[7] + m[12] * m[3] * m[6];
+    c[10] = m[0] * m[5] * m[15] - m[0] * m[7] * m[13] - m[4] * m[1] * m[15] + m[4] * m[3] * m[13] + m[12] * m[1] * m[7] - m[12] * m[3] * m[5];
+    c[14] = -m[0] * m[5] * m[14] + m[0] * m[6] * m[13] + m[4] * m[1] * m[14] - m[4] * m[2] * m[13] - m[12] * m[1] * m[6] + m[12] * m[2] * m[5];
+    c[3] = -m[1] * m[6] * m[11] + m[1] * m[7] * m[10] + m[5] * m[2] * m[11] - m[5] * m[3] * m[10] - m[9] * m[2] * m[7] + m[9] * m[3] * m[6];
+    c[7] = m[0] * m[6] * m[11] - m[0] * m[7] * m[10] - m[4] * m[2] * m[11] + m[4] * m[3] * m[10] + m[8] * m[2] * m[7] - m[8] * m[3] * m[6];
+    c[11] = -m[0] * m[5] * m[11] + m[0] * m[7] * m[9] + m[4] * m[1] * m[11] - m[4] * m[3] * m[9] - m[8] * m[1] * m[7] + m[8] * m[3] * m[5];
+    c[15] = m[0] * m[5] * m[10] - m[0] * m[6] * m[9] - m[4] * m[1] * m[10] + m[4] * m[2] * m[9] + m[8] * m[1] * m[6] - m[8] * m[2] * m[5];
+}
+
+static void Mat4InvScalar(const float *m, float *dest)
+{
+    float c[16];
+    Mat4Cofactors(m, c);
+
+    const float invDet = 1.0f / (m[0] * c[0] + m[1] * c[4] + m[2] * c[8] + m[3] * c[12]);
+    for (int i = 0; i < 16; i++)
+        dest[i] = c[i] * invDet;
+}
+
+static float Mat4DetScalar(const float *m)
+{
+    float c[16];
+    Mat4Cofactors(m, c);
+
+    return m[0] * c[0] + m[1] * c[4] + m[2] * c[8] + m[3] * c[12];
+}
+#pragma endregion
+
+#pragma region cglm
+// cglm selects its SSE2/NEON implementation at compile time, inputs are copied to aligned storage first
+static void Mat4InvGlm(const float *m, float *dest)
+{
+    mat4 matrix;
+    memcpy(matrix, m, sizeof(mat4));
+    glm_mat4_inv(matrix, matrix);
+    memcpy(dest, matrix, sizeof(mat4));
+}
+
+static float Mat4DetGlm(const float *m)
+{
+    mat4 matrix;
+    memcpy(matrix, m, sizeof(mat4));
+    return glm_mat4_det(matrix);
+}
+#pragma endregion
+
+#if SIMD_X86
+#pragma region sse2
+#define SPLAT(v, i) _mm_shuffle_ps((v), (v), _MM_SHUFFLE(i, i, i, i))
+
+static void Mat4MulSse2(const float *a, const float *b, float *dest)
+{
+    const __m128 a0 = _mm_loadu_ps(a + 0);
+    const __m128 a1 = _mm_loadu_ps(a + 4);
+    const __m128 a2 = _mm_loadu_ps(a + 8);
+    const __m128 a3 = _mm_loadu_ps(a + 12);
+
+    __m128 result[4];
+    for (int col = 0; col < 4; col++)
+    {
+        const __m128 bCol = _mm_loadu_ps(b + col * 4);
+        result[col] = _mm_add_ps(
+            _mm_add_ps(_mm_mul_ps(a0, SPLAT(bCol, 0)), _mm_mul_ps(a1, SPLAT(bCol, 1))),
+            _mm_add_ps(_mm_mul_ps(a2, SPLAT(bCol, 2)), _mm_mul_ps(a3, SPLAT(bCol, 3))));
+    }
+
+    for (int col = 0; col < 4; col++)
+        _mm_storeu_ps(dest + col * 4, result[col]);
+}
+
+static void Mat4MulvSse2(const float *m, const float *v, float *dest)
+{
+    const __m128 vec = _mm_loadu_ps(v);
+    const __m128 result = _mm_add_ps(
+        _mm_add_ps(_mm_mul_ps(_mm_loadu_ps(m + 0), SPLAT(vec, 0)), _mm_mul_ps(_mm_loadu_ps(m + 4), SPLAT(vec, 1))),
+        _mm_add_ps(_mm_mul_ps(_mm_loadu_ps(m + 8), SPLAT(vec, 2)), _mm_mul_ps(_mm_loadu_ps(m + 12), SPLAT(vec, 3))));
+
+    _mm_storeu_ps(dest, result);
+}
+#pragma endregion
+
+#pragma region avx
+// processes two result columns per 256-bit register
+TARGET_AVX static void Mat4MulAvx(const float *a, const float *b, float *dest)
+{
+    const __m256 a01 = _mm256_loadu_ps(a);
+    const __m256 a23 = _mm256_loadu_ps(a + 8);
+    const __m256 b01 = _mm256_loadu_ps(b);
+    const __m256 b23 = _mm256_loadu_ps(b + 8);
+
+    const __m256 a0 = _mm256_permute2f128_ps(a01, a01, 0x00);
+    const __m256 a1 = _mm256_permute2f128_ps(a01, a01, 0x11);
+    const __m256 a2 = _mm256_permute2f128_ps(a23, a23, 0x00);
+    const __m256 a3 = _mm256_permute2f128_ps(a23, a23, 0x11);
+
+    const __m256 result01 = _mm256_add_ps(
+        _mm256_add_ps(_mm256_mul_ps(a0, _mm256_permute_ps(b01, 0x00)), _mm256_mul_ps(a1, _mm256_permute_ps(b01, 0x55))),
+        _mm256_add_ps(_mm256_mul_ps(a2, _mm256_permute_ps(b01, 0xAA)), _mm256_mul_ps(a3, _mm256_permute_ps(b01, 0xFF))));
+    const __m256 result23 = _mm256_add_ps(
+        _mm256_add_ps(_mm256_mul_ps(a0, _mm256_permute_ps(b23, 0x00)), _mm256_mul_ps(a1, _mm256_permute_ps(b23, 0x55))),
+        _mm256_add_ps(_mm256_mul_ps(a2, _mm256_permute_ps(b23, 0xAA)), _mm256_mul_ps(a3, _mm256_permute_ps(b23, 0xFF))));
+
+    _mm256_storeu_ps(dest, result01);
+    _mm256_storeu_ps(dest + 8, result23);
+}
+#pragma endregion
+
+static bool CpuSupportsAvx(void)
+{
+#if defined(_MSC_VER)
+    int info[4];
+    __cpuid(info, 1);
+
+    const bool osUsesXsave = (info[2] & (1 << 27)) != 0;
+    const bool cpuHasAvx = (info[2] & (1 << 28)) != 0;
+    if (!osUsesXsave || !cpuHasAvx)
+        return false;
+
+    // OS has to preserve both XMM and YMM state
+    return (_xgetbv(0) & 0x6) == 0x6;
+#elif defined(__GNUC__)
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx");
+#else
+    return false;
+#endif
+}
+#endif
+
+#if SIMD_NEON
+#pragma region neon
+static void Mat4MulNeon(const float *a, const float *b, float *dest)
+{
+    const float32x4_t a0 = vld1q_f32(a + 0);
+    const float32x4_t a1 = vld1q_f32(a + 4);
+    const float32x4_t a2 = vld1q_f32(a + 8);
+    const float32x4_t a3 = vld1q_f32(a + 12);
+
+    float32x4_t result[4];
+    for (int col = 0; col < 4; col++)
+    {
+        float32x4_t r = vmulq_n_f32(a0, b[col * 4 + 0]);
+        r = vmlaq_n_f32(r, a1, b[col * 4 + 1]);
+        r = vmlaq_n_f32(r, a2, b[col * 4 + 2]);
+        result[col] = vmlaq_n_f32(r, a3, b[col * 4 + 3]);
+    }
+
+    for (int col = 0; col < 4; col++)
+        vst1q_f32(dest + col * 4, result[col]);
+}
+
+static void Mat4MulvNeon(const float *m, const float *v, float *dest)
+{
+    float32x4_t r = vmulq_n_f32(vld1q_f32(m + 0), v[0]);
+    r = vmlaq_n_f32(r, vld1q_f32(m + 4), v[1]);
+    r = vmlaq_n_f32(r, vld1q_f32(m + 8), v[2]);
+    r = vmlaq_n_f32(r, vld1q_f32(m + 12), v[3]);
+
+    vst1q_f32(dest, r);
+}
+#pragma endregion
+#endif
+
+PyMathSimdKernels PyMathSimd_Kernels = {
+    .mat4_mul = Mat4MulScalar,
+    .mat4_mulv = Mat4MulvScalar,
+    .mat4_inv = Mat4InvScalar,
+    .mat4_det = Mat4DetScalar,
+};
+
+PyMathSimdLevel PyMathSimd_detect_level(void)
+{
+#if SIMD_X86
+    return CpuSupportsAvx() ? PY_MATH_SIMD_AVX : PY_MATH_SIMD_SSE2;
+#elif SIMD_NEON
+    return PY_MATH_SIMD_NEON;
+#else
+    return PY_MATH_SIMD_SCALAR;
+#endif
+}
+
+bool PyMathSimd_is_level_supported(PyMathSimdLevel level)
+{
+    if (level == PY_MATH_SIMD_SCALAR)
+        return true;
+
+#if SIMD_X86
+    if (level == PY_MATH_SIMD_SSE2)
+        return true;
+    if (level == PY_MATH_SIMD_AVX)
+        return CpuSupportsAvx();
+#elif SIMD_NEON
+    if (level == PY_MATH_SIMD_NEON)
+        return true;
+#endif
+
+    return false;
+}
+
+void PyMathSimd_set_level(PyMathSimdLevel level)
+{
+    PyMathSimd_Kernels = (PyMathSimdKernels){
+        .mat4_mul = Mat4MulScalar,
+        .mat4_mulv = Mat4MulvScalar,
+        .mat4_inv = Mat4InvScalar,
+        .mat4_det = Mat4DetScalar,
+    };
+
+    switch (level)
+    {
+#if SIMD_X86
+    case PY_MATH_SIMD_AVX:
+        PyMathSimd_Kernels.mat4_mul = Mat4MulAvx;
+        PyMathSimd_Kernels.mat4_mulv = Mat4MulvSse2;
+        PyMathSimd_Kernels.mat4_inv = Mat4InvGlm;
+        PyMathSimd_Kernels.mat4_det = Mat4DetGlm;
+        break;
+    case PY_MATH_SIMD_SSE2:
+        PyMathSimd_Kernels.mat4_mul = Mat4MulSse2;
+        PyMathSimd_Kernels.mat4_mulv = Mat4MulvSse2;
+        PyMathSimd_Kernels.mat4_inv = Mat4InvGlm;
+        PyMathSimd_Kernels.mat4_det = Mat4DetGlm;
+        break;
+#elif SIMD_NEON
+    case PY_MATH_SIMD_NEON:
+        PyMathSimd_Kernels.mat4_mul = Mat4MulNeon;
+        PyMathSimd_Kernels.mat4_mulv = Mat4MulvNeon;
+        PyMathSimd_Kernels.mat4_inv = Mat4InvGlm;
+        PyMathSimd_Kernels.mat4_det = Mat4DetGlm;
+        break;
+#endif
+    default:
+        level = PY_MATH_SIMD_SCALAR;
+        break;
+    }
+
+    s_SimdLevel = level;
+}
+
+PyMathSimdLevel PyMathSimd_get_level(void)
+{
+    return s_SimdLevel;
+}
+
+const char *PyMathSimd_get_level_name(PyMathSimdLevel level)
+{
+    switch (level)
+    {
+    case PY_MATH_SIMD_SSE2:
+        return "sse2";
+    case PY_MATH_SIMD_AVX:
+        return "avx";
+    case PY_MATH_SIMD_NEON:
+        return "neon";
+    default:
+        return "scalar";
+    }
+}
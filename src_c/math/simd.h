@@ -0,0 +1,28 @@
+#pragma once
+#include <stdbool.h>
+
+typedef enum
+{
+    PY_MATH_SIMD_SCALAR = 0,
+    PY_MATH_SIMD_SSE2 = 1,
+    PY_MATH_SIMD_AVX = 2,
+    PY_MATH_SIMD_NEON = 3,
+} PyMathSimdLevel;
+
+// 4x4 kernels working on column-major float[16] matrices. Pointers do not have to be aligned
+// and destination may alias any of the inputs.
+typedef struct
+{
+    void (*mat4_mul)(const float *a, const float *b, float *dest);
+    void (*mat4_mulv)(const float *m, const float *v, float *dest);
+    void (*mat4_inv)(const float *m, float *dest);
+    float (*mat4_det)(const float *m);
+} PyMathSimdKernels;
+
+extern PyMathSimdKernels PyMathSimd_Kernels;
+
+PyMathSimdLevel PyMathSimd_detect_level(void);
+bool PyMathSimd_is_level_supported(PyMathSimdLevel level);
+void PyMathSimd_set_level(PyMathSimdLevel level);
+PyMathSimdLevel PyMathSimd_get_level(void);
+const char *PyMathSimd_get_level_name(PyMathSimdLevel level);
@@ -1,6 +1,7 @@
 #pragma once
 #include <cglm/cglm.h>
 #include "../utils.h"
+#include "freeList.h"
 
 typedef struct
 {
@@ -38,3 +39,7 @@ extern PyTypeObject PyVectorIter_Type;
 extern PyTypeObject PyVector2_Type;
 extern PyTypeObject PyVector3_Type;
 extern PyTypeObject PyVector4_Type;
+
+extern PyMathFreeList PyVector2_FreeList;
+extern PyMathFreeList PyVector3_FreeList;
+extern PyMathFreeList PyVector4_FreeList;
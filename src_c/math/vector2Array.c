@@ -0,0 +1,2 @@
+#define VEC_LEN 2
+#include "vectorArrayTemplate.h"
@@ -0,0 +1,2 @@
+#define VEC_LEN 3
+#include "vectorArrayTemplate.h"
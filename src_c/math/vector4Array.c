@@ -0,0 +1,2 @@
+#define VEC_LEN 4
+#include "vectorArrayTemplate.h"
@@ -0,0 +1,679 @@
+// Do not add include guard to this file
+#include "mathArray.h"
+#include "vectorUtils.h"
+#include "simd.h"
+
+#ifndef VEC_LEN
+#error "Vector array template: VEC_LEN not defined"
+#endif
+
+#define PY_ELEMENT_TYPE_NAME MACRO_CONCAT(PyVector, VEC_LEN)
+#define PY_ELEMENT_TYPE_OBJECT_NAME MACRO_CONCAT(PY_ELEMENT_TYPE_NAME, _Type)
+#define PY_TYPE_OBJECT_NAME MACRO_CONCAT(MACRO_CONCAT(PyVector, VEC_LEN), Array_Type)
+// required alignment of wrapped memory, cglm uses aligned SIMD loads for vec4
+#if VEC_LEN == 4
+#define ELEM_ALIGNMENT 16
+#else
+#define ELEM_ALIGNMENT sizeof(float)
+#endif
+
+typedef enum
+{
+    OPERAND_NOT_SUPPORTED = 0,
+    OPERAND_OK = 1,
+    OPERAND_ERROR = -1,
+} OperandResult;
+
+static void InitShape(PyMathArray *self)
+{
+    self->shape[0] = self->length;
+    self->shape[1] = VEC_LEN;
+    self->shape[2] = 0;
+    self->strides[0] = VEC_LEN * sizeof(float);
+    self->strides[1] = sizeof(float);
+    self->strides[2] = 0;
+}
+
+static PyMathArray *CreateArray(Py_ssize_t length)
+{
+    PyMathArray *array = PyMathArray_new(&PY_TYPE_OBJECT_NAME, length, VEC_LEN);
+    if (array != NULL)
+        InitShape(array);
+
+    return array;
+}
+
+// Resolves right hand side operand of element-wise operation. Arrays are used directly,
+// single vectors and scalars are broadcast to every element by using element stride of 0.
+static OperandResult GetOperand(PyMathArray *self, PyObject *other, const float **data, Py_ssize_t *stride, float *scalarStorage)
+{
+    if (PyObject_TypeCheck(other, &PY_TYPE_OBJECT_NAME))
+    {
+        PyMathArray *otherArray = (PyMathArray *)other;
+        if (otherArray->length != self->length)
+        {
+            PyErr_Format(PyExc_ValueError, "Array lengths do not match: %zd and %zd.", self->length, otherArray->length);
+            return OPERAND_ERROR;
+        }
+
+        *data = otherArray->data;
+        *stride = VEC_LEN;
+        return OPERAND_OK;
+    }
+
+    if (PyObject_TypeCheck(other, &PY_ELEMENT_TYPE_OBJECT_NAME))
+    {
+        *data = ((PY_ELEMENT_TYPE_NAME *)other)->data;
+        *stride = 0;
+        return OPERAND_OK;
+    }
+
+    if (PyFloat_Check(other) || PyLong_Check(other))
+    {
+        const float value = (float)PyFloat_AsDouble(other);
+        if (value == -1.0f && PyErr_Occurred())
+            return OPERAND_ERROR;
+
+        for (Py_ssize_t i = 0; i < VEC_LEN; i++)
+            scalarStorage[i] = value;
+
+        *data = scalarStorage;
+        *stride = 0;
+        return OPERAND_OK;
+    }
+
+    return OPERAND_NOT_SUPPORTED;
+}
+
+static void AddKernel(const float *a, const float *b, Py_ssize_t bStride, float *out, Py_ssize_t length)
+{
+    for (Py_ssize_t i = 0; i < length; i++)
+        for (Py_ssize_t j = 0; j < VEC_LEN; j++)
+            out[i * VEC_LEN + j] = a[i * VEC_LEN + j] + b[i * bStride + j];
+}
+
+static void SubtractKernel(const float *a, const float *b, Py_ssize_t bStride, float *out, Py_ssize_t length)
+{
+    for (Py_ssize_t i = 0; i < length; i++)
+        for (Py_ssize_t j = 0; j < VEC_LEN; j++)
+            out[i * VEC_LEN + j] = a[i * VEC_LEN + j] - b[i * bStride + j];
+}
+
+static void MultiplyKernel(const float *a, const float *b, Py_ssize_t bStride, float *out, Py_ssize_t length)
+{
+    for (Py_ssize_t i = 0; i < length; i++)
+        for (Py_ssize_t j = 0; j < VEC_LEN; j++)
+            out[i * VEC_LEN + j] = a[i * VEC_LEN + j] * b[i * bStride + j];
+}
+
+typedef void (*BinaryKernel)(const float *a, const float *b, Py_ssize_t bStride, float *out, Py_ssize_t length);
+
+static PyObject *ApplyBinaryKernel(PyObject *self, PyObject *other, BinaryKernel kernel, bool commutative)
+{
+    if (!PyObject_TypeCheck(self, &PY_TYPE_OBJECT_NAME))
+    {
+        if (!commutative)
+            Py_RETURN_NOTIMPLEMENTED;
+
+        PyObject *tmp = self;
+        self = other;
+        other = tmp;
+    }
+
+    PyMathArray *array = (PyMathArray *)self;
+
+    float scalarStorage[VEC_LEN];
+    const float *otherData;
+    Py_ssize_t otherStride;
+    switch (GetOperand(array, other, &otherData, &otherStride, scalarStorage))
+    {
+    case OPERAND_NOT_SUPPORTED:
+        Py_RETURN_NOTIMPLEMENTED;
+    case OPERAND_ERROR:
+        return NULL;
+    default:
+        break;
+    }
+
+    PyMathArray *result = CreateArray(array->length);
+    if (result == NULL)
+        return NULL;
+
+    kernel(array->data, otherData, otherStride, result->data, array->length);
+    return (PyObject *)result;
+}
+
+static PyObject *ApplyBinaryKernelInplace(PyMathArray *self, PyObject *other, BinaryKernel kernel)
+{
+    float scalarStorage[VEC_LEN];
+    const float *otherData;
+    Py_ssize_t otherStride;
+    switch (GetOperand(self, other, &otherData, &otherStride, scalarStorage))
+    {
+    case OPERAND_NOT_SUPPORTED:
+        Py_RETURN_NOTIMPLEMENTED;
+    case OPERAND_ERROR:
+        return NULL;
+    default:
+        break;
+    }
+
+    kernel(self->data, otherData, otherStride, self->data, self->length);
+    return Py_NewRef(self);
+}
+
+static int InitFromSequence(PyMathArray *self, PyObject *sequence)
+{
+    const Py_ssize_t length = PySequence_Fast_GET_SIZE(sequence);
+    if (PyMathArray_allocate(self, length, VEC_LEN))
+        return -1;
+
+    for (Py_ssize_t i = 0; i < length; i++)
+    {
+        if (PyVector_init_one_arg(self->data + i * VEC_LEN, PySequence_Fast_GET_ITEM(sequence, i), VEC_LEN))
+            return -1;
+    }
+
+    return 0;
+}
+
+static int InitFromBuffer(PyMathArray *self, Py_buffer *buffer)
+{
+    // buffer format and size are already validated by PyMathArray_get_float_buffer
+    if (PyMathArray_allocate(self, buffer->len / (VEC_LEN * sizeof(float)), VEC_LEN))
+        return -1;
+
+    return PyBuffer_ToContiguous(self->data, buffer, buffer->len, 'C');
+}
+
+static int PyVectorArray_init(PyMathArray *self, PyObject *args, PyObject *kwargs)
+{
+    (void)kwargs;
+
+    PyObject *arg;
+    if (!PyArg_ParseTuple(args, "O", &arg))
+        return -1;
+
+    if (PyMathArray_check_uninitialized(self))
+        return -1;
+
+    int result = -1;
+    if (PyLong_Check(arg))
+    {
+        const Py_ssize_t length = PyLong_AsSsize_t(arg);
+        if (length == -1 && PyErr_Occurred())
+            return -1;
+
+        result = PyMathArray_allocate(self, length, VEC_LEN);
+    }
+    else if (PyObject_CheckBuffer(arg))
+    {
+        Py_buffer buffer = {0};
+        if (PyMathArray_get_float_buffer(arg, &buffer, PyBUF_SIMPLE, VEC_LEN, "source"))
+            return -1;
+
+        result = InitFromBuffer(self, &buffer);
+        PyBuffer_Release(&buffer);
+    }
+    else
+    {
+        PyObject *sequence = PySequence_Fast(arg, "");
+        if (sequence == NULL)
+        {
+            PyErr_Format(PyExc_TypeError, "Expected argument to be either int, t.Sequence[Vector%d] or support buffer protocol, got: %s.", VEC_LEN, Py_TYPE(arg)->tp_name);
+            return -1;
+        }
+
+        result = InitFromSequence(self, sequence);
+        Py_DECREF(sequence);
+    }
+
+    InitShape(self);
+    return result;
+}
+
+static void PyVectorArray_dealloc(PyMathArray *self)
+{
+    PyMathArray_release(self);
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject *PyVectorArray_repr(PyMathArray *self)
+{
+    return PyUnicode_FromFormat("<%s (length: %zd) at %p>", Py_TYPE(self)->tp_name, self->length, (void *)self);
+}
+
+#pragma region tp_as_buffer
+static int PyVectorArray_bf_getbuffer(PyMathArray *self, Py_buffer *view, int flags)
+{
+    *view = (Py_buffer){
+        .obj = Py_NewRef(self),
+        .buf = self->data,
+        .len = self->length * VEC_LEN * sizeof(float),
+        .itemsize = sizeof(float),
+        .ndim = 2,
+        .readonly = 0,
+        .format = FLAG_IS_SET(flags, PyBUF_FORMAT) ? "f" : NULL,
+        .shape = FLAG_IS_SET(flags, PyBUF_ND) ? self->shape : NULL,
+        .strides = FLAG_IS_SET(flags, PyBUF_STRIDES) ? self->strides : NULL,
+    };
+
+    return 0;
+}
+#pragma endregion
+
+#pragma region tp_as_mapping
+static Py_ssize_t PyVectorArray_mp_length(PyMathArray *self)
+{
+    return self->length;
+}
+
+static PyObject *PyVectorArray_sq_item(PyMathArray *self, Py_ssize_t idx)
+{
+    if (idx < 0 || idx >= self->length)
+    {
+        PyErr_Format(PyExc_IndexError, "Index outside of bounds for %s of length %zd.", Py_TYPE(self)->tp_name, self->length);
+        return NULL;
+    }
+
+    PY_ELEMENT_TYPE_NAME *element = (PY_ELEMENT_TYPE_NAME *)PyMathFreeList_alloc(&MACRO_CONCAT(PY_ELEMENT_TYPE_NAME, _FreeList), &PY_ELEMENT_TYPE_OBJECT_NAME);
+    if (element == NULL)
+        return NULL;
+
+    memcpy(element->data, self->data + idx * VEC_LEN, VEC_LEN * sizeof(float));
+    return (PyObject *)element;
+}
+
+static PyObject *PyVectorArray_mp_subscript(PyMathArray *self, PyObject *index)
+{
+    if (PySlice_Check(index))
+    {
+        Py_ssize_t start, length;
+        if (PyMathArray_get_slice(self, index, &start, &length))
+            return NULL;
+
+        return (PyObject *)PyMathArray_new_view(self, start, length, VEC_LEN);
+    }
+
+    const Py_ssize_t idx = PyMathArray_get_index(self, index);
+    if (idx == -1)
+        return NULL;
+
+    return PyVectorArray_sq_item(self, idx);
+}
+
+static int PyVectorArray_mp_ass_subscript(PyMathArray *self, PyObject *index, PyObject *value)
+{
+    if (value == NULL)
+    {
+        PyErr_Format(PyExc_RuntimeError, "%s does not support item deletion.", Py_TYPE(self)->tp_name);
+        return -1;
+    }
+
+    if (PySlice_Check(index))
+    {
+        Py_ssize_t start, length;
+        if (PyMathArray_get_slice(self, index, &start, &length))
+            return -1;
+
+        Py_buffer buffer = {0};
+        if (PyMathArray_get_float_buffer(value, &buffer, PyBUF_SIMPLE, VEC_LEN, "assigned"))
+            return -1;
+
+        if (buffer.len != (Py_ssize_t)(length * VEC_LEN * sizeof(float)))
+        {
+            PyErr_Format(PyExc_ValueError, "Expected %zd bytes of data for slice assignment, got: %zd.", length * VEC_LEN * sizeof(float), buffer.len);
+            PyBuffer_Release(&buffer);
+            return -1;
+        }
+
+        // memmove, source might be a view into the same array
+        memmove(self->data + start * VEC_LEN, buffer.buf, buffer.len);
+        PyBuffer_Release(&buffer);
+
+        return 0;
+    }
+
+    const Py_ssize_t idx = PyMathArray_get_index(self, index);
+    if (idx == -1)
+        return -1;
+
+    return PyVector_init_one_arg(self->data + idx * VEC_LEN, value, VEC_LEN);
+}
+#pragma endregion
+
+#pragma region tp_as_number
+static PyObject *PyVectorArray_nb_add(PyObject *self, PyObject *other)
+{
+    return ApplyBinaryKernel(self, other, AddKernel, true);
+}
+
+static PyObject *PyVectorArray_nb_inplace_add(PyMathArray *self, PyObject *other)
+{
+    return ApplyBinaryKernelInplace(self, other, AddKernel);
+}
+
+static PyObject *PyVectorArray_nb_subtract(PyObject *self, PyObject *other)
+{
+    return ApplyBinaryKernel(self, other, SubtractKernel, false);
+}
+
+static PyObject *PyVectorArray_nb_inplace_subtract(PyMathArray *self, PyObject *other)
+{
+    return ApplyBinaryKernelInplace(self, other, SubtractKernel);
+}
+
+static PyObject *PyVectorArray_nb_multiply(PyObject *self, PyObject *other)
+{
+    return ApplyBinaryKernel(self, other, MultiplyKernel, true);
+}
+
+static PyObject *PyVectorArray_nb_inplace_multiply(PyMathArray *self, PyObject *other)
+{
+    return ApplyBinaryKernelInplace(self, other, MultiplyKernel);
+}
+
+#if VEC_LEN == 4
+// Matrix4 @ Vector4Array transforms every vector by the same matrix, Matrix4Array @ Vector4Array transforms element-wise
+static PyObject *PyVectorArray_nb_matrix_multiply(PyObject *matrix, PyObject *self)
+{
+    if (!PyObject_TypeCheck(self, &PY_TYPE_OBJECT_NAME))
+        Py_RETURN_NOTIMPLEMENTED;
+
+    PyMathArray *vectors = (PyMathArray *)self;
+    const float *matrixData;
+    Py_ssize_t matrixStride;
+
+    if (PyObject_TypeCheck(matrix, &PyMatrix4_Type))
+    {
+        matrixData = &((PyMatrix4 *)matrix)->data[0][0];
+        matrixStride = 0;
+    }
+    else if (PyObject_TypeCheck(matrix, &PyMatrix4Array_Type))
+    {
+        PyMathArray *matrices = (PyMathArray *)matrix;
+        if (matrices->length != vectors->length)
+        {
+            PyErr_Format(PyExc_ValueError, "Array lengths do not match: %zd and %zd.", matrices->length, vectors->length);
+            return NULL;
+        }
+
+        matrixData = matrices->data;
+        matrixStride = 16;
+    }
+    else
+        Py_RETURN_NOTIMPLEMENTED;
+
+    PyMathArray *result = CreateArray(vectors->length);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < vectors->length; i++)
+        PyMathSimd_Kernels.mat4_mulv(matrixData + i * matrixStride, vectors->data + i * VEC_LEN, result->data + i * VEC_LEN);
+
+    return (PyObject *)result;
+}
+#endif
+
+static PyObject *PyVectorArray_nb_negative(PyMathArray *self)
+{
+    PyMathArray *result = CreateArray(self->length);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < self->length * VEC_LEN; i++)
+        result->data[i] = -self->data[i];
+
+    return (PyObject *)result;
+}
+#pragma endregion
+
+static PyObject *PyVectorArray_dot(PyMathArray *self, PyObject *other)
+{
+    float scalarStorage[VEC_LEN];
+    const float *otherData;
+    Py_ssize_t otherStride;
+    switch (GetOperand(self, other, &otherData, &otherStride, scalarStorage))
+    {
+    case OPERAND_NOT_SUPPORTED:
+        PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s or %s, got: %s.", PY_TYPE_OBJECT_NAME.tp_name, PY_ELEMENT_TYPE_OBJECT_NAME.tp_name, Py_TYPE(other)->tp_name);
+        return NULL;
+    case OPERAND_ERROR:
+        return NULL;
+    default:
+        break;
+    }
+
+    float *resultData;
+    PyObject *result = PyMathArray_create_float_view(self->length, &resultData);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < self->length; i++)
+    {
+        float dot = 0.0f;
+        for (Py_ssize_t j = 0; j < VEC_LEN; j++)
+            dot += self->data[i * VEC_LEN + j] * otherData[i * otherStride + j];
+
+        resultData[i] = dot;
+    }
+
+    return result;
+}
+
+#if VEC_LEN == 3
+static PyObject *PyVectorArray_cross(PyMathArray *self, PyObject *other)
+{
+    float scalarStorage[VEC_LEN];
+    const float *b;
+    Py_ssize_t bStride;
+    if (!PyObject_TypeCheck(other, &PY_TYPE_OBJECT_NAME) && !PyObject_TypeCheck(other, &PY_ELEMENT_TYPE_OBJECT_NAME))
+    {
+        PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s or %s, got: %s.", PY_TYPE_OBJECT_NAME.tp_name, PY_ELEMENT_TYPE_OBJECT_NAME.tp_name, Py_TYPE(other)->tp_name);
+        return NULL;
+    }
+
+    if (GetOperand(self, other, &b, &bStride, scalarStorage) != OPERAND_OK)
+        return NULL;
+
+    PyMathArray *result = CreateArray(self->length);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < self->length; i++)
+    {
+        const float *a = self->data + i * 3;
+        const float *bi = b + i * bStride;
+        float *out = result->data + i * 3;
+
+        out[0] = a[1] * bi[2] - a[2] * bi[1];
+        out[1] = a[2] * bi[0] - a[0] * bi[2];
+        out[2] = a[0] * bi[1] - a[1] * bi[0];
+    }
+
+    return (PyObject *)result;
+}
+#endif
+
+static PyObject *CalculateLengths(PyMathArray *self, bool squared)
+{
+    float *resultData;
+    PyObject *result = PyMathArray_create_float_view(self->length, &resultData);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < self->length; i++)
+    {
+        float length = 0.0f;
+        for (Py_ssize_t j = 0; j < VEC_LEN; j++)
+            length += self->data[i * VEC_LEN + j] * self->data[i * VEC_LEN + j];
+
+        resultData[i] = squared ? length : sqrtf(length);
+    }
+
+    return result;
+}
+
+static PyObject *PyVectorArray_length(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+    return CalculateLengths(self, false);
+}
+
+static PyObject *PyVectorArray_length_squared(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+    return CalculateLengths(self, true);
+}
+
+static void NormalizeKernel(const float *data, float *out, Py_ssize_t length)
+{
+    for (Py_ssize_t i = 0; i < length; i++)
+    {
+        float lengthSquared = 0.0f;
+        for (Py_ssize_t j = 0; j < VEC_LEN; j++)
+            lengthSquared += data[i * VEC_LEN + j] * data[i * VEC_LEN + j];
+
+        // follow cglm behaviour and zero out vectors that cannot be normalized
+        const float invLength = lengthSquared < FLT_EPSILON ? 0.0f : 1.0f / sqrtf(lengthSquared);
+        for (Py_ssize_t j = 0; j < VEC_LEN; j++)
+            out[i * VEC_LEN + j] = data[i * VEC_LEN + j] * invLength;
+    }
+}
+
+static PyObject *PyVectorArray_normalize(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+    NormalizeKernel(self->data, self->data, self->length);
+    Py_RETURN_NONE;
+}
+
+static PyObject *PyVectorArray_normalized(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+
+    PyMathArray *result = CreateArray(self->length);
+    if (result == NULL)
+        return NULL;
+
+    NormalizeKernel(self->data, result->data, self->length);
+    return (PyObject *)result;
+}
+
+static PyObject *PyVectorArray_interpolate(PyMathArray *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyObject *other;
+    float t;
+    if (!_PyArg_ParseStack(args, nArgs, "Of", &other, &t))
+        return NULL;
+
+    float scalarStorage[VEC_LEN];
+    const float *otherData;
+    Py_ssize_t otherStride;
+    switch (GetOperand(self, other, &otherData, &otherStride, scalarStorage))
+    {
+    case OPERAND_NOT_SUPPORTED:
+        PyErr_Format(PyExc_TypeError, "Expected argument to be of type %s or %s, got: %s.", PY_TYPE_OBJECT_NAME.tp_name, PY_ELEMENT_TYPE_OBJECT_NAME.tp_name, Py_TYPE(other)->tp_name);
+        return NULL;
+    case OPERAND_ERROR:
+        return NULL;
+    default:
+        break;
+    }
+
+    PyMathArray *result = CreateArray(self->length);
+    if (result == NULL)
+        return NULL;
+
+    for (Py_ssize_t i = 0; i < self->length; i++)
+    {
+        for (Py_ssize_t j = 0; j < VEC_LEN; j++)
+        {
+            const float from = self->data[i * VEC_LEN + j];
+            result->data[i * VEC_LEN + j] = from + (otherData[i * otherStride + j] - from) * t;
+        }
+    }
+
+    return (PyObject *)result;
+}
+
+static PyObject *PyVectorArray_from_buffer(PyTypeObject *cls, PyObject *obj)
+{
+    PyMathArray *array = PyMathArray_new_wrapper(cls, obj, VEC_LEN, ELEM_ALIGNMENT);
+    if (array != NULL)
+        InitShape(array);
+
+    return (PyObject *)array;
+}
+
+static PyObject *PyVectorArray_get_array_interface(PyMathArray *self, void *closure)
+{
+    (void)closure;
+    return PyMathArray_create_array_interface(self->data, 2, self->shape, self->strides);
+}
+
+static PyObject *PyVectorArray_copy(PyMathArray *self, PyObject *args)
+{
+    (void)args;
+
+    PyMathArray *result = CreateArray(self->length);
+    if (result == NULL)
+        return NULL;
+
+    memcpy(result->data, self->data, self->length * VEC_LEN * sizeof(float));
+    return (PyObject *)result;
+}
+
+PyTypeObject PY_TYPE_OBJECT_NAME = {
+    PY_VAR_OBJECT_HEAD_INIT(NULL, 0),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_basicsize = sizeof(PyMathArray),
+    .tp_name = "spyke.math.Vector" MACRO_STRINGIFY(VEC_LEN) "Array",
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)PyVectorArray_init,
+    .tp_dealloc = (destructor)PyVectorArray_dealloc,
+    .tp_repr = (reprfunc)PyVectorArray_repr,
+    .tp_as_buffer = &(PyBufferProcs){
+        .bf_getbuffer = (getbufferproc)PyVectorArray_bf_getbuffer,
+        .bf_releasebuffer = NULL,
+    },
+    .tp_as_sequence = &(PySequenceMethods){
+        .sq_length = (lenfunc)PyVectorArray_mp_length,
+        .sq_item = (ssizeargfunc)PyVectorArray_sq_item,
+    },
+    .tp_as_mapping = &(PyMappingMethods){
+        .mp_length = (lenfunc)PyVectorArray_mp_length,
+        .mp_subscript = (binaryfunc)PyVectorArray_mp_subscript,
+        .mp_ass_subscript = (objobjargproc)PyVectorArray_mp_ass_subscript,
+    },
+    .tp_as_number = &(PyNumberMethods){
+        .nb_add = (binaryfunc)PyVectorArray_nb_add,
+        .nb_inplace_add = (binaryfunc)PyVectorArray_nb_inplace_add,
+        .nb_subtract = (binaryfunc)PyVectorArray_nb_subtract,
+        .nb_inplace_subtract = (binaryfunc)PyVectorArray_nb_inplace_subtract,
+        .nb_multiply = (binaryfunc)PyVectorArray_nb_multiply,
+        .nb_inplace_multiply = (binaryfunc)PyVectorArray_nb_inplace_multiply,
+        .nb_negative = (unaryfunc)PyVectorArray_nb_negative,
+#if VEC_LEN == 4
+        .nb_matrix_multiply = (binaryfunc)PyVectorArray_nb_matrix_multiply,
+#endif
+    },
+    .tp_getset = (PyGetSetDef[]){
+        {"__array_interface__", (getter)PyVectorArray_get_array_interface, NULL, NULL, NULL},
+        {0},
+    },
+    .tp_methods = (PyMethodDef[]){
+        {"from_buffer", (PyCFunction)PyVectorArray_from_buffer, METH_O | METH_CLASS, NULL},
+        {"dot", (PyCFunction)PyVectorArray_dot, METH_O, NULL},
+#if VEC_LEN == 3
+        {"cross", (PyCFunction)PyVectorArray_cross, METH_O, NULL},
+#endif
+        {"length", (PyCFunction)PyVectorArray_length, METH_NOARGS, NULL},
+        {"length_squared", (PyCFunction)PyVectorArray_length_squared, METH_NOARGS, NULL},
+        {"normalize", (PyCFunction)PyVectorArray_normalize, METH_NOARGS, NULL},
+        {"normalized", (PyCFunction)PyVectorArray_normalized, METH_NOARGS, NULL},
+        {"interpolate", (PyCFunction)PyVectorArray_interpolate, METH_FASTCALL, NULL},
+        {"copy", (PyCFunction)PyVectorArray_copy, METH_NOARGS, NULL},
+        {0},
+    },
+};
@@ -1,6 +1,7 @@
 // Do not add include guard to this file
 #include "vector.h"
 #include "vectorUtils.h"
+#include "mathArray.h"
 
 #ifndef VEC_LEN
 #error "Vector template: VEC_LEN not defined"
@@ -16,11 +17,20 @@
 #define VECTOR_STR_FUNC MACRO_CONCAT(MACRO_CONCAT(PyVector, VEC_LEN), _str)
 #define VECTOR_RICH_COMPARE_FUNC MACRO_CONCAT(MACRO_CONCAT(PyVector, VEC_LEN), _richcompare)
 #define VECTOR_CHECK_ZERO MACRO_CONCAT(MACRO_CONCAT(PyVector, VEC_LEN), _check_zero)
+#define FREE_LIST_NAME MACRO_CONCAT(PY_TYPE_NAME, _FreeList)
+#define NEW_OBJECT(type) ((PY_TYPE_NAME *)PyMathFreeList_alloc(&FREE_LIST_NAME, (type)))
 
 static PyObject *VECTOR_STR_FUNC(PY_TYPE_NAME *self);
 static bool VECTOR_CHECK_ZERO(PY_TYPE_NAME *self);
 static int VECTOR_INIT_MULTI_ARGS_FUNC(PY_TYPE_NAME *self, PyObject *args);
 
+// Clears error set by failed float conversion so other operand gets a chance to handle the operation
+static PY_TYPE_NAME *ReturnNotImplemented(void)
+{
+    PyErr_Clear();
+    return (PY_TYPE_NAME *)Py_NewRef(Py_NotImplemented);
+}
+
 static float GetVectorLengthSquared(PY_TYPE_NAME *self)
 {
     float length = 0.0f;
@@ -41,6 +51,24 @@ static bool CheckTypeSelf(PyObject *other)
     return true;
 }
 
+PyMathFreeList FREE_LIST_NAME = {.type = &PY_TYPE_OBJECT_NAME};
+
+static PyObject *PyVector_alloc(PyTypeObject *type, Py_ssize_t nItems)
+{
+    (void)nItems;
+
+    PY_TYPE_NAME *new = NEW_OBJECT(type);
+    if (new != NULL)
+        memset(&new->data, 0, sizeof(new->data));
+
+    return (PyObject *)new;
+}
+
+static void PyVector_dealloc(PyObject *self)
+{
+    PyMathFreeList_free(&FREE_LIST_NAME, self);
+}
+
 static int PyVector_init(_PyVectorAbstract *self, PyObject *args, PyObject *kwargs)
 {
     (void)kwargs;
@@ -60,6 +88,10 @@ static int PyVector_init(_PyVectorAbstract *self, PyObject *args, PyObject *kwar
 #pragma region tp_as_buffer
 static int PyVector_bf_getbuffer(PY_TYPE_NAME *self, Py_buffer *view, int flags)
 {
+    // shape and strides have to outlive this call, so they cannot be compound literals
+    static Py_ssize_t shape[] = {VEC_LEN};
+    static Py_ssize_t strides[] = {sizeof(float)};
+
     *view = (Py_buffer){
         .obj = Py_NewRef(self),
         .buf = &self->data[0],
@@ -68,8 +100,8 @@ static int PyVector_bf_getbuffer(PY_TYPE_NAME *self, Py_buffer *view, int flags)
         .ndim = 1,
         .readonly = !FLAG_IS_SET(flags, PyBUF_WRITABLE),
         .format = FLAG_IS_SET(flags, PyBUF_FORMAT) ? "f" : NULL,
-        .shape = FLAG_IS_SET(flags, PyBUF_ND) ? (Py_ssize_t[]){VEC_LEN} : NULL,
-        .strides = FLAG_IS_SET(flags, PyBUF_STRIDES) ? (Py_ssize_t[]){sizeof(float)} : NULL,
+        .shape = FLAG_IS_SET(flags, PyBUF_ND) ? shape : NULL,
+        .strides = FLAG_IS_SET(flags, PyBUF_STRIDES) ? strides : NULL,
     };
 
     return 0;
@@ -125,7 +157,7 @@ static int PyVector_sq_ass_item(PY_TYPE_NAME *self, Py_ssize_t idx, PyObject *va
 #pragma region tp_as_number
 static PY_TYPE_NAME *PyVector_nb_add(PY_TYPE_NAME *self, PyObject *other)
 {
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
 
     if (PyObject_IsInstance(other, (PyObject *)&PY_TYPE_OBJECT_NAME))
     {
@@ -137,7 +169,7 @@ static PY_TYPE_NAME *PyVector_nb_add(PY_TYPE_NAME *self, PyObject *other)
     if (otherFloat == NULL)
     {
         Py_DECREF(new);
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
     }
 
     GLM_CALL_FUNC(adds, self->data, (float)PyFloat_AS_DOUBLE(otherFloat), new->data);
@@ -155,7 +187,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_add(PY_TYPE_NAME *self, PyObject *other
 
     PyObject *otherFloat = PyNumber_Float(other);
     if (otherFloat == NULL)
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
 
     GLM_CALL_FUNC(adds, self->data, (float)PyFloat_AS_DOUBLE(otherFloat), self->data);
     Py_DECREF(otherFloat);
@@ -164,7 +196,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_add(PY_TYPE_NAME *self, PyObject *other
 
 static PY_TYPE_NAME *PyVector_nb_subtract(PY_TYPE_NAME *self, PyObject *other)
 {
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
 
     if (PyObject_IsInstance(other, (PyObject *)&PY_TYPE_OBJECT_NAME))
     {
@@ -176,7 +208,7 @@ static PY_TYPE_NAME *PyVector_nb_subtract(PY_TYPE_NAME *self, PyObject *other)
     if (otherFloat == NULL)
     {
         Py_DECREF(new);
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
     }
 
     GLM_CALL_FUNC(subs, self->data, (float)PyFloat_AS_DOUBLE(otherFloat), new->data);
@@ -194,7 +226,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_subtract(PY_TYPE_NAME *self, PyObject *
 
     PyObject *otherFloat = PyNumber_Float(other);
     if (otherFloat == NULL)
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
 
     GLM_CALL_FUNC(subs, self->data, (float)PyFloat_AS_DOUBLE(otherFloat), self->data);
     Py_DECREF(otherFloat);
@@ -203,7 +235,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_subtract(PY_TYPE_NAME *self, PyObject *
 
 static PY_TYPE_NAME *PyVector_nb_multiply(PY_TYPE_NAME *self, PyObject *other)
 {
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
 
     if (PyObject_IsInstance(other, (PyObject *)&PY_TYPE_OBJECT_NAME))
     {
@@ -215,7 +247,7 @@ static PY_TYPE_NAME *PyVector_nb_multiply(PY_TYPE_NAME *self, PyObject *other)
     if (otherFloat == NULL)
     {
         Py_DECREF(new);
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
     }
 
     GLM_CALL_FUNC(scale, self->data, (float)PyFloat_AS_DOUBLE(otherFloat), new->data);
@@ -233,7 +265,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_multiply(PY_TYPE_NAME *self, PyObject *
 
     PyObject *otherFloat = PyNumber_Float(other);
     if (otherFloat == NULL)
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
 
     GLM_CALL_FUNC(scale, self->data, (float)PyFloat_AS_DOUBLE(otherFloat), self->data);
     Py_DECREF(otherFloat);
@@ -242,7 +274,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_multiply(PY_TYPE_NAME *self, PyObject *
 
 static PY_TYPE_NAME *PyVector_nb_true_divide(PY_TYPE_NAME *self, PyObject *other)
 {
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
 
     if (PyObject_IsInstance(other, (PyObject *)&PY_TYPE_OBJECT_NAME))
     {
@@ -260,7 +292,7 @@ static PY_TYPE_NAME *PyVector_nb_true_divide(PY_TYPE_NAME *self, PyObject *other
     if (other == NULL)
     {
         Py_DECREF(new);
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
     }
 
     float value = (float)PyFloat_AS_DOUBLE(other);
@@ -292,7 +324,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_true_divide(PY_TYPE_NAME *self, PyObjec
 
     other = PyNumber_Float(other);
     if (other == NULL)
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
 
     float value = (float)PyFloat_AS_DOUBLE(other);
     if (value == 0.0f)
@@ -309,7 +341,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_true_divide(PY_TYPE_NAME *self, PyObjec
 
 static PY_TYPE_NAME *PyVector_nb_remainder(PY_TYPE_NAME *self, PyObject *other)
 {
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
 
     if (PyObject_IsInstance(other, (PyObject *)&PY_TYPE_OBJECT_NAME))
     {
@@ -329,7 +361,7 @@ static PY_TYPE_NAME *PyVector_nb_remainder(PY_TYPE_NAME *self, PyObject *other)
     if (other == NULL)
     {
         Py_DECREF(new);
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
     }
 
     float value = (float)PyFloat_AS_DOUBLE(other);
@@ -365,7 +397,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_remainder(PY_TYPE_NAME *self, PyObject
 
     other = PyNumber_Float(other);
     if (other == NULL)
-        return (PY_TYPE_NAME *)&_Py_NotImplementedStruct;
+        return ReturnNotImplemented();
 
     float value = (float)PyFloat_AS_DOUBLE(other);
     if (value == 0.0f)
@@ -384,7 +416,7 @@ static PY_TYPE_NAME *PyVector_nb_inplace_remainder(PY_TYPE_NAME *self, PyObject
 
 static PY_TYPE_NAME *PyVector_nb_negative(PY_TYPE_NAME *self)
 {
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
     GLM_CALL_FUNC(negate_to, self->data, new->data);
     return new;
 }
@@ -412,7 +444,7 @@ static PyObject *PyVector_cross(PY_TYPE_NAME *self, PY_TYPE_NAME *other)
 #if VEC_LEN == 2
     return PyFloat_FromDouble((double)GLM_CALL_FUNC(cross, self->data, other->data));
 #else
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
     GLM_CALL_FUNC(cross, self->data, other->data, new->data);
 
     return (PyObject *)new;
@@ -477,7 +509,7 @@ static PyObject *PyVector_normalize(PY_TYPE_NAME *self, PyObject *args)
 static PY_TYPE_NAME *PyVector_normalized(PY_TYPE_NAME *self, PyObject *args)
 {
     (void)args;
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
     GLM_CALL_FUNC(normalize_to, self->data, new->data);
 
     return new;
@@ -490,18 +522,88 @@ static PY_TYPE_NAME *PyVector_interpolate(PY_TYPE_NAME *self, PyObject *const *a
     if (!_PyArg_ParseStack(args, nArgs, "O!f", &PY_TYPE_OBJECT_NAME, &other, &t))
         return NULL;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, &PY_TYPE_OBJECT_NAME);
+    PY_TYPE_NAME *new = NEW_OBJECT(&PY_TYPE_OBJECT_NAME);
     GLM_CALL_FUNC(lerp, self->data, other->data, t, new->data);
 
     return new;
 }
 
+static PY_TYPE_NAME *PyVector_from_array(PyTypeObject *cls, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyObject *arrayObj;
+    Py_ssize_t index;
+    if (!_PyArg_ParseStack(args, nArgs, "On", &arrayObj, &index))
+        return NULL;
+
+    Py_buffer buffer = {0};
+    float *element;
+    if (PyMathArray_get_element(arrayObj, &buffer, PyBUF_SIMPLE, index, VEC_LEN, &element))
+        return NULL;
+
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
+    if (new != NULL)
+        memcpy(new->data, element, sizeof(GLM_TYPE_NAME));
+
+    PyBuffer_Release(&buffer);
+    return new;
+}
+
+static PyObject *PyVector_write_to(PY_TYPE_NAME *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PyObject *arrayObj;
+    Py_ssize_t index;
+    if (!_PyArg_ParseStack(args, nArgs, "On", &arrayObj, &index))
+        return NULL;
+
+    Py_buffer buffer = {0};
+    float *element;
+    if (PyMathArray_get_element(arrayObj, &buffer, PyBUF_WRITABLE, index, VEC_LEN, &element))
+        return NULL;
+
+    memcpy(element, self->data, sizeof(GLM_TYPE_NAME));
+    PyBuffer_Release(&buffer);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *PyVector_get_array_interface(PY_TYPE_NAME *self, void *closure)
+{
+    (void)closure;
+    return PyMathArray_create_array_interface(self->data, 1, (Py_ssize_t[]){VEC_LEN}, (Py_ssize_t[]){sizeof(float)});
+}
+
+static PyObject *PyVector_fma(PY_TYPE_NAME *self, PyObject *const *args, Py_ssize_t nArgs)
+{
+    PY_TYPE_NAME *a, *b;
+    float scalar;
+
+    if (nArgs == 2)
+    {
+        // self += a * scalar
+        if (!_PyArg_ParseStack(args, nArgs, "O!f", &PY_TYPE_OBJECT_NAME, &a, &scalar))
+            return NULL;
+
+        GLM_CALL_FUNC(muladds, a->data, scalar, self->data);
+        Py_RETURN_NONE;
+    }
+
+    // self = a + b * scalar
+    if (!_PyArg_ParseStack(args, nArgs, "O!O!f", &PY_TYPE_OBJECT_NAME, &a, &PY_TYPE_OBJECT_NAME, &b, &scalar))
+        return NULL;
+
+    GLM_TYPE_NAME result;
+    GLM_CALL_FUNC(copy, a->data, result);
+    GLM_CALL_FUNC(muladds, b->data, scalar, result);
+    GLM_CALL_FUNC(copy, result, self->data);
+
+    Py_RETURN_NONE;
+}
+
 static PY_TYPE_NAME *PyVector_one(PyTypeObject *cls, PyObject *args)
 {
     (void)args;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
 
     GLM_CALL_FUNC(one, new->data);
 
@@ -512,8 +614,7 @@ static PY_TYPE_NAME *PyVector_zero(PyTypeObject *cls, PyObject *args)
 {
     (void)args;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
 
     GLM_CALL_FUNC(zero, new->data);
 
@@ -524,8 +625,7 @@ static PY_TYPE_NAME *PyVector_unit_x(PyTypeObject *cls, PyObject *args)
 {
     (void)args;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
     GLM_CALL_FUNC(zero, new->data);
     new->data[0] = 1.0f;
 
@@ -536,8 +636,7 @@ static PY_TYPE_NAME *PyVector_unit_y(PyTypeObject *cls, PyObject *args)
 {
     (void)args;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
     GLM_CALL_FUNC(zero, new->data);
     new->data[1] = 1.0f;
 
@@ -549,8 +648,7 @@ static PY_TYPE_NAME *PyVector_unit_z(PyTypeObject *cls, PyObject *args)
 {
     (void)args;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
     GLM_CALL_FUNC(zero, new->data);
     new->data[2] = 1.0f;
 
@@ -563,8 +661,7 @@ static PY_TYPE_NAME *PyVector_unit_w(PyTypeObject *cls, PyObject *args)
 {
     (void)args;
 
-    PY_TYPE_NAME *new = PyObject_New(PY_TYPE_NAME, cls);
-    new = (PY_TYPE_NAME *)PyObject_Init((PyObject *)new, cls);
+    PY_TYPE_NAME *new = NEW_OBJECT(cls);
     GLM_CALL_FUNC(zero, new->data);
     new->data[3] = 1.0f;
 
@@ -604,6 +701,8 @@ PyTypeObject PY_TYPE_OBJECT_NAME = {
     .tp_basicsize = sizeof(PY_TYPE_NAME),
     .tp_name = MACRO_CONCAT("spyke.math.Vector", MACRO_STRINGIFY(VEC_LEN)),
     .tp_new = PyType_GenericNew,
+    .tp_alloc = PyVector_alloc,
+    .tp_dealloc = PyVector_dealloc,
     .tp_init = (initproc)PyVector_init,
     .tp_str = (reprfunc)VECTOR_STR_FUNC,
     .tp_richcompare = (richcmpfunc)PyVector_richcompare,
@@ -641,8 +740,14 @@ PyTypeObject PY_TYPE_OBJECT_NAME = {
 #endif
         {0},
     },
+    .tp_getset = (PyGetSetDef[]){
+        {"__array_interface__", (getter)PyVector_get_array_interface, NULL, NULL, NULL},
+        {0},
+    },
     .tp_methods = (PyMethodDef[]){
         {"one", (PyCFunction)PyVector_one, METH_NOARGS | METH_CLASS, NULL},
+        {"from_array", (PyCFunction)PyVector_from_array, METH_FASTCALL | METH_CLASS, NULL},
+        {"write_to", (PyCFunction)PyVector_write_to, METH_FASTCALL, NULL},
         {"zero", (PyCFunction)PyVector_zero, METH_NOARGS | METH_CLASS, NULL},
         {"unit_x", (PyCFunction)PyVector_unit_x, METH_NOARGS | METH_CLASS, NULL},
         {"unit_y", (PyCFunction)PyVector_unit_y, METH_NOARGS | METH_CLASS, NULL},
@@ -663,6 +768,7 @@ PyTypeObject PY_TYPE_OBJECT_NAME = {
         {"normalize", (PyCFunction)PyVector_normalize, METH_NOARGS, NULL},
         {"normalized", (PyCFunction)PyVector_normalized, METH_NOARGS, NULL},
         {"interpolate", (PyCFunction)PyVector_interpolate, METH_FASTCALL, NULL},
+        {"fma", (PyCFunction)PyVector_fma, METH_FASTCALL, NULL},
 #if VEC_LEN != 4
         {"cross", (PyCFunction)PyVector_cross, METH_O, NULL},
 #endif
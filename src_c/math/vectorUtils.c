@@ -75,3 +75,26 @@ int PyVector_init_one_arg(float *data, PyObject *arg, Py_ssize_t vectorLength)
     PyErr_Format(PyExc_TypeError, "Expected argument to be either float, t.Sequence[float] or support buffer protocol, got: %s.", Py_TYPE(arg)->tp_name);
     return -1;
 }
+
+PyVector3 *PyVector3_new(const float *data)
+{
+    PyVector3 *new = (PyVector3 *)PyMathFreeList_alloc(&PyVector3_FreeList, &PyVector3_Type);
+    if (new != NULL)
+        memcpy(new->data, data, sizeof(vec3));
+
+    return new;
+}
+
+int PyVector3_set(float *dest, PyObject *value, const char *name)
+{
+    if (value == NULL)
+    {
+        PyErr_Format(PyExc_AttributeError, "Cannot delete attribute %s.", name);
+        return -1;
+    }
+
+    CHECK_ARG_TYPE(value, &PyVector3_Type, -1);
+    memcpy(dest, ((PyVector3 *)value)->data, sizeof(vec3));
+
+    return 0;
+}
@@ -5,3 +5,7 @@ int PyVector_init_buffer(float *vectorData, Py_buffer *buffer, Py_ssize_t vector
 int PyVector_init_sequence(float *vectorData, PyObject *sequence, Py_ssize_t vectorLength);
 int PyVector_init_float(float *vectorData, PyObject *floatObject, Py_ssize_t vectorLength);
 int PyVector_init_one_arg(float *data, PyObject *arg, Py_ssize_t vectorLength);
+// creates new Vector3 holding a copy of data
+PyVector3 *PyVector3_new(const float *data);
+// copies Vector3 value into dest, used by setters of Vector3 attributes
+int PyVector3_set(float *dest, PyObject *value, const char *name);
@@ -2,7 +2,7 @@ import dataclasses
 
 from spyke import math
 from spyke.assets.asset import Asset
-from spyke.graphics import gl
+from spyke.graphics import gl, renderer
 
 
 @dataclasses.dataclass(slots=True)
@@ -21,7 +21,7 @@ class Font(Asset):
     _name: str = dataclasses.field(init=False)
 
     def unload(self):
-        self._texture.delete()
+        renderer.delete_texture(self._texture)
 
     def get_glyph(self, char: str) -> Glyph:
         if char not in self._glyphs:
@@ -35,7 +35,7 @@ class Image(Asset):
 
     def unload(self):
         if self.is_loaded:
-            self._texture.delete()
+            renderer.delete_texture(self._texture)
 
     @debug.profiled
     def post_load(self, load_data: ImageLoadData):
@@ -1,26 +1,33 @@
+from spyke.ecs.command_buffer import CommandBuffer
 from spyke.ecs.components.component import Component
 from spyke.ecs.components.light import LightComponent
+from spyke.ecs.components.particleSystem import ParticleSystemComponent
 from spyke.ecs.components.sprite import SpriteComponent
 from spyke.ecs.components.tag import TagComponent
 from spyke.ecs.components.text import TextComponent
 from spyke.ecs.components.transform import TransformComponent
+from spyke.ecs.entity import get_entity_generation, get_entity_index
 from spyke.ecs.scene import Scene
+from spyke.ecs.serialization import load_scene, register_component, save_scene
 
 __all__ = (
     'set_current_scene',
     'get_current_scene',
+    'get_entity_index',
+    'get_entity_generation',
+    'save_scene',
+    'load_scene',
+    'register_component',
+    'CommandBuffer',
     'Component',
     'TagComponent',
     'SpriteComponent',
     'TextComponent',
     'TransformComponent',
     'LightComponent',
+    'ParticleSystemComponent',
     'Scene')
 
-# TODO: We can further increase speed of `get_components` by assigning
-# each component an entity id for which it is registered. It would remove second
-# iteration over types in `get_components`.
-
 def set_current_scene(scene: Scene) -> None:
     '''
     Sets given scene "current" so it can be later retrieved from
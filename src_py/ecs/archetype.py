@@ -0,0 +1,146 @@
+import typing as t
+
+from spyke.ecs.components.component import Component
+from spyke.ecs.entity import ENTITY_INDEX_MASK
+
+if t.TYPE_CHECKING:
+    from spyke.ecs.query import Query
+
+
+class Archetype:
+    '''
+    Storage of all entities that have exactly the same set of component types.
+    Components are kept in one column per type, so components of an entity
+    occupy the same row in every column and queries can iterate columns
+    directly without looking up each entity. Rows are written into a list indexed
+    by entity slot, which is shared with the scene and all of its archetypes.
+    '''
+
+    __slots__ = (
+        'types',
+        'entities',
+        'columns',
+        'queries',
+        '_rows',
+        '_add_edges',
+        '_remove_edges')
+
+    def __init__(self, types: frozenset[type[Component]], rows: list[int]) -> None:
+        self.types = types
+        self.entities = list[int]()
+        self.columns = {_type: list[Component]() for _type in types}
+        self.queries = list['Query']()
+
+        self._rows = rows
+        self._add_edges = dict[type[Component], Archetype]()
+        self._remove_edges = dict[type[Component], Archetype]()
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def add(self, entity: int, components: t.Mapping[type[Component], Component]) -> None:
+        '''
+        Appends entity with its components at the end of the archetype.
+
+        @entity: Id of the entity to add.
+        @components: Components of the entity, keyed by their types. Keys have to match archetype types.
+        '''
+
+        row = len(self.entities)
+        self._rows[entity & ENTITY_INDEX_MASK] = row
+        self.entities.append(entity)
+
+        for _type, column in self.columns.items():
+            column.append(components[_type])
+
+        for query in self.queries:
+            query.append_rows(self, row)
+
+    def add_many(self, entities: t.Sequence[int], columns: t.Mapping[type[Component], t.Sequence[Component]]) -> None:
+        '''
+        Appends multiple entities with their components at the end of the archetype.
+
+        @entities: Ids of the entities to add.
+        @columns: Components of the entities, keyed by their types. Every column has to be of the same length as `entities`.
+        '''
+
+        start = len(self.entities)
+        rows = self._rows
+        for row, entity in enumerate(entities, start):
+            rows[entity & ENTITY_INDEX_MASK] = row
+
+        self.entities.extend(entities)
+
+        for _type, column in self.columns.items():
+            column.extend(columns[_type])
+
+        for query in self.queries:
+            query.append_rows(self, start)
+
+    def remove(self, entity: int) -> dict[type[Component], Component]:
+        '''
+        Removes entity from the archetype and returns its components. The last entity
+        is moved in place of the removed one, so rows of other entities may change.
+
+        @entity: Id of the entity to remove.
+        '''
+
+        row = self._rows[entity & ENTITY_INDEX_MASK]
+        components = self._remove_row(entity)
+        for query in self.queries:
+            query.remove_rows(self, (row,), (components,))
+
+        return components
+
+    def remove_many(self, entities: t.Iterable[int]) -> None:
+        '''
+        Removes multiple entities from the archetype. Rows of the remaining entities may change.
+
+        @entities: Ids of the entities to remove.
+        '''
+
+        rows = list[int]()
+        removed = list[dict[type[Component], Component]]()
+        for entity in entities:
+            rows.append(self._rows[entity & ENTITY_INDEX_MASK])
+            removed.append(self._remove_row(entity))
+
+        if len(rows) != 0:
+            for query in self.queries:
+                query.remove_rows(self, rows, removed)
+
+    def get(self, entity: int, _type: type[Component]) -> Component:
+        return self.columns[_type][self._rows[entity & ENTITY_INDEX_MASK]]
+
+    def get_all(self, entity: int) -> dict[type[Component], Component]:
+        row = self._rows[entity & ENTITY_INDEX_MASK]
+        return {_type: column[row] for _type, column in self.columns.items()}
+
+    def get_add_edge(self, _type: type[Component]) -> 'Archetype | None':
+        return self._add_edges.get(_type, None)
+
+    def get_remove_edge(self, _type: type[Component]) -> 'Archetype | None':
+        return self._remove_edges.get(_type, None)
+
+    def set_add_edge(self, _type: type[Component], archetype: 'Archetype') -> None:
+        self._add_edges[_type] = archetype
+        archetype._remove_edges[_type] = self
+
+    def _remove_row(self, entity: int) -> dict[type[Component], Component]:
+        row = self._rows[entity & ENTITY_INDEX_MASK]
+        last_entity = self.entities.pop()
+
+        components = dict[type[Component], Component]()
+        for _type, column in self.columns.items():
+            last_component = column.pop()
+            if last_entity == entity:
+                components[_type] = last_component
+            else:
+                components[_type] = column[row]
+                column[row] = last_component
+
+        if last_entity != entity:
+            self.entities[row] = last_entity
+            self._rows[last_entity & ENTITY_INDEX_MASK] = row
+
+        return components
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+import typing as t
+from collections import defaultdict
+
+from spyke.ecs.components.component import Component
+
+if t.TYPE_CHECKING:
+    from spyke.ecs.scene import Scene
+
+class CommandBuffer:
+    '''
+    Records structural changes (entity creation and removal, adding and removing
+    components) so they can be applied to a scene later, in a single batched flush.
+    Recording is thread-safe, so the buffer can be shared between worker threads.
+
+    Commands are applied in the following order: component additions and removals
+    (in the order they were recorded), then entity removals and finally entity creations.
+    Commands targeting entities that do not exist anymore at the time of flush are skipped.
+    '''
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._component_commands = list[tuple[int, Component | type[Component], bool]]()
+        self._to_remove = list[int]()
+        self._to_create = list[tuple[Component, ...]]()
+
+    def __len__(self) -> int:
+        return len(self._component_commands) + len(self._to_remove) + len(self._to_create)
+
+    def create_entity(self, *components: Component) -> None:
+        '''
+        Records creation of a new entity with provided components.
+
+        @components: Components that should be added to the newly created entity.
+        '''
+
+        with self._lock:
+            self._to_create.append(components)
+
+    def remove_entity(self, entity: int) -> None:
+        '''
+        Records removal of the given entity.
+
+        @entity: Entity that should be removed.
+        '''
+
+        with self._lock:
+            self._to_remove.append(entity)
+
+    def add_component(self, entity: int, component: Component) -> None:
+        '''
+        Records addition of a component to the given entity.
+
+        @entity: Id of an entity to which to add the component.
+        @component: A component that will be added.
+        '''
+
+        with self._lock:
+            self._component_commands.append((entity, component, True))
+
+    def remove_component(self, entity: int, _type: type[Component]) -> None:
+        '''
+        Records removal of a component of given type from the entity.
+
+        @entity: Id of the entity from which to remove the component.
+        @_type: Type of the component that should be removed.
+        '''
+
+        with self._lock:
+            self._component_commands.append((entity, _type, False))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._component_commands.clear()
+            self._to_remove.clear()
+            self._to_create.clear()
+
+    def flush(self, scene: Scene) -> None:
+        '''
+        Applies all recorded commands to the scene and clears the buffer. Entities created
+        with the same set of component types are created with a single `create_entities` call.
+
+        @scene: The scene to which commands should be applied.
+        '''
+
+        with self._lock:
+            component_commands = self._component_commands
+            to_remove = self._to_remove
+            to_create = self._to_create
+
+            self._component_commands = []
+            self._to_remove = []
+            self._to_create = []
+
+        for entity, value, is_add in component_commands:
+            if not scene.is_alive(entity):
+                continue
+
+            if is_add:
+                scene.add_component(entity, value) # type: ignore[arg-type]
+            else:
+                scene.remove_component(entity, value) # type: ignore[arg-type]
+
+        if len(to_remove) != 0:
+            scene.remove_entities(to_remove, immediate=True)
+
+        creations_by_types = defaultdict[tuple[type[Component], ...], list[tuple[Component, ...]]](list)
+        for components in to_create:
+            creations_by_types[tuple(type(x) for x in components)].append(components)
+
+        for entities_components in creations_by_types.values():
+            if len(entities_components) == 1:
+                scene.create_entity(*entities_components[0])
+            else:
+                scene.create_entities(len(entities_components), *map(list, zip(*entities_components)))
@@ -1,143 +1,181 @@
-import random
-import glm
-
-class Particle(object):
-	def __init__(self):
-		self.position = glm.vec2(0.0)
-		self.velocity = glm.vec2(0.0)
-		self.size = glm.vec2(0.0)
-		self.rotation = 0.0
-		self.rotationVelocity = 0.0
-		self.transform = glm.mat4(1.0)
-
-		self.life = 0.0
-		self.isAlive = False
-
-		self.color = glm.vec4(1.0)
-
-		self.texture = None
-	
-	def __repr__(self):
-		return f"Active: {self.isAlive}"
-
-class ParticleSystemComponent(object):
-	MaxCount = 100
-
-	def __init__(self, basePos: glm.vec2, duration: float, maxCount: int):
-		self.basePos = basePos
-		self.baseRot = 0.0
-
-		self.duration = duration
-		self.velocity = glm.vec2(0.0)
-		self.rotationVelocity = 0.0
-
-		self._sizeBegin = glm.vec2(0.0)
-		self._sizeEnd = glm.vec2(0.0)
-		self.sizeChange = False
-
-		self._colorBegin = glm.vec4(1.0)
-		self._colorEnd = glm.vec4(1.0)
-		self.colorChange = False
-
-		self.randomizeMovement = False
-		self.fadeOut = False
-
-		self.__texture = None
-
-		self.maxCount = max(maxCount, ParticleSystemComponent.MaxCount)
-		
-		self.particlePool = []
-		for _ in range(self.maxCount):
-			self.particlePool.append(Particle())
-		self.activeParticleIdx = self.maxCount - 1
-	
-	@property
-	def texHandle(self):
-		return self.__texHandle
-	
-	@texHandle.setter
-	def texHandle(self, value: str):
-		self.__texHandle = TextureManager.Textures[value]
-	
-	def EmitParticles(self, count: int) -> None:
-		for _ in range(count):
-			self.EmitParticle()
-
-	def EmitParticle(self) -> None:
-		particle = self.particlePool[self.activeParticleIdx]
-		particle.isAlive = True
-
-		particle.position = self.basePos.__copy__()
-		particle.rotation = self.baseRot
-		
-		if self.randomizeMovement:
-			randomChange = random.random() - 0.5
-		else:
-			randomChange = 1.0
-		
-		particle.velocity = self.velocity * randomChange
-		particle.rotationVelocity = self.rotationVelocity * randomChange
-
-		particle.color = self._colorBegin
-		particle.size = self._sizeBegin
-
-		particle.life = self.duration
-		
-		particle.texHandle = self.texHandle
-
-		oldIndex = self.activeParticleIdx
-		self.activeParticleIdx = (oldIndex - 1) % self.maxCount
-	
-	#region Setters
-	@property
-	def colorBegin(self):
-		return self._colorBegin
-
-	@colorBegin.setter
-	def colorBegin(self, value):
-		if value != self._colorBegin:
-			self.colorChange = True
-		else:
-			self.colorChange = False
-		
-		self._colorBegin = value
-
-	@property
-	def colorEnd(self):
-		return self._colorEnd
-	
-	@colorEnd.setter
-	def colorEnd(self, value):
-		if value != self._colorEnd:
-			self.colorChange = True
-		else:
-			self.colorChange = False
-		
-		self._colorEnd = value
-	
-	@property
-	def sizeBegin(self):
-		return self._sizeBegin
-	
-	@sizeBegin.setter
-	def sizeBegin(self, value):
-		if value != self._sizeBegin:
-			self.sizeChange = True
-		else:
-			self.sizeChange = False
-		
-		self._sizeBegin = value
-
-	@property
-	def sizeEnd(self):
-		return self._sizeEnd
-	
-	@sizeEnd.setter
-	def sizeEnd(self, value):
-		if value != self._sizeEnd:
-			self.sizeChange = True
-		else:
-			self.sizeChange = False
-		
-		self._sizeEnd = value
-	#endregion
\ No newline at end of file
+import dataclasses
+from uuid import UUID
+
+import numpy as np
+
+from spyke import math
+from spyke.ecs.components.component import Component
+from spyke.graphics.render_batch import InstanceDtype
+
+
+@dataclasses.dataclass(eq=False, slots=True)
+class ParticleSystemComponent(Component):
+    '''
+    Particle emitter that keeps particles in struct-of-arrays storage. Alive particles
+    always occupy the first `count` elements of every array, so emission, integration
+    and removal of dead particles are performed as vectorized operations over them.
+    Particle rotation is expressed in radians, around the Z axis.
+    '''
+
+    max_count: int
+    duration: float
+    base_position: math.Vector3 = dataclasses.field(default_factory=math.Vector3.zero)
+    base_rotation: float = 0.0
+    velocity: math.Vector3 = dataclasses.field(default_factory=math.Vector3.zero)
+    rotation_velocity: float = 0.0
+    size_begin: math.Vector2 = dataclasses.field(default_factory=math.Vector2.one)
+    size_end: math.Vector2 = dataclasses.field(default_factory=math.Vector2.one)
+    color_begin: math.Vector4 = dataclasses.field(default_factory=math.Vector4.one)
+    color_end: math.Vector4 = dataclasses.field(default_factory=math.Vector4.one)
+    randomize_movement: bool = False
+    fade_out: bool = False
+    texture_id: UUID | None = None
+    seed: int | None = None
+
+    count: int = dataclasses.field(init=False, default=0)
+    positions: np.ndarray = dataclasses.field(init=False, repr=False)
+    velocities: np.ndarray = dataclasses.field(init=False, repr=False)
+    sizes: np.ndarray = dataclasses.field(init=False, repr=False)
+    rotations: np.ndarray = dataclasses.field(init=False, repr=False)
+    rotation_velocities: np.ndarray = dataclasses.field(init=False, repr=False)
+    colors: np.ndarray = dataclasses.field(init=False, repr=False)
+    lives: np.ndarray = dataclasses.field(init=False, repr=False)
+    _instance_data: np.ndarray = dataclasses.field(init=False, repr=False)
+    _rng: np.random.Generator = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_count <= 0:
+            raise ValueError(f'Particle system max count has to be greater than 0, got: {self.max_count}.')
+
+        if self.duration <= 0.0:
+            raise ValueError(f'Particle duration has to be greater than 0, got: {self.duration}.')
+
+        self.positions = np.zeros((self.max_count, 3), dtype=np.float32)
+        self.velocities = np.zeros((self.max_count, 3), dtype=np.float32)
+        self.sizes = np.zeros((self.max_count, 2), dtype=np.float32)
+        self.rotations = np.zeros((self.max_count,), dtype=np.float32)
+        self.rotation_velocities = np.zeros((self.max_count,), dtype=np.float32)
+        self.colors = np.zeros((self.max_count, 4), dtype=np.float32)
+        self.lives = np.zeros((self.max_count,), dtype=np.float32)
+
+        self._instance_data = np.zeros((self.max_count,), dtype=InstanceDtype)
+        # constant part of every 2D transform (scale Z and W components)
+        transforms = self._instance_data['transform']
+        transforms[:, 10] = 1.0
+        transforms[:, 15] = 1.0
+
+        self._rng = np.random.default_rng(self.seed)
+
+    def emit(self, count: int) -> int:
+        '''
+        Emits new particles at `base_position`. If there is not enough free space only
+        as many particles as possible are emitted. Returns number of emitted particles.
+
+        @count: Number of particles to emit.
+        '''
+
+        start = self.count
+        emitted = min(count, self.max_count - start)
+        if emitted <= 0:
+            return 0
+
+        new = slice(start, start + emitted)
+        if self.randomize_movement:
+            factors = self._rng.random(emitted, dtype=np.float32) - 0.5
+            self.velocities[new] = np.asarray(self.velocity) * factors[:, np.newaxis]
+            self.rotation_velocities[new] = self.rotation_velocity * factors
+        else:
+            self.velocities[new] = np.asarray(self.velocity)
+            self.rotation_velocities[new] = self.rotation_velocity
+
+        self.positions[new] = np.asarray(self.base_position)
+        self.rotations[new] = self.base_rotation
+        self.sizes[new] = np.asarray(self.size_begin)
+        self.colors[new] = np.asarray(self.color_begin)
+        self.lives[new] = self.duration
+
+        self.count += emitted
+        return emitted
+
+    def update(self, dt: float) -> None:
+        '''
+        Advances simulation of all alive particles by `dt` seconds and removes
+        particles which lifetime has ended.
+
+        @dt: Time step in seconds.
+        '''
+
+        count = self.count
+        if count == 0:
+            return
+
+        alive = slice(0, count)
+        self.positions[alive] += self.velocities[alive] * dt
+        self.rotations[alive] += self.rotation_velocities[alive] * dt
+        self.lives[alive] -= dt
+
+        # 1 at the moment of emission, 0 at the end of particle life
+        progress = np.clip(self.lives[alive] / self.duration, 0.0, 1.0)[:, np.newaxis]
+
+        color_begin = np.asarray(self.color_begin)
+        color_end = np.asarray(self.color_end)
+        if not np.array_equal(color_begin, color_end):
+            np.multiply(color_begin - color_end, progress, out=self.colors[alive])
+            self.colors[alive] += color_end
+
+        if self.fade_out:
+            self.colors[alive, 3] = progress[:, 0]
+
+        size_begin = np.asarray(self.size_begin)
+        size_end = np.asarray(self.size_end)
+        if not np.array_equal(size_begin, size_end):
+            np.multiply(size_begin - size_end, progress, out=self.sizes[alive])
+            self.sizes[alive] += size_end
+
+        self._remove_dead()
+
+    def get_instance_data(self, albedo_index: float = 0.0, specular_index: float = 0.0) -> np.ndarray:
+        '''
+        Builds renderer instance data (see `RenderBatch`) for all alive particles
+        and returns it as a view into internal storage, valid until the next call.
+
+        @albedo_index: Albedo texture index written to every instance.
+        @specular_index: Specular texture index written to every instance.
+        '''
+
+        count = self.count
+        alive = slice(0, count)
+        instances = self._instance_data[alive]
+
+        instances['color'] = self.colors[alive]
+        instances['albedo_idx'] = albedo_index
+        instances['specular_idx'] = specular_index
+
+        # column-major translation * rotation(Z) * scale
+        cos = np.cos(self.rotations[alive])
+        sin = np.sin(self.rotations[alive])
+        scale_x = self.sizes[alive, 0]
+        scale_y = self.sizes[alive, 1]
+        transforms = instances['transform']
+        transforms[:, 0] = cos * scale_x
+        transforms[:, 1] = sin * scale_x
+        transforms[:, 4] = -sin * scale_y
+        transforms[:, 5] = cos * scale_y
+        transforms[:, 12:15] = self.positions[alive]
+
+        return instances
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def _remove_dead(self) -> None:
+        count = self.count
+        alive_mask = self.lives[:count] > 0.0
+        alive_count = int(np.count_nonzero(alive_mask))
+        if alive_count == count:
+            return
+
+        for array in (self.positions, self.velocities, self.sizes, self.rotations, self.rotation_velocities, self.colors, self.lives):
+            array[:alive_count] = array[:count][alive_mask]
+
+        self.count = alive_count
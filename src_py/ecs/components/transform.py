@@ -1,17 +1,42 @@
+from __future__ import annotations
+
 import dataclasses
+import typing as t
+
+import numpy as np
 
 from spyke import math
 from spyke.ecs.components.component import Component
 
+if t.TYPE_CHECKING:
+    from spyke.ecs.scene import Scene
+
 
 @dataclasses.dataclass(repr=False, slots=True, eq=False)
 class TransformComponent(Component):
+    '''
+    Transform of an entity. `matrix` holds the local transform, relative to the parent
+    transform (if any), and `world_matrix` holds the final transform, which is updated
+    by `TransformHierarchy`. For transforms without parent both matrices are the same.
+    Setting `position`, `scale` or `rotation` of a transform that belongs to a scene
+    marks it as changed, so that `TransformProcessor` recalculates it. Other modifications,
+    e.g. of vector values in place, have to be marked with `Scene.mark_changed`.
+    '''
+
     matrix: math.Matrix4
+    world_matrix: math.Matrix4 = dataclasses.field(init=False)
     _position: math.Vector3
     _scale: math.Vector3
     _rotation: math.Vector3 # TODO Use quaternions for rotation once they are implemented
     _rotation_hint: math.Vector3 = dataclasses.field(init=False)
     _needs_recalculate: bool = dataclasses.field(init=False)
+    _parent: TransformComponent | None = dataclasses.field(init=False)
+    _children: list[TransformComponent] = dataclasses.field(init=False)
+    _depth: int = dataclasses.field(init=False)
+    _world_changed: bool = dataclasses.field(init=False)
+    # scene and entity the transform belongs to, set by the scene
+    _scene: Scene | None = dataclasses.field(init=False)
+    _entity: int = dataclasses.field(init=False)
 
     def __init__(self,
                  position: math.Vector3,
@@ -22,12 +47,72 @@ class TransformComponent(Component):
         self._rotation_hint = rotation
         self._rotation = rotation
         self._needs_recalculate = True
+        self._parent = None
+        self._children = []
+        self._depth = 0
+        self._scene = None
+        self._entity = 0
 
         self.recalculate()
 
+    @classmethod
+    def create_many(cls, positions: np.ndarray, scales: np.ndarray, rotations: np.ndarray) -> list[TransformComponent]:
+        '''
+        Creates transforms from arrays of their values. Matrices of all transforms
+        are calculated at once with `Matrix4.transform_many`, instead of one by one
+        in the constructor.
+
+        @positions: Array of shape (N, 3) with float32 positions.
+        @scales: Array of shape (N, 3) with float32 scales.
+        @rotations: Array of shape (N, 3) with float32 rotations.
+        '''
+
+        count = len(positions)
+        if len(scales) != count or len(rotations) != count:
+            raise ValueError(f'Expected the same number of positions, scales and rotations, got: {count}, {len(scales)}, {len(rotations)}.')
+
+        matrices = math.Matrix4Array(count)
+        math.Matrix4.transform_many(positions, scales, rotations, matrices)
+
+        transforms = list[TransformComponent]()
+        for matrix, position, scale, rotation in zip(matrices, math.Vector3Array(positions), math.Vector3Array(scales), math.Vector3Array(rotations)):
+            transform = cls.__new__(cls)
+            transform.matrix = matrix
+            transform.world_matrix = matrix
+            transform._position = position
+            transform._scale = scale
+            transform._rotation = rotation
+            transform._rotation_hint = rotation
+            transform._needs_recalculate = False
+            transform._parent = None
+            transform._children = []
+            transform._depth = 0
+            transform._world_changed = True
+            transform._scene = None
+            transform._entity = 0
+            transforms.append(transform)
+
+        return transforms
+
     def recalculate(self) -> None:
         self.matrix = math.Matrix4.transform(self._position, self._scale, self._rotation)
+        if self._parent is None:
+            self.world_matrix = self.matrix
+
         self._needs_recalculate = False
+        self._world_changed = True
+
+    @property
+    def parent(self) -> TransformComponent | None:
+        return self._parent
+
+    @property
+    def children(self) -> tuple[TransformComponent, ...]:
+        return tuple(self._children)
+
+    @property
+    def depth(self) -> int:
+        return self._depth
 
     @property
     def needs_recalculate(self) -> bool:
@@ -40,7 +125,7 @@ class TransformComponent(Component):
     @position.setter
     def position(self, value: math.Vector3) -> None:
         self._position = value
-        self._needs_recalculate = True
+        self._mark_changed()
 
     @property
     def scale(self) -> math.Vector3:
@@ -49,7 +134,7 @@ class TransformComponent(Component):
     @scale.setter
     def scale(self, value: math.Vector3) -> None:
         self._scale = value
-        self._needs_recalculate = True
+        self._mark_changed()
 
     @property
     def rotation(self) -> math.Vector3:
@@ -59,4 +144,10 @@ class TransformComponent(Component):
     def rotation(self, value: math.Vector3):
         self._rotation_hint = value % 360.0
         self._rotation = value
-        self._needs_recalculate = True
+        self._mark_changed()
+
+    def _mark_changed(self) -> None:
+        if self._scene is None:
+            self._needs_recalculate = True
+        else:
+            self._scene.mark_changed(self._entity, TransformComponent)
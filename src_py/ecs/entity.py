@@ -0,0 +1,19 @@
+ENTITY_INDEX_BITS = 32
+ENTITY_INDEX_MASK = (1 << ENTITY_INDEX_BITS) - 1
+ENTITY_GENERATION_MASK = (1 << 32) - 1
+
+def make_entity(index: int, generation: int) -> int:
+    '''
+    Packs entity slot index and its generation into a single entity id.
+
+    @index: Index of the storage slot occupied by the entity.
+    @generation: Number of times the slot was reused.
+    '''
+
+    return ((generation & ENTITY_GENERATION_MASK) << ENTITY_INDEX_BITS) | index
+
+def get_entity_index(entity: int) -> int:
+    return entity & ENTITY_INDEX_MASK
+
+def get_entity_generation(entity: int) -> int:
+    return entity >> ENTITY_INDEX_BITS
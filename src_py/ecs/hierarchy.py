@@ -0,0 +1,111 @@
+import typing as t
+
+from spyke import math
+from spyke.ecs.components.transform import TransformComponent
+
+
+class TransformHierarchy:
+    '''
+    Keeps parent-child relationships between transforms. Child transforms are stored
+    in levels sorted by their depth, so that world matrices can be computed level by level,
+    each level with a single batched matrix multiplication.
+    '''
+
+    def __init__(self) -> None:
+        # levels[0] holds transforms at depth 1 (direct children of root transforms)
+        self._levels = list[dict[TransformComponent, None]]()
+
+    def set_parent(self, transform: TransformComponent, parent: TransformComponent | None) -> None:
+        '''
+        Attaches transform to the given parent. If `parent` is None the transform
+        is detached and becomes a root. Children of the transform are moved together with it.
+
+        @transform: Transform to attach.
+        @parent: New parent of the transform or None.
+        '''
+
+        ancestor = parent
+        while ancestor is not None:
+            if ancestor is transform:
+                raise ValueError('Transform cannot be parented to itself or to any of its descendants.')
+
+            ancestor = ancestor.parent
+
+        if transform._parent is not None:
+            transform._parent._children.remove(transform)
+
+        transform._parent = parent
+        transform._world_changed = True
+
+        if parent is None:
+            transform.world_matrix = transform.matrix
+            self._set_depth(transform, 0)
+        else:
+            parent._children.append(transform)
+            self._set_depth(transform, parent._depth + 1)
+
+    def detach(self, transform: TransformComponent) -> None:
+        '''
+        Removes transform from the hierarchy. Its children become root transforms.
+
+        @transform: Transform to remove.
+        '''
+
+        for child in transform.children:
+            self.set_parent(child, None)
+
+        if transform._parent is not None:
+            self.set_parent(transform, None)
+
+    def update(self, transforms: t.Iterable[TransformComponent]) -> int:
+        '''
+        Recalculates local matrices of modified transforms and world matrices of all
+        transforms affected by the changes. Changes are propagated down the hierarchy.
+        Returns number of world matrices recalculated for child transforms.
+
+        @transforms: Transforms that may need recalculation, usually transforms marked as changed in a scene.
+        '''
+
+        changed = list[TransformComponent]()
+        for transform in transforms:
+            if transform._needs_recalculate:
+                transform.recalculate()
+                changed.append(transform)
+
+        updated = list[TransformComponent]()
+        for level in self._levels:
+            pending = [x for x in level if x._world_changed or x._parent._world_changed] # type: ignore[union-attr]
+            if len(pending) == 0:
+                continue
+
+            world_matrices = math.Matrix4Array([x._parent.world_matrix for x in pending]) # type: ignore[union-attr]
+            world_matrices @= math.Matrix4Array([x.matrix for x in pending])
+
+            for i, transform in enumerate(pending):
+                transform.world_matrix = world_matrices[i]
+                transform._world_changed = True
+
+            updated.extend(pending)
+
+        for transform in changed:
+            transform._world_changed = False
+
+        for transform in updated:
+            transform._world_changed = False
+            transform._parent._world_changed = False # type: ignore[union-attr]
+
+        return len(updated)
+
+    def _set_depth(self, transform: TransformComponent, depth: int) -> None:
+        if transform._depth != 0:
+            del self._levels[transform._depth - 1][transform]
+
+        transform._depth = depth
+        if depth != 0:
+            while len(self._levels) < depth:
+                self._levels.append({})
+
+            self._levels[depth - 1][transform] = None
+
+        for child in transform._children:
+            self._set_depth(child, depth + 1)
@@ -4,9 +4,42 @@ import abc
 import typing as t
 
 if t.TYPE_CHECKING:
+    from spyke.ecs.components.component import Component
     from spyke.ecs.scene import Scene
 
 class Processor(abc.ABC):
+    '''
+    Base class for systems that operate on scene components. Processors may declare
+    component types they read and write using `reads` and `writes` class attributes.
+    Processors whose declared accesses do not conflict are ran concurrently by the scene.
+    Processors that do not declare any access are treated as accessing everything
+    and always run alone.
+    '''
+
+    reads: t.ClassVar[tuple[type[Component], ...] | None] = None
+    writes: t.ClassVar[tuple[type[Component], ...] | None] = None
+
+    def conflicts_with(self, other: Processor) -> bool:
+        '''
+        Checks if this processor cannot run concurrently with the other one, that is
+        if any of them does not declare its access or one writes components the other one uses.
+
+        @other: Processor to check against.
+        '''
+
+        if not self.has_declared_access or not other.has_declared_access:
+            return True
+
+        self_writes = set(self.writes or ())
+        other_writes = set(other.writes or ())
+        return not self_writes.isdisjoint(other_writes) \
+            or not self_writes.isdisjoint(other.reads or ()) \
+            or not other_writes.isdisjoint(self.reads or ())
+
+    @property
+    def has_declared_access(self) -> bool:
+        return self.reads is not None or self.writes is not None
+
     @abc.abstractmethod
     def process(self, scene: 'Scene', *args: t.Any, **kwargs: t.Any) -> None:
         pass
@@ -1,50 +1,22 @@
 import typing as t
 
-from spyke.utils import lerp_float, lerp_vector
-
-from . import Processor, Scene
-from .components import *
+from spyke.ecs.components.particleSystem import ParticleSystemComponent
+from spyke.ecs.components.transform import TransformComponent
+from spyke.ecs.processor import Processor
+from spyke.ecs.scene import Scene
 
 
 class TransformProcessor(Processor):
-    def process(self, scene: Scene, *args: t.Any, **kwargs: t.Any):
-        for transform in scene.get_component(TransformComponent):
-            if transform.should_recalculate:
-                transform.recalculate()
-
-        for _, (camera, transform) in scene.get_components(CameraComponent, TransformComponent):
-            if camera.should_recalculate:
-                camera.recalculate(transform.matrix)
+    writes = (TransformComponent,)
 
-class AudioProcessor(Processor):
     def process(self, scene: Scene, *args: t.Any, **kwargs: t.Any):
-        for audio in scene.get_component(AudioComponent):
-            state = audio.Handle.GetState()
+        scene.hierarchy.update(transform for _, transform in scene.get_changed(TransformComponent))
 
 class ParticleProcessor(Processor):
-    def process(self, scene: Scene, *args: t.Any, **kwargs: t.Any):
-        dt: float = args['dt']
-
-        for _, particleComponent in scene.get_component(ParticleSystemComponent):
-            for particle in particleComponent.particlePool:
-                if not particle.isAlive:
-                    continue
+    writes = (ParticleSystemComponent,)
 
-                particle.position += particle.velocity * dt
-                particle.rotation += particle.rotationVelocity * dt
-                particle.life -= dt
-
-                if particleComponent.colorChange:
-                    particle.color = lerp_vector(
-                        particle.life / particleComponent.duration, particleComponent.colorEnd, particleComponent.colorBegin)
-
-                if particleComponent.fadeOut:
-                    particle.color.w = lerp_float(
-                        particle.life / particleComponent.duration, 0.0, 1.0)
-
-                if particleComponent.sizeChange:
-                    particle.size = lerp_vector(
-                        particle.life / particleComponent.duration, particleComponent.sizeEnd, particleComponent.sizeBegin)
+    def process(self, scene: Scene, *args: t.Any, **kwargs: t.Any):
+        dt: float = kwargs['dt']
 
-                if particle.life < 0.0:
-                    particle.isAlive = False
+        for particle_system in scene.get_component(ParticleSystemComponent):
+            particle_system.update(dt)
@@ -0,0 +1,184 @@
+import dataclasses
+import typing as t
+
+from spyke.ecs.archetype import Archetype
+from spyke.ecs.components.component import Component
+
+
+@dataclasses.dataclass(slots=True)
+class QueryStats:
+    hits: int = 0
+    rebuilds: int = 0
+    updates: int = 0
+
+class Query:
+    '''
+    Cached results of a component query. The query keeps track of all archetypes
+    that contain its component types. Results are built once and then rows appended to
+    or removed from matching archetypes are applied to them in place, so that neither
+    unrelated nor matching changes cause the whole result to be rebuilt. Results
+    already returned to the caller are copied before they are updated.
+    '''
+
+    __slots__ = (
+        'types',
+        'archetypes',
+        'stats',
+        '_result',
+        '_result_shared',
+        '_component_set',
+        '_component_set_shared')
+
+    def __init__(self, types: tuple[type[Component], ...]) -> None:
+        self.types = types
+        self.archetypes = list[Archetype]()
+        self.stats = QueryStats()
+
+        self._result: list[tuple[int, tuple[t.Any, ...]]] | None = None
+        self._result_shared = False
+        self._component_set: set[t.Any] | None = None
+        self._component_set_shared = False
+
+    def matches(self, archetype: Archetype) -> bool:
+        return archetype.types.issuperset(self.types)
+
+    def add_archetype(self, archetype: Archetype) -> None:
+        '''
+        Registers archetype that matches the query, so that the query will be
+        updated whenever entities of this archetype change.
+
+        @archetype: Archetype containing all query component types.
+        '''
+
+        self.archetypes.append(archetype)
+        archetype.queries.append(self)
+
+        if len(archetype) != 0:
+            self.append_rows(archetype, 0)
+
+    def append_rows(self, archetype: Archetype, start: int) -> None:
+        '''
+        Adds rows of the archetype, starting at `start` up to its end, to the cached results.
+        Has to be called after the rows are appended to the archetype.
+
+        @archetype: Matching archetype to which the rows were appended.
+        @start: Index of the first appended row.
+        '''
+
+        if self._result is None and self._component_set is None:
+            return
+
+        self.stats.updates += 1
+
+        if self._result is not None:
+            if self._result_shared:
+                self._result = list(self._result)
+                self._result_shared = False
+
+            # rows of the archetype end where rows of the next archetype begin
+            end = self._get_offset(archetype) + start
+            columns = [archetype.columns[_type][start:] for _type in self.types]
+            self._result[end:end] = zip(archetype.entities[start:], zip(*columns))
+
+        if self._component_set is not None:
+            if self._component_set_shared:
+                self._component_set = set(self._component_set)
+                self._component_set_shared = False
+
+            self._component_set.update(archetype.columns[self.types[0]][start:])
+
+    def remove_rows(self, archetype: Archetype, rows: t.Sequence[int], components: t.Sequence[t.Mapping[type[Component], Component]]) -> None:
+        '''
+        Removes rows of the archetype from the cached results. Every removed row is replaced
+        with the last row of the archetype, the same way the archetype does, so rows have to be
+        given in the order they were removed. Has to be called after the rows are removed from the archetype.
+
+        @archetype: Matching archetype from which the rows were removed.
+        @rows: Indices of the removed rows, at the moment of their removal.
+        @components: Components of the removed rows, keyed by their types.
+        '''
+
+        if self._result is None and self._component_set is None:
+            return
+
+        self.stats.updates += 1
+
+        if self._result is not None:
+            if self._result_shared:
+                self._result = list(self._result)
+                self._result_shared = False
+
+            offset = self._get_offset(archetype)
+            end = offset + len(archetype) + len(rows)
+            if len(rows) == 1:
+                self._result[offset + rows[0]] = self._result[end - 1]
+                del self._result[end - 1]
+            else:
+                # replay removals on rows of the archetype only, so that rows of next archetypes are moved once
+                segment = self._result[offset:end]
+                for row in rows:
+                    segment[row] = segment[-1]
+                    segment.pop()
+
+                self._result[offset:end] = segment
+
+        if self._component_set is not None:
+            if self._component_set_shared:
+                self._component_set = set(self._component_set)
+                self._component_set_shared = False
+
+            _type = self.types[0]
+            self._component_set.difference_update(x[_type] for x in components)
+
+    def get_result(self) -> list[tuple[int, tuple[t.Any, ...]]]:
+        '''
+        Returns list of (entity, components tuple) for all entities matched by the query,
+        building it on the first call.
+        '''
+
+        self._result_shared = True
+        if self._result is not None:
+            self.stats.hits += 1
+            return self._result
+
+        self.stats.rebuilds += 1
+
+        result = list[tuple[int, tuple[t.Any, ...]]]()
+        for archetype in self.archetypes:
+            columns = [archetype.columns[_type] for _type in self.types]
+            result.extend(zip(archetype.entities, zip(*columns)))
+
+        self._result = result
+        return result
+
+    def get_component_set(self) -> set[t.Any]:
+        '''
+        Returns set of components of the first query type for all matched entities,
+        building it on the first call.
+        '''
+
+        self._component_set_shared = True
+        if self._component_set is not None:
+            self.stats.hits += 1
+            return self._component_set
+
+        self.stats.rebuilds += 1
+
+        _type = self.types[0]
+        result = set[t.Any]()
+        for archetype in self.archetypes:
+            result.update(archetype.columns[_type])
+
+        self._component_set = result
+        return result
+
+    def _get_offset(self, archetype: Archetype) -> int:
+        # index in the result of the first row of the archetype
+        offset = 0
+        for x in self.archetypes:
+            if x is archetype:
+                return offset
+
+            offset += len(x)
+
+        raise ValueError('Archetype is not matched by the query.')
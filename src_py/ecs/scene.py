@@ -1,26 +1,72 @@
-import functools
+import concurrent.futures
+import itertools
 import typing as t
 from collections import defaultdict
 
+from spyke.ecs.archetype import Archetype
+from spyke.ecs.command_buffer import CommandBuffer
 from spyke.ecs.components.component import Component
+from spyke.ecs.components.transform import TransformComponent
+from spyke.ecs.entity import (ENTITY_GENERATION_MASK, ENTITY_INDEX_BITS,
+                              ENTITY_INDEX_MASK, make_entity)
+from spyke.ecs.hierarchy import TransformHierarchy
 from spyke.ecs.processor import Processor
+from spyke.ecs.query import Query, QueryStats
+from spyke.ecs.spatial import SpatialIndex
 from spyke.graphics.camera import Camera
 
 ComponentType = t.TypeVar('ComponentType', bound=Component)
 ComponentTypes = t.TypeVarTuple('ComponentTypes')
 
 class Scene:
-    def __init__(self, name: str, camera: Camera) -> None:
+    '''
+    Stores entities and their components. Entity ids are generational handles:
+    the lower bits hold index of the storage slot and the upper bits hold generation
+    of that slot, which is incremented whenever entity occupying it gets removed.
+    Freed slots are reused, so stale ids can be detected with `is_alive`.
+
+    Processors should record structural changes into `commands` instead of applying
+    them directly, so that they get applied in one batch after all processors have run.
+
+    Scene also tracks which components changed during the current frame. Components
+    are marked as changed when they are added and when `mark_changed` is called.
+    Changes are visible through `get_changed` until the end of the next `process` call,
+    so changes marked by a processor are seen by processors that run after it in the same
+    frame and by processors that run before it in the next frame.
+
+    Optionally scene can maintain a spatial index of entities that have `TransformComponent`
+    (see `set_spatial_index`), which is updated from changed transforms at the end of `process`.
+    '''
+
+    def __init__(self, name: str, camera: Camera, max_workers: int | None = None) -> None:
         self.name = name
 
-        self._components_by_type = defaultdict[type[Component], set[Component]](set)
-        self._components_by_entity = defaultdict[int, dict[type[Component], Component]](dict)
-        self._entities_by_components = defaultdict[type[Component], set[int]](set)
+        self._archetypes = dict[frozenset[type[Component]], Archetype]()
+        self._archetypes_by_component = defaultdict[type[Component], list[Archetype]](list)
+        self._queries = dict[tuple[type[Component], ...], Query]()
         self._to_remove = set[int]()
-        self._next_entity_id = 0
-        self._processors: list[Processor] = []
+        # changes marked since the start of the last `process` call and changes marked before it,
+        # which are visible until the end of the call
+        self._changed = dict[type[Component], set[int]]()
+        self._previous_changed = dict[type[Component], set[int]]()
+
+        # dense storage indexed by entity slot
+        self._generations = list[int]()
+        self._entity_archetypes = list[Archetype | None]()
+        self._entity_rows = list[int]()
+        self._free_slots = list[int]()
+        self._processors = list[tuple[int, Processor]]()
+        self._processor_stages: list[list[Processor]] | None = None
+        self._max_workers = max_workers
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
 
         self.camera = camera
+        self.commands = CommandBuffer()
+        self.hierarchy = TransformHierarchy()
+
+        self._spatial_index: SpatialIndex | None = None
+        # entities of transforms that have a parent, used to update descendants in the spatial index
+        self._transform_entities = dict[TransformComponent, int]()
 
     def create_entity(self, *components: Component) -> int:
         '''
@@ -29,16 +75,69 @@ class Scene:
         @components: List of components that should be added to the newly created entity.
         '''
 
-        _id = self._next_entity_id
-        self._next_entity_id += 1
+        _id = self._allocate_entities(1)[0]
+
+        components_by_type = {type(x): x for x in components}
+        archetype = self._get_archetype(frozenset(components_by_type))
+        archetype.add(_id, components_by_type)
+        self._entity_archetypes[_id & ENTITY_INDEX_MASK] = archetype
 
-        for comp in components:
-            self.add_component(_id, comp)
+        transform = components_by_type.get(TransformComponent, None)
+        if transform is not None:
+            self._attach_transform(_id, transform) # type: ignore[arg-type]
 
-        self._clear_caches()
+        for _type in components_by_type:
+            self._changed.setdefault(_type, set()).add(_id)
 
         return _id
 
+    def create_entities(self, count: int, *components: t.Callable[[], Component] | t.Sequence[Component]) -> list[int]:
+        '''
+        Creates `count` new entities that share the same set of component types and
+        returns their ids. Ids are reserved at once, reusing free slots first,
+        and all entities are inserted into the storage in a single pass.
+
+        @count: Number of entities to create.
+        @components: For every component type either a factory called once per entity
+            (e.g. the component type itself) or a sequence of `count` already created components.
+        '''
+
+        if count < 0:
+            raise ValueError(f'Entity count cannot be negative, got: {count}.')
+
+        if count == 0:
+            return []
+
+        columns = dict[type[Component], t.Sequence[Component]]()
+        for source in components:
+            if callable(source):
+                column = [source() for _ in range(count)]
+            else:
+                column = source
+                if len(column) != count:
+                    raise ValueError(f'Expected component sequence of length {count}, got: {len(column)}.')
+
+            columns[type(column[0])] = column
+
+        entities = self._allocate_entities(count)
+
+        archetype = self._get_archetype(frozenset(columns))
+        archetype.add_many(entities, columns)
+
+        entity_archetypes = self._entity_archetypes
+        for entity in entities:
+            entity_archetypes[entity & ENTITY_INDEX_MASK] = archetype
+
+        transforms = columns.get(TransformComponent, None)
+        if transforms is not None:
+            for entity, transform in zip(entities, transforms):
+                self._attach_transform(entity, transform) # type: ignore[arg-type]
+
+        for _type in columns:
+            self._changed.setdefault(_type, set()).update(entities)
+
+        return entities
+
     def add_component(self, entity: int, component: Component) -> None:
         '''
         Adds new component to the given entity. If the entity already has
@@ -48,28 +147,96 @@ class Scene:
         @component: A component that will be added.
         '''
 
-        self._components_by_type[type(component)].add(component)
-        self._entities_by_components[type(component)].add(entity)
-        self._components_by_entity[entity][type(component)] = component
+        _type = type(component)
+        archetype = self._get_entity_archetype(entity)
+        if _type in archetype.types:
+            return
+
+        target = archetype.get_add_edge(_type)
+        if target is None:
+            target = self._get_archetype(archetype.types | {_type})
+            archetype.set_add_edge(_type, target)
+
+        components = archetype.remove(entity)
+        components[_type] = component
+        target.add(entity, components)
+        self._entity_archetypes[entity & ENTITY_INDEX_MASK] = target
 
-        self._clear_caches()
+        if _type is TransformComponent:
+            self._attach_transform(entity, component) # type: ignore[arg-type]
+
+        self._changed.setdefault(_type, set()).add(entity)
 
     def has_component(self, entity: int, component_type: type[Component]) -> bool:
-        entities = self._entities_by_components.get(component_type, None)
-        if entities is not None:
-            return entity in entities
+        if self.is_alive(entity):
+            return component_type in self._entity_archetypes[entity & ENTITY_INDEX_MASK].types # type: ignore[union-attr]
 
         return False
 
+    def mark_changed(self, entity: int, *types: type[Component]) -> None:
+        '''
+        Marks components of given types that belong to the entity as changed in the current frame.
+        Marked `TransformComponent` gets recalculated by `TransformProcessor`.
+        Can be safely called from processors running concurrently.
+
+        @entity: Id of the entity which components were changed.
+        @types: Types of the changed components.
+        '''
+
+        for _type in types:
+            self._changed.setdefault(_type, set()).add(entity)
+
+            if _type is TransformComponent and self.is_alive(entity):
+                archetype = self._entity_archetypes[entity & ENTITY_INDEX_MASK]
+                if TransformComponent in archetype.types: # type: ignore[union-attr]
+                    archetype.get(entity, TransformComponent)._needs_recalculate = True # type: ignore[union-attr, attr-defined]
+
+    def get_changed(self, _type: type[ComponentType]) -> list[tuple[int, ComponentType]]:
+        '''
+        Returns entities and their components of given type that were marked as changed
+        since the start of the previous `process` call. Entities that were removed or
+        lost the component in the meantime are skipped.
+
+        @_type: Type of the component to retrieve.
+        '''
+
+        entities = self._changed.get(_type, None)
+        previous = self._previous_changed.get(_type, None)
+        if entities is None and previous is None:
+            return []
+
+        if previous is not None:
+            entities = previous if entities is None else previous | entities
+
+        result = list[tuple[int, ComponentType]]()
+        for entity in list(entities): # type: ignore[arg-type]
+            if self.is_alive(entity):
+                archetype = self._entity_archetypes[entity & ENTITY_INDEX_MASK]
+                if _type in archetype.types: # type: ignore[union-attr]
+                    result.append((entity, archetype.get(entity, _type))) # type: ignore[union-attr]
+
+        return result
+
+    def is_alive(self, entity: int) -> bool:
+        '''
+        Checks if entity with given id exists. Returns False for ids of removed
+        entities, even if their slot is already occupied by a new entity.
+
+        @entity: Id of the entity to check.
+        '''
+
+        index = entity & ENTITY_INDEX_MASK
+        return index < len(self._generations) \
+            and self._generations[index] == entity >> ENTITY_INDEX_BITS \
+            and self._entity_archetypes[index] is not None
+
     def remove_entity(self, entity: int, immediate: bool = False) -> None:
         '''
         Flags entity as enqueued to removal. This means it will
         be removed at the start of next `process` call (before processors are
         ran). If the `immediate` parameter is set to True the entity will be deleted
-        immediately. If the entity is already flagged for deletion this funcition does
-        nothing. NOTE: Neither this function nor functions that are called later check if
-        provided entity exists. If this is not the case an exception
-        could be thrown later at some point.
+        immediately. If the entity is already flagged for deletion or does not exist
+        this function does nothing.
 
         @entity: Entity that should be removed.
         '''
@@ -79,6 +246,20 @@ class Scene:
         else:
             self._to_remove.add(entity)
 
+    def remove_entities(self, entities: t.Iterable[int], immediate: bool = False) -> None:
+        '''
+        Flags multiple entities as enqueued to removal, the same way `remove_entity` does.
+        If the `immediate` parameter is set to True the entities are deleted immediately,
+        removing them from each archetype in a single pass.
+
+        @entities: Entities that should be removed.
+        '''
+
+        if immediate:
+            self._remove_entities(entities)
+        else:
+            self._to_remove.update(entities)
+
     def remove_component(self, entity: int, _type: type[Component]) -> None:
         '''
         Removes component of given type from the entity. If the entity
@@ -88,27 +269,77 @@ class Scene:
         @_type: Type of the component that should be removed.
         '''
 
-        self._entities_by_components[_type].discard(entity)
+        archetype = self._get_entity_archetype(entity)
+        if _type not in archetype.types:
+            return
 
-        entity_component_store = self._components_by_entity[entity]
-        if comp := entity_component_store.get(_type, None):
-            del entity_component_store[_type]
-            self._components_by_type[_type].remove(comp)
+        target = archetype.get_remove_edge(_type)
+        if target is None:
+            target = self._get_archetype(archetype.types - {_type})
+            target.set_add_edge(_type, archetype)
 
-        self._clear_caches()
+        components = archetype.remove(entity)
+        removed = components.pop(_type)
+        if _type is TransformComponent:
+            self._remove_transform(entity, removed) # type: ignore[arg-type]
+
+        target.add(entity, components)
+        self._entity_archetypes[entity & ENTITY_INDEX_MASK] = target
+
+    def set_parent(self, entity: int, parent: int | None) -> None:
+        '''
+        Attaches transform of the entity to transform of the parent entity, so that
+        it is positioned relative to it. If `parent` is None the entity is detached from its
+        current parent. Both entities have to have `TransformComponent`. When an entity
+        gets removed its children are detached.
+
+        @entity: Id of the child entity.
+        @parent: Id of the parent entity or None.
+        '''
+
+        transform = self.get_component_for_entity(entity, TransformComponent)
+        parent_transform = None if parent is None else self.get_component_for_entity(parent, TransformComponent)
+        self.hierarchy.set_parent(transform, parent_transform)
+        self._transform_entities[transform] = entity
+        self.mark_changed(entity, TransformComponent)
+
+    @property
+    def spatial_index(self) -> SpatialIndex | None:
+        return self._spatial_index
+
+    def set_spatial_index(self, index: SpatialIndex | None) -> None:
+        '''
+        Sets spatial index that will be maintained by the scene. All entities that have
+        `TransformComponent` are inserted into the index using world matrices of their transforms.
+        Passing None disables spatial indexing.
+
+        @index: Spatial index to use or None.
+        '''
+
+        if index is not None:
+            index.clear()
+            for entity, (transform,) in self.get_components(TransformComponent):
+                index.update_transform(entity, transform.world_matrix)
+
+        self._spatial_index = index
 
     def add_processor(self, processor: Processor, priority: int = 0) -> None:
         '''
         Registers new processor to the scene. The `priority` is used
-        to determine the order in which processors should run.
+        to determine the order in which processors should run, higher priority
+        processors run first. Processors with equal priority keep the order in which
+        they were registered. Order is only kept between processors which access
+        conflicts, others may run concurrently (see `Processor`).
         NOTE: It is discouraged to register multiple processors of the
         same type as that may cause collisions.
 
         @processor: A processor instance to be registered.
+        @priority: Priority of the processor.
         '''
 
-        self._processors.append(processor)
-        self._processors.sort(key=lambda x: priority, reverse=True)
+        self._processors.append((priority, processor))
+        self._processors.sort(key=lambda x: x[0], reverse=True)
+        self._processor_stages = None
 
     def remove_processor(self, _type: type[Processor]) -> None:
         '''
@@ -118,65 +349,110 @@ class Scene:
         @_type: Type of the processor to be removed.
         '''
 
-        proc = next((x for x in self._processors if isinstance(x, _type)), None)
-        if proc is None:
+        entry = next((x for x in self._processors if isinstance(x[1], _type)), None)
+        if entry is None:
             return
 
-        self._processors.remove(proc)
+        self._processors.remove(entry)
+        self._processor_stages = None
+
+    def get_entities(self) -> list[int]:
+        return list(itertools.chain.from_iterable(x.entities for x in self._archetypes.values()))
+
+    def get_archetypes(self) -> list[Archetype]:
+        '''
+        Returns all archetypes of the scene, including empty ones.
+        Archetypes must not be modified by the caller.
+        '''
 
-    def get_entities(self) -> t.KeysView[int]:
-        return self._components_by_entity.keys()
+        return list(self._archetypes.values())
 
     def process(self, *args: t.Any, **kwargs: t.Any) -> None:
         '''
         Calls `process` on every registered processor with provided arguments.
+        Processors are grouped into stages, so that processors within a stage do not
+        conflict with each other and are ran concurrently on a thread pool. Stages
+        run one after another. After all processors have run, changed components are
+        reset and commands recorded into `commands` are applied.
         '''
 
-        for entity in self._to_remove:
-            self._remove_entity(entity)
+        if len(self._to_remove) != 0:
+            self._remove_entities(self._to_remove)
+            self._to_remove.clear()
+
+        # changes marked during this call are kept until the end of the next one
+        self._previous_changed = self._changed
+        self._changed = {}
+
+        for stage in self._get_processor_stages():
+            if len(stage) == 1:
+                stage[0].process(self, *args, **kwargs)
+                continue
+
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(self._max_workers, f'{self.name}-processor')
+
+            futures = [self._executor.submit(x.process, self, *args, **kwargs) for x in stage]
+            concurrent.futures.wait(futures)
+            for future in futures:
+                future.result()
+
+        if self._spatial_index is not None:
+            self._update_spatial_index(self._spatial_index)
+
+        self._previous_changed = {}
+        self.commands.flush(self)
 
-        for processor in self._processors:
-            processor.process(self, *args, **kwargs)
+    def close(self) -> None:
+        '''
+        Shuts down thread pool used to run processors concurrently, waiting for its
+        threads to finish. Should be called once the scene is no longer used.
+        If the scene is processed again a new thread pool is created.
+        '''
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_processor_stages(self) -> list[list[Processor]]:
+        '''
+        Returns processors grouped into stages in which they will be executed. Each
+        processor is placed in the stage after the last stage containing higher (or equal,
+        but registered earlier) priority processor it conflicts with.
+        '''
+
+        return [list(x) for x in self._get_processor_stages()]
 
-    @functools.lru_cache()
     def get_components(self, *types: *ComponentTypes) -> list[tuple[int, tuple[*ComponentTypes]]]:
         '''
         Retrieves all entities that have components of given types. The returned query
-        is in form of (entity, components generator). The second value will always be of length
-        of number of types that were given.
+        is in form of (entity, components tuple). The second value will always be of length
+        of number of types that were given. Entities are grouped by their archetypes.
+        The result is cached and updated in place when entities matching the query change
+        (a list returned earlier is left intact), so it must not be modified by the caller.
 
         @types: Types of components that are required for entity to have.
         '''
 
-        result = list[tuple[int, tuple[*ComponentTypes]]]()
-        for entity in set.intersection(*(self._entities_by_components[x] for x in types)):
-            entity_component_store = self._components_by_entity[entity]
-            entity_components = tuple(
-                entity_component_store[_type]
-                for _type in types
-                if _type in entity_component_store)
-            result.append((entity, entity_components))
-
-        return result
+        return self._get_query(types).get_result() # type: ignore[return-value]
 
-    @functools.lru_cache()
     def get_component(self, _type: type[ComponentType]) -> set[ComponentType]:
         '''
         Returns set of all components of given type.
         Returns empty set if there are no components of the given type.
+        The result is cached and must not be modified by the caller.
 
         @_type: Type of the component to retrieve.
         '''
 
-        return self._components_by_type.get(_type, set()) # type: ignore[return-value]
+        return self._get_query((_type,)).get_component_set()
 
     def get_component_for_entity(self, entity: int, _type: type[ComponentType]) -> ComponentType:
-        component = self._components_by_entity[entity][_type]
+        component = self._get_entity_archetype(entity).get(entity, _type)
         assert isinstance(component, _type)
 
         return component
 
-    @functools.lru_cache()
     def get_components_for_entity(self, entity: int) -> t.ValuesView[Component]:
         '''
         Returns all components that belong to given entity.
@@ -185,16 +461,163 @@ class Scene:
         @entity: Entity id for which components to retrieve.
         '''
 
-        return self._components_by_entity.get(entity, dict()).values()
+        if not self.is_alive(entity):
+            return dict[type[Component], Component]().values()
 
-    def _remove_entity(self, entity: int) -> None:
-        for comp_type, comp in self._components_by_entity[entity].items():
-            self._components_by_type[comp_type].remove(comp)
-            self._entities_by_components[comp_type].remove(entity)
+        return self._get_entity_archetype(entity).get_all(entity).values()
+
+    def get_query_stats(self, *types: type[Component]) -> QueryStats:
+        '''
+        Returns cache statistics of the query for given component types. If no types
+        are provided returns statistics summed over all queries made on this scene.
 
-        del self._components_by_entity[entity]
+        @types: Component types of the query, in the same order as passed to `get_components`.
+        '''
+
+        if len(types) != 0:
+            query = self._queries.get(types, None)
+            return QueryStats() if query is None else QueryStats(query.stats.hits, query.stats.rebuilds, query.stats.updates)
+
+        stats = QueryStats()
+        for query in self._queries.values():
+            stats.hits += query.stats.hits
+            stats.rebuilds += query.stats.rebuilds
+            stats.updates += query.stats.updates
+
+        return stats
+
+    def _get_processor_stages(self) -> list[list[Processor]]:
+        if self._processor_stages is not None:
+            return self._processor_stages
+
+        stages = list[list[Processor]]()
+        processor_stages = list[tuple[Processor, int]]()
+        for _, processor in self._processors:
+            stage = 0
+            for other, other_stage in processor_stages:
+                if other_stage >= stage and processor.conflicts_with(other):
+                    stage = other_stage + 1
+
+            if stage == len(stages):
+                stages.append([])
+
+            stages[stage].append(processor)
+            processor_stages.append((processor, stage))
+
+        self._processor_stages = stages
+        return stages
+
+    def _remove_entity(self, entity: int) -> None:
+        if not self.is_alive(entity):
+            return
 
-    def _clear_caches(self) -> None:
-        self.get_component.cache_clear()
-        self.get_components.cache_clear()
-        self.get_components_for_entity.cache_clear()
+        archetype = self._entity_archetypes[entity & ENTITY_INDEX_MASK]
+        components = archetype.remove(entity) # type: ignore[union-attr]
+        if (transform := components.get(TransformComponent, None)) is not None:
+            self._remove_transform(entity, transform) # type: ignore[arg-type]
+
+        self._free_entity(entity)
+
+    def _remove_entities(self, entities: t.Iterable[int]) -> None:
+        entities_by_archetype = defaultdict[Archetype, list[int]](list)
+        for entity in entities:
+            if self.is_alive(entity):
+                entities_by_archetype[self._entity_archetypes[entity & ENTITY_INDEX_MASK]].append(entity) # type: ignore[index]
+                self._free_entity(entity)
+
+        for archetype, archetype_entities in entities_by_archetype.items():
+            if TransformComponent in archetype.types:
+                for entity in archetype_entities:
+                    self._remove_transform(entity, archetype.get(entity, TransformComponent)) # type: ignore[arg-type]
+
+            archetype.remove_many(archetype_entities)
+
+    def _attach_transform(self, entity: int, transform: TransformComponent) -> None:
+        transform._scene = self
+        transform._entity = entity
+
+    def _remove_transform(self, entity: int, transform: TransformComponent) -> None:
+        transform._scene = None
+        self.hierarchy.detach(transform)
+        self._transform_entities.pop(transform, None)
+        if self._spatial_index is not None:
+            self._spatial_index.remove(entity)
+
+    def _update_spatial_index(self, index: SpatialIndex) -> None:
+        stack = self.get_changed(TransformComponent)
+        updated = set[int]()
+        while len(stack) != 0:
+            entity, transform = stack.pop()
+            if entity in updated:
+                continue
+
+            index.update_transform(entity, transform.world_matrix)
+            updated.add(entity)
+
+            # world matrices of descendants change together with their ancestors
+            for child in transform._children:
+                child_entity = self._transform_entities.get(child, None)
+                if child_entity is not None:
+                    stack.append((child_entity, child))
+
+    def _allocate_entities(self, count: int) -> list[int]:
+        reused = min(count, len(self._free_slots))
+        entities = [
+            make_entity(index, self._generations[index])
+            for index in self._free_slots[len(self._free_slots) - reused:]]
+        del self._free_slots[len(self._free_slots) - reused:]
+
+        # slots that were never used before are at generation 0, so their ids are equal to indices
+        start = len(self._generations)
+        added = count - reused
+        self._generations.extend(itertools.repeat(0, added))
+        self._entity_archetypes.extend(itertools.repeat(None, added))
+        self._entity_rows.extend(itertools.repeat(0, added))
+        entities.extend(range(start, start + added))
+
+        return entities
+
+    def _free_entity(self, entity: int) -> None:
+        index = entity & ENTITY_INDEX_MASK
+        self._entity_archetypes[index] = None
+        self._generations[index] = (self._generations[index] + 1) & ENTITY_GENERATION_MASK
+        self._free_slots.append(index)
+
+    def _get_entity_archetype(self, entity: int) -> Archetype:
+        if not self.is_alive(entity):
+            raise KeyError(f'Entity {entity} does not exist.')
+
+        return self._entity_archetypes[entity & ENTITY_INDEX_MASK] # type: ignore[return-value]
+
+    def _get_archetype(self, types: frozenset[type[Component]]) -> Archetype:
+        archetype = self._archetypes.get(types, None)
+        if archetype is None:
+            archetype = Archetype(types, self._entity_rows)
+            self._archetypes[types] = archetype
+            for _type in types:
+                self._archetypes_by_component[_type].append(archetype)
+
+            for query in self._queries.values():
+                if query.matches(archetype):
+                    query.add_archetype(archetype)
+
+        return archetype
+
+    def _get_query(self, types: tuple[type[Component], ...]) -> Query:
+        query = self._queries.get(types, None)
+        if query is None:
+            query = Query(types)
+            for archetype in self._get_matching_archetypes(types):
+                query.add_archetype(archetype)
+
+            self._queries[types] = query
+
+        return query
+
+    def _get_matching_archetypes(self, types: tuple[type[Component], ...]) -> list[Archetype]:
+        if len(types) == 0:
+            return list(self._archetypes.values())
+
+        # start from the rarest component type so that fewest archetypes are checked
+        candidates = min((self._archetypes_by_component.get(x, []) for x in types), key=len)
+        return [x for x in candidates if x.types.issuperset(types)]
@@ -0,0 +1,353 @@
+import dataclasses
+import json
+import mmap
+import os
+import struct
+import typing as t
+from uuid import UUID
+
+import numpy as np
+
+from spyke import math
+from spyke.ecs.components.component import Component
+from spyke.ecs.components.light import LightComponent
+from spyke.ecs.components.sprite import SpriteComponent
+from spyke.ecs.components.tag import TagComponent
+from spyke.ecs.components.text import TextComponent
+from spyke.ecs.components.transform import TransformComponent
+from spyke.ecs.scene import Scene
+
+SCENE_MAGIC = b'SPKS'
+SCENE_VERSION = 1
+
+# magic, version, header size
+_PREAMBLE = struct.Struct('<4sII')
+_ALIGNMENT = 16
+
+_VECTOR_TYPES: dict[str, tuple[type[t.Any], int]] = {
+    'vec2': (math.Vector2, 2),
+    'vec3': (math.Vector3, 3),
+    'vec4': (math.Vector4, 4)}
+
+_FIELD_KINDS: dict[t.Any, str] = {
+    float: 'float',
+    int: 'int',
+    bool: 'bool',
+    str: 'str',
+    UUID: 'uuid',
+    UUID | None: 'uuid?',
+    **{v[0]: k for k, v in _VECTOR_TYPES.items()}}
+
+# kinds stored as a single array, which is passed as is to bulk component factories
+_COLUMN_KINDS = frozenset(('float', 'int', 'bool', *_VECTOR_TYPES))
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ComponentSchema:
+    '''
+    Describes how components of a given type are stored in a scene file. Every field
+    is stored as a separate column and fields are passed to the component constructor
+    as positional arguments, in the order they are declared here. If `create_many` is set,
+    it is called with whole columns instead, to create all components at once.
+    '''
+
+    name: str
+    type: type[Component]
+    fields: tuple[tuple[str, str], ...]
+    create_many: t.Callable[..., list[t.Any]] | None = None
+
+def register_component(_type: type[Component],
+                       fields: t.Sequence[tuple[str, t.Any]] | None = None,
+                       name: str | None = None,
+                       create_many: t.Callable[..., list[t.Any]] | None = None) -> ComponentSchema:
+    '''
+    Registers component type so it can be saved in and loaded from scene files.
+    Supported field types are `float`, `int`, `bool`, `str`, `UUID`, `UUID | None`,
+    `Vector2`, `Vector3` and `Vector4`.
+
+    @_type: Type of the component.
+    @fields: Pairs of (name, type) of fields to store. If not provided, fields
+        of the dataclass that are accepted by its constructor are used.
+    @name: Name under which the component is stored. Defaults to name of the type.
+    @create_many: Function creating all components of an archetype at once, called with
+        a column of every field: numpy array for numeric and vector fields and list of values
+        for other fields. Arrays are owned by the caller and can be kept by created components.
+        If not provided, components are created one by one.
+    '''
+
+    if fields is None:
+        if not dataclasses.is_dataclass(_type):
+            raise ValueError(f'Fields have to be provided for component type {_type.__name__}, as it is not a dataclass.')
+
+        hints = t.get_type_hints(_type)
+        fields = [(x.name, hints[x.name]) for x in dataclasses.fields(_type) if x.init]
+
+    field_kinds = list[tuple[str, str]]()
+    for field_name, field_type in fields:
+        kind = _FIELD_KINDS.get(field_type, None)
+        if kind is None:
+            raise ValueError(f'Field {field_name} of component type {_type.__name__} has unsupported type: {field_type}.')
+
+        field_kinds.append((field_name, kind))
+
+    name = _type.__name__ if name is None else name
+    if (registered := _schemas_by_name.get(name, None)) is not None and registered.type is not _type:
+        raise ValueError(f'Component name {name} is already registered for type {registered.type.__name__}.')
+
+    schema = ComponentSchema(name, _type, tuple(field_kinds), create_many)
+    _schemas_by_name[name] = schema
+    _schemas_by_type[_type] = schema
+
+    return schema
+
+def get_component_schema(_type: type[Component]) -> ComponentSchema:
+    schema = _schemas_by_type.get(_type, None)
+    if schema is None:
+        raise KeyError(f'Component type {_type.__name__} is not registered for serialization.')
+
+    return schema
+
+def save_scene(scene: Scene, filepath: str | os.PathLike[str]) -> None:
+    '''
+    Saves all entities of the scene, together with their components and transform
+    hierarchy, to a binary scene file.
+
+    @scene: The scene to save.
+    @filepath: Path of the file to write.
+    '''
+
+    with open(filepath, 'wb') as f:
+        f.write(serialize_scene(scene))
+
+def load_scene(scene: Scene, filepath: str | os.PathLike[str]) -> list[int]:
+    '''
+    Loads entities from a binary scene file into the given scene. The file is memory
+    mapped and columns are read directly from the mapping. Returns ids of created entities,
+    in the order they were saved.
+
+    @scene: The scene to which loaded entities are added.
+    @filepath: Path of the scene file.
+    '''
+
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f'Scene file {filepath} is empty.')
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return deserialize_scene(scene, data)
+
+def serialize_scene(scene: Scene) -> bytes:
+    '''
+    Serializes all entities of the scene into scene file format.
+    Components of every archetype are stored column-wise, one column per component field.
+
+    @scene: The scene to serialize.
+    '''
+
+    writer = _ColumnWriter()
+    archetypes = [x for x in scene.get_archetypes() if len(x) != 0]
+
+    # index of each transform in the order entities are saved, used to store the hierarchy
+    transform_indices = dict[TransformComponent, int]()
+    offset = 0
+    for archetype in archetypes:
+        if TransformComponent in archetype.types:
+            transform_indices.update(zip(archetype.columns[TransformComponent], range(offset, offset + len(archetype)))) # type: ignore[arg-type]
+
+        offset += len(archetype)
+
+    archetype_headers = list[dict[str, t.Any]]()
+    for archetype in archetypes:
+        components = list[dict[str, t.Any]]()
+        for _type in sorted(archetype.types, key=lambda x: get_component_schema(x).name):
+            schema = get_component_schema(_type)
+            column = archetype.columns[_type]
+            components.append({
+                'name': schema.name,
+                'fields': [
+                    {'name': field_name, 'kind': kind, 'arrays': [writer.write(x) for x in _encode_field(kind, [getattr(c, field_name) for c in column])]}
+                    for field_name, kind in schema.fields]})
+
+        archetype_headers.append({'count': len(archetype), 'components': components})
+
+    header: dict[str, t.Any] = {'name': scene.name, 'archetypes': archetype_headers}
+
+    parents = np.full(offset, -1, dtype=np.int32)
+    for transform, index in transform_indices.items():
+        if transform.parent is not None:
+            parents[index] = transform_indices[transform.parent]
+
+    if np.any(parents != -1):
+        header['parents'] = writer.write(parents)
+
+    header_data = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    data_start = _align(_PREAMBLE.size + len(header_data))
+
+    return b''.join((
+        _PREAMBLE.pack(SCENE_MAGIC, SCENE_VERSION, len(header_data)),
+        header_data,
+        bytes(data_start - _PREAMBLE.size - len(header_data)),
+        writer.get_data()))
+
+def deserialize_scene(scene: Scene, data: t.Any) -> list[int]:
+    '''
+    Creates entities described by data in scene file format. Entities of each
+    archetype are created at once, directly from decoded component columns.
+    Columns are copied out of the data, so no references to it are kept.
+    Returns ids of created entities, in the order they were saved.
+
+    @scene: The scene to which loaded entities are added.
+    @data: Scene file data, any object supporting the buffer protocol.
+    '''
+
+    buffer = memoryview(data)
+    try:
+        return _deserialize(scene, buffer)
+    finally:
+        # views into memory mapped files have to be released before the mapping is closed
+        buffer.release()
+
+def _deserialize(scene: Scene, buffer: memoryview) -> list[int]:
+    if len(buffer) < _PREAMBLE.size:
+        raise ValueError('Invalid scene data: data is too short.')
+
+    magic, version, header_size = _PREAMBLE.unpack_from(buffer, 0)
+    if magic != SCENE_MAGIC:
+        raise ValueError('Invalid scene data: magic number does not match.')
+
+    if version != SCENE_VERSION:
+        raise ValueError(f'Unsupported scene data version: {version}.')
+
+    header = json.loads(bytes(buffer[_PREAMBLE.size:_PREAMBLE.size + header_size]))
+    data_start = _align(_PREAMBLE.size + header_size)
+
+    def read(array: dict[str, t.Any]) -> np.ndarray:
+        dtype = np.dtype(array['dtype'])
+        shape = tuple(array['shape'])
+        count = int(np.prod(shape))
+        # copy, so that columns kept by components do not export the buffer
+        return np.frombuffer(buffer, dtype, count, data_start + array['offset']).reshape(shape).copy()
+
+    entities = list[int]()
+    for archetype in header['archetypes']:
+        count = archetype['count']
+        columns = list[list[Component]]()
+        for component in archetype['components']:
+            schema = _schemas_by_name.get(component['name'], None)
+            if schema is None:
+                raise KeyError(f'Component type {component["name"]} is not registered for serialization.')
+
+            fields = {x['name']: x for x in component['fields']}
+            values = list[list[t.Any]]()
+            for field_name, kind in schema.fields:
+                field = fields.get(field_name, None)
+                if field is None:
+                    raise ValueError(f'Scene data is missing field {field_name} of component {schema.name}.')
+
+                if field['kind'] != kind:
+                    raise ValueError(f'Field {field_name} of component {schema.name} is stored as {field["kind"]}, expected {kind}.')
+
+                arrays = [read(x) for x in field['arrays']]
+                if schema.create_many is not None and kind in _COLUMN_KINDS:
+                    values.append(arrays[0])
+                else:
+                    values.append(_decode_field(kind, arrays, count))
+
+            if schema.create_many is not None:
+                columns.append(schema.create_many(*values))
+            elif len(values) == 0:
+                columns.append([schema.type() for _ in range(count)])
+            else:
+                columns.append([schema.type(*x) for x in zip(*values)])
+
+        entities.extend(scene.create_entities(count, *columns))
+
+    if 'parents' in header:
+        parents = read(header['parents']).tolist()
+        for entity, parent in zip(entities, parents):
+            if parent != -1:
+                scene.set_parent(entity, entities[parent])
+
+    return entities
+
+def _encode_field(kind: str, values: list[t.Any]) -> list[np.ndarray]:
+    count = len(values)
+    match kind:
+        case 'float':
+            return [np.fromiter(values, np.float64, count)]
+        case 'int':
+            return [np.fromiter(values, np.int64, count)]
+        case 'bool':
+            return [np.fromiter(values, np.bool_, count)]
+        case 'uuid' | 'uuid?':
+            nil = bytes(16)
+            data = b''.join(nil if x is None else x.bytes for x in values)
+            return [np.frombuffer(data, np.uint8).reshape(count, 16)]
+        case 'str':
+            encoded = [x.encode('utf-8') for x in values]
+            offsets = np.zeros(count + 1, dtype=np.uint32)
+            np.cumsum([len(x) for x in encoded], out=offsets[1:])
+            return [offsets, np.frombuffer(b''.join(encoded), np.uint8)]
+        case _:
+            _, size = _VECTOR_TYPES[kind]
+            array = np.empty((count, size), dtype=np.float32)
+            for i, value in enumerate(values):
+                value.write_to(array, i)
+
+            return [array]
+
+def _decode_field(kind: str, arrays: list[np.ndarray], count: int) -> list[t.Any]:
+    match kind:
+        case 'float' | 'int' | 'bool':
+            return arrays[0].tolist()
+        case 'uuid' | 'uuid?':
+            data = arrays[0].tobytes()
+            keys = [data[i:i + 16] for i in range(0, count * 16, 16)]
+            # the same ids (e.g. of models and textures) are usually shared by many components
+            uuids = {x: UUID(bytes=x) for x in set(keys)}
+            if kind == 'uuid?':
+                uuids[bytes(16)] = None # type: ignore[assignment]
+
+            return [uuids[x] for x in keys]
+        case 'str':
+            offsets = arrays[0].tolist()
+            data = arrays[1].tobytes()
+            return [data[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(count)]
+        case _:
+            vector_type, _ = _VECTOR_TYPES[kind]
+            array = arrays[0]
+            return [vector_type.from_array(array, i) for i in range(count)]
+
+def _align(value: int) -> int:
+    return (value + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+class _ColumnWriter:
+    def __init__(self) -> None:
+        self._chunks = list[bytes]()
+        self._size = 0
+
+    def write(self, array: np.ndarray) -> dict[str, t.Any]:
+        data = np.ascontiguousarray(array)
+        description = {'dtype': data.dtype.str, 'shape': list(data.shape), 'offset': self._size}
+
+        raw = data.tobytes()
+        padding = _align(len(raw)) - len(raw)
+        self._chunks.append(raw)
+        self._chunks.append(bytes(padding))
+        self._size += len(raw) + padding
+
+        return description
+
+    def get_data(self) -> bytes:
+        return b''.join(self._chunks)
+
+_schemas_by_name = dict[str, ComponentSchema]()
+_schemas_by_type = dict[type[Component], ComponentSchema]()
+
+register_component(
+    TransformComponent,
+    [('position', math.Vector3), ('scale', math.Vector3), ('rotation', math.Vector3)],
+    create_many=TransformComponent.create_many)
+register_component(SpriteComponent)
+register_component(LightComponent)
+register_component(TagComponent)
+register_component(TextComponent)
@@ -0,0 +1,676 @@
+import abc
+import heapq
+import typing as t
+from math import floor, inf
+
+from spyke import math
+
+Bounds = tuple[float, float, float, float, float, float]
+
+class SpatialIndex(abc.ABC):
+    '''
+    Base class for spatial structures that keep bounds of entities and allow
+    to query them by location. Bounds of an entity are computed by transforming
+    `local_bounds` with world matrix of its transform.
+    '''
+
+    def __init__(self, local_bounds: math.AABB | None = None) -> None:
+        if local_bounds is None:
+            local_bounds = math.AABB(math.Vector3(-0.5), math.Vector3(0.5))
+
+        self.local_bounds = local_bounds
+        self._bounds = dict[int, Bounds]()
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __contains__(self, entity: int) -> bool:
+        return entity in self._bounds
+
+    def get_bounds(self, entity: int) -> math.AABB:
+        bounds = self._bounds[entity]
+        return math.AABB(math.Vector3(bounds[:3]), math.Vector3(bounds[3:]))
+
+    def update(self, entity: int, bounds: math.AABB) -> None:
+        '''
+        Inserts entity into the index or updates its bounds if it is already present.
+
+        @entity: Id of the entity.
+        @bounds: World-space bounds of the entity.
+        '''
+
+        new_bounds = _get_bounds(bounds)
+        self._update(entity, self._bounds.get(entity, None), new_bounds)
+        self._bounds[entity] = new_bounds
+
+    def update_transform(self, entity: int, matrix: math.Matrix4) -> None:
+        '''
+        Inserts entity into the index or updates its bounds, using `local_bounds`
+        transformed by the given world matrix.
+
+        @entity: Id of the entity.
+        @matrix: World matrix of the entity.
+        '''
+
+        self.update(entity, self.local_bounds.transformed(matrix))
+
+    def remove(self, entity: int) -> None:
+        '''
+        Removes entity from the index. If the entity is not present this function does nothing.
+
+        @entity: Id of the entity to remove.
+        '''
+
+        if entity in self._bounds:
+            self._remove(entity)
+            del self._bounds[entity]
+
+    def clear(self) -> None:
+        self._clear()
+        self._bounds.clear()
+
+    def query_region(self, region: math.AABB) -> list[int]:
+        '''
+        Returns all entities which bounds intersect the given region.
+
+        @region: Region to check.
+        '''
+
+        region_bounds = _get_bounds(region)
+        return [x for x in self._get_candidates(region_bounds) if _overlaps(self._bounds[x], region_bounds)]
+
+    def query_radius(self, center: math.Vector3, radius: float) -> list[int]:
+        '''
+        Returns all entities which bounds are within `radius` from the `center`.
+
+        @center: Center of the queried sphere.
+        @radius: Radius of the queried sphere.
+        '''
+
+        x, y, z = center
+        region_bounds = (x - radius, y - radius, z - radius, x + radius, y + radius, z + radius)
+        radius_squared = radius * radius
+        return [
+            entity
+            for entity in self._get_candidates(region_bounds)
+            if _distance_squared(self._bounds[entity], x, y, z) <= radius_squared]
+
+    @abc.abstractmethod
+    def nearest(self, point: math.Vector3, max_distance: float = inf) -> int | None:
+        '''
+        Returns entity which bounds are closest to the given point or None if there
+        is no entity within `max_distance`. Distance to a point inside bounds is 0.
+
+        @point: Point for which to find the nearest entity.
+        @max_distance: Maximum distance at which entities are considered.
+        '''
+
+    @abc.abstractmethod
+    def raycast(self, ray: math.Ray, max_distance: float = inf) -> tuple[int, float] | None:
+        '''
+        Returns the first entity hit by the ray together with distance to the hit
+        or None if the ray does not hit anything within `max_distance`.
+
+        @ray: Ray to cast.
+        @max_distance: Maximum distance along the ray.
+        '''
+
+    @abc.abstractmethod
+    def _update(self, entity: int, old_bounds: Bounds | None, new_bounds: Bounds) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _remove(self, entity: int) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _clear(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _get_candidates(self, bounds: Bounds) -> t.Iterable[int]:
+        pass
+
+class UniformGrid(SpatialIndex):
+    '''
+    Spatial index that partitions the XY plane into square cells of equal size.
+    Best suited for 2D scenes with objects of similar size.
+    '''
+
+    def __init__(self, cell_size: float, local_bounds: math.AABB | None = None) -> None:
+        if cell_size <= 0.0:
+            raise ValueError(f'Cell size has to be greater than 0, got: {cell_size}.')
+
+        super().__init__(local_bounds)
+
+        self.cell_size = cell_size
+
+        self._inv_cell_size = 1.0 / cell_size
+        self._cells = dict[tuple[int, int], set[int]]()
+        self._cell_ranges = dict[int, tuple[int, int, int, int]]()
+        # conservative range of cells that were ever occupied
+        self._extent: tuple[int, int, int, int] | None = None
+
+    def nearest(self, point: math.Vector3, max_distance: float = inf) -> int | None:
+        if self._extent is None or len(self._bounds) == 0:
+            return None
+
+        x, y, z = point
+        cell_x = floor(x * self._inv_cell_size)
+        cell_y = floor(y * self._inv_cell_size)
+        min_x, min_y, max_x, max_y = self._extent
+        max_ring = max(cell_x - min_x, max_x - cell_x, cell_y - min_y, max_y - cell_y, 0)
+
+        best_entity = None
+        best_distance = max_distance * max_distance
+        for ring in range(max_ring + 1):
+            # the point may lie anywhere in its cell, so entities first found at this ring are at least that far
+            ring_distance = (ring - 1) * self.cell_size
+            if ring_distance > 0.0 and ring_distance * ring_distance > best_distance:
+                break
+
+            for cell in self._get_ring_cells(cell_x, cell_y, ring):
+                for entity in self._cells.get(cell, ()):
+                    distance = _distance_squared(self._bounds[entity], x, y, z)
+                    if distance <= best_distance:
+                        best_entity = entity
+                        best_distance = distance
+
+        return best_entity
+
+    def raycast(self, ray: math.Ray, max_distance: float = inf) -> tuple[int, float] | None:
+        if self._extent is None or len(self._bounds) == 0:
+            return None
+
+        origin, inv_direction = _get_ray(ray)
+        cell_size = self.cell_size
+        min_x, min_y, max_x, max_y = self._extent
+        extent_bounds = (min_x * cell_size, min_y * cell_size, -inf, (max_x + 1) * cell_size, (max_y + 1) * cell_size, inf)
+        clip = _intersect_ray(origin, inv_direction, extent_bounds, max_distance)
+        if clip is None:
+            return None
+
+        distance, exit_distance = clip
+        direction = ray.direction
+        cell_x = floor((origin[0] + direction.x * distance) * self._inv_cell_size)
+        cell_y = floor((origin[1] + direction.y * distance) * self._inv_cell_size)
+
+        step_x, next_x, delta_x = _get_dda_axis(origin[0], inv_direction[0], cell_x, cell_size)
+        step_y, next_y, delta_y = _get_dda_axis(origin[1], inv_direction[1], cell_y, cell_size)
+
+        best_entity = None
+        best_distance = max_distance
+        tested = set[int]()
+        while distance <= min(exit_distance, best_distance):
+            for entity in self._cells.get((cell_x, cell_y), ()):
+                if entity in tested:
+                    continue
+
+                tested.add(entity)
+                hit = _intersect_ray(origin, inv_direction, self._bounds[entity], best_distance)
+                if hit is not None and (best_entity is None or hit[0] < best_distance):
+                    best_entity = entity
+                    best_distance = hit[0]
+
+            # hits inside already visited cells cannot be beaten by entities further along the ray
+            cell_exit = min(next_x, next_y)
+            if (best_entity is not None and best_distance <= cell_exit) or cell_exit == inf:
+                break
+
+            if next_x < next_y:
+                cell_x += step_x
+                distance = next_x
+                next_x += delta_x
+            else:
+                cell_y += step_y
+                distance = next_y
+                next_y += delta_y
+
+        return None if best_entity is None else (best_entity, best_distance)
+
+    def _update(self, entity: int, old_bounds: Bounds | None, new_bounds: Bounds) -> None:
+        cell_range = self._get_cell_range(new_bounds)
+        old_range = self._cell_ranges.get(entity, None)
+        if cell_range == old_range:
+            return
+
+        if old_range is not None:
+            self._remove(entity)
+
+        for cell in self._iter_cells(cell_range):
+            self._cells.setdefault(cell, set()).add(entity)
+
+        self._cell_ranges[entity] = cell_range
+
+        if self._extent is None:
+            self._extent = cell_range
+        else:
+            self._extent = (
+                min(self._extent[0], cell_range[0]),
+                min(self._extent[1], cell_range[1]),
+                max(self._extent[2], cell_range[2]),
+                max(self._extent[3], cell_range[3]))
+
+    def _remove(self, entity: int) -> None:
+        for cell in self._iter_cells(self._cell_ranges.pop(entity)):
+            entities = self._cells[cell]
+            entities.discard(entity)
+            if len(entities) == 0:
+                del self._cells[cell]
+
+    def _clear(self) -> None:
+        self._cells.clear()
+        self._cell_ranges.clear()
+        self._extent = None
+
+    def _get_candidates(self, bounds: Bounds) -> t.Iterable[int]:
+        min_x, min_y, max_x, max_y = self._get_cell_range(bounds)
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self._cells):
+            return self._bounds.keys()
+
+        candidates = set[int]()
+        for cell in self._iter_cells((min_x, min_y, max_x, max_y)):
+            entities = self._cells.get(cell, None)
+            if entities is not None:
+                candidates.update(entities)
+
+        return candidates
+
+    def _get_cell_range(self, bounds: Bounds) -> tuple[int, int, int, int]:
+        inv_cell_size = self._inv_cell_size
+        return (
+            floor(bounds[0] * inv_cell_size),
+            floor(bounds[1] * inv_cell_size),
+            floor(bounds[3] * inv_cell_size),
+            floor(bounds[4] * inv_cell_size))
+
+    @staticmethod
+    def _iter_cells(cell_range: tuple[int, int, int, int]) -> t.Iterator[tuple[int, int]]:
+        min_x, min_y, max_x, max_y = cell_range
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                yield (x, y)
+
+    @staticmethod
+    def _get_ring_cells(x: int, y: int, ring: int) -> t.Iterator[tuple[int, int]]:
+        if ring == 0:
+            yield (x, y)
+            return
+
+        for cell_x in range(x - ring, x + ring + 1):
+            yield (cell_x, y - ring)
+            yield (cell_x, y + ring)
+
+        for cell_y in range(y - ring + 1, y + ring):
+            yield (x - ring, cell_y)
+            yield (x + ring, cell_y)
+
+class _Node:
+    __slots__ = (
+        'bounds',
+        'parent',
+        'left',
+        'right',
+        'entity',
+        'height')
+
+    def __init__(self, bounds: Bounds, entity: int | None = None) -> None:
+        self.bounds = bounds
+        self.parent: _Node | None = None
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+        self.entity = entity
+        self.height = 0
+
+class AABBTree(SpatialIndex):
+    '''
+    Dynamic bounding volume hierarchy, suited for 3D scenes and objects of varying sizes.
+    Leaves store bounds enlarged by `margin`, so that small movements do not require
+    restructuring the tree. The tree is kept balanced using rotations.
+    '''
+
+    def __init__(self, margin: float = 0.1, local_bounds: math.AABB | None = None) -> None:
+        super().__init__(local_bounds)
+
+        self.margin = margin
+
+        self._root: _Node | None = None
+        self._leaves = dict[int, _Node]()
+
+    @property
+    def height(self) -> int:
+        return 0 if self._root is None else self._root.height
+
+    def nearest(self, point: math.Vector3, max_distance: float = inf) -> int | None:
+        if self._root is None:
+            return None
+
+        x, y, z = point
+        best_entity = None
+        best_distance = max_distance * max_distance
+
+        counter = 0
+        heap = [(_distance_squared(self._root.bounds, x, y, z), counter, self._root)]
+        while len(heap) != 0:
+            distance, _, node = heapq.heappop(heap)
+            if distance > best_distance:
+                break
+
+            if node.entity is not None:
+                distance = _distance_squared(self._bounds[node.entity], x, y, z)
+                if distance <= best_distance:
+                    best_entity = node.entity
+                    best_distance = distance
+
+                continue
+
+            for child in (node.left, node.right):
+                counter += 1
+                heapq.heappush(heap, (_distance_squared(child.bounds, x, y, z), counter, child)) # type: ignore[union-attr]
+
+        return best_entity
+
+    def raycast(self, ray: math.Ray, max_distance: float = inf) -> tuple[int, float] | None:
+        if self._root is None:
+            return None
+
+        origin, inv_direction = _get_ray(ray)
+        best_entity = None
+        best_distance = max_distance
+
+        stack = [self._root]
+        while len(stack) != 0:
+            node = stack.pop()
+            if _intersect_ray(origin, inv_direction, node.bounds, best_distance) is None:
+                continue
+
+            if node.entity is not None:
+                hit = _intersect_ray(origin, inv_direction, self._bounds[node.entity], best_distance)
+                if hit is not None and (best_entity is None or hit[0] < best_distance):
+                    best_entity = node.entity
+                    best_distance = hit[0]
+
+                continue
+
+            stack.append(node.left) # type: ignore[arg-type]
+            stack.append(node.right) # type: ignore[arg-type]
+
+        return None if best_entity is None else (best_entity, best_distance)
+
+    def _update(self, entity: int, old_bounds: Bounds | None, new_bounds: Bounds) -> None:
+        leaf = self._leaves.get(entity, None)
+        if leaf is not None:
+            if _contains(leaf.bounds, new_bounds):
+                return
+
+            self._remove_leaf(leaf)
+        else:
+            leaf = _Node(new_bounds, entity)
+            self._leaves[entity] = leaf
+
+        margin = self.margin
+        leaf.bounds = (
+            new_bounds[0] - margin,
+            new_bounds[1] - margin,
+            new_bounds[2] - margin,
+            new_bounds[3] + margin,
+            new_bounds[4] + margin,
+            new_bounds[5] + margin)
+        self._insert_leaf(leaf)
+
+    def _remove(self, entity: int) -> None:
+        self._remove_leaf(self._leaves.pop(entity))
+
+    def _clear(self) -> None:
+        self._root = None
+        self._leaves.clear()
+
+    def _get_candidates(self, bounds: Bounds) -> t.Iterable[int]:
+        if self._root is None:
+            return []
+
+        candidates = list[int]()
+        stack = [self._root]
+        while len(stack) != 0:
+            node = stack.pop()
+            if not _overlaps(node.bounds, bounds):
+                continue
+
+            if node.entity is not None:
+                candidates.append(node.entity)
+            else:
+                stack.append(node.left) # type: ignore[arg-type]
+                stack.append(node.right) # type: ignore[arg-type]
+
+        return candidates
+
+    def _insert_leaf(self, leaf: _Node) -> None:
+        if self._root is None:
+            self._root = leaf
+            leaf.parent = None
+            return
+
+        # find the best sibling using surface area heuristic
+        bounds = leaf.bounds
+        sibling = self._root
+        while sibling.entity is None:
+            left: _Node = sibling.left # type: ignore[assignment]
+            right: _Node = sibling.right # type: ignore[assignment]
+
+            combined_area = _area(_union(sibling.bounds, bounds))
+            cost = 2.0 * combined_area
+            inheritance_cost = 2.0 * (combined_area - _area(sibling.bounds))
+
+            left_cost = _area(_union(left.bounds, bounds)) + inheritance_cost
+            if left.entity is None:
+                left_cost -= _area(left.bounds)
+
+            right_cost = _area(_union(right.bounds, bounds)) + inheritance_cost
+            if right.entity is None:
+                right_cost -= _area(right.bounds)
+
+            if cost < left_cost and cost < right_cost:
+                break
+
+            sibling = left if left_cost < right_cost else right
+
+        old_parent = sibling.parent
+        new_parent = _Node(_union(sibling.bounds, bounds))
+        new_parent.parent = old_parent
+        new_parent.height = sibling.height + 1
+
+        if old_parent is None:
+            self._root = new_parent
+        elif old_parent.left is sibling:
+            old_parent.left = new_parent
+        else:
+            old_parent.right = new_parent
+
+        new_parent.left = sibling
+        new_parent.right = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+
+        self._refit(new_parent)
+
+    def _remove_leaf(self, leaf: _Node) -> None:
+        if leaf is self._root:
+            self._root = None
+            return
+
+        parent: _Node = leaf.parent # type: ignore[assignment]
+        grandparent = parent.parent
+        sibling: _Node = parent.left if parent.right is leaf else parent.right # type: ignore[assignment]
+
+        leaf.parent = None
+        sibling.parent = grandparent
+        if grandparent is None:
+            self._root = sibling
+            return
+
+        if grandparent.left is parent:
+            grandparent.left = sibling
+        else:
+            grandparent.right = sibling
+
+        self._refit(grandparent)
+
+    def _refit(self, node: _Node | None) -> None:
+        while node is not None:
+            node = self._balance(node)
+
+            left: _Node = node.left # type: ignore[assignment]
+            right: _Node = node.right # type: ignore[assignment]
+            node.height = 1 + max(left.height, right.height)
+            node.bounds = _union(left.bounds, right.bounds)
+
+            node = node.parent
+
+    def _balance(self, a: _Node) -> _Node:
+        '''
+        Performs a left or right rotation if node `a` is imbalanced. Returns the new root of the subtree.
+        '''
+
+        if a.entity is not None or a.height < 2:
+            return a
+
+        b: _Node = a.left # type: ignore[assignment]
+        c: _Node = a.right # type: ignore[assignment]
+        balance = c.height - b.height
+
+        if balance > 1:
+            f: _Node = c.left # type: ignore[assignment]
+            g: _Node = c.right # type: ignore[assignment]
+
+            self._replace_child(a, c)
+            c.left = a
+            a.parent = c
+
+            if f.height > g.height:
+                c.right = f
+                a.right = g
+                g.parent = a
+            else:
+                c.right = g
+                a.right = f
+                f.parent = a
+
+            a.bounds = _union(b.bounds, a.right.bounds)
+            a.height = 1 + max(b.height, a.right.height)
+            c.bounds = _union(a.bounds, c.right.bounds)
+            c.height = 1 + max(a.height, c.right.height)
+
+            return c
+
+        if balance < -1:
+            d: _Node = b.left # type: ignore[assignment]
+            e: _Node = b.right # type: ignore[assignment]
+
+            self._replace_child(a, b)
+            b.left = a
+            a.parent = b
+
+            if d.height > e.height:
+                b.right = d
+                a.left = e
+                e.parent = a
+            else:
+                b.right = e
+                a.left = d
+                d.parent = a
+
+            a.bounds = _union(c.bounds, a.left.bounds)
+            a.height = 1 + max(c.height, a.left.height)
+            b.bounds = _union(a.bounds, b.right.bounds)
+            b.height = 1 + max(a.height, b.right.height)
+
+            return b
+
+        return a
+
+    def _replace_child(self, old: _Node, new: _Node) -> None:
+        parent = old.parent
+        new.parent = parent
+        if parent is None:
+            self._root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+def _get_bounds(aabb: math.AABB) -> Bounds:
+    _min = aabb.min
+    _max = aabb.max
+    return (_min.x, _min.y, _min.z, _max.x, _max.y, _max.z)
+
+def _get_ray(ray: math.Ray) -> tuple[tuple[float, float, float], tuple[float | None, float | None, float | None]]:
+    origin = ray.origin
+    direction = ray.direction
+    return (
+        (origin.x, origin.y, origin.z),
+        tuple(None if x == 0.0 else 1.0 / x for x in (direction.x, direction.y, direction.z))) # type: ignore[return-value]
+
+def _get_dda_axis(origin: float, inv_direction: float | None, cell: int, cell_size: float) -> tuple[int, float, float]:
+    if inv_direction is None:
+        return (0, inf, inf)
+
+    if inv_direction > 0.0:
+        return (1, ((cell + 1) * cell_size - origin) * inv_direction, cell_size * inv_direction)
+
+    return (-1, (cell * cell_size - origin) * inv_direction, -cell_size * inv_direction)
+
+def _overlaps(a: Bounds, b: Bounds) -> bool:
+    return a[0] <= b[3] and a[3] >= b[0] \
+        and a[1] <= b[4] and a[4] >= b[1] \
+        and a[2] <= b[5] and a[5] >= b[2]
+
+def _contains(outer: Bounds, inner: Bounds) -> bool:
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and outer[2] <= inner[2] \
+        and outer[3] >= inner[3] and outer[4] >= inner[4] and outer[5] >= inner[5]
+
+def _union(a: Bounds, b: Bounds) -> Bounds:
+    return (
+        min(a[0], b[0]),
+        min(a[1], b[1]),
+        min(a[2], b[2]),
+        max(a[3], b[3]),
+        max(a[4], b[4]),
+        max(a[5], b[5]))
+
+def _area(bounds: Bounds) -> float:
+    x = bounds[3] - bounds[0]
+    y = bounds[4] - bounds[1]
+    z = bounds[5] - bounds[2]
+    return 2.0 * (x * y + y * z + z * x)
+
+def _distance_squared(bounds: Bounds, x: float, y: float, z: float) -> float:
+    dx = max(bounds[0] - x, 0.0, x - bounds[3])
+    dy = max(bounds[1] - y, 0.0, y - bounds[4])
+    dz = max(bounds[2] - z, 0.0, z - bounds[5])
+    return dx * dx + dy * dy + dz * dz
+
+def _intersect_ray(origin: tuple[float, float, float],
+                   inv_direction: tuple[float | None, float | None, float | None],
+                   bounds: Bounds,
+                   max_distance: float) -> tuple[float, float] | None:
+    near = 0.0
+    far = max_distance
+    for axis in range(3):
+        inv = inv_direction[axis]
+        if inv is None:
+            if origin[axis] < bounds[axis] or origin[axis] > bounds[axis + 3]:
+                return None
+
+            continue
+
+        t0 = (bounds[axis] - origin[axis]) * inv
+        t1 = (bounds[axis + 3] - origin[axis]) * inv
+        if t0 > t1:
+            t0, t1 = t1, t0
+
+        near = max(near, t0)
+        far = min(far, t1)
+        if near > far:
+            return None
+
+    return (near, far)
@@ -5,6 +5,8 @@ import numpy as np
 from spyke import _data, debug
 from spyke.graphics import gl, shader_cache
 from spyke.graphics.frame_data import FrameData
+from spyke.graphics.indirect import (DrawElementsIndirectCommandDtype,
+                                     pack_batches)
 from spyke.graphics.pipeline import (GraphicsPipeline, PipelineInfo,
                                      PipelineSettings)
 
@@ -22,16 +24,24 @@ class DeferredPipeline(GraphicsPipeline):
         self._geometry_vao: gl.VertexArray
         self._empty_vao: gl.VertexArray
         self._instance_buffer: gl.Buffer
+        self._indirect_instance_buffer: gl.Buffer | None = None
+        self._indirect_command_buffer: gl.Buffer | None = None
         self._camera_uniform_buffer: gl.Buffer
         self._lights_uniform_buffer: gl.Buffer
         self._framebuffer: gl.Framebuffer
 
         self._model_vertex_size = 0
+        self._instance_vertex_size = 0
+        self._max_indirect_instances = 0
+        self._max_indirect_commands = 0
         self._info = self._create_pipeline_info()
 
     @debug.profiled
     def initialize(self, settings: PipelineSettings, fb_width: int, fb_height: int) -> None:
         self._model_vertex_size = settings.model_vertex_size
+        self._instance_vertex_size = settings.instance_vertex_size
+        self._max_indirect_instances = settings.max_indirect_instances
+        self._max_indirect_commands = settings.max_indirect_commands
         self._create_buffers(settings)
         self._create_shaders(settings)
         self._create_vaos(settings)
@@ -43,6 +53,10 @@ class DeferredPipeline(GraphicsPipeline):
 
     def reset_buffers(self) -> None:
         self._instance_buffer.reset_data_offset()
+        if self._indirect_instance_buffer is not None:
+            self._indirect_instance_buffer.reset_data_offset()
+            self._indirect_command_buffer.reset_data_offset() # type: ignore[union-attr]
+
         self._camera_uniform_buffer.reset_data_offset()
         self._lights_uniform_buffer.reset_data_offset()
 
@@ -65,6 +79,10 @@ class DeferredPipeline(GraphicsPipeline):
         self._geometry_vao.delete()
         self._empty_vao.delete()
         self._instance_buffer.delete()
+        if self._indirect_instance_buffer is not None:
+            self._indirect_instance_buffer.delete()
+            self._indirect_command_buffer.delete() # type: ignore[union-attr]
+
         self._camera_uniform_buffer.delete()
         self._lights_uniform_buffer.delete()
         self._framebuffer.delete()
@@ -145,6 +163,13 @@ class DeferredPipeline(GraphicsPipeline):
         self._instance_buffer = gl.Buffer(settings.instance_buffer_size, gl.BufferFlag.MAP_WRITE_BIT | gl.BufferFlag.MAP_PERSISTENT_BIT)
         self._instance_buffer.set_debug_name('InstanceBuffer')
 
+        if settings.max_indirect_instances != 0 and settings.max_indirect_commands != 0:
+            self._indirect_instance_buffer = gl.Buffer(settings.max_indirect_instances * settings.instance_vertex_size, gl.BufferFlag.MAP_WRITE_BIT | gl.BufferFlag.MAP_PERSISTENT_BIT)
+            self._indirect_instance_buffer.set_debug_name('IndirectInstanceBuffer')
+
+            self._indirect_command_buffer = gl.Buffer(settings.max_indirect_commands * DrawElementsIndirectCommandDtype.itemsize, gl.BufferFlag.MAP_WRITE_BIT | gl.BufferFlag.MAP_PERSISTENT_BIT)
+            self._indirect_command_buffer.set_debug_name('IndirectCommandBuffer')
+
         self._camera_uniform_buffer = gl.Buffer(settings.uniform_buffer_size, gl.BufferFlag.MAP_WRITE_BIT | gl.BufferFlag.MAP_PERSISTENT_BIT)
         self._camera_uniform_buffer.bind_base(gl.BufferBaseTarget.UNIFORM_BUFFER, self._CAMERA_MATRICES_BUFFER_BINDING)
         self._camera_uniform_buffer.set_debug_name('CameraUniformBuffer')
@@ -189,6 +214,13 @@ class DeferredPipeline(GraphicsPipeline):
         self._camera_uniform_buffer.bind(gl.BufferTarget.UNIFORM_BUFFER)
         frame_data.white_texture.bind_to_unit(0)
 
+        if len(frame_data.static_batches) != 0:
+            self._render_static_batches(frame_data)
+
+        if self._can_render_indirect(frame_data):
+            self._render_batches_indirect(frame_data)
+            return
+
         for model, batches in frame_data.batches.items():
             self._geometry_vao.bind_index_buffer(model.buffer)
             self._geometry_vao.bind_vertex_buffer(model.buffer, 0, self._model_vertex_size, model.vertex_offset)
@@ -199,13 +231,89 @@ class DeferredPipeline(GraphicsPipeline):
                         self._instance_buffer.write(batch.instance_data[:batch.current_instance])
                         self._instance_buffer.transfer()
 
-                    gl.bind_textures(batch.textures, first=1)
+                    gl.bind_texture_ids(batch.texture_ids, first=1)
                     gl.draw_elements_instanced(
                         batch.draw_mode,
                         model.index_count,
                         model.index_type,
                         batch.current_instance)
 
+    def _can_render_indirect(self, frame_data: FrameData) -> bool:
+        if self._indirect_instance_buffer is None:
+            return False
+
+        batches = [x for model_batches in frame_data.batches.values() for x in model_batches]
+        return len(batches) <= self._max_indirect_commands \
+            and sum(x.current_instance for x in batches) <= self._max_indirect_instances
+
+    @debug.profiled
+    def _render_batches_indirect(self, frame_data: FrameData) -> None:
+        assert self._indirect_instance_buffer is not None and self._indirect_command_buffer is not None
+
+        draw_data = pack_batches(frame_data.batches)
+        if len(draw_data.draws) == 0:
+            return
+
+        with debug.profiled_scope('transfer_instance_data'):
+            self._indirect_instance_buffer.write(draw_data.instance_data)
+            self._indirect_instance_buffer.transfer()
+
+            # commands of all draws are uploaded once, each draw reads them at its own offset
+            self._indirect_command_buffer.write(draw_data.commands)
+            self._indirect_command_buffer.transfer()
+
+        self._geometry_vao.bind_vertex_buffer(self._indirect_instance_buffer, 1, self._instance_vertex_size, 0, 1)
+        self._indirect_command_buffer.bind(gl.BufferTarget.DRAW_INDIRECT_BUFFER)
+
+        bound_model = None
+        for draw in draw_data.draws:
+            with debug.profiled_scope('render_indirect'):
+                if draw.model is not bound_model:
+                    self._geometry_vao.bind_index_buffer(draw.model.buffer)
+                    self._geometry_vao.bind_vertex_buffer(draw.model.buffer, 0, self._model_vertex_size, draw.model.vertex_offset)
+                    bound_model = draw.model
+
+                gl.bind_texture_ids(draw.texture_ids, first=1)
+                gl.multi_draw_elements_indirect(
+                    draw.draw_mode,
+                    draw.model.index_type,
+                    draw.command_count,
+                    DrawElementsIndirectCommandDtype.itemsize,
+                    draw.first_command * DrawElementsIndirectCommandDtype.itemsize)
+
+        self._geometry_vao.bind_vertex_buffer(self._instance_buffer, 1, self._instance_vertex_size, 0, 1)
+
+    @debug.profiled
+    def _render_static_batches(self, frame_data: FrameData) -> None:
+        for static_batch in frame_data.static_batches:
+            if static_batch.is_dirty:
+                static_batch.upload()
+
+            if static_batch.buffer is None:
+                continue
+
+            model = static_batch.model
+            self._geometry_vao.bind_index_buffer(model.buffer)
+            self._geometry_vao.bind_vertex_buffer(model.buffer, 0, self._model_vertex_size, model.vertex_offset)
+            self._geometry_vao.bind_vertex_buffer(static_batch.buffer, 1, self._instance_vertex_size, 0, 1)
+
+            # instances of all batches are stored one after another in the static buffer
+            base_instance = 0
+            for batch in static_batch.batches:
+                with debug.profiled_scope('render_static_batch'):
+                    gl.bind_texture_ids(batch.texture_ids, first=1)
+                    gl.draw_elements_instanced_base_instance(
+                        batch.draw_mode,
+                        model.index_count,
+                        model.index_type,
+                        batch.current_instance,
+                        base_instance)
+
+                base_instance += batch.current_instance
+
+        # restore per-frame instance buffer used by dynamic batches
+        self._geometry_vao.bind_vertex_buffer(self._instance_buffer, 1, self._instance_vertex_size, 0, 1)
+
     @debug.profiled
     def _execute_light_pass(self, frame_data: FrameData) -> None:
         gl.polygon_mode(gl.CullFace.FRONT_AND_BACK, gl.PolygonMode.FILL)
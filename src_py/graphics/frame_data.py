@@ -9,6 +9,7 @@ if t.TYPE_CHECKING:
     from spyke.assets import Model
     from spyke.graphics.light_data import LightData
     from spyke.graphics.render_batch import RenderBatch
+    from spyke.graphics.static_batch import StaticBatch
 
 @dataclasses.dataclass(slots=True)
 class FrameData:
@@ -22,6 +23,8 @@ class FrameData:
     polygon_mode: 'gl.PolygonMode' = gl.PolygonMode.FILL
     batches: defaultdict['Model', list['RenderBatch']] = dataclasses.field(default_factory=lambda: defaultdict(list))
     lights: list['LightData'] = dataclasses.field(default_factory=list)
+    # static batches are retained between frames
+    static_batches: list['StaticBatch'] = dataclasses.field(default_factory=list)
 
     def reset(self) -> None:
         self.batches.clear()
@@ -1422,7 +1422,7 @@ def draw_elements_instanced_base_instance(mode: DrawMode, count: int, type: Elem
 def draw_elements_instanced_base_vertex(mode: DrawMode, count: int, type: ElementsType, instance_count: int, base_vertex: int, /) -> None: ...
 def draw_elements_instanced_base_vertex_base_instance(mode: DrawMode, count: int, type: ElementsType, instance_count: int, base_vertex: int, base_instance: int, /) -> None: ...
 def draw_elements_indirect(mode: DrawMode, type: ElementsType, /) -> None: ...
-def multi_draw_elements_indirect(mode: DrawMode, type: ElementsType, draw_count: int, stride: int, /) -> None: ...
+def multi_draw_elements_indirect(mode: DrawMode, type: ElementsType, draw_count: int, stride: int, offset: int = 0, /) -> None: ...
 
 def clear(mask: ClearMask, /) -> None:
     '''
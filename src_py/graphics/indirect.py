@@ -0,0 +1,128 @@
+import dataclasses
+import typing as t
+
+import numpy as np
+
+from spyke.graphics import gl
+from spyke.graphics.render_batch import InstanceDtype, RenderBatch
+
+if t.TYPE_CHECKING:
+    from spyke.assets import Model
+
+# layout of DrawElementsIndirectCommand structure consumed by glMultiDrawElementsIndirect
+DrawElementsIndirectCommandDtype = np.dtype([
+    ('count', np.uint32),
+    ('instance_count', np.uint32),
+    ('first_index', np.uint32),
+    ('base_vertex', np.int32),
+    ('base_instance', np.uint32)])
+
+@dataclasses.dataclass(slots=True)
+class IndirectDraw:
+    '''
+    Single multi-draw-indirect call, drawing `command_count` commands starting
+    at `first_command`. All of them use the same model, draw mode and textures.
+    '''
+
+    model: 'Model'
+    draw_mode: gl.DrawMode
+    texture_ids: list[int]
+    first_command: int
+    command_count: int
+
+@dataclasses.dataclass(slots=True)
+class IndirectDrawData:
+    instance_data: np.ndarray
+    commands: np.ndarray
+    draws: list[IndirectDraw]
+
+def build_draw_commands(index_counts: np.ndarray, instance_counts: np.ndarray, first_instance: int = 0) -> np.ndarray:
+    '''
+    Builds array of indirect draw commands, one per batch. Instances of consecutive
+    batches are expected to be stored one after another, starting at `first_instance`.
+
+    @index_counts: Number of indices of the model drawn by every batch.
+    @instance_counts: Number of instances of every batch.
+    @first_instance: Index of the first instance in the instance buffer.
+    '''
+
+    commands = np.zeros(len(instance_counts), dtype=DrawElementsIndirectCommandDtype)
+    commands['count'] = index_counts
+    commands['instance_count'] = instance_counts
+    # exclusive prefix sum of instance counts
+    np.cumsum(instance_counts[:-1], out=commands['base_instance'][1:])
+    commands['base_instance'] += first_instance
+
+    return commands
+
+def pack_batches(batches: t.Mapping['Model', t.Sequence[RenderBatch]]) -> IndirectDrawData:
+    '''
+    Packs instance data of all non-empty batches into a single array and builds draw commands
+    referencing it. Batches of the same model and draw mode are merged into a single draw
+    as long as all textures they use fit into the texture limit of a batch, in which case
+    texture indices of their instances are remapped to the merged texture set.
+
+    @batches: Render batches grouped by the model they draw.
+    '''
+
+    draws = list[IndirectDraw]()
+    draw_batches = list[list[RenderBatch]]()
+    for model, model_batches in batches.items():
+        first_draw = len(draws)
+        for batch in model_batches:
+            if batch.current_instance == 0:
+                continue
+
+            for draw, used_batches in zip(draws[first_draw:], draw_batches[first_draw:]):
+                if draw.draw_mode != batch.draw_mode:
+                    continue
+
+                texture_ids = _merge_texture_ids(draw.texture_ids, batch.texture_ids, batch.max_texture_count)
+                if texture_ids is not None:
+                    draw.texture_ids = texture_ids
+                    draw.command_count += 1
+                    used_batches.append(batch)
+                    break
+            else:
+                draws.append(IndirectDraw(model, batch.draw_mode, list(batch.texture_ids), 0, 1))
+                draw_batches.append([batch])
+
+    if len(draws) == 0:
+        return IndirectDrawData(
+            np.empty((0,), dtype=InstanceDtype),
+            np.empty((0,), dtype=DrawElementsIndirectCommandDtype),
+            [])
+
+    instance_data = list[np.ndarray]()
+    index_counts = list[int]()
+    instance_counts = list[int]()
+    for draw, used_batches in zip(draws, draw_batches):
+        draw.first_command = len(instance_counts)
+        for batch in used_batches:
+            instance_data.append(_remap_texture_indices(batch, draw.texture_ids))
+            index_counts.append(draw.model.index_count)
+            instance_counts.append(batch.current_instance)
+
+    commands = build_draw_commands(
+        np.array(index_counts, dtype=np.uint32),
+        np.array(instance_counts, dtype=np.uint32))
+
+    return IndirectDrawData(np.concatenate(instance_data), commands, draws)
+
+def _merge_texture_ids(texture_ids: list[int], other: list[int], max_texture_count: int) -> list[int] | None:
+    # textures already used keep their indices, so that instances using them do not need remapping
+    merged = texture_ids + [x for x in other if x not in texture_ids]
+    return merged if len(merged) <= max_texture_count else None
+
+def _remap_texture_indices(batch: RenderBatch, texture_ids: list[int]) -> np.ndarray:
+    data = batch.instance_data[:batch.current_instance]
+    if texture_ids[:len(batch.texture_ids)] == batch.texture_ids:
+        return data
+
+    # index 0 (white texture) stays the same, index `i` refers to `batch.texture_ids[i - 1]`
+    remap = np.array([0, *(texture_ids.index(x) + 1 for x in batch.texture_ids)], dtype=np.float32)
+    data = data.copy()
+    data['albedo_idx'] = remap[data['albedo_idx'].astype(np.intp)]
+    data['specular_idx'] = remap[data['specular_idx'].astype(np.intp)]
+
+    return data
@@ -24,6 +24,10 @@ class PipelineSettings:
     max_textures_per_batch: int
     max_lights: int
 
+    # multi-draw-indirect rendering is disabled if any of these is 0
+    max_indirect_instances: int = 0
+    max_indirect_commands: int = 0
+
 class GraphicsPipeline(abc.ABC):
     def __init__(self) -> None:
         self._info = PipelineInfo()
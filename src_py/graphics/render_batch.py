@@ -19,10 +19,17 @@ class RenderBatch:
         self.max_instance_count = max_instance_count
         self.max_texture_count = max_texture_count
         self.current_instance = 0
-        self.textures = list[gl.Texture]()
+        # OpenGL ids of textures used by the batch, instance texture index `i` refers to `texture_ids[i - 1]`
+        self.texture_ids = list[int]()
         self.draw_mode = draw_mode
         self.instance_data = np.empty((max_instance_count,), dtype=InstanceDtype)
 
+        # field views are created once so instances can be written without allocating per call
+        self._colors = self.instance_data['color']
+        self._albedo_indices = self.instance_data['albedo_idx']
+        self._specular_indices = self.instance_data['specular_idx']
+        self._transforms = self.instance_data['transform']
+
     # TODO Materials to store color and texture inside them
     @debug.profiled
     def try_add_instance(self,
@@ -32,21 +39,72 @@ class RenderBatch:
         if self._too_many_instances() or self._cannot_use_textures(textures):
             return False
 
-        current_instance = self.instance_data[self.current_instance]
-        current_instance[0] = np.frombuffer(color, dtype=np.float32)
-        current_instance[1] = self._get_texture_index(textures[0]) # albedo
-        current_instance[2] = self._get_texture_index(textures[1]) # specular
-        current_instance[3] = np.frombuffer(transform, dtype=np.float32)
+        idx = self.current_instance
+        color.write_to(self._colors, idx)
+        self._albedo_indices[idx] = self._get_texture_index(textures[0])
+        self._specular_indices[idx] = self._get_texture_index(textures[1])
+        transform.write_to(self._transforms, idx)
         self.current_instance += 1
 
         return True
 
+    @debug.profiled
+    def add_instances(self,
+                      transforms: np.ndarray,
+                      colors: np.ndarray,
+                      albedo_ids: np.ndarray,
+                      specular_ids: np.ndarray) -> int:
+        '''
+        Copies as many of the given instances as possible into the batch, in order. Stops
+        when the batch is full or when the next instance would need more textures than
+        the batch can use. Returns number of instances added.
+
+        @transforms: Array of shape (N, 16) with column-major instance transforms.
+        @colors: Array of shape (N, 4) with instance colors.
+        @albedo_ids: Array of shape (N,) with OpenGL ids of albedo textures, 0 for no texture.
+        @specular_ids: Array of shape (N,) with OpenGL ids of specular textures, 0 for no texture.
+        '''
+
+        count = min(len(transforms), self.max_instance_count - self.current_instance)
+        if count <= 0:
+            return 0
+
+        ids = np.stack((albedo_ids[:count], specular_ids[:count]), axis=1).ravel()
+        unique_ids, first_indices = np.unique(ids, return_index=True)
+        is_new = (unique_ids != 0) & ~np.isin(unique_ids, self.texture_ids)
+        new_ids = unique_ids[is_new]
+        if len(new_ids) != 0:
+            # new textures are assigned slots in order of their first use
+            new_first_indices = first_indices[is_new]
+            order = np.argsort(new_first_indices)
+            new_ids = new_ids[order]
+            new_first_indices = new_first_indices[order]
+            free_slots = self.max_texture_count - len(self.texture_ids)
+            if len(new_ids) > free_slots:
+                count = int(new_first_indices[free_slots]) // 2
+                if count == 0:
+                    return 0
+
+                new_ids = new_ids[new_first_indices < count * 2]
+
+            self.texture_ids.extend(new_ids.tolist())
+
+        start = self.current_instance
+        end = start + count
+        self._transforms[start:end] = transforms[:count]
+        self._colors[start:end] = colors[:count]
+        self._albedo_indices[start:end] = self._get_texture_indices(albedo_ids[:count])
+        self._specular_indices[start:end] = self._get_texture_indices(specular_ids[:count])
+        self.current_instance = end
+
+        return count
+
     def _too_many_instances(self) -> bool:
         return self.current_instance >= self.max_instance_count
 
-    def _cannot_use_textures(self, textures: t.Iterable[gl.Texture]) -> bool:
+    def _cannot_use_textures(self, textures: t.Iterable[gl.Texture | None]) -> bool:
         for texture in textures:
-            if texture is not None and texture not in self.textures and len(self.textures) >= self.max_texture_count:
+            if texture is not None and texture.id not in self.texture_ids and len(self.texture_ids) >= self.max_texture_count:
                 return True
 
         return False
@@ -56,7 +114,13 @@ class RenderBatch:
             return 0
 
         try:
-            return self.textures.index(texture)
+            return self.texture_ids.index(texture.id) + 1
         except ValueError:
-            self.textures.append(texture)
-            return len(self.textures)
+            self.texture_ids.append(texture.id)
+            return len(self.texture_ids)
+
+    def _get_texture_indices(self, texture_ids: np.ndarray) -> np.ndarray:
+        # index 0 is reserved for the white texture, used by instances without texture
+        keys = np.array([0, *self.texture_ids], dtype=texture_ids.dtype)
+        sorter = np.argsort(keys)
+        return sorter[np.searchsorted(keys, texture_ids, sorter=sorter)]
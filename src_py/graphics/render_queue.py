@@ -0,0 +1,184 @@
+import dataclasses
+import typing as t
+
+import numpy as np
+
+from spyke import debug, math
+
+if t.TYPE_CHECKING:
+    from spyke.assets import Model
+
+# layout of the sort key, from the most significant bits:
+# pipeline (4 bits) | model (12 bits) | texture set (16 bits) | depth (32 bits)
+PIPELINE_BITS = 4
+MODEL_BITS = 12
+TEXTURE_SET_BITS = 16
+DEPTH_BITS = 32
+
+_PIPELINE_SHIFT = MODEL_BITS + TEXTURE_SET_BITS + DEPTH_BITS
+_MODEL_SHIFT = TEXTURE_SET_BITS + DEPTH_BITS
+_TEXTURE_SET_SHIFT = DEPTH_BITS
+_RADIX_BITS = 16
+
+@dataclasses.dataclass(slots=True)
+class RenderRun:
+    '''
+    Consecutive sorted instances that use the same model and pipeline.
+    '''
+
+    model: 'Model'
+    pipeline: int
+    transforms: np.ndarray
+    colors: np.ndarray
+    albedo_ids: np.ndarray
+    specular_ids: np.ndarray
+
+class RenderQueue:
+    '''
+    Collects instance submissions made during a frame and orders them by 64-bit sort keys
+    built from pipeline, model, texture set and depth. Instances sharing model and textures
+    end up next to each other, which lets them be packed into fewer, fuller batches,
+    and within such group instances are ordered front to back.
+    '''
+
+    def __init__(self) -> None:
+        self._model_indices = dict['Model', int]()
+        self._submissions = list[tuple[int, int, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def submit(self,
+               model: 'Model',
+               transforms: np.ndarray,
+               colors: np.ndarray,
+               albedo_ids: np.ndarray,
+               specular_ids: np.ndarray,
+               pipeline: int = 0) -> None:
+        '''
+        Adds instances to the queue. Arrays are referenced, not copied, until the queue is sorted.
+
+        @model: Model of the instances.
+        @transforms: Array of shape (N, 16) with column-major instance transforms.
+        @colors: Array of shape (N, 4) with instance colors.
+        @albedo_ids: Array of shape (N,) with OpenGL ids of albedo textures.
+        @specular_ids: Array of shape (N,) with OpenGL ids of specular textures.
+        @pipeline: Pipeline (render state) group of the instances, lower groups are drawn first.
+        '''
+
+        if not 0 <= pipeline < 1 << PIPELINE_BITS:
+            raise ValueError(f'Pipeline index has to be in range [0, {1 << PIPELINE_BITS}), got: {pipeline}.')
+
+        if len(transforms) == 0:
+            return
+
+        model_index = self._model_indices.setdefault(model, len(self._model_indices))
+        self._submissions.append((pipeline, model_index, transforms, colors, albedo_ids, specular_ids))
+        self._count += len(transforms)
+
+    def clear(self) -> None:
+        self._model_indices.clear()
+        self._submissions.clear()
+        self._count = 0
+
+    @debug.profiled
+    def sort(self, camera_position: math.Vector3) -> list[RenderRun]:
+        '''
+        Sorts all submitted instances and returns them split into runs of instances
+        that share model and pipeline, in draw order. Clears the queue.
+
+        @camera_position: Position of the camera, used to order instances front to back.
+        '''
+
+        if self._count == 0:
+            return []
+
+        models = list(self._model_indices)
+        submissions = self._submissions
+        counts = [len(x[2]) for x in submissions]
+        pipelines = np.repeat(np.array([x[0] for x in submissions], dtype=np.uint64), counts)
+        model_indices = np.repeat(np.array([x[1] for x in submissions], dtype=np.uint64), counts)
+        transforms = np.concatenate([x[2] for x in submissions])
+        colors = np.concatenate([x[3] for x in submissions])
+        albedo_ids = np.concatenate([x[4] for x in submissions])
+        specular_ids = np.concatenate([x[5] for x in submissions])
+        self.clear()
+
+        keys = build_sort_keys(pipelines, model_indices, albedo_ids, specular_ids, transforms[:, 12:15], camera_position)
+        order = radix_argsort(keys)
+
+        transforms = transforms[order]
+        colors = colors[order]
+        albedo_ids = albedo_ids[order]
+        specular_ids = specular_ids[order]
+        pipelines = pipelines[order]
+        model_indices = model_indices[order]
+
+        # runs are split on actual model indices, so they stay correct even if model bits of keys were saturated
+        groups = (pipelines << np.uint64(32)) | model_indices
+        bounds = [0, *(np.flatnonzero(np.diff(groups)) + 1).tolist(), len(order)]
+
+        runs = list[RenderRun]()
+        for start, end in zip(bounds, bounds[1:]):
+            runs.append(RenderRun(
+                models[int(model_indices[start])],
+                int(pipelines[start]),
+                transforms[start:end],
+                colors[start:end],
+                albedo_ids[start:end],
+                specular_ids[start:end]))
+
+        return runs
+
+def build_sort_keys(pipelines: np.ndarray,
+                    model_indices: np.ndarray,
+                    albedo_ids: np.ndarray,
+                    specular_ids: np.ndarray,
+                    positions: np.ndarray,
+                    camera_position: math.Vector3) -> np.ndarray:
+    '''
+    Builds 64-bit sort keys of instances. Texture sets are ranked by their (albedo, specular)
+    pair and depth is the squared distance from the camera, stored as float bits,
+    which for non-negative floats preserve their order.
+
+    @pipelines: Pipeline group of every instance.
+    @model_indices: Index of the model of every instance.
+    @albedo_ids: Albedo texture id of every instance.
+    @specular_ids: Specular texture id of every instance.
+    @positions: Array of shape (N, 3) with instance positions.
+    @camera_position: Position of the camera.
+    '''
+
+    texture_pairs = (albedo_ids.astype(np.uint64) << np.uint64(32)) | specular_ids.astype(np.uint64)
+    _, texture_sets = np.unique(texture_pairs, return_inverse=True)
+
+    offsets = positions - np.asarray(camera_position, dtype=np.float32)
+    depths = np.einsum('ij,ij->i', offsets, offsets).astype(np.float32)
+
+    keys = np.minimum(pipelines, (1 << PIPELINE_BITS) - 1).astype(np.uint64) << np.uint64(_PIPELINE_SHIFT)
+    keys |= np.minimum(model_indices, (1 << MODEL_BITS) - 1).astype(np.uint64) << np.uint64(_MODEL_SHIFT)
+    keys |= np.minimum(texture_sets.ravel(), (1 << TEXTURE_SET_BITS) - 1).astype(np.uint64) << np.uint64(_TEXTURE_SET_SHIFT)
+    keys |= depths.view(np.uint32).astype(np.uint64)
+
+    return keys
+
+def radix_argsort(keys: np.ndarray) -> np.ndarray:
+    '''
+    Returns indices that stably sort 64-bit unsigned keys. Performs least significant
+    digit radix sort with 16-bit digits, for which numpy's stable sort is a counting sort.
+    Passes over digits that are equal for all keys are skipped.
+
+    @keys: Array of unsigned 64-bit keys.
+    '''
+
+    order = np.arange(len(keys))
+    mask = np.uint64((1 << _RADIX_BITS) - 1)
+    for shift in range(0, 64, _RADIX_BITS):
+        digits = ((keys >> np.uint64(shift)) & mask).astype(np.uint16)
+        if digits.min() == digits.max():
+            continue
+
+        order = order[np.argsort(digits[order], kind='stable')]
+
+    return order
@@ -2,6 +2,7 @@ import ctypes as ct
 import dataclasses
 import logging
 import typing as t
+from collections.abc import Buffer as SupportsBufferProtocol
 
 import numpy as np
 
@@ -13,6 +14,9 @@ from spyke.graphics.light_data import LightData
 from spyke.graphics.pipeline import (GraphicsPipeline, PipelineInfo,
                                      PipelineSettings)
 from spyke.graphics.render_batch import RenderBatch
+from spyke.graphics.render_queue import RenderQueue
+from spyke.graphics.static_batch import StaticBatch
+from spyke.graphics.texture_slots import TextureSlotCache, TextureSlotStats
 from spyke.scheduler import Scheduler
 
 if t.TYPE_CHECKING:
@@ -22,12 +26,18 @@ DEFERRED_PIPELINE = DeferredPipeline()
 
 MAX_MODEL_VERTICES = 8192
 MAX_INSTANCES = 1024
+MAX_INDIRECT_INSTANCES = 65536
+MAX_INDIRECT_COMMANDS = 4096
 MAX_INDICES = 16384
 INDEX_SIZE = ct.sizeof(ct.c_ushort)
 
 _FLOAT_SIZE = ct.sizeof(ct.c_float)
 _UBYTE_SIZE = ct.sizeof(ct.c_ubyte)
 _MAX_TEXTURES_COUNT = 16
+# textures bound through the slot cache use units above the ones used by pipelines,
+# which bind white texture and batch textures to units [0, _MAX_TEXTURES_COUNT) themselves
+_TEXTURE_SLOTS_FIRST_UNIT = _MAX_TEXTURES_COUNT
+_TEXTURE_SLOTS_COUNT = 16
 _MAX_LIGHTS_COUNT = 32
 
 # space for single 640x480 RGBA8 texture
@@ -110,11 +120,6 @@ class TextureUploadBuffer:
 
         return buffer
 
-class TextureBinding:
-    def __init__(self, unit: int) -> None:
-        self.unit = unit
-        self.age = 0
-
 @debug.profiled
 def initialize(width: int, height: int) -> None:
     global _frame_data
@@ -142,7 +147,9 @@ def initialize(width: int, height: int) -> None:
         _InstanceVertex.SIZE,
         _LightData.SIZE,
         _MAX_TEXTURES_COUNT - 1,
-        _MAX_LIGHTS_COUNT)
+        _MAX_LIGHTS_COUNT,
+        MAX_INDIRECT_INSTANCES,
+        MAX_INDIRECT_COMMANDS)
     DEFERRED_PIPELINE.initialize(pipeline_settings, width, height)
 
     _frame_data = FrameData(_white_texture, width, height)
@@ -152,6 +159,9 @@ def initialize(width: int, height: int) -> None:
 def shutdown() -> None:
     DEFERRED_PIPELINE.destroy()
 
+    for static_batch in _frame_data.static_batches:
+        static_batch.delete()
+
     _white_texture.delete()
     for buffer in _texture_upload_buffers:
         buffer.delete()
@@ -287,11 +297,14 @@ def begin_frame(pipeline: GraphicsPipeline) -> None:
 
     _current_pipeline = pipeline
     _frame_data.reset()
+    _render_queue.clear()
+    _report_texture_slot_stats()
 
 @debug.profiled
 def end_frame() -> None:
     assert _current_pipeline is not None, 'Cannot render frame: no pipeline bound'
 
+    _flush_render_queue()
     _current_pipeline.execute(_frame_data)
 
 @debug.profiled
@@ -316,6 +329,117 @@ def render(model: 'Model',
 
     batch_list.append(new_batch)
 
+@debug.profiled
+def render_many(model: 'Model',
+                transforms: SupportsBufferProtocol,
+                colors: SupportsBufferProtocol,
+                albedo_ids: SupportsBufferProtocol,
+                specular_ids: SupportsBufferProtocol,
+                pipeline: int = 0) -> None:
+    '''
+    Renders multiple instances of the model at once. Instances are collected in the render
+    queue and sorted by pipeline, model, textures and depth at the end of the frame. Then they are
+    copied into render batches with slice assignments; new batches are created only when
+    the current one runs out of instance or texture slots. Provided arrays are not copied
+    and must not be modified before the end of the frame.
+
+    @model: Model to render.
+    @transforms: Instance transforms, either `Matrix4Array` or array of shape (N, 4, 4) or (N, 16) with column-major matrices.
+    @colors: Instance colors, array of shape (N, 4) or a single color used for all instances.
+    @albedo_ids: OpenGL ids of albedo textures, array of shape (N,) or a single id. 0 means no texture.
+    @specular_ids: OpenGL ids of specular textures, array of shape (N,) or a single id. 0 means no texture.
+    @pipeline: Render state group of the instances, lower groups are drawn first.
+    '''
+
+    _render_queue.submit(model, *_get_instance_arrays(transforms, colors, albedo_ids, specular_ids), pipeline)
+
+@debug.profiled
+def add_static_batch(model: 'Model',
+                     transforms: SupportsBufferProtocol,
+                     colors: SupportsBufferProtocol,
+                     albedo_ids: SupportsBufferProtocol,
+                     specular_ids: SupportsBufferProtocol) -> StaticBatch:
+    '''
+    Registers instances of the model that are drawn every frame until the batch is removed
+    with `remove_static_batch`. Their instance data is uploaded to a dedicated GPU buffer once
+    and uploaded again only after the batch is updated or invalidated. Use it for
+    geometry that doesn't move. Parameters are the same as for `render_many`.
+    '''
+
+    static_batch = StaticBatch(model)
+    _add_instances(static_batch.batches, *_get_instance_arrays(transforms, colors, albedo_ids, specular_ids))
+    _frame_data.static_batches.append(static_batch)
+
+    return static_batch
+
+@debug.profiled
+def update_static_batch(static_batch: StaticBatch,
+                        transforms: SupportsBufferProtocol,
+                        colors: SupportsBufferProtocol,
+                        albedo_ids: SupportsBufferProtocol,
+                        specular_ids: SupportsBufferProtocol) -> None:
+    '''
+    Replaces all instances of the static batch. Parameters are the same as for `render_many`.
+
+    @static_batch: Static batch returned by `add_static_batch`.
+    '''
+
+    static_batch.batches.clear()
+    _add_instances(static_batch.batches, *_get_instance_arrays(transforms, colors, albedo_ids, specular_ids))
+    static_batch.invalidate()
+
+def remove_static_batch(static_batch: StaticBatch) -> None:
+    '''
+    Stops drawing the static batch and releases its GPU buffer.
+    If the batch was already removed this function does nothing.
+
+    @static_batch: Static batch returned by `add_static_batch`.
+    '''
+
+    if static_batch in _frame_data.static_batches:
+        _frame_data.static_batches.remove(static_batch)
+        static_batch.delete()
+
+@debug.profiled
+def _flush_render_queue() -> None:
+    for run in _render_queue.sort(_frame_data.camera_pos):
+        _add_instances(_frame_data.batches[run.model], run.transforms, run.colors, run.albedo_ids, run.specular_ids)
+
+def _get_instance_arrays(transforms: SupportsBufferProtocol,
+                         colors: SupportsBufferProtocol,
+                         albedo_ids: SupportsBufferProtocol,
+                         specular_ids: SupportsBufferProtocol) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    _transforms = np.asarray(transforms, dtype=np.float32).reshape(-1, 16)
+    count = len(_transforms)
+
+    return (
+        _transforms,
+        np.broadcast_to(np.asarray(colors, dtype=np.float32), (count, 4)),
+        np.broadcast_to(np.asarray(albedo_ids, dtype=np.uint32), (count,)),
+        np.broadcast_to(np.asarray(specular_ids, dtype=np.uint32), (count,)))
+
+def _add_instances(batch_list: list[RenderBatch],
+                   transforms: np.ndarray,
+                   colors: np.ndarray,
+                   albedo_ids: np.ndarray,
+                   specular_ids: np.ndarray) -> None:
+    count = len(transforms)
+    start = 0
+    with debug.profiled_scope('fill_existing_batches'):
+        for batch in batch_list:
+            if start == count:
+                return
+
+            start += batch.add_instances(transforms[start:], colors[start:], albedo_ids[start:], specular_ids[start:])
+
+    while start < count:
+        new_batch = _create_new_batch()
+        added = new_batch.add_instances(transforms[start:], colors[start:], albedo_ids[start:], specular_ids[start:])
+        assert added != 0, 'Failed to add instances to a newly created batch'
+
+        batch_list.append(new_batch)
+        start += added
+
 # TODO Reorder light data so that color is first and A component is the intensity
 @debug.profiled
 def add_light(position: math.Vector3,
@@ -327,29 +451,41 @@ def add_light(position: math.Vector3,
     _frame_data.lights.append(LightData(position, color, intensity))
 
 def bind_texture(texture_id: int) -> int:
-    slot = _textures.get(texture_id, None)
-    if slot is not None:
-        return slot.unit
+    '''
+    Binds texture to one of the texture units and returns the unit. Textures that are
+    already bound are not bound again; if all units are taken the least recently used one is reused.
+
+    @texture_id: OpenGL id of the texture.
+    '''
+
+    return _texture_slots.bind(texture_id)
 
-    if len(_textures) < _max_bound_textures:
-        unit = len(_textures)
-        _textures[texture_id] = TextureBinding(unit)
-        gl.bind_texture_id(texture_id, unit)
+def unbind_texture(texture_id: int) -> None:
+    '''
+    Releases texture unit used by the texture, should be called when the texture gets deleted.
 
-        return unit
+    @texture_id: OpenGL id of the texture.
+    '''
 
-    old_texture_id, slot = sorted(_textures.items(), key=lambda x: x[1].age, reverse=True)[0]
-    del _textures[old_texture_id]
+    _texture_slots.remove(texture_id)
 
-    slot.age = 0
-    _textures[texture_id] = slot
-    gl.bind_texture_id(texture_id, unit)
+def delete_texture(texture: gl.Texture) -> None:
+    '''
+    Deletes the texture, releasing texture unit it was bound to, so that the unit
+    is not reported as bound to a texture id that might get reused by OpenGL.
 
-    return slot.unit
+    @texture: The texture to delete.
+    '''
 
-def update_textures() -> None:
-    for slot in _textures.values():
-        slot.age += 1
+    unbind_texture(texture.id)
+    texture.delete()
+
+def get_texture_slot_stats() -> TextureSlotStats:
+    '''
+    Returns texture slot cache counters collected since the last `begin_frame` call.
+    '''
+
+    return _texture_slots.stats
 
 def set_camera_transform(view: math.Matrix4, projection: math.Matrix4, position: math.Vector3) -> None:
     _frame_data.camera_view = view
@@ -369,6 +505,15 @@ def get_pipeline_info() -> PipelineInfo:
     assert _current_pipeline is not None, 'No pipeline bound'
     return _current_pipeline.info
 
+def _report_texture_slot_stats() -> None:
+    # counters of the previous frame are reported when the next one begins, so that
+    # `get_texture_slot_stats` still returns them after the frame has been rendered
+    stats = _texture_slots.stats
+    debug.update_profiling_counter(stats.hits, 'texture slot hits')
+    debug.update_profiling_counter(stats.misses, 'texture slot misses')
+    debug.update_profiling_counter(stats.rebinds, 'texture slot rebinds')
+    _texture_slots.reset_stats()
+
 def _get_format_required_alignment(format: gl.PixelFormat) -> int:
     match format:
         case gl.PixelFormat.RED:
@@ -455,10 +600,10 @@ _logger = logging.getLogger(__name__)
 _white_texture: gl.Texture
 _frame_data: FrameData
 _current_pipeline: GraphicsPipeline | None = None
+_render_queue = RenderQueue()
 
 _texture_upload_buffers = list[TextureUploadBuffer]()
 _texture_uploads = list[TextureUpload]()
-_max_bound_textures = 16
-_textures = dict[int, TextureBinding]()
+_texture_slots = TextureSlotCache(_TEXTURE_SLOTS_COUNT, _TEXTURE_SLOTS_FIRST_UNIT)
 _upload_buffer_resize_request: int | None = None
 _upload_buffer_max_size = 0
@@ -0,0 +1,61 @@
+import typing as t
+
+import numpy as np
+
+from spyke import debug
+from spyke.graphics import gl
+from spyke.graphics.render_batch import RenderBatch
+
+if t.TYPE_CHECKING:
+    from spyke.assets import Model
+
+class StaticBatch:
+    '''
+    Instances of a model that are drawn every frame without being submitted again.
+    Instance data is kept in render batches and in a dedicated GPU buffer, which
+    is uploaded only after the batch gets invalidated.
+    '''
+
+    def __init__(self, model: 'Model') -> None:
+        self.model = model
+        self.batches = list[RenderBatch]()
+        self.buffer: gl.Buffer | None = None
+        self.is_dirty = True
+
+    @property
+    def instance_count(self) -> int:
+        return sum(x.current_instance for x in self.batches)
+
+    def invalidate(self) -> None:
+        '''
+        Marks instance data as modified, so it is uploaded again before the next draw.
+        Has to be called after instance data of the batches is modified in place.
+        '''
+
+        self.is_dirty = True
+
+    @debug.profiled
+    def upload(self) -> None:
+        '''
+        Uploads instance data of all batches into the GPU buffer, replacing previous
+        buffer contents. Instances of consecutive batches are stored one after another.
+        '''
+
+        if self.buffer is not None:
+            self.buffer.delete()
+            self.buffer = None
+
+        if self.instance_count != 0:
+            data = np.concatenate([x.instance_data[:x.current_instance] for x in self.batches])
+            self.buffer = gl.Buffer(data.nbytes, gl.BufferFlag.NONE, data)
+            if __debug__:
+                self.buffer.set_debug_name('StaticInstanceBuffer')
+
+        self.is_dirty = False
+
+    def delete(self) -> None:
+        if self.buffer is not None:
+            self.buffer.delete()
+            self.buffer = None
+
+        self.batches.clear()
@@ -0,0 +1,81 @@
+import dataclasses
+from collections import OrderedDict
+
+from spyke.graphics import gl
+
+
+@dataclasses.dataclass(slots=True)
+class TextureSlotStats:
+    hits: int = 0
+    misses: int = 0
+    rebinds: int = 0
+
+class TextureSlotCache:
+    '''
+    Assigns textures to a fixed number of texture units, evicting least recently used
+    texture when all units are taken. Lookup, touch and eviction take constant time.
+    '''
+
+    def __init__(self, slot_count: int, first_unit: int = 0) -> None:
+        if slot_count <= 0:
+            raise ValueError(f'Texture slot count has to be greater than 0, got: {slot_count}.')
+
+        self.slot_count = slot_count
+        self.first_unit = first_unit
+        self.stats = TextureSlotStats()
+
+        # texture id -> unit, ordered from least to most recently used
+        self._units = OrderedDict[int, int]()
+        self._free_units = list(reversed(range(first_unit, first_unit + slot_count)))
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def __contains__(self, texture_id: int) -> bool:
+        return texture_id in self._units
+
+    def bind(self, texture_id: int) -> int:
+        '''
+        Returns texture unit to which the texture is bound, binding it first if needed.
+        If all units are taken, the least recently used texture is replaced.
+
+        @texture_id: OpenGL id of the texture.
+        '''
+
+        unit = self._units.get(texture_id, None)
+        if unit is not None:
+            self._units.move_to_end(texture_id)
+            self.stats.hits += 1
+            return unit
+
+        self.stats.misses += 1
+        if len(self._free_units) != 0:
+            unit = self._free_units.pop()
+        else:
+            _, unit = self._units.popitem(last=False)
+            self.stats.rebinds += 1
+
+        self._units[texture_id] = unit
+        gl.bind_texture_id(texture_id, unit)
+
+        return unit
+
+    def remove(self, texture_id: int) -> None:
+        '''
+        Forgets binding of the texture, e.g. after it has been deleted, so that its unit
+        can be given to another texture without evicting anything. If the texture
+        is not bound this function does nothing.
+
+        @texture_id: OpenGL id of the texture.
+        '''
+
+        unit = self._units.pop(texture_id, None)
+        if unit is not None:
+            self._free_units.append(unit)
+
+    def clear(self) -> None:
+        self._units.clear()
+        self._free_units = list(reversed(range(self.first_unit, self.first_unit + self.slot_count)))
+
+    def reset_stats(self) -> None:
+        self.stats = TextureSlotStats()
@@ -39,6 +39,12 @@ class Vector2:
     x: float
     y: float
 
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_array(cls, array: Buffer, index: int, /) -> t.Self: ...
+
     @classmethod
     def one(cls) -> t.Self: ...
 
@@ -63,6 +69,7 @@ class Vector2:
     @t.overload
     def __init__(self, v0: t.SupportsFloat, v1: t.SupportsFloat, /) -> None: ...
 
+    def write_to(self, array: Buffer, index: int, /) -> None: ...
     def length(self) -> float: ...
     def length_squared(self) -> float: ...
     def cross(self, other: t.Self, /) -> float: ...
@@ -73,6 +80,12 @@ class Vector2:
     def normalized(self) -> t.Self: ...
     def interpolate(self, other: t.Self, amount: float, /) -> t.Self: ...
 
+    @t.overload
+    def fma(self, a: t.Self, scalar: float, /) -> None: ...
+
+    @t.overload
+    def fma(self, a: t.Self, b: t.Self, scalar: float, /) -> None: ...
+
     def __iter__(self) -> VectorIter: ...
 
     def __buffer__(self, flags: int) -> memoryview: ...
@@ -98,6 +111,12 @@ class Vector3:
     y: float
     z: float
 
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_array(cls, array: Buffer, index: int, /) -> t.Self: ...
+
     @classmethod
     def one(cls) -> t.Self: ...
 
@@ -125,6 +144,7 @@ class Vector3:
     @t.overload
     def __init__(self, v0: t.SupportsFloat, v1: t.SupportsFloat, v2: t.SupportsFloat, /) -> None: ...
 
+    def write_to(self, array: Buffer, index: int, /) -> None: ...
     def length(self) -> float: ...
     def length_squared(self) -> float: ...
     def cross(self, other: t.Self, /) -> t.Self: ...
@@ -136,6 +156,12 @@ class Vector3:
     def normalized(self) -> t.Self: ...
     def interpolate(self, other: t.Self, amount: float, /) -> t.Self: ...
 
+    @t.overload
+    def fma(self, a: t.Self, scalar: float, /) -> None: ...
+
+    @t.overload
+    def fma(self, a: t.Self, b: t.Self, scalar: float, /) -> None: ...
+
     def __iter__(self) -> VectorIter: ...
 
     def __buffer__(self, flags: int) -> memoryview: ...
@@ -162,6 +188,12 @@ class Vector4:
     z: float
     w: float
 
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_array(cls, array: Buffer, index: int, /) -> t.Self: ...
+
     @classmethod
     def one(cls) -> t.Self: ...
 
@@ -192,6 +224,7 @@ class Vector4:
     @t.overload
     def __init__(self, v0: t.SupportsFloat, v1: t.SupportsFloat, v2: t.SupportsFloat, v3: t.SupportsFloat, /) -> None: ...
 
+    def write_to(self, array: Buffer, index: int, /) -> None: ...
     def length(self) -> float: ...
     def length_squared(self) -> float: ...
     def dot(self, other: t.Self, /) -> float: ...
@@ -201,6 +234,12 @@ class Vector4:
     def normalized(self) -> t.Self: ...
     def interpolate(self, other: t.Self, amount: float, /) -> t.Self: ...
 
+    @t.overload
+    def fma(self, a: t.Self, scalar: float, /) -> None: ...
+
+    @t.overload
+    def fma(self, a: t.Self, b: t.Self, scalar: float, /) -> None: ...
+
     def __iter__(self) -> VectorIter: ...
 
     def __buffer__(self, flags: int) -> memoryview: ...
@@ -222,6 +261,12 @@ class Vector4:
     def __neg__(self) -> t.Self: ...
 
 class Matrix2:
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_array(cls, array: Buffer, index: int, /) -> t.Self: ...
+
     @classmethod
     def identity(cls) -> t.Self: ...
 
@@ -237,12 +282,16 @@ class Matrix2:
     @t.overload
     def __init__(self, row0: Vector2, row1: Vector2, /) -> None: ...
 
+    def write_to(self, array: Buffer, index: int, /) -> None: ...
     def transpose(self) -> None: ...
     def transposed(self) -> t.Self: ...
     def inverse(self) -> None: ...
     def inversed(self) -> t.Self: ...
     def determinant(self) -> float: ...
 
+    @classmethod
+    def multiply_into(cls, a: t.Self, b: t.Self, out: t.Self, /) -> None: ...
+
     def __buffer__(self, flags: int) -> memoryview: ...
 
     def __len__(self) -> int: ...
@@ -255,10 +304,19 @@ class Matrix2:
     def __isub__(self, other: t.Self) -> t.Self: ...
     def __mul__(self, other: t.Self) -> t.Self: ...
     def __imul__(self, other: t.Self) -> t.Self: ...
+    @t.overload
     def __matmul__(self, other: t.Self) -> t.Self: ...
+    @t.overload
+    def __matmul__(self, other: Vector2) -> Vector2: ...
     def __imatmul__(self, other: t.Self) -> t.Self: ...
 
 class Matrix3:
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_array(cls, array: Buffer, index: int, /) -> t.Self: ...
+
     @classmethod
     def identity(cls) -> t.Self: ...
 
@@ -277,12 +335,16 @@ class Matrix3:
     @t.overload
     def __init__(self, topleft: Matrix2, /) -> None: ... # type: ignore[overload-cannot-match]
 
+    def write_to(self, array: Buffer, index: int, /) -> None: ...
     def transpose(self) -> None: ...
     def transposed(self) -> t.Self: ...
     def inverse(self) -> None: ...
     def inversed(self) -> t.Self: ...
     def determinant(self) -> float: ...
 
+    @classmethod
+    def multiply_into(cls, a: t.Self, b: t.Self, out: t.Self, /) -> None: ...
+
     def __buffer__(self, flags: int) -> memoryview: ...
 
     def __len__(self) -> int: ...
@@ -295,12 +357,20 @@ class Matrix3:
     def __isub__(self, other: t.Self) -> t.Self: ...
     def __mul__(self, other: t.Self) -> t.Self: ...
     def __imul__(self, other: t.Self) -> t.Self: ...
+    @t.overload
     def __matmul__(self, other: t.Self) -> t.Self: ...
+    @t.overload
+    def __matmul__(self, other: Vector3) -> Vector3: ...
     def __imatmul__(self, other: t.Self) -> t.Self: ...
 
-# TODO Allow passing quaternions as rotation values
 # TODO Add ability to iterate over rows and columns as Vector4 objects
 class Matrix4:
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_array(cls, array: Buffer, index: int, /) -> t.Self: ...
+
     @classmethod
     def identity(cls) -> t.Self: ...
 
@@ -308,7 +378,10 @@ class Matrix4:
     def zero(cls) -> t.Self: ...
 
     @classmethod
-    def transform(cls, translation: Vector3, scale: Vector3, rotation: Vector3, /) -> t.Self: ...
+    def transform(cls, translation: Vector3, scale: Vector3, rotation: Vector3 | Quaternion, /) -> t.Self: ...
+
+    @classmethod
+    def transform_many(cls, translations: Buffer, scales: Buffer, rotations: Buffer, out: Buffer, dirty: Buffer | None = None, /) -> int: ...
 
     @classmethod
     def ortho(cls, left: float, right: float, bottom: float, top: float, near: float, far: float, /) -> t.Self: ...
@@ -337,9 +410,15 @@ class Matrix4:
     @t.overload
     def rotate(self, rotation: Vector3, /) -> None: ...
 
+    @t.overload
+    def rotate(self, rotation: Quaternion, /) -> None: ...
+
+    def write_to(self, array: Buffer, index: int, /) -> None: ...
     def translate(self, translation: Vector3, /) -> None: ...
+    def set_transform(self, translation: Vector3, scale: Vector3, rotation: Vector3 | Quaternion, /) -> None: ...
     def scale(self, scale: Vector3, /) -> None: ...
     def perspective_resize(self, aspect: t.SupportsFloat, /) -> None: ...
+    def unproject(self, x: float, y: float, viewport: Viewport2D | Viewport3D, /) -> Ray: ...
     def transpose(self) -> None: ...
     def transposed(self) -> t.Self: ...
     def inverse(self) -> None: ...
@@ -348,6 +427,9 @@ class Matrix4:
     def inversed_fast(self) -> t.Self: ...
     def determinant(self) -> float: ...
 
+    @classmethod
+    def multiply_into(cls, a: t.Self, b: t.Self, out: t.Self, /) -> None: ...
+
     def __buffer__(self, flags: int, /) -> memoryview: ...
 
     def __len__(self) -> int: ...
@@ -360,8 +442,402 @@ class Matrix4:
     def __isub__(self, other: t.Self) -> t.Self: ...
     def __mul__(self, other: t.Self) -> t.Self: ...
     def __imul__(self, other: t.Self) -> t.Self: ...
+    @t.overload
     def __matmul__(self, other: t.Self) -> t.Self: ...
+    @t.overload
+    def __matmul__(self, other: Vector4) -> Vector4: ...
     def __imatmul__(self, other: t.Self) -> t.Self: ...
 
+class Quaternion:
+    x: float
+    y: float
+    z: float
+    w: float
+
+    @classmethod
+    def identity(cls) -> t.Self: ...
+
+    @classmethod
+    def from_axis_angle(cls, angle: float, axis: Vector3, /) -> t.Self: ...
+
+    @classmethod
+    def from_euler(cls, rotation: Vector3, /) -> t.Self: ...
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix3 | Matrix4, /) -> t.Self: ...
+
+    @classmethod
+    def slerp_many(cls, from_: Buffer, to: Buffer, amount: float | Buffer, out: Buffer, /) -> None: ...
+
+    @t.overload
+    def __init__(self) -> None: ...
+
+    @t.overload
+    def __init__(self, values: Buffer, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: t.Sequence[float], /) -> None: ...
+
+    @t.overload
+    def __init__(self, x: t.SupportsFloat, y: t.SupportsFloat, z: t.SupportsFloat, w: t.SupportsFloat, /) -> None: ...
+
+    def normalize(self) -> None: ...
+    def normalized(self) -> t.Self: ...
+    def conjugate(self) -> None: ...
+    def conjugated(self) -> t.Self: ...
+    def inverse(self) -> None: ...
+    def inversed(self) -> t.Self: ...
+    def dot(self, other: t.Self, /) -> float: ...
+    def length(self) -> float: ...
+    def angle(self) -> float: ...
+    def axis(self) -> Vector3: ...
+    def slerp(self, other: t.Self, amount: float, /) -> t.Self: ...
+    def nlerp(self, other: t.Self, amount: float, /) -> t.Self: ...
+    def rotate(self, vector: Vector3, /) -> Vector3: ...
+    def to_matrix3(self) -> Matrix3: ...
+    def to_matrix4(self) -> Matrix4: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> float: ...
+    def __setitem__(self, index: int, value: t.SupportsFloat) -> None: ...
+
+    def __neg__(self) -> t.Self: ...
+    def __mul__(self, other: t.Self) -> t.Self: ...
+    def __imul__(self, other: t.Self) -> t.Self: ...
+
+class AABB:
+    min: Vector3
+    max: Vector3
+
+    @classmethod
+    def from_points(cls, points: Buffer, /) -> t.Self: ...
+
+    def __init__(self, min: Vector3 = ..., max: Vector3 = ..., /) -> None: ...
+
+    def center(self) -> Vector3: ...
+    def size(self) -> Vector3: ...
+    def contains(self, point: Vector3, /) -> bool: ...
+    def intersects(self, other: AABB | Sphere, /) -> bool: ...
+    def merged(self, other: AABB, /) -> AABB: ...
+    def transformed(self, matrix: Matrix4, /) -> AABB: ...
+
+class Sphere:
+    center: Vector3
+    radius: float
+
+    def __init__(self, center: Vector3 = ..., radius: float = 0.0, /) -> None: ...
+
+    def contains(self, point: Vector3, /) -> bool: ...
+    def intersects(self, other: Sphere | AABB, /) -> bool: ...
+
+class Plane:
+    normal: Vector3
+    distance: float
+
+    @classmethod
+    def from_point_normal(cls, point: Vector3, normal: Vector3, /) -> t.Self: ...
+
+    def __init__(self, normal: Vector3 = ..., distance: float = 0.0, /) -> None: ...
+
+    def distance_to(self, point: Vector3, /) -> float: ...
+    def normalize(self) -> None: ...
+    def normalized(self) -> Plane: ...
+
+class Frustum:
+    @property
+    def planes(self) -> tuple[Plane, Plane, Plane, Plane, Plane, Plane]: ...
+
+    @classmethod
+    def from_matrix(cls, view_projection: Matrix4, /) -> t.Self: ...
+
+    def __init__(self, view_projection: Matrix4 = ..., /) -> None: ...
+
+    def test_point(self, point: Vector3, /) -> bool: ...
+    def test_sphere(self, sphere: Sphere, /) -> bool: ...
+    def test_aabb(self, aabb: AABB, /) -> bool: ...
+    def test_spheres(self, centers: Buffer, radii: float | Buffer, out: Buffer | None = None, /) -> memoryview: ...
+    def test_aabbs(self, mins: Buffer, maxs: Buffer, out: Buffer | None = None, /) -> memoryview: ...
+
+class Ray:
+    origin: Vector3
+    direction: Vector3
+
+    def __init__(self, origin: Vector3 = ..., direction: Vector3 = ..., /) -> None: ...
+
+    def point_at(self, distance: float, /) -> Vector3: ...
+    def intersect_aabb(self, aabb: AABB, /) -> float | None: ...
+    def intersect_sphere(self, sphere: Sphere, /) -> float | None: ...
+    def intersect_plane(self, plane: Plane, /) -> float | None: ...
+    def intersect_triangle(self, v0: Vector3, v1: Vector3, v2: Vector3, /) -> float | None: ...
+    def intersect_aabbs(self, mins: Buffer, maxs: Buffer, /) -> tuple[memoryview, memoryview]: ...
+    def intersect_spheres(self, centers: Buffer, radii: float | Buffer, /) -> tuple[memoryview, memoryview]: ...
+    def intersect_triangles(self, vertices: Buffer, /) -> tuple[memoryview, memoryview]: ...
+    def intersect_planes(self, planes: Buffer, /) -> tuple[memoryview, memoryview]: ...
+
+class Vector2Array:
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer, /) -> t.Self: ...
+
+    @t.overload
+    def __init__(self, length: int, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: Buffer, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: t.Sequence[Vector2], /) -> None: ...
+
+    def dot(self, other: t.Self | Vector2, /) -> memoryview: ...
+    def length(self) -> memoryview: ...
+    def length_squared(self) -> memoryview: ...
+    def normalize(self) -> None: ...
+    def normalized(self) -> t.Self: ...
+    def interpolate(self, other: t.Self | Vector2, amount: float, /) -> t.Self: ...
+    def copy(self) -> t.Self: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __len__(self) -> int: ...
+
+    @t.overload
+    def __getitem__(self, index: int) -> Vector2: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.Self: ...
+
+    @t.overload
+    def __setitem__(self, index: int, value: Vector2 | t.Sequence[float]) -> None: ...
+
+    @t.overload
+    def __setitem__(self, index: slice, value: Buffer) -> None: ...
+
+    def __neg__(self) -> t.Self: ...
+    def __add__(self, other: t.Self | Vector2 | float) -> t.Self: ...
+    def __radd__(self, other: Vector2 | float) -> t.Self: ...
+    def __iadd__(self, other: t.Self | Vector2 | float) -> t.Self: ...
+    def __sub__(self, other: t.Self | Vector2 | float) -> t.Self: ...
+    def __rsub__(self, other: Vector2 | float) -> t.Self: ...
+    def __isub__(self, other: t.Self | Vector2 | float) -> t.Self: ...
+    def __mul__(self, other: t.Self | Vector2 | float) -> t.Self: ...
+    def __rmul__(self, other: Vector2 | float) -> t.Self: ...
+    def __imul__(self, other: t.Self | Vector2 | float) -> t.Self: ...
+
+class Vector3Array:
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer, /) -> t.Self: ...
+
+    @t.overload
+    def __init__(self, length: int, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: Buffer, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: t.Sequence[Vector3], /) -> None: ...
+
+    def dot(self, other: t.Self | Vector3, /) -> memoryview: ...
+    def cross(self, other: Vector3Array | Vector3, /) -> Vector3Array: ...
+    def length(self) -> memoryview: ...
+    def length_squared(self) -> memoryview: ...
+    def normalize(self) -> None: ...
+    def normalized(self) -> t.Self: ...
+    def interpolate(self, other: t.Self | Vector3, amount: float, /) -> t.Self: ...
+    def copy(self) -> t.Self: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __len__(self) -> int: ...
+
+    @t.overload
+    def __getitem__(self, index: int) -> Vector3: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.Self: ...
+
+    @t.overload
+    def __setitem__(self, index: int, value: Vector3 | t.Sequence[float]) -> None: ...
+
+    @t.overload
+    def __setitem__(self, index: slice, value: Buffer) -> None: ...
+
+    def __neg__(self) -> t.Self: ...
+    def __add__(self, other: t.Self | Vector3 | float) -> t.Self: ...
+    def __radd__(self, other: Vector3 | float) -> t.Self: ...
+    def __iadd__(self, other: t.Self | Vector3 | float) -> t.Self: ...
+    def __sub__(self, other: t.Self | Vector3 | float) -> t.Self: ...
+    def __rsub__(self, other: Vector3 | float) -> t.Self: ...
+    def __isub__(self, other: t.Self | Vector3 | float) -> t.Self: ...
+    def __mul__(self, other: t.Self | Vector3 | float) -> t.Self: ...
+    def __rmul__(self, other: Vector3 | float) -> t.Self: ...
+    def __imul__(self, other: t.Self | Vector3 | float) -> t.Self: ...
+
+class Vector4Array:
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer, /) -> t.Self: ...
+
+    @t.overload
+    def __init__(self, length: int, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: Buffer, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: t.Sequence[Vector4], /) -> None: ...
+
+    def dot(self, other: t.Self | Vector4, /) -> memoryview: ...
+    def length(self) -> memoryview: ...
+    def length_squared(self) -> memoryview: ...
+    def normalize(self) -> None: ...
+    def normalized(self) -> t.Self: ...
+    def interpolate(self, other: t.Self | Vector4, amount: float, /) -> t.Self: ...
+    def copy(self) -> t.Self: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __len__(self) -> int: ...
+
+    @t.overload
+    def __getitem__(self, index: int) -> Vector4: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.Self: ...
+
+    @t.overload
+    def __setitem__(self, index: int, value: Vector4 | t.Sequence[float]) -> None: ...
+
+    @t.overload
+    def __setitem__(self, index: slice, value: Buffer) -> None: ...
+
+    def __neg__(self) -> t.Self: ...
+    def __add__(self, other: t.Self | Vector4 | float) -> t.Self: ...
+    def __radd__(self, other: Vector4 | float) -> t.Self: ...
+    def __iadd__(self, other: t.Self | Vector4 | float) -> t.Self: ...
+    def __sub__(self, other: t.Self | Vector4 | float) -> t.Self: ...
+    def __rsub__(self, other: Vector4 | float) -> t.Self: ...
+    def __isub__(self, other: t.Self | Vector4 | float) -> t.Self: ...
+    def __mul__(self, other: t.Self | Vector4 | float) -> t.Self: ...
+    def __rmul__(self, other: Vector4 | float) -> t.Self: ...
+    def __imul__(self, other: t.Self | Vector4 | float) -> t.Self: ...
+    def __rmatmul__(self, other: Matrix4 | Matrix4Array) -> t.Self: ...
+
+class Matrix3Array:
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer, /) -> t.Self: ...
+
+    @classmethod
+    def identity(cls, length: int, /) -> t.Self: ...
+
+    @t.overload
+    def __init__(self, length: int, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: Buffer, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: t.Sequence[Matrix3], /) -> None: ...
+
+    def transpose(self) -> None: ...
+    def transposed(self) -> t.Self: ...
+    def inverse(self) -> None: ...
+    def inversed(self) -> t.Self: ...
+    def determinant(self) -> memoryview: ...
+    def copy(self) -> t.Self: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __len__(self) -> int: ...
+
+    @t.overload
+    def __getitem__(self, index: int) -> Matrix3: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.Self: ...
+
+    @t.overload
+    def __setitem__(self, index: int, value: Matrix3) -> None: ...
+
+    @t.overload
+    def __setitem__(self, index: slice, value: Buffer) -> None: ...
+
+    def __add__(self, other: t.Self | Matrix3) -> t.Self: ...
+    def __iadd__(self, other: t.Self | Matrix3) -> t.Self: ...
+    def __sub__(self, other: t.Self | Matrix3) -> t.Self: ...
+    def __isub__(self, other: t.Self | Matrix3) -> t.Self: ...
+    def __mul__(self, other: t.Self | Matrix3) -> t.Self: ...
+    def __imul__(self, other: t.Self | Matrix3) -> t.Self: ...
+    def __matmul__(self, other: t.Self | Matrix3) -> t.Self: ...
+    def __rmatmul__(self, other: Matrix3) -> t.Self: ...
+    def __imatmul__(self, other: t.Self | Matrix3) -> t.Self: ...
+
+class Matrix4Array:
+    @property
+    def __array_interface__(self) -> dict[str, t.Any]: ...
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer, /) -> t.Self: ...
+
+    @classmethod
+    def identity(cls, length: int, /) -> t.Self: ...
+
+    @t.overload
+    def __init__(self, length: int, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: Buffer, /) -> None: ...
+
+    @t.overload
+    def __init__(self, values: t.Sequence[Matrix4], /) -> None: ...
+
+    def transpose(self) -> None: ...
+    def transposed(self) -> t.Self: ...
+    def inverse(self) -> None: ...
+    def inversed(self) -> t.Self: ...
+    def determinant(self) -> memoryview: ...
+    def copy(self) -> t.Self: ...
+
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+    def __len__(self) -> int: ...
+
+    @t.overload
+    def __getitem__(self, index: int) -> Matrix4: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.Self: ...
+
+    @t.overload
+    def __setitem__(self, index: int, value: Matrix4) -> None: ...
+
+    @t.overload
+    def __setitem__(self, index: slice, value: Buffer) -> None: ...
+
+    def __add__(self, other: t.Self | Matrix4) -> t.Self: ...
+    def __iadd__(self, other: t.Self | Matrix4) -> t.Self: ...
+    def __sub__(self, other: t.Self | Matrix4) -> t.Self: ...
+    def __isub__(self, other: t.Self | Matrix4) -> t.Self: ...
+    def __mul__(self, other: t.Self | Matrix4) -> t.Self: ...
+    def __imul__(self, other: t.Self | Matrix4) -> t.Self: ...
+    def __matmul__(self, other: t.Self | Matrix4) -> t.Self: ...
+    def __rmatmul__(self, other: Matrix4) -> t.Self: ...
+    def __imatmul__(self, other: t.Self | Matrix4) -> t.Self: ...
+
 def deg_to_rad(value: t.SupportsFloat) -> float: ...
 def rad_to_deg(value: t.SupportsFloat) -> float: ...
+def get_free_list_stats() -> dict[type, dict[str, int]]: ...
+def clear_free_lists() -> None: ...
+def get_simd_level() -> str: ...
+def set_simd_level(level: str) -> None: ...
@@ -0,0 +1,106 @@
+import dataclasses
+import threading
+
+from spyke.ecs import CommandBuffer, Component, Scene
+from spyke.ecs.processor import Processor
+
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Position(Component):
+    x: float = 0.0
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Velocity(Component):
+    x: float = 0.0
+
+class SpawnProcessor(Processor):
+    def process(self, scene, *args, **kwargs):
+        for entity, (position,) in scene.get_components(Position):
+            scene.commands.add_component(entity, Velocity(position.x))
+            scene.commands.create_entity(Position(position.x + 100.0))
+
+def test_command_buffer_deferred():
+    scene = Scene('test', None)
+    buffer = CommandBuffer()
+    entity = scene.create_entity(Position())
+
+    buffer.add_component(entity, Velocity())
+    buffer.create_entity(Position())
+
+    assert len(buffer) == 2
+    assert not scene.has_component(entity, Velocity)
+    assert len(scene.get_entities()) == 1
+
+    buffer.flush(scene)
+
+    assert len(buffer) == 0
+    assert scene.has_component(entity, Velocity)
+    assert len(scene.get_entities()) == 2
+
+def test_command_buffer_batched_create():
+    scene = Scene('test', None)
+    buffer = CommandBuffer()
+    positions = [Position(i) for i in range(10)]
+    for position in positions:
+        buffer.create_entity(position, Velocity())
+
+    buffer.flush(scene)
+
+    assert {x[1][0] for x in scene.get_components(Position, Velocity)} == set(positions)
+
+def test_command_buffer_remove():
+    scene = Scene('test', None)
+    buffer = CommandBuffer()
+    removed = scene.create_entity(Position(), Velocity())
+    kept = scene.create_entity(Position(), Velocity())
+
+    buffer.remove_entity(removed)
+    buffer.remove_component(kept, Velocity)
+    # commands for entities removed before flush are skipped
+    buffer.add_component(removed, Velocity())
+    buffer.flush(scene)
+
+    assert not scene.is_alive(removed)
+    assert scene.get_components(Position, Velocity) == []
+    assert scene.has_component(kept, Position)
+
+def test_command_buffer_skips_dead_entities():
+    scene = Scene('test', None)
+    buffer = CommandBuffer()
+    entity = scene.create_entity(Position())
+    buffer.add_component(entity, Velocity())
+    scene.remove_entity(entity, immediate=True)
+
+    buffer.flush(scene)
+
+    assert scene.get_components(Velocity) == []
+
+def test_command_buffer_threads():
+    scene = Scene('test', None)
+    buffer = CommandBuffer()
+
+    def record():
+        for _ in range(1000):
+            buffer.create_entity(Position())
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    buffer.flush(scene)
+
+    assert len(scene.get_components(Position)) == 4000
+
+def test_scene_process_flushes_commands():
+    scene = Scene('test', None)
+    scene.create_entities(3, Position)
+    scene.add_processor(SpawnProcessor())
+
+    scene.process()
+
+    assert len(scene.get_components(Position, Velocity)) == 3
+    assert len(scene.get_components(Position)) == 6
+    assert len(scene.commands) == 0
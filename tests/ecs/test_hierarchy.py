@@ -0,0 +1,180 @@
+import numpy as np
+import pytest
+
+from spyke import math
+from spyke.ecs import Scene, TransformComponent
+from spyke.ecs.processor import Processor
+from spyke.ecs.processors import TransformProcessor
+
+
+def _transform(x=0.0, scale=1.0):
+    return TransformComponent(math.Vector3(x, 0, 0), math.Vector3(scale, scale, scale), math.Vector3(0, 0, 0))
+
+def _translation(matrix):
+    return tuple(np.asarray(matrix)[:3, 3])
+
+def test_hierarchy_world_matrix():
+    scene = Scene('test', None)
+    root = scene.create_entity(_transform(1.0, 2.0))
+    child = scene.create_entity(_transform(1.0))
+    grandchild = scene.create_entity(_transform(3.0))
+    scene.set_parent(child, root)
+    scene.set_parent(grandchild, child)
+
+    updated = scene.hierarchy.update(scene.get_component(TransformComponent))
+
+    assert updated == 2
+    assert _translation(scene.get_component_for_entity(child, TransformComponent).world_matrix) == (3.0, 0.0, 0.0)
+    assert _translation(scene.get_component_for_entity(grandchild, TransformComponent).world_matrix) == (9.0, 0.0, 0.0)
+
+def test_hierarchy_depth():
+    scene = Scene('test', None)
+    root = scene.create_entity(_transform())
+    child = scene.create_entity(_transform())
+    grandchild = scene.create_entity(_transform())
+    scene.set_parent(grandchild, child)
+    scene.set_parent(child, root)
+
+    transform = scene.get_component_for_entity(grandchild, TransformComponent)
+    assert transform.depth == 2
+    assert transform.parent is scene.get_component_for_entity(child, TransformComponent)
+
+    scene.set_parent(child, None)
+    assert transform.depth == 1
+
+def test_hierarchy_dirty_propagation():
+    scene = Scene('test', None)
+    root = scene.create_entity(_transform())
+    child = scene.create_entity(_transform(1.0))
+    other_root = scene.create_entity(_transform())
+    other_child = scene.create_entity(_transform(1.0))
+    scene.set_parent(child, root)
+    scene.set_parent(other_child, other_root)
+    scene.hierarchy.update(scene.get_component(TransformComponent))
+
+    assert scene.hierarchy.update(scene.get_component(TransformComponent)) == 0
+
+    scene.get_component_for_entity(root, TransformComponent).position = math.Vector3(5, 0, 0)
+
+    assert scene.hierarchy.update(scene.get_component(TransformComponent)) == 1
+    assert _translation(scene.get_component_for_entity(child, TransformComponent).world_matrix) == (6.0, 0.0, 0.0)
+
+def test_hierarchy_cycle():
+    scene = Scene('test', None)
+    root = scene.create_entity(_transform())
+    child = scene.create_entity(_transform())
+    scene.set_parent(child, root)
+
+    with pytest.raises(ValueError):
+        scene.set_parent(root, child)
+
+    with pytest.raises(ValueError):
+        scene.set_parent(root, root)
+
+def test_hierarchy_remove_parent():
+    scene = Scene('test', None)
+    root = scene.create_entity(_transform(2.0))
+    child = scene.create_entity(_transform(1.0))
+    scene.set_parent(child, root)
+    scene.hierarchy.update(scene.get_component(TransformComponent))
+
+    scene.remove_entity(root, immediate=True)
+
+    transform = scene.get_component_for_entity(child, TransformComponent)
+    assert transform.parent is None
+    assert transform.world_matrix is transform.matrix
+
+def test_transform_processor():
+    scene = Scene('test', None)
+    scene.add_processor(TransformProcessor())
+    parent = scene.create_entity(_transform(1.0))
+    child = scene.create_entity(_transform(2.0))
+    scene.set_parent(child, parent)
+
+    scene.process()
+
+    child_transform = scene.get_component_for_entity(child, TransformComponent)
+    assert _translation(child_transform.world_matrix) == pytest.approx((3.0, 0.0, 0.0))
+
+    parent_transform = scene.get_component_for_entity(parent, TransformComponent)
+    parent_transform.position = math.Vector3(5.0, 0.0, 0.0)
+    scene.mark_changed(parent, TransformComponent)
+    scene.process()
+
+    assert _translation(child_transform.world_matrix) == pytest.approx((7.0, 0.0, 0.0))
+
+def test_transform_processor_setters_mark_changed():
+    scene = Scene('test', None)
+    scene.add_processor(TransformProcessor())
+    parent = scene.create_entity(_transform(1.0))
+    child = scene.create_entity(_transform(2.0))
+    scene.set_parent(child, parent)
+    scene.process()
+
+    parent_transform = scene.get_component_for_entity(parent, TransformComponent)
+    parent_transform.position = math.Vector3(5.0, 0.0, 0.0)
+    scene.process()
+
+    child_transform = scene.get_component_for_entity(child, TransformComponent)
+    assert not parent_transform.needs_recalculate
+    assert _translation(parent_transform.world_matrix) == pytest.approx((5.0, 0.0, 0.0))
+    assert _translation(child_transform.world_matrix) == pytest.approx((7.0, 0.0, 0.0))
+
+def test_transform_create_many():
+    positions = np.array([[1, 2, 3], [4, 5, 6]], dtype=np.float32)
+    scales = np.array([[1, 1, 1], [2, 3, 4]], dtype=np.float32)
+    rotations = np.array([[0, 0, 0.5], [10, 20, 30]], dtype=np.float32)
+
+    transforms = TransformComponent.create_many(positions, scales, rotations)
+
+    assert len(transforms) == 2
+    for i, transform in enumerate(transforms):
+        expected = TransformComponent(math.Vector3(*positions[i]), math.Vector3(*scales[i]), math.Vector3(*rotations[i]))
+        assert tuple(transform.position) == tuple(expected.position)
+        assert tuple(transform.rotation) == tuple(expected.rotation)
+        assert [transform.world_matrix[j] for j in range(16)] == pytest.approx([expected.world_matrix[j] for j in range(16)])
+        assert not transform.needs_recalculate
+        assert transform.parent is None
+
+    with pytest.raises(ValueError):
+        TransformComponent.create_many(positions, scales, rotations[:1])
+
+def test_transform_processor_mark_changed_in_place():
+    scene = Scene('test', None)
+    scene.add_processor(TransformProcessor())
+    entity = scene.create_entity(_transform(0.0))
+    scene.process()
+
+    transform = scene.get_component_for_entity(entity, TransformComponent)
+    transform.position.x = 5.0
+    scene.mark_changed(entity, TransformComponent)
+    scene.process()
+
+    assert transform.matrix[3, 0] == pytest.approx(5.0)
+    assert transform.world_matrix[3, 0] == pytest.approx(5.0)
+
+class _MoveProcessor(Processor):
+    writes = (TransformComponent,)
+
+    def __init__(self, entity):
+        self.entity = entity
+
+    def process(self, scene, *args, **kwargs):
+        scene.get_component_for_entity(self.entity, TransformComponent).position = math.Vector3(3.0, 0.0, 0.0)
+
+def test_transform_processor_change_after_processor():
+    scene = Scene('test', None)
+    entity = scene.create_entity(_transform(0.0))
+    scene.add_processor(TransformProcessor(), priority=1)
+    scene.add_processor(_MoveProcessor(entity), priority=0)
+    scene.process()
+
+    transform = scene.get_component_for_entity(entity, TransformComponent)
+    # the change was marked after TransformProcessor had run, it is applied in the next frame
+    assert scene.get_changed(TransformComponent) == [(entity, transform)]
+
+    scene.remove_processor(_MoveProcessor)
+    scene.process()
+
+    assert _translation(transform.world_matrix) == pytest.approx((3.0, 0.0, 0.0))
+    assert scene.get_changed(TransformComponent) == []
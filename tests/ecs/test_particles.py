@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from spyke import math
+from spyke.ecs import ParticleSystemComponent, Scene
+from spyke.ecs.processors import ParticleProcessor
+
+
+def test_particles_emit():
+    particles = ParticleSystemComponent(
+        10,
+        1.0,
+        base_position=math.Vector3(1, 2, 3),
+        velocity=math.Vector3(1, 0, 0),
+        color_begin=math.Vector4(1, 0, 0, 1))
+
+    assert particles.emit(4) == 4
+    assert particles.count == 4
+    assert np.all(particles.positions[:4] == (1, 2, 3))
+    assert np.all(particles.colors[:4] == (1, 0, 0, 1))
+
+    # only as many particles as there is space for
+    assert particles.emit(20) == 6
+    assert particles.emit(1) == 0
+
+def test_particles_invalid():
+    with pytest.raises(ValueError):
+        ParticleSystemComponent(0, 1.0)
+
+    with pytest.raises(ValueError):
+        ParticleSystemComponent(10, 0.0)
+
+def test_particles_update():
+    particles = ParticleSystemComponent(
+        10,
+        2.0,
+        velocity=math.Vector3(2, 0, 0),
+        rotation_velocity=1.0,
+        color_begin=math.Vector4(1, 1, 1, 1),
+        color_end=math.Vector4(0, 0, 0, 1),
+        size_begin=math.Vector2(2, 2),
+        size_end=math.Vector2(0, 0))
+    particles.emit(3)
+
+    particles.update(0.5)
+
+    assert particles.count == 3
+    assert np.allclose(particles.positions[:3], (1, 0, 0))
+    assert np.allclose(particles.rotations[:3], 0.5)
+    assert np.allclose(particles.colors[:3], (0.75, 0.75, 0.75, 1))
+    assert np.allclose(particles.sizes[:3], (1.5, 1.5))
+
+def test_particles_fade_out():
+    particles = ParticleSystemComponent(4, 1.0, fade_out=True)
+    particles.emit(1)
+    particles.update(0.25)
+
+    assert particles.colors[0, 3] == pytest.approx(0.75)
+
+def test_particles_death_compaction():
+    particles = ParticleSystemComponent(10, 1.0, base_position=math.Vector3(0, 0, 0))
+    particles.emit(2)
+    particles.update(0.5)
+    particles.base_position = math.Vector3(5, 0, 0)
+    particles.emit(3)
+
+    particles.update(0.6)
+
+    assert particles.count == 3
+    assert np.all(particles.positions[:3, 0] == 5)
+    assert np.allclose(particles.lives[:3], 0.4)
+
+def test_particles_randomized():
+    particles = ParticleSystemComponent(100, 1.0, velocity=math.Vector3(1, 1, 0), randomize_movement=True, seed=1)
+    particles.emit(100)
+
+    assert np.all(np.abs(particles.velocities[:, 0]) <= 0.5)
+    assert len(np.unique(particles.velocities[:, 0])) > 1
+
+def test_particles_instance_data():
+    particles = ParticleSystemComponent(
+        4,
+        1.0,
+        base_position=math.Vector3(1, 2, 3),
+        base_rotation=0.7,
+        size_begin=math.Vector2(2, 3))
+    particles.emit(2)
+
+    instances = particles.get_instance_data(albedo_index=1.0)
+    expected = math.Matrix4.transform(math.Vector3(1, 2, 3), math.Vector3(2, 3, 1), math.Vector3(0, 0, 0.7))
+
+    assert len(instances) == 2
+    assert np.all(instances['albedo_idx'] == 1.0)
+    assert np.allclose(instances['transform'][1], np.frombuffer(memoryview(expected).tobytes('A'), dtype=np.float32), atol=1e-5)
+
+def test_particle_processor():
+    scene = Scene('test', None)
+    particles = ParticleSystemComponent(10, 1.0)
+    particles.emit(5)
+    scene.create_entity(particles)
+    scene.add_processor(ParticleProcessor())
+
+    scene.process(dt=2.0)
+
+    assert particles.count == 0
@@ -0,0 +1,136 @@
+import dataclasses
+import threading
+
+import pytest
+
+from spyke.ecs import Component, Scene
+from spyke.ecs.processor import Processor
+from spyke.ecs.processors import ParticleProcessor, TransformProcessor
+
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Position(Component):
+    x: float = 0.0
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Velocity(Component):
+    x: float = 0.0
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Health(Component):
+    value: int = 100
+
+class RecordingProcessor(Processor):
+    def __init__(self, name, log, reads=None, writes=None):
+        self.name = name
+        self.log = log
+        self.reads = reads
+        self.writes = writes
+
+    def process(self, scene, *args, **kwargs):
+        self.log.append(self.name)
+
+class BarrierProcessor(Processor):
+    reads = (Position,)
+
+    def __init__(self, barrier):
+        self.barrier = barrier
+
+    def process(self, scene, *args, **kwargs):
+        # succeeds only if both processors run at the same time
+        self.barrier.wait(timeout=5.0)
+
+class FailingProcessor(Processor):
+    reads = (Health,)
+
+    def process(self, scene, *args, **kwargs):
+        raise RuntimeError('failed')
+
+def test_processor_priority():
+    log = []
+    scene = Scene('test', None)
+    scene.add_processor(RecordingProcessor('low', log), priority=-1)
+    scene.add_processor(RecordingProcessor('high', log), priority=10)
+    scene.add_processor(RecordingProcessor('first', log))
+    scene.add_processor(RecordingProcessor('second', log))
+
+    scene.process()
+
+    assert log == ['high', 'first', 'second', 'low']
+
+def test_processor_conflicts():
+    log = []
+    reader = RecordingProcessor('reader', log, reads=(Position,))
+    writer = RecordingProcessor('writer', log, writes=(Position,))
+    other = RecordingProcessor('other', log, reads=(Position,), writes=(Velocity,))
+    undeclared = RecordingProcessor('undeclared', log)
+
+    assert reader.conflicts_with(writer)
+    assert writer.conflicts_with(reader)
+    assert not reader.conflicts_with(other)
+    assert other.conflicts_with(writer)
+    assert undeclared.conflicts_with(reader)
+
+def test_processor_stages():
+    log = []
+    scene = Scene('test', None)
+    a = RecordingProcessor('a', log, reads=(Position,))
+    b = RecordingProcessor('b', log, reads=(Position,), writes=(Velocity,))
+    c = RecordingProcessor('c', log, writes=(Position,))
+    d = RecordingProcessor('d', log, writes=(Health,))
+    e = RecordingProcessor('e', log)
+    for processor in (a, b, c, d, e):
+        scene.add_processor(processor)
+
+    assert scene.get_processor_stages() == [[a, b, d], [c], [e]]
+
+def test_processor_concurrent():
+    barrier = threading.Barrier(2)
+    scene = Scene('test', None, max_workers=2)
+    scene.add_processor(BarrierProcessor(barrier))
+    scene.add_processor(BarrierProcessor(barrier))
+
+    scene.process()
+
+def test_scene_close():
+    barrier = threading.Barrier(2)
+    scene = Scene('test', None, max_workers=2)
+    scene.add_processor(BarrierProcessor(barrier))
+    scene.add_processor(BarrierProcessor(barrier))
+    scene.process()
+    threads = {x for x in threading.enumerate() if x.name.startswith('test-processor')}
+    assert len(threads) != 0
+
+    scene.close()
+
+    assert not any(x.is_alive() for x in threads)
+    scene.close()
+
+def test_processor_exception():
+    scene = Scene('test', None)
+    scene.add_processor(FailingProcessor())
+    scene.add_processor(RecordingProcessor('reader', [], reads=(Position,)))
+
+    with pytest.raises(RuntimeError):
+        scene.process()
+
+def test_processor_remove():
+    log = []
+    scene = Scene('test', None)
+    scene.add_processor(RecordingProcessor('a', log))
+    scene.add_processor(BarrierProcessor(None))
+    scene.remove_processor(BarrierProcessor)
+
+    scene.process()
+
+    assert log == ['a']
+
+def test_builtin_processors_access():
+    scene = Scene('test', None)
+    transform = TransformProcessor()
+    particles = ParticleProcessor()
+    scene.add_processor(transform)
+    scene.add_processor(particles)
+
+    assert all(x.has_declared_access for x in (transform, particles))
+    assert scene.get_processor_stages() == [[transform, particles]]
@@ -0,0 +1,315 @@
+import dataclasses
+
+import pytest
+
+from spyke.ecs import (Component, Scene, get_entity_generation,
+                       get_entity_index)
+
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Position(Component):
+    x: float = 0.0
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Velocity(Component):
+    x: float = 0.0
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Health(Component):
+    value: int = 100
+
+def test_scene_create_entity():
+    scene = Scene('test', None)
+    position = Position(1.0)
+    entity = scene.create_entity(position, Velocity())
+
+    assert entity in scene.get_entities()
+    assert scene.has_component(entity, Position)
+    assert scene.has_component(entity, Velocity)
+    assert not scene.has_component(entity, Health)
+    assert scene.get_component_for_entity(entity, Position) is position
+
+def test_scene_create_entity_empty():
+    scene = Scene('test', None)
+    entity = scene.create_entity()
+
+    assert entity in scene.get_entities()
+    assert len(scene.get_components_for_entity(entity)) == 0
+
+def test_scene_get_components():
+    scene = Scene('test', None)
+    moving = [scene.create_entity(Position(i), Velocity(i)) for i in range(3)]
+    scene.create_entity(Position(10.0))
+    living = scene.create_entity(Velocity(5.0), Health(), Position(5.0))
+
+    result = scene.get_components(Position, Velocity)
+
+    assert sorted(x[0] for x in result) == sorted(moving + [living])
+    for entity, (position, velocity) in result:
+        assert isinstance(position, Position)
+        assert isinstance(velocity, Velocity)
+        assert scene.get_component_for_entity(entity, Position) is position
+
+def test_scene_get_component():
+    scene = Scene('test', None)
+    a = Position()
+    b = Position()
+    scene.create_entity(a)
+    scene.create_entity(b, Health())
+
+    assert scene.get_component(Position) == {a, b}
+    assert scene.get_component(Velocity) == set()
+
+def test_scene_add_component():
+    scene = Scene('test', None)
+    entity = scene.create_entity(Position())
+    velocity = Velocity(2.0)
+
+    assert scene.get_components(Position, Velocity) == []
+
+    scene.add_component(entity, velocity)
+
+    assert scene.get_components(Position, Velocity)[0][0] == entity
+    assert scene.get_component_for_entity(entity, Velocity) is velocity
+
+def test_scene_add_component_existing():
+    scene = Scene('test', None)
+    position = Position()
+    entity = scene.create_entity(position)
+    scene.add_component(entity, Position(3.0))
+
+    assert scene.get_component_for_entity(entity, Position) is position
+
+def test_scene_remove_component():
+    scene = Scene('test', None)
+    position = Position()
+    entity = scene.create_entity(position, Velocity())
+    scene.remove_component(entity, Velocity)
+
+    assert not scene.has_component(entity, Velocity)
+    assert scene.get_component_for_entity(entity, Position) is position
+    assert scene.get_components(Velocity) == []
+
+    # must not fail when the component is missing
+    scene.remove_component(entity, Velocity)
+
+def test_scene_remove_entity_keeps_others():
+    scene = Scene('test', None)
+    entities = [scene.create_entity(Position(i)) for i in range(4)]
+    scene.remove_entity(entities[1], immediate=True)
+
+    assert entities[1] not in scene.get_entities()
+    for entity in (entities[0], entities[2], entities[3]):
+        assert scene.get_component_for_entity(entity, Position).x == entity
+
+def test_scene_remove_entity_deferred():
+    scene = Scene('test', None)
+    entity = scene.create_entity(Position())
+    scene.remove_entity(entity)
+
+    assert entity in scene.get_entities()
+
+    scene.process()
+
+    assert entity not in scene.get_entities()
+    assert scene.get_components(Position) == []
+
+def test_scene_query_cache_hit():
+    scene = Scene('test', None)
+    scene.create_entity(Position(), Velocity())
+
+    first = scene.get_components(Position, Velocity)
+    second = scene.get_components(Position, Velocity)
+
+    assert first is second
+    stats = scene.get_query_stats(Position, Velocity)
+    assert stats.hits == 1
+    assert stats.rebuilds == 1
+
+def test_scene_query_cache_unrelated_change():
+    scene = Scene('test', None)
+    scene.create_entity(Position(), Velocity())
+    scene.get_components(Position, Velocity)
+
+    entity = scene.create_entity(Health())
+    scene.add_component(entity, Position())
+    scene.remove_entity(entity, immediate=True)
+
+    assert len(scene.get_components(Position, Velocity)) == 1
+    assert scene.get_query_stats(Position, Velocity).rebuilds == 1
+
+def test_scene_query_cache_matching_change():
+    scene = Scene('test', None)
+    scene.create_entity(Position(), Velocity())
+    scene.get_components(Position, Velocity)
+    scene.get_component(Velocity)
+
+    entity = scene.create_entity(Velocity(), Health())
+    scene.add_component(entity, Position())
+
+    assert len(scene.get_components(Position, Velocity)) == 2
+    assert len(scene.get_component(Velocity)) == 2
+    assert scene.get_query_stats(Position, Velocity).rebuilds == 1
+    assert scene.get_query_stats(Position, Velocity).updates == 1
+    assert scene.get_query_stats(Velocity).rebuilds == 1
+
+    scene.remove_component(entity, Position)
+
+    assert len(scene.get_components(Position, Velocity)) == 1
+    stats = scene.get_query_stats()
+    assert stats.rebuilds == 2
+    assert stats.updates == 7
+
+def test_scene_query_incremental_update():
+    scene = Scene('test', None)
+    first = scene.create_entities(4, Position, Velocity)
+    second = scene.create_entities(3, Position, Velocity, Health)
+    before = scene.get_components(Position, Velocity)
+    before_copy = list(before)
+    velocities = scene.get_component(Velocity)
+    velocities_copy = set(velocities)
+
+    scene.remove_entities([first[0], second[1], first[2]], immediate=True)
+    added = scene.create_entities(2, Position, Velocity)
+    scene.remove_component(second[0], Health)
+    result = scene.get_components(Position, Velocity)
+
+    # previously returned results are not modified
+    assert before == before_copy
+    assert velocities == velocities_copy
+
+    expected = [(e, (scene.get_component_for_entity(e, Position), scene.get_component_for_entity(e, Velocity))) for e in scene.get_entities()]
+    assert sorted(result, key=lambda x: x[0]) == sorted(expected, key=lambda x: x[0])
+    assert {e for e, _ in result} == {first[1], first[3], second[0], second[2], *added}
+    assert scene.get_component(Velocity) == {x[1][1] for x in result}
+    assert scene.get_query_stats(Position, Velocity).rebuilds == 1
+    assert scene.get_query_stats(Velocity).rebuilds == 1
+
+def test_scene_create_entities():
+    scene = Scene('test', None)
+    healths = [Health(i) for i in range(100)]
+    entities = scene.create_entities(100, Position, healths)
+
+    assert len(entities) == 100
+    assert len(set(entities)) == 100
+    assert len(scene.get_components(Position, Health)) == 100
+    for i, entity in enumerate(entities):
+        assert scene.get_component_for_entity(entity, Health) is healths[i]
+
+    # ids must not collide with entities created afterwards
+    assert scene.create_entity(Position()) not in entities
+
+def test_scene_create_entities_invalid_length():
+    scene = Scene('test', None)
+
+    with pytest.raises(ValueError):
+        scene.create_entities(3, [Position()])
+
+def test_scene_remove_entities():
+    scene = Scene('test', None)
+    entities = scene.create_entities(10, Position)
+    others = scene.create_entities(5, Position, Velocity)
+    scene.remove_entities(entities[::2] + others[:2], immediate=True)
+
+    remaining = {x[0] for x in scene.get_components(Position)}
+    assert remaining == set(entities[1::2] + others[2:])
+
+def test_scene_remove_entities_deferred():
+    scene = Scene('test', None)
+    entities = scene.create_entities(4, Position)
+    scene.remove_entities(entities[:3])
+
+    assert len(scene.get_components(Position)) == 4
+
+    scene.process()
+
+    assert [x[0] for x in scene.get_components(Position)] == entities[3:]
+
+def test_scene_entity_recycling():
+    scene = Scene('test', None)
+    first = scene.create_entity(Position())
+    scene.remove_entity(first, immediate=True)
+    second = scene.create_entity(Velocity())
+
+    assert get_entity_index(second) == get_entity_index(first)
+    assert get_entity_generation(second) == get_entity_generation(first) + 1
+    assert second != first
+
+def test_scene_is_alive():
+    scene = Scene('test', None)
+    entity = scene.create_entity(Position())
+
+    assert scene.is_alive(entity)
+
+    scene.remove_entity(entity, immediate=True)
+    replacement = scene.create_entity(Position())
+
+    assert not scene.is_alive(entity)
+    assert scene.is_alive(replacement)
+    assert not scene.has_component(entity, Position)
+    assert not scene.is_alive(12345)
+
+def test_scene_stale_entity():
+    scene = Scene('test', None)
+    entity = scene.create_entity(Position())
+    scene.remove_entity(entity, immediate=True)
+    scene.create_entity(Position())
+
+    with pytest.raises(KeyError):
+        scene.get_component_for_entity(entity, Position)
+
+    with pytest.raises(KeyError):
+        scene.add_component(entity, Velocity())
+
+    # removing stale id must not affect the entity that reuses its slot
+    scene.remove_entity(entity, immediate=True)
+    assert len(scene.get_components(Position)) == 1
+
+def test_scene_storage_bounded():
+    scene = Scene('test', None)
+    for _ in range(10):
+        entities = scene.create_entities(100, Position)
+        scene.remove_entities(entities, immediate=True)
+
+    assert len(scene.get_entities()) == 0
+    assert max(get_entity_index(x) for x in scene.create_entities(100, Position)) < 100
+
+def test_scene_get_changed():
+    scene = Scene('test', None)
+    position = Position()
+    entity = scene.create_entity(position, Velocity())
+
+    assert scene.get_changed(Position) == [(entity, position)]
+
+    scene.process()
+
+    assert scene.get_changed(Position) == []
+
+    scene.mark_changed(entity, Position)
+    scene.add_component(entity, Health())
+
+    assert scene.get_changed(Position) == [(entity, position)]
+    assert scene.get_changed(Velocity) == []
+    assert len(scene.get_changed(Health)) == 1
+
+def test_scene_get_changed_bulk():
+    scene = Scene('test', None)
+    entities = scene.create_entities(10, Position)
+
+    assert sorted(x[0] for x in scene.get_changed(Position)) == entities
+
+def test_scene_get_changed_removed():
+    scene = Scene('test', None)
+    entity = scene.create_entity(Position())
+    scene.remove_entity(entity, immediate=True)
+    scene.create_entity(Velocity())
+
+    assert scene.get_changed(Position) == []
+
+def test_scene_get_changed_commands():
+    scene = Scene('test', None)
+    scene.commands.create_entity(Position())
+    scene.process()
+
+    # components added during flush are reported in the next frame
+    assert len(scene.get_changed(Position)) == 1
@@ -0,0 +1,124 @@
+import dataclasses
+import typing as t
+import uuid
+
+import pytest
+
+from spyke import math
+from spyke.ecs import (Component, LightComponent, Scene, SpriteComponent,
+                       TagComponent, TransformComponent, load_scene,
+                       register_component, save_scene)
+from spyke.ecs.serialization import deserialize_scene, serialize_scene
+
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Health(Component):
+    value: float
+    alive: bool
+    respawns: int
+
+class Unregistered(Component):
+    pass
+
+register_component(Health)
+
+def _transform(x):
+    return TransformComponent(math.Vector3(x, 1.0, 2.0), math.Vector3(1.0, 2.0, 3.0), math.Vector3(0.0, 0.0, 0.5))
+
+def test_scene_serialization_roundtrip(tmp_path):
+    model_id = uuid.uuid4()
+    scene = Scene('test', None)
+    root = scene.create_entity(
+        _transform(1.0),
+        SpriteComponent(math.Vector4(1.0, 0.5, 0.25, 1.0), model_id, uuid.uuid4()),
+        TagComponent('root'))
+    child = scene.create_entity(_transform(2.0), LightComponent(math.Vector3(1.0, 1.0, 0.0), 2.5))
+    # 0.1 cannot be represented exactly as a 32-bit float
+    scene.create_entity(Health(0.1, True, 3), TagComponent('zażółć'))
+    scene.set_parent(child, root)
+    save_scene(scene, tmp_path / 'test.scene')
+
+    loaded = Scene('loaded', None)
+    entities = load_scene(loaded, tmp_path / 'test.scene')
+
+    assert len(entities) == 3
+    components = {x: {type(c): c for c in loaded.get_components_for_entity(x)} for x in entities}
+    by_tag = {c[TagComponent].name: c for c in components.values() if TagComponent in c}
+
+    sprite = by_tag['root'][SpriteComponent]
+    assert sprite.model_id == model_id
+    assert sprite.specular_id is None
+    assert tuple(sprite.color) == (1.0, 0.5, 0.25, 1.0)
+
+    health = by_tag['zażółć'][Health]
+    assert (health.value, health.alive, health.respawns) == (0.1, True, 3)
+
+    (light_entity, (light, transform)), = loaded.get_components(LightComponent, TransformComponent)
+    assert tuple(light.color) == (1.0, 1.0, 0.0)
+    assert light.intensity == 2.5
+    assert tuple(transform.position) == (2.0, 1.0, 2.0)
+    assert tuple(transform.scale) == (1.0, 2.0, 3.0)
+    assert transform.parent is by_tag['root'][TransformComponent]
+    assert light_entity in entities
+
+def test_scene_serialization_unregistered():
+    scene = Scene('test', None)
+    scene.create_entity(Unregistered())
+
+    with pytest.raises(KeyError):
+        serialize_scene(scene)
+
+def test_scene_serialization_invalid_data():
+    with pytest.raises(ValueError):
+        deserialize_scene(Scene('test', None), b'XXXX' + bytes(16))
+
+def test_scene_serialization_large(tmp_path):
+    scene = Scene('test', None)
+    count = 40000
+    scene.create_entities(
+        count,
+        [_transform(float(i)) for i in range(count)],
+        [SpriteComponent(math.Vector4(1.0, 1.0, 1.0, 1.0), uuid.UUID(int=i % 16), uuid.UUID(int=i % 4)) for i in range(count)])
+    save_scene(scene, tmp_path / 'large.scene')
+
+    loaded = Scene('loaded', None)
+    entities = load_scene(loaded, tmp_path / 'large.scene')
+
+    assert len(entities) == count
+    result = loaded.get_components(TransformComponent, SpriteComponent)
+    assert len(result) == count
+    assert result[-1][1][0].position.x == count - 1
+    assert result[-1][1][1].model_id == uuid.UUID(int=(count - 1) % 16)
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Stats(Component):
+    value: float
+    level: int
+    column: t.Any = None
+
+def _create_stats(values, levels):
+    # components keep the loaded column itself, without copying it
+    return [Stats(value, level, values) for value, level in zip(values.tolist(), levels.tolist())]
+
+register_component(Stats, [('value', float), ('level', int)], create_many=_create_stats)
+
+def test_scene_serialization_create_many_keeps_columns(tmp_path):
+    scene = Scene('test', None)
+    scene.create_entities(2, [Stats(0.5, 1), Stats(1.5, 2)])
+    save_scene(scene, tmp_path / 'stats.scene')
+
+    loaded = Scene('loaded', None)
+    load_scene(loaded, tmp_path / 'stats.scene')
+
+    stats = sorted(loaded.get_component(Stats), key=lambda x: x.level)
+    assert [x.value for x in stats] == [0.5, 1.5]
+    assert stats[0].column.tolist() == [0.5, 1.5]
+
+def test_scene_serialization_truncated(tmp_path):
+    scene = Scene('test', None)
+    scene.create_entities(100, lambda: Health(1.0, True, 0))
+    data = serialize_scene(scene)
+    (tmp_path / 'truncated.scene').write_bytes(data[:len(data) - 64])
+
+    with pytest.raises(ValueError):
+        load_scene(Scene('loaded', None), tmp_path / 'truncated.scene')
@@ -0,0 +1,152 @@
+import random
+
+import pytest
+
+from spyke import math
+from spyke.ecs import Scene, TransformComponent
+from spyke.ecs.processor import Processor
+from spyke.ecs.spatial import AABBTree, UniformGrid
+
+INDEX_FACTORIES = [
+    lambda: UniformGrid(4.0),
+    lambda: AABBTree(0.5)]
+
+class HierarchyProcessor(Processor):
+    def process(self, scene, *args, **kwargs):
+        scene.hierarchy.update(x[1] for x in scene.get_changed(TransformComponent))
+
+def _box(x, y, z, size=1.0):
+    return math.AABB(math.Vector3(x, y, z), math.Vector3(x + size, y + size, z + size))
+
+def _fill(index, count=200, seed=0):
+    rng = random.Random(seed)
+    boxes = {}
+    for entity in range(count):
+        box = (rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(-5, 5), rng.uniform(0.1, 3.0))
+        boxes[entity] = box
+        index.update(entity, _box(*box))
+
+    return boxes
+
+def _overlaps(box, lo, hi):
+    x, y, z, size = box
+    return x <= hi[0] and x + size >= lo[0] and y <= hi[1] and y + size >= lo[1] and z <= hi[2] and z + size >= lo[2]
+
+def _distance(box, point):
+    x, y, z, size = box
+    d = [max(lo - p, 0.0, p - (lo + size)) for lo, p in zip((x, y, z), point)]
+    return sum(v * v for v in d) ** 0.5
+
+@pytest.mark.parametrize('factory', INDEX_FACTORIES)
+def test_spatial_query_region(factory):
+    index = factory()
+    boxes = _fill(index)
+    lo, hi = (-10.0, -20.0, -1.0), (15.0, 5.0, 2.0)
+
+    result = index.query_region(math.AABB(math.Vector3(lo), math.Vector3(hi)))
+
+    assert sorted(result) == sorted(e for e, box in boxes.items() if _overlaps(box, lo, hi))
+
+@pytest.mark.parametrize('factory', INDEX_FACTORIES)
+def test_spatial_query_radius(factory):
+    index = factory()
+    boxes = _fill(index)
+    center = (3.0, -7.0, 0.0)
+
+    result = index.query_radius(math.Vector3(center), 12.0)
+
+    assert sorted(result) == sorted(e for e, box in boxes.items() if _distance(box, center) <= 12.0)
+
+@pytest.mark.parametrize('factory', INDEX_FACTORIES)
+def test_spatial_nearest(factory):
+    index = factory()
+    boxes = _fill(index)
+    rng = random.Random(1)
+    for _ in range(20):
+        point = (rng.uniform(-60, 60), rng.uniform(-60, 60), rng.uniform(-5, 5))
+        entity = index.nearest(math.Vector3(point))
+
+        assert _distance(boxes[entity], point) == pytest.approx(min(_distance(x, point) for x in boxes.values()))
+
+    assert index.nearest(math.Vector3(1000.0, 0.0, 0.0), max_distance=10.0) is None
+
+@pytest.mark.parametrize('factory', INDEX_FACTORIES)
+def test_spatial_raycast(factory):
+    index = factory()
+    index.update(1, _box(10.0, 0.0, 0.0))
+    index.update(2, _box(5.0, 0.0, 0.0))
+    index.update(3, _box(5.0, 10.0, 0.0))
+
+    hit = index.raycast(math.Ray(math.Vector3(0.0, 0.5, 0.5), math.Vector3(1.0, 0.0, 0.0)))
+
+    assert hit is not None
+    assert hit[0] == 2
+    assert hit[1] == pytest.approx(5.0)
+
+    assert index.raycast(math.Ray(math.Vector3(0.0, 0.5, 0.5), math.Vector3(-1.0, 0.0, 0.0))) is None
+    assert index.raycast(math.Ray(math.Vector3(0.0, 0.5, 0.5), math.Vector3(1.0, 0.0, 0.0)), max_distance=4.0) is None
+
+@pytest.mark.parametrize('factory', INDEX_FACTORIES)
+def test_spatial_raycast_random(factory):
+    index = factory()
+    boxes = _fill(index, seed=2)
+    rng = random.Random(3)
+    for _ in range(20):
+        origin = math.Vector3(rng.uniform(-60, 60), rng.uniform(-60, 60), rng.uniform(-5, 5))
+        direction = math.Vector3(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-0.1, 0.1))
+        ray = math.Ray(origin, direction)
+
+        expected = [
+            (distance, entity)
+            for entity, box in boxes.items()
+            if (distance := ray.intersect_aabb(_box(*box))) is not None]
+        hit = index.raycast(ray)
+
+        if len(expected) == 0:
+            assert hit is None
+        else:
+            assert hit is not None
+            assert hit[1] == pytest.approx(min(expected)[0], abs=1e-4)
+
+@pytest.mark.parametrize('factory', INDEX_FACTORIES)
+def test_spatial_update_remove(factory):
+    index = factory()
+    index.update(1, _box(0.0, 0.0, 0.0))
+    index.update(1, _box(30.0, 30.0, 0.0))
+    index.update(2, _box(0.0, 0.0, 0.0))
+    index.remove(2)
+    index.remove(3)
+
+    assert len(index) == 1
+    assert index.query_region(_box(-1.0, -1.0, -1.0, 3.0)) == []
+    assert index.query_region(_box(29.0, 29.0, -1.0, 3.0)) == [1]
+
+def test_aabb_tree_balanced():
+    index = AABBTree(0.0)
+    for entity in range(1024):
+        index.update(entity, _box(entity * 2.0, 0.0, 0.0))
+
+    assert index.height < 32
+
+def test_scene_spatial_index():
+    scene = Scene('test', None)
+    scene.add_processor(HierarchyProcessor())
+    root = scene.create_entity(TransformComponent(math.Vector3(0, 0, 0), math.Vector3(1, 1, 1), math.Vector3(0, 0, 0)))
+    child = scene.create_entity(TransformComponent(math.Vector3(2, 0, 0), math.Vector3(1, 1, 1), math.Vector3(0, 0, 0)))
+    scene.set_parent(child, root)
+    scene.set_spatial_index(AABBTree())
+    scene.process()
+
+    assert sorted(scene.spatial_index.query_radius(math.Vector3(2, 0, 0), 0.1)) == [child]
+
+    transform = scene.get_component_for_entity(root, TransformComponent)
+    transform.position = math.Vector3(10, 0, 0)
+    scene.mark_changed(root, TransformComponent)
+    scene.process()
+
+    assert scene.spatial_index.nearest(math.Vector3(12, 0, 0)) == child
+    assert scene.spatial_index.query_radius(math.Vector3(2, 0, 0), 0.1) == []
+
+    scene.remove_entity(child, immediate=True)
+
+    assert child not in scene.spatial_index
@@ -0,0 +1,93 @@
+import numpy as np
+
+from spyke.graphics.indirect import build_draw_commands, pack_batches
+from spyke.graphics.render_batch import RenderBatch
+
+
+class DummyModel:
+    def __init__(self, index_count):
+        self.index_count = index_count
+
+def _batch(count, albedo_id):
+    batch = RenderBatch(16, 4)
+    transforms = np.full((count, 16), albedo_id, dtype=np.float32)
+    colors = np.ones((count, 4), dtype=np.float32)
+    ids = np.full(count, albedo_id, dtype=np.uint32)
+    batch.add_instances(transforms, colors, ids, np.zeros(count, dtype=np.uint32))
+    return batch
+
+def test_build_draw_commands():
+    commands = build_draw_commands(np.array([6, 6, 36]), np.array([3, 5, 2]), first_instance=10)
+
+    assert commands['count'].tolist() == [6, 6, 36]
+    assert commands['instance_count'].tolist() == [3, 5, 2]
+    assert commands['base_instance'].tolist() == [10, 13, 18]
+    assert commands['first_index'].tolist() == [0, 0, 0]
+    assert commands['base_vertex'].tolist() == [0, 0, 0]
+    assert commands.itemsize == 20
+
+def test_pack_batches():
+    quad = DummyModel(6)
+    cube = DummyModel(36)
+    batches = {
+        quad: [_batch(3, 1), _batch(4, 1), _batch(2, 2)],
+        cube: [_batch(5, 1), RenderBatch(16, 4)]}
+
+    data = pack_batches(batches)
+
+    assert len(data.instance_data) == 14
+    assert data.commands['base_instance'].tolist() == [0, 3, 7, 9]
+    assert data.commands['count'].tolist() == [6, 6, 6, 36]
+    # batches with different textures are drawn together when the union of their textures fits
+    assert [(x.model, x.first_command, x.command_count, x.texture_ids) for x in data.draws] == [
+        (quad, 0, 3, [1, 2]),
+        (cube, 3, 1, [1])]
+    # instance data follows base instances of commands
+    assert data.instance_data['transform'][7, 0] == 2.0
+
+def test_pack_batches_remaps_texture_indices():
+    quad = DummyModel(6)
+    first = _batch(2, 1)
+    second = _batch(3, 2)
+    second.add_instances(
+        np.zeros((1, 16), dtype=np.float32),
+        np.ones((1, 4), dtype=np.float32),
+        np.array([1], dtype=np.uint32),
+        np.array([2], dtype=np.uint32))
+
+    data = pack_batches({quad: [first, second]})
+
+    assert second.texture_ids == [2, 1]
+    assert data.draws[0].texture_ids == [1, 2]
+    assert data.instance_data['albedo_idx'].tolist() == [1, 1, 2, 2, 2, 1]
+    assert data.instance_data['specular_idx'].tolist() == [0, 0, 0, 0, 0, 2]
+    # source batches are left untouched
+    assert second.instance_data['albedo_idx'][:4].tolist() == [1, 1, 1, 2]
+
+def test_pack_batches_texture_limit():
+    quad = DummyModel(6)
+    batches = list[RenderBatch]()
+    for ids in ([1, 2], [3, 4], [2, 1]):
+        batch = RenderBatch(16, 2)
+        batch.add_instances(
+            np.zeros((2, 16), dtype=np.float32),
+            np.ones((2, 4), dtype=np.float32),
+            np.array(ids, dtype=np.uint32),
+            np.zeros(2, dtype=np.uint32))
+        batches.append(batch)
+
+    data = pack_batches({quad: batches})
+
+    # second batch does not fit next to the first one, but the last one does
+    assert [(x.first_command, x.command_count, x.texture_ids) for x in data.draws] == [
+        (0, 2, [1, 2]),
+        (2, 1, [3, 4])]
+    assert data.commands['base_instance'].tolist() == [0, 2, 4]
+    assert data.instance_data['albedo_idx'].tolist() == [1, 2, 2, 1, 1, 2]
+
+def test_pack_batches_empty():
+    data = pack_batches({DummyModel(6): [RenderBatch(16, 4)]})
+
+    assert len(data.instance_data) == 0
+    assert len(data.commands) == 0
+    assert data.draws == []
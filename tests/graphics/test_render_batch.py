@@ -0,0 +1,41 @@
+import numpy as np
+
+from spyke.graphics.render_batch import RenderBatch
+
+
+def _instances(count, albedo_ids, specular_ids):
+    transforms = np.arange(count * 16, dtype=np.float32).reshape(count, 16)
+    colors = np.full((count, 4), 0.5, dtype=np.float32)
+    return transforms, colors, np.asarray(albedo_ids, dtype=np.uint32), np.asarray(specular_ids, dtype=np.uint32)
+
+def test_render_batch_add_instances():
+    batch = RenderBatch(8, 4)
+    transforms, colors, albedo_ids, specular_ids = _instances(5, [10, 0, 11, 10, 11], [0, 12, 12, 0, 0])
+
+    assert batch.add_instances(transforms, colors, albedo_ids, specular_ids) == 5
+    assert batch.current_instance == 5
+    assert batch.texture_ids == [10, 12, 11]
+    np.testing.assert_array_equal(batch.instance_data['transform'][:5], transforms)
+    np.testing.assert_array_equal(batch.instance_data['albedo_idx'][:5], [1, 0, 3, 1, 3])
+    np.testing.assert_array_equal(batch.instance_data['specular_idx'][:5], [0, 2, 2, 0, 0])
+
+def test_render_batch_add_instances_capacity():
+    batch = RenderBatch(4, 4)
+    transforms, colors, albedo_ids, specular_ids = _instances(6, [0] * 6, [0] * 6)
+
+    assert batch.add_instances(transforms, colors, albedo_ids, specular_ids) == 4
+    assert batch.add_instances(transforms[4:], colors[4:], albedo_ids[4:], specular_ids[4:]) == 0
+
+def test_render_batch_add_instances_texture_limit():
+    batch = RenderBatch(16, 2)
+    transforms, colors, albedo_ids, specular_ids = _instances(4, [1, 2, 1, 3], [0, 0, 4, 0])
+
+    # the third instance would need third texture slot
+    assert batch.add_instances(transforms, colors, albedo_ids, specular_ids) == 2
+    assert batch.texture_ids == [1, 2]
+
+    other = RenderBatch(16, 3)
+    assert other.add_instances(transforms[2:], colors[2:], albedo_ids[2:], specular_ids[2:]) == 2
+    assert other.texture_ids == [1, 4, 3]
+    np.testing.assert_array_equal(other.instance_data['albedo_idx'][:2], [1, 3])
+    np.testing.assert_array_equal(other.instance_data['specular_idx'][:2], [2, 0])
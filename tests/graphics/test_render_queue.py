@@ -0,0 +1,49 @@
+import numpy as np
+
+from spyke import math
+from spyke.graphics.render_queue import (RenderQueue, build_sort_keys,
+                                         radix_argsort)
+
+
+def _transforms(positions):
+    transforms = np.zeros((len(positions), 16), dtype=np.float32)
+    transforms[:, 12:15] = positions
+    return transforms
+
+def test_radix_argsort():
+    rng = np.random.default_rng(0)
+    keys = rng.integers(0, 2 ** 64 - 1, 10000, dtype=np.uint64)
+    keys[::3] = keys[0]
+
+    order = radix_argsort(keys)
+
+    np.testing.assert_array_equal(order, np.argsort(keys, kind='stable'))
+
+def test_sort_keys_order():
+    positions = np.array([[0, 0, 5], [0, 0, 1], [0, 0, 3]], dtype=np.float32)
+    keys = build_sort_keys(
+        np.zeros(3, dtype=np.uint64),
+        np.zeros(3, dtype=np.uint64),
+        np.array([7, 7, 7], dtype=np.uint32),
+        np.zeros(3, dtype=np.uint32),
+        positions,
+        math.Vector3(0.0, 0.0, 0.0))
+
+    # front to back within the same texture set
+    assert radix_argsort(keys).tolist() == [1, 2, 0]
+
+def test_render_queue_groups_models_and_textures():
+    queue = RenderQueue()
+    positions = np.zeros((4, 3), dtype=np.float32)
+    colors = np.ones((4, 4), dtype=np.float32)
+    queue.submit('a', _transforms(positions), colors, np.array([1, 2, 1, 2], dtype=np.uint32), np.zeros(4, dtype=np.uint32))
+    queue.submit('b', _transforms(positions), colors, np.array([3, 3, 3, 3], dtype=np.uint32), np.zeros(4, dtype=np.uint32), pipeline=1)
+    queue.submit('a', _transforms(positions[:2]), colors[:2], np.array([2, 1], dtype=np.uint32), np.zeros(2, dtype=np.uint32))
+
+    assert len(queue) == 10
+
+    runs = queue.sort(math.Vector3(0.0, 0.0, 0.0))
+
+    assert len(queue) == 0
+    assert [(x.model, x.pipeline, len(x.transforms)) for x in runs] == [('a', 0, 6), ('b', 1, 4)]
+    assert runs[0].albedo_ids.tolist() == [1, 1, 1, 2, 2, 2]
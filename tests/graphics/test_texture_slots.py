@@ -0,0 +1,45 @@
+import pytest
+
+from spyke.graphics import gl
+from spyke.graphics.texture_slots import TextureSlotCache
+
+
+@pytest.fixture
+def bound(monkeypatch):
+    bindings = list[tuple[int, int]]()
+    monkeypatch.setattr(gl, 'bind_texture_id', lambda texture_id, unit: bindings.append((texture_id, unit)), raising=False)
+    return bindings
+
+def test_texture_slots_lru_eviction(bound):
+    cache = TextureSlotCache(2, first_unit=1)
+
+    assert cache.bind(10) == 1
+    assert cache.bind(11) == 2
+    assert cache.bind(10) == 1
+    # 11 is the least recently used texture now
+    assert cache.bind(12) == 2
+
+    assert 11 not in cache
+    assert bound == [(10, 1), (11, 2), (12, 2)]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.rebinds) == (1, 3, 1)
+
+def test_texture_slots_remove(bound):
+    cache = TextureSlotCache(2)
+    cache.bind(10)
+    cache.bind(11)
+    cache.remove(10)
+    cache.remove(10)
+
+    assert cache.bind(12) == 0
+    assert cache.stats.rebinds == 0
+    assert len(cache) == 2
+
+def test_texture_slots_reset_stats(bound):
+    cache = TextureSlotCache(1)
+    cache.bind(1)
+    cache.bind(1)
+    cache.reset_stats()
+
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.rebinds) == (0, 0, 0)
+    assert cache.bind(1) == 0
+    assert cache.stats.hits == 1
@@ -0,0 +1,106 @@
+import array
+import math
+
+import pytest
+
+from spyke.math import (AABB, Frustum, Matrix4, Plane, Sphere, Vector3,
+                        Vector3Array)
+
+
+def _camera_frustum():
+    # camera at origin looking down -z, visible depth range 0.1 - 100
+    return Frustum.from_matrix(Matrix4.perspective(math.pi / 2, 1.0, 0.1, 100.0))
+
+def test_aabb_constructor():
+    box = AABB(Vector3(-1, -2, -3), Vector3(1, 2, 3))
+    assert tuple(box.min) == (-1.0, -2.0, -3.0)
+    assert tuple(box.max) == (1.0, 2.0, 3.0)
+    assert tuple(box.center()) == (0.0, 0.0, 0.0)
+    assert tuple(box.size()) == (2.0, 4.0, 6.0)
+
+def test_aabb_from_points():
+    points = Vector3Array([Vector3(1, 5, -1), Vector3(-2, 0, 3), Vector3(0, 1, 0)])
+    assert AABB.from_points(points) == AABB(Vector3(-2, 0, -1), Vector3(1, 5, 3))
+
+def test_aabb_from_points_empty():
+    with pytest.raises(ValueError):
+        AABB.from_points(array.array('f'))
+
+def test_aabb_intersects():
+    box = AABB(Vector3(0, 0, 0), Vector3(1, 1, 1))
+    assert box.contains(Vector3(0.5, 0.5, 0.5))
+    assert not box.contains(Vector3(1.5, 0.5, 0.5))
+    assert box.intersects(AABB(Vector3(0.5, 0.5, 0.5), Vector3(2, 2, 2)))
+    assert not box.intersects(AABB(Vector3(2, 2, 2), Vector3(3, 3, 3)))
+    assert box.intersects(Sphere(Vector3(2, 0.5, 0.5), 1.0))
+    assert not box.intersects(Sphere(Vector3(3, 0.5, 0.5), 1.0))
+
+def test_aabb_merged():
+    merged = AABB(Vector3(0, 0, 0), Vector3(1, 1, 1)).merged(AABB(Vector3(-1, 2, 0), Vector3(0, 3, 0.5)))
+    assert merged == AABB(Vector3(-1, 0, 0), Vector3(1, 3, 1))
+
+def test_aabb_transformed():
+    m = Matrix4.identity()
+    m.translate(Vector3(10, 0, 0))
+    m.scale(Vector3(2, 2, 2))
+    box = AABB(Vector3(-1, -1, -1), Vector3(1, 1, 1)).transformed(m)
+    assert tuple(box.min) == pytest.approx((8.0, -2.0, -2.0))
+    assert tuple(box.max) == pytest.approx((12.0, 2.0, 2.0))
+
+def test_sphere():
+    sphere = Sphere(Vector3(1, 2, 3), 2.0)
+    assert tuple(sphere.center) == (1.0, 2.0, 3.0)
+    assert sphere.radius == 2.0
+    assert sphere.contains(Vector3(1, 2, 4.5))
+    assert sphere.intersects(Sphere(Vector3(4, 2, 3), 1.5))
+    assert not sphere.intersects(Sphere(Vector3(6, 2, 3), 1.5))
+
+def test_plane_from_point_normal():
+    plane = Plane.from_point_normal(Vector3(0, 2, 0), Vector3(0, 4, 0))
+    assert tuple(plane.normal) == pytest.approx((0.0, 1.0, 0.0))
+    assert plane.distance == pytest.approx(-2.0)
+    assert plane.distance_to(Vector3(5, 5, 5)) == pytest.approx(3.0)
+
+def test_frustum_planes():
+    planes = _camera_frustum().planes
+    assert len(planes) == 6
+    for plane in planes:
+        assert plane.normal.length() == pytest.approx(1.0)
+
+def test_frustum_test_single():
+    frustum = _camera_frustum()
+    assert frustum.test_point(Vector3(0, 0, -10))
+    assert not frustum.test_point(Vector3(0, 0, 10))
+    assert frustum.test_sphere(Sphere(Vector3(0, 0, 1), 2.0))
+    assert not frustum.test_sphere(Sphere(Vector3(0, 0, -200), 2.0))
+    assert frustum.test_aabb(AABB(Vector3(-1, -1, -11), Vector3(1, 1, -9)))
+    assert not frustum.test_aabb(AABB(Vector3(50, -1, -11), Vector3(52, 1, -9)))
+
+def test_frustum_test_spheres():
+    frustum = _camera_frustum()
+    centers = Vector3Array([Vector3(0, 0, -10), Vector3(0, 0, 10), Vector3(12, 0, -10), Vector3(0, 0, -200)])
+    mask = frustum.test_spheres(centers, array.array('f', [1, 1, 3, 1]))
+    assert list(mask) == [True, False, True, False]
+    assert list(frustum.test_spheres(centers, 1.0)) == [True, False, False, False]
+
+def test_frustum_test_spheres_out():
+    frustum = _camera_frustum()
+    out = bytearray(3)
+    result = frustum.test_spheres(array.array('f', [0, 0, -5, 0, 0, 5, 0, 0, -50]), 0.5, out)
+    assert result is out
+    assert list(out) == [1, 0, 1]
+
+def test_frustum_test_aabbs():
+    frustum = _camera_frustum()
+    mins = Vector3Array([Vector3(-1, -1, -11), Vector3(50, -1, -11), Vector3(9, -1, -11)])
+    maxs = Vector3Array([Vector3(1, 1, -9), Vector3(52, 1, -9), Vector3(11, 1, -9)])
+    assert list(frustum.test_aabbs(mins, maxs)) == [True, False, True]
+
+def test_frustum_test_batched_invalid():
+    frustum = _camera_frustum()
+    with pytest.raises(ValueError):
+        frustum.test_spheres(array.array('f', [0, 0, 0]), array.array('f', [1, 1]))
+    with pytest.raises(ValueError):
+        frustum.test_aabbs(array.array('f', [0, 0, 0]), array.array('f', []))
+    with pytest.raises(ValueError):
+        frustum.test_spheres(array.array('f', [0, 0, 0, 1, 1, 1]), 1.0, bytearray(1))
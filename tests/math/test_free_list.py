@@ -0,0 +1,34 @@
+from spyke.math import Matrix4, Vector3, clear_free_lists, get_free_list_stats
+
+
+def test_free_list_stats_types():
+    stats = get_free_list_stats()
+    assert Vector3 in stats
+    assert Matrix4 in stats
+    assert set(stats[Vector3]) == {'hits', 'misses', 'size'}
+
+def test_free_list_reuses_released_objects():
+    clear_free_lists()
+    v = Vector3(1, 2, 3)
+    del v
+    assert get_free_list_stats()[Vector3]['size'] == 1
+
+    v = Vector3(4, 5, 6)
+    stats = get_free_list_stats()[Vector3]
+    assert stats['hits'] == 1
+    assert stats['size'] == 0
+    assert tuple(v) == (4.0, 5.0, 6.0)
+
+def test_free_list_reused_object_is_zeroed():
+    clear_free_lists()
+    identity = Matrix4.identity()
+    del identity
+    m = Matrix4.__new__(Matrix4)
+    assert all(m[i] == 0.0 for i in range(16))
+
+def test_free_list_clear():
+    a = Matrix4.identity() @ Matrix4.identity()
+    del a
+    clear_free_lists()
+    stats = get_free_list_stats()[Matrix4]
+    assert stats == {'hits': 0, 'misses': 0, 'size': 0}
@@ -1,8 +1,9 @@
+import array
 import struct
 
 import pytest
 
-from spyke.math import Matrix3, Matrix4, Vector3, Vector4
+from spyke.math import Matrix3, Matrix4, Matrix4Array, Vector3, Vector3Array, Vector4
 
 
 def test_matrix4_identity():
@@ -69,6 +70,37 @@ def test_matrix4_transform_static():
     m = Matrix4.transform(Vector3(1, 2, 3), Vector3(1, 1, 1), Vector3(0, 0, 0))
     assert isinstance(m, Matrix4)
 
+def test_matrix4_transform_many():
+    translations = Vector3Array([Vector3(1, 2, 3), Vector3(4, 5, 6)])
+    scales = Vector3Array([Vector3(1, 1, 1), Vector3(2, 2, 2)])
+    rotations = Vector3Array([Vector3(0, 0, 0), Vector3(0.5, 0.25, 0)])
+    out = Matrix4Array(2)
+
+    assert Matrix4.transform_many(translations, scales, rotations, out) == 2
+
+    for i in range(2):
+        expected = Matrix4.transform(translations[i], scales[i], rotations[i])
+        assert [out[i][j] for j in range(16)] == pytest.approx([expected[j] for j in range(16)])
+
+def test_matrix4_transform_many_dirty():
+    translations = array.array('f', [1, 2, 3, 4, 5, 6])
+    ones = array.array('f', [1] * 6)
+    zeros = array.array('f', [0] * 6)
+    out = array.array('f', [0] * 32)
+
+    assert Matrix4.transform_many(translations, ones, zeros, out, bytes([0, 1])) == 1
+
+    values = out.tolist()
+    assert all(v == 0 for v in values[:16])
+    assert values[28:31] == pytest.approx((4, 5, 6))
+
+def test_matrix4_transform_many_length_mismatch():
+    with pytest.raises(ValueError):
+        Matrix4.transform_many(Vector3Array(2), Vector3Array(1), Vector3Array(2), Matrix4Array(2))
+
+    with pytest.raises(ValueError):
+        Matrix4.transform_many(Vector3Array(2), Vector3Array(2), Vector3Array(2), Matrix4Array(1))
+
 def test_matrix4_ortho_static():
     m = Matrix4.ortho(-1, 1, -1, 1, 0.1, 100)
     assert isinstance(m, Matrix4)
@@ -121,3 +153,32 @@ def test_matrix4_constructor_vectors():
         Vector4(0.0, 0.0, 0.0, 4.0))
 
     assert m[0, 0] == 1.0 and m[1, 1] == 2.0 and m[2, 2] == 3.0 and m[3, 3] == 4.0
+
+def test_matrix4_multiply_into():
+    a = Matrix4.identity()
+    a.translate(Vector3(1, 2, 3))
+    b = Matrix4.identity()
+    b.scale(Vector3(2, 2, 2))
+    out = Matrix4.zero()
+    expected = a @ b
+
+    assert Matrix4.multiply_into(a, b, out) is None
+    assert [out[i] for i in range(16)] == pytest.approx([expected[i] for i in range(16)])
+
+    Matrix4.multiply_into(a, b, b)
+    assert [b[i] for i in range(16)] == pytest.approx([expected[i] for i in range(16)])
+
+def test_matrix4_set_transform():
+    m = Matrix4.zero()
+    m.set_transform(Vector3(1, 2, 3), Vector3(2, 2, 2), Vector3(0.1, 0.2, 0.3))
+    expected = Matrix4.transform(Vector3(1, 2, 3), Vector3(2, 2, 2), Vector3(0.1, 0.2, 0.3))
+    assert [m[i] for i in range(16)] == pytest.approx([expected[i] for i in range(16)])
+
+def test_matrix4_imatmul_in_place():
+    m = Matrix4.identity()
+    ref = m
+    t = Matrix4.identity()
+    t.translate(Vector3(1, 2, 3))
+    m @= t
+    assert m is ref
+    assert m[3, 2] == pytest.approx(3.0)
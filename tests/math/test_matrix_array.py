@@ -0,0 +1,84 @@
+import pytest
+
+from spyke.math import Matrix3, Matrix3Array, Matrix4, Matrix4Array, Vector3
+
+
+def test_matrix_array_zero_initialized():
+    a = Matrix4Array(3)
+    assert len(a) == 3
+    assert all(a[1][i] == 0.0 for i in range(16))
+
+def test_matrix_array_identity():
+    a = Matrix4Array.identity(2)
+    assert all(a[1][i, i] == 1.0 for i in range(4))
+    assert a[1][0, 1] == 0.0
+
+def test_matrix_array_buffer_protocol():
+    a = Matrix4Array(2)
+    view = memoryview(a)
+    assert view.shape == (2, 4, 4)
+    assert view.nbytes == 2 * 16 * 4
+
+def test_matrix_array_constructor_sequence():
+    m = Matrix4.identity()
+    m.translate(Vector3(1, 2, 3))
+    a = Matrix4Array([Matrix4.identity(), m])
+    assert a[1][3, 0] == pytest.approx(1.0)
+
+def test_matrix_array_setitem():
+    a = Matrix3Array(2)
+    a[0] = Matrix3.identity()
+    assert a[0][2, 2] == 1.0
+
+def test_matrix_array_slice_is_view():
+    a = Matrix4Array(4)
+    view = a[2:]
+    view[0] = Matrix4.identity()
+    assert a[2][0, 0] == 1.0
+
+def test_matrix_array_matmul():
+    t = Matrix4.identity()
+    t.translate(Vector3(1, 2, 3))
+    a = Matrix4Array.identity(2)
+    b = Matrix4Array([t, t])
+    c = a @ b
+    assert c[1][3, 2] == pytest.approx(3.0)
+
+def test_matrix_array_matmul_broadcast():
+    t = Matrix4.identity()
+    t.translate(Vector3(1, 2, 3))
+    a = Matrix4Array.identity(2)
+    assert (t @ a)[0][3, 1] == pytest.approx(2.0)
+    assert (a @ t)[1][3, 1] == pytest.approx(2.0)
+
+def test_matrix_array_add():
+    a = Matrix3Array.identity(2)
+    c = a + a
+    assert c[1][1, 1] == pytest.approx(2.0)
+
+def test_matrix_array_transposed():
+    m = Matrix4.zero()
+    m[0, 1] = 1
+    a = Matrix4Array([m])
+    assert a.transposed()[0][1, 0] == 1.0
+
+def test_matrix_array_inverse():
+    m = Matrix4.identity()
+    m.scale(Vector3(2, 2, 2))
+    a = Matrix4Array([m])
+    a.inverse()
+    assert a[0][0, 0] == pytest.approx(0.5)
+
+def test_matrix_array_determinant():
+    a = Matrix3Array.identity(3)
+    assert list(a.determinant()) == pytest.approx([1.0, 1.0, 1.0])
+
+def test_matrix_array_reinit_rejected():
+    a = Matrix4Array(2)
+    exported = memoryview(a)
+
+    with pytest.raises(RuntimeError):
+        a.__init__(1)
+
+    assert len(a) == 2
+    assert exported.nbytes == 2 * 16 * 4
@@ -0,0 +1,118 @@
+import struct
+
+import numpy as np
+import pytest
+
+from spyke.math import (Matrix3, Matrix4, Matrix4Array, Vector3, Vector3Array,
+                        Vector4, Vector4Array)
+
+
+def _raw(m):
+    # values in memory order, buffer of a matrix is exported as column-major
+    data = memoryview(m).tobytes('A')
+    return list(struct.unpack(f'{len(data) // 4}f', data))
+
+def test_vector_array_interface():
+    v = Vector3(1, 2, 3)
+    interface = v.__array_interface__
+    assert interface['shape'] == (3,)
+    assert interface['typestr'][1:] == 'f4'
+    assert np.asarray(v).tolist() == [1.0, 2.0, 3.0]
+
+def test_matrix_array_interface():
+    m = Matrix4.identity()
+    m[3, 0] = 5.0
+    assert m.__array_interface__['shape'] == (4, 4)
+    expected = np.identity(4, dtype=np.float32)
+    # rows of the interface are columns of the matrix, same as its buffer
+    expected[0, 3] = 5.0
+    np.testing.assert_array_equal(np.asarray(m), expected)
+
+def test_vector_array_from_buffer():
+    data = np.zeros((4, 3), dtype=np.float32)
+    array = Vector3Array.from_buffer(data)
+    assert len(array) == 4
+
+    array[1] = Vector3(1, 2, 3)
+    array += Vector3(1, 1, 1)
+    assert data[1].tolist() == [2.0, 3.0, 4.0]
+    assert data[0].tolist() == [1.0, 1.0, 1.0]
+
+def test_matrix_array_from_buffer():
+    data = np.zeros((3, 4, 4), dtype=np.float32)
+    array = Matrix4Array.from_buffer(data)
+    array[1] = Matrix4.identity()
+    np.testing.assert_array_equal(data[1], np.identity(4, dtype=np.float32))
+
+    view = array[1:]
+    del array
+    view[0] = Matrix4.zero()
+    assert not data[1].any()
+
+def test_from_buffer_array_interface():
+    data = np.arange(8, dtype=np.float32)
+    array = Vector4Array.from_buffer(data)
+    assert array.__array_interface__['data'][0] == data.ctypes.data
+    np.testing.assert_array_equal(np.asarray(array), data.reshape(2, 4))
+
+def test_from_buffer_invalid():
+    with pytest.raises(ValueError):
+        Vector3Array.from_buffer(np.zeros(4, dtype=np.float32))
+    with pytest.raises(TypeError):
+        Vector3Array.from_buffer(np.zeros(3, dtype=np.float64))
+    with pytest.raises(ValueError):
+        Matrix4Array.from_buffer(np.zeros(17, dtype=np.float32)[1:])
+
+def test_constructor_rejects_non_float32():
+    with pytest.raises(TypeError):
+        Vector3Array(np.zeros((4, 3), dtype=np.float64))
+    with pytest.raises(TypeError):
+        Vector3Array(np.zeros((4, 3), dtype=np.int32))
+    with pytest.raises(TypeError):
+        Matrix4Array(np.zeros((2, 16), dtype=np.float64))
+    with pytest.raises(TypeError):
+        Vector3Array(np.zeros(12, dtype=np.bool_))
+
+def test_slice_assignment_rejects_non_float32():
+    vectors = Vector3Array(4)
+    with pytest.raises(TypeError):
+        vectors[0:2] = np.ones((2, 3), dtype=np.int32)
+    with pytest.raises(TypeError):
+        vectors[0:1] = np.ones(12, dtype=np.uint8)
+    assert not np.asarray(vectors).any()
+
+    matrices = Matrix4Array(2)
+    with pytest.raises(TypeError):
+        matrices[0:1] = np.ones((1, 8), dtype=np.float64)
+
+    vectors[1:3] = np.arange(6, dtype=np.float32).reshape(2, 3)
+    assert np.asarray(vectors)[2].tolist() == [3.0, 4.0, 5.0]
+
+def test_write_to_structured_array():
+    dtype = np.dtype([('color', np.float32, (4,)), ('index', np.float32), ('transform', np.float32, (16,))])
+    data = np.zeros(3, dtype=dtype)
+    m = Matrix4.identity()
+    m[3, 0] = 5.0
+
+    m.write_to(data['transform'], 2)
+    Vector4(1, 2, 3, 4).write_to(data['color'], -1)
+
+    assert data['transform'][2].tolist() == _raw(m)
+    assert data['color'][2].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert not data['transform'][:2].any()
+
+def test_from_array():
+    data = np.arange(18, dtype=np.float32).reshape(2, 3, 3)
+    m = Matrix3.from_array(data, 1)
+    assert _raw(m) == data[1].ravel().tolist()
+    assert tuple(Vector3.from_array(np.arange(6, dtype=np.float32), 1)) == (3.0, 4.0, 5.0)
+
+def test_from_array_invalid():
+    with pytest.raises(IndexError):
+        Vector3.from_array(np.zeros((2, 3), dtype=np.float32), 2)
+    with pytest.raises(ValueError):
+        Vector3.from_array(np.zeros((2, 4), dtype=np.float32), 0)
+    with pytest.raises(TypeError):
+        Vector3.from_array(np.zeros((2, 3), dtype=np.float64), 0)
+    with pytest.raises(ValueError):
+        Vector3.from_array(np.zeros((3, 2), dtype=np.float32).T, 0)
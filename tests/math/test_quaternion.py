@@ -0,0 +1,88 @@
+import array
+import math
+import struct
+
+import pytest
+
+from spyke.math import Matrix3, Matrix4, Quaternion, Vector3, Vector4Array
+
+
+def _approx(q):
+    return pytest.approx(tuple(q), abs=1e-5)
+
+def test_quaternion_identity():
+    assert tuple(Quaternion()) == (0.0, 0.0, 0.0, 1.0)
+    assert Quaternion.identity() == Quaternion(0, 0, 0, 1)
+
+def test_quaternion_constructor_buffer():
+    q = Quaternion(struct.pack('4f', 1, 2, 3, 4))
+    assert (q.x, q.y, q.z, q.w) == (1.0, 2.0, 3.0, 4.0)
+
+def test_quaternion_from_axis_angle():
+    q = Quaternion.from_axis_angle(math.pi / 2, Vector3(0, 0, 1))
+    assert q.angle() == pytest.approx(math.pi / 2)
+    assert tuple(q.axis()) == _approx((0, 0, 1))
+
+def test_quaternion_rotate():
+    q = Quaternion.from_axis_angle(math.pi / 2, Vector3(0, 0, 1))
+    assert tuple(q.rotate(Vector3(1, 0, 0))) == _approx((0, 1, 0))
+
+def test_quaternion_multiply():
+    q = Quaternion.from_axis_angle(math.pi / 4, Vector3(0, 1, 0))
+    assert tuple(q * q) == _approx(Quaternion.from_axis_angle(math.pi / 2, Vector3(0, 1, 0)))
+
+    q *= q.inversed()
+    assert tuple(q) == _approx(Quaternion.identity())
+
+def test_quaternion_normalize():
+    q = Quaternion(0, 0, 2, 0)
+    assert tuple(q.normalized()) == _approx((0, 0, 1, 0))
+
+    q.normalize()
+    assert q.length() == pytest.approx(1.0)
+
+def test_quaternion_conjugate():
+    q = Quaternion(1, 2, 3, 4)
+    assert tuple(q.conjugated()) == (-1.0, -2.0, -3.0, 4.0)
+
+def test_quaternion_slerp():
+    a = Quaternion.identity()
+    b = Quaternion.from_axis_angle(math.pi / 2, Vector3(1, 0, 0))
+    expected = Quaternion.from_axis_angle(math.pi / 4, Vector3(1, 0, 0))
+    assert tuple(a.slerp(b, 0.5)) == _approx(expected)
+    assert tuple(a.nlerp(b, 0.5)) == _approx(expected)
+
+def test_quaternion_matrix_roundtrip():
+    q = Quaternion.from_axis_angle(1.0, Vector3(1, 2, 3))
+    assert tuple(Quaternion.from_matrix(q.to_matrix4())) == _approx(q)
+    assert tuple(Quaternion.from_matrix(q.to_matrix3())) == _approx(q)
+
+def test_quaternion_from_euler_matches_matrix():
+    rotation = Vector3(0.3, -0.7, 1.2)
+    m = Matrix4.identity()
+    m.rotate(rotation)
+    expected = Quaternion.from_euler(rotation).to_matrix4()
+    assert [m[i] for i in range(16)] == pytest.approx([expected[i] for i in range(16)], abs=1e-5)
+
+def test_quaternion_matrix4_transform():
+    q = Quaternion.from_euler(Vector3(0.1, 0.2, 0.3))
+    a = Matrix4.transform(Vector3(1, 2, 3), Vector3(2, 2, 2), q)
+    b = Matrix4.transform(Vector3(1, 2, 3), Vector3(2, 2, 2), Vector3(0.1, 0.2, 0.3))
+    assert [a[i] for i in range(16)] == pytest.approx([b[i] for i in range(16)], abs=1e-5)
+
+def test_quaternion_slerp_many():
+    axis = Vector3(0, 0, 1)
+    start = Vector4Array(Quaternion.identity() for _ in range(3))
+    end = Vector4Array(Quaternion.from_axis_angle(math.pi / 2, axis) for _ in range(3))
+    out = Vector4Array(3)
+
+    Quaternion.slerp_many(start, end, 0.5, out)
+    assert all(tuple(v) == _approx(Quaternion.from_axis_angle(math.pi / 4, axis)) for v in out)
+
+    Quaternion.slerp_many(start, end, array.array('f', [0.0, 0.5, 1.0]), out)
+    assert tuple(out[0]) == _approx(Quaternion.identity())
+    assert tuple(out[2]) == _approx(Quaternion.from_axis_angle(math.pi / 2, axis))
+
+def test_quaternion_slerp_many_length_mismatch():
+    with pytest.raises(ValueError):
+        Quaternion.slerp_many(Vector4Array(2), Vector4Array(3), 0.5, Vector4Array(2))
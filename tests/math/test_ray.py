@@ -0,0 +1,90 @@
+import array
+import math
+
+import pytest
+
+from spyke.math import (AABB, Matrix4, Plane, Ray, Sphere, Vector3,
+                        Vector3Array, Viewport2D)
+
+
+def test_ray_constructor():
+    ray = Ray(Vector3(1, 2, 3), Vector3(0, 0, -5))
+    assert tuple(ray.origin) == (1.0, 2.0, 3.0)
+    assert tuple(ray.direction) == pytest.approx((0.0, 0.0, -1.0))
+    assert tuple(ray.point_at(2.0)) == pytest.approx((1.0, 2.0, 1.0))
+
+def test_ray_direction_normalized():
+    ray = Ray()
+    ray.direction = Vector3(3, 0, 4)
+    assert tuple(ray.direction) == pytest.approx((0.6, 0.0, 0.8))
+
+def test_ray_intersect_single():
+    ray = Ray(Vector3(0, 0, 10), Vector3(0, 0, -1))
+    assert ray.intersect_aabb(AABB(Vector3(-1, -1, -1), Vector3(1, 1, 1))) == pytest.approx(9.0)
+    assert ray.intersect_aabb(AABB(Vector3(2, 2, 2), Vector3(3, 3, 3))) is None
+    assert ray.intersect_sphere(Sphere(Vector3(0, 0, 0), 2.0)) == pytest.approx(8.0)
+    assert ray.intersect_sphere(Sphere(Vector3(0, 0, 20), 2.0)) is None
+    assert ray.intersect_plane(Plane(Vector3(0, 0, 1), 0.0)) == pytest.approx(10.0)
+    assert ray.intersect_plane(Plane(Vector3(1, 0, 0), 0.0)) is None
+    assert ray.intersect_triangle(Vector3(-1, -1, 0), Vector3(1, -1, 0), Vector3(0, 1, 0)) == pytest.approx(10.0)
+    assert ray.intersect_triangle(Vector3(1, 1, 0), Vector3(2, 1, 0), Vector3(1, 2, 0)) is None
+
+def test_ray_origin_inside():
+    ray = Ray(Vector3(0, 0, 0), Vector3(1, 0, 0))
+    assert ray.intersect_aabb(AABB(Vector3(-1, -1, -1), Vector3(1, 1, 1))) == 0.0
+    assert ray.intersect_sphere(Sphere(Vector3(0, 0, 0), 1.0)) == 0.0
+
+def test_ray_intersect_aabbs():
+    ray = Ray(Vector3(0, 0, 10), Vector3(0, 0, -1))
+    mins = Vector3Array([Vector3(-1, -1, -1), Vector3(5, 5, 5), Vector3(-1, -1, 4)])
+    maxs = Vector3Array([Vector3(1, 1, 1), Vector3(6, 6, 6), Vector3(1, 1, 5)])
+    mask, distances = ray.intersect_aabbs(mins, maxs)
+    assert list(mask) == [True, False, True]
+    assert list(distances) == pytest.approx([9.0, math.inf, 5.0])
+
+def test_ray_intersect_spheres():
+    ray = Ray(Vector3(0, 0, 10), Vector3(0, 0, -1))
+    centers = array.array('f', [0, 0, 0, 5, 0, 0, 0, 0, 20])
+    mask, distances = ray.intersect_spheres(centers, array.array('f', [1, 6, 1]))
+    assert list(mask) == [True, True, False]
+    assert distances[0] == pytest.approx(9.0)
+    assert list(ray.intersect_spheres(centers, 1.0)[0]) == [True, False, False]
+
+def test_ray_intersect_triangles():
+    ray = Ray(Vector3(0.1, 0.1, 10), Vector3(0, 0, -1))
+    vertices = array.array('f', [
+        -1, -1, 0, 1, -1, 0, 0, 1, 0,
+        -1, -1, 5, 1, -1, 5, 0, 1, 5,
+        5, 5, 0, 6, 5, 0, 5, 6, 0,
+    ])
+    mask, distances = ray.intersect_triangles(vertices)
+    assert list(mask) == [True, True, False]
+    assert list(distances)[:2] == pytest.approx([10.0, 5.0])
+
+def test_ray_intersect_planes():
+    ray = Ray(Vector3(0, 0, 10), Vector3(0, 0, -1))
+    mask, distances = ray.intersect_planes(array.array('f', [0, 0, 1, 0, 0, 0, 1, -20, 1, 0, 0, 0]))
+    assert list(mask) == [True, False, False]
+    assert distances[0] == pytest.approx(10.0)
+
+def test_ray_intersect_batched_invalid():
+    ray = Ray()
+    with pytest.raises(ValueError):
+        ray.intersect_aabbs(array.array('f', [0, 0, 0]), array.array('f'))
+    with pytest.raises(ValueError):
+        ray.intersect_triangles(array.array('f', [0, 0, 0]))
+
+def test_matrix4_unproject():
+    projection = Matrix4.perspective(math.pi / 2, 1.0, 0.1, 100.0)
+    view = Matrix4.look_at(Vector3(0, 0, 5), Vector3(0, 0, 0), Vector3(0, 1, 0))
+    view_projection = projection @ view
+    ray = view_projection.unproject(400, 300, Viewport2D(0, 800, 0, 600))
+    assert tuple(ray.origin) == pytest.approx((0.0, 0.0, 4.9), abs=1e-4)
+    assert tuple(ray.direction) == pytest.approx((0.0, 0.0, -1.0), abs=1e-4)
+    assert ray.intersect_sphere(Sphere(Vector3(0, 0, 0), 1.0)) == pytest.approx(3.9, abs=1e-3)
+
+def test_matrix4_unproject_flipped_viewport():
+    view_projection = Matrix4.ortho(-1, 1, -1, 1, 0.1, 10.0)
+    # window coordinates with y pointing down
+    ray = view_projection.unproject(0, 0, Viewport2D(0, 100, 100, 0))
+    assert tuple(ray.origin)[:2] == pytest.approx((-1.0, 1.0), abs=1e-5)
@@ -0,0 +1,94 @@
+import pytest
+
+from spyke.math import (Matrix3, Matrix4, Matrix4Array, Vector3, Vector4,
+                        Vector4Array, get_simd_level, set_simd_level)
+
+LEVELS = ('scalar', 'sse2', 'avx', 'neon')
+
+
+def _supported_levels():
+    original = get_simd_level()
+    supported = []
+    for level in LEVELS:
+        try:
+            set_simd_level(level)
+        except ValueError:
+            continue
+
+        supported.append(level)
+
+    set_simd_level(original)
+    return supported
+
+def _values(m):
+    return [m[i] for i in range(len(m))]
+
+def _test_matrix():
+    m = Matrix4.transform(Vector3(1, -2, 3), Vector3(2, 3, 4), Vector3(0.3, 0.2, 0.1))
+    m[0, 3] = 0.5
+    return m
+
+@pytest.fixture(params=_supported_levels())
+def simd_level(request):
+    original = get_simd_level()
+    set_simd_level(request.param)
+    yield request.param
+    set_simd_level(original)
+
+def test_simd_level_default():
+    assert get_simd_level() in LEVELS
+
+def test_simd_level_invalid():
+    with pytest.raises(ValueError):
+        set_simd_level('sse9000')
+
+def test_simd_matmul(simd_level):
+    a = _test_matrix()
+    b = a.transposed()
+    result = a @ b
+    for i in range(4):
+        for j in range(4):
+            assert result[i, j] == pytest.approx(sum(a[k, j] * b[i, k] for k in range(4)), abs=1e-4)
+
+def test_simd_inverse(simd_level):
+    m = _test_matrix()
+    result = m @ m.inversed()
+    assert _values(result) == pytest.approx(_values(Matrix4.identity()), abs=1e-5)
+
+def test_simd_determinant(simd_level):
+    m = Matrix4.identity()
+    m.scale(Vector3(2, 3, 4))
+    assert m.determinant() == pytest.approx(24.0)
+
+def test_simd_mulv(simd_level):
+    m = Matrix4.identity()
+    m.translate(Vector3(1, 2, 3))
+    assert tuple(m @ Vector4(1, 1, 1, 1)) == pytest.approx((2.0, 3.0, 4.0, 1.0))
+
+def test_simd_array_kernels(simd_level):
+    m = _test_matrix()
+    a = Matrix4Array([m, m.transposed()])
+    product = a @ m
+    inverses = a.inversed()
+    for i in range(2):
+        assert _values(product[i]) == pytest.approx(_values(a[i] @ m), abs=1e-4)
+        assert _values(inverses[i]) == pytest.approx(_values(a[i].inversed()), abs=1e-4)
+
+def test_matrix4_matmul_vector4_array(simd_level):
+    m = Matrix4.identity()
+    m.translate(Vector3(1, 2, 3))
+    result = m @ Vector4Array([Vector4(0, 0, 0, 1), Vector4(1, 1, 1, 0)])
+    assert tuple(result[0]) == pytest.approx((1.0, 2.0, 3.0, 1.0))
+    assert tuple(result[1]) == pytest.approx((1.0, 1.0, 1.0, 0.0))
+
+def test_matrix4_array_matmul_vector4_array():
+    matrices = Matrix4Array.identity(2)
+    matrices[1] = Matrix4.transform(Vector3(1, 0, 0), Vector3(1, 1, 1), Vector3(0, 0, 0))
+    result = matrices @ Vector4Array([Vector4(0, 0, 0, 1), Vector4(0, 0, 0, 1)])
+    assert tuple(result[0]) == pytest.approx((0.0, 0.0, 0.0, 1.0))
+    assert tuple(result[1]) == pytest.approx((1.0, 0.0, 0.0, 1.0))
+
+def test_matrix3_matmul_vector3():
+    m = Matrix3.identity()
+    m[0, 0] = 2.0
+    assert tuple(m @ Vector3(1, 1, 1)) == pytest.approx((2.0, 1.0, 1.0))
@@ -168,3 +168,13 @@ def test_vector3_unit_y():
 
 def test_vector3_unit_z():
     assert Vector3.unit_z() == Vector3(0.0, 0.0, 1.0)
+
+def test_vector3_fma():
+    v = Vector3(1.0, 2.0, 3.0)
+    v.fma(Vector3(1.0, 1.0, 2.0), 0.5)
+    assert v == Vector3(1.5, 2.5, 4.0)
+
+def test_vector3_fma_out():
+    v = Vector3.zero()
+    v.fma(Vector3(1.0, 2.0, 3.0), Vector3(2.0, 2.0, 2.0), 2.0)
+    assert v == Vector3(5.0, 6.0, 7.0)
@@ -0,0 +1,137 @@
+import array
+
+import pytest
+
+from spyke.math import Vector2, Vector2Array, Vector3, Vector3Array, Vector4, Vector4Array
+
+
+def test_vector_array_zero_initialized():
+    a = Vector3Array(4)
+    assert len(a) == 4
+    assert all(tuple(v) == (0.0, 0.0, 0.0) for v in a)
+
+def test_vector_array_constructor_sequence():
+    a = Vector2Array([Vector2(1, 2), Vector2(3, 4)])
+    assert (a[1].x, a[1].y) == pytest.approx((3.0, 4.0))
+
+def test_vector_array_constructor_buffer():
+    data = array.array('f', (float(i) for i in range(8)))
+    a = Vector4Array(data)
+    assert len(a) == 2
+    assert tuple(a[1]) == pytest.approx((4.0, 5.0, 6.0, 7.0))
+
+def test_vector_array_buffer_protocol():
+    a = Vector3Array(5)
+    view = memoryview(a)
+    assert view.shape == (5, 3)
+    assert view.format == 'f'
+    assert view.nbytes == 5 * 3 * 4
+
+def test_vector_array_getitem_negative():
+    a = Vector3Array([Vector3(1, 2, 3), Vector3(4, 5, 6)])
+    assert tuple(a[-1]) == pytest.approx((4.0, 5.0, 6.0))
+
+def test_vector_array_getitem_out_of_bounds():
+    a = Vector3Array(2)
+    with pytest.raises(IndexError):
+        a[2]
+
+def test_vector_array_setitem():
+    a = Vector3Array(2)
+    a[1] = Vector3(1, 2, 3)
+    assert tuple(a[1]) == pytest.approx((1.0, 2.0, 3.0))
+
+def test_vector_array_slice_is_view():
+    a = Vector3Array(4)
+    view = a[1:3]
+    view[0] = Vector3(7, 8, 9)
+    assert len(view) == 2
+    assert tuple(a[1]) == pytest.approx((7.0, 8.0, 9.0))
+
+def test_vector_array_slice_outlives_base():
+    a = Vector3Array([Vector3(1, 1, 1), Vector3(2, 2, 2)])
+    view = a[1:]
+    del a
+    assert tuple(view[0]) == pytest.approx((2.0, 2.0, 2.0))
+
+def test_vector_array_slice_assignment():
+    a = Vector2Array(4)
+    a[2:4] = Vector2Array([Vector2(1, 2), Vector2(3, 4)])
+    assert tuple(a[3]) == pytest.approx((3.0, 4.0))
+
+def test_vector_array_add():
+    a = Vector3Array([Vector3(1, 2, 3), Vector3(4, 5, 6)])
+    b = Vector3Array([Vector3(1, 1, 1), Vector3(2, 2, 2)])
+    c = a + b
+    assert tuple(c[1]) == pytest.approx((6.0, 7.0, 8.0))
+
+def test_vector_array_add_broadcast_vector():
+    a = Vector3Array(2)
+    c = a + Vector3(1, 2, 3)
+    assert tuple(c[0]) == pytest.approx((1.0, 2.0, 3.0))
+    assert tuple(c[1]) == pytest.approx((1.0, 2.0, 3.0))
+
+def test_vector_array_iadd():
+    a = Vector3Array([Vector3(1, 2, 3)])
+    a += 1.0
+    assert tuple(a[0]) == pytest.approx((2.0, 3.0, 4.0))
+
+def test_vector_array_mul_scalar():
+    a = Vector2Array([Vector2(1, 2)])
+    assert tuple((a * 2)[0]) == pytest.approx((2.0, 4.0))
+    assert tuple((2 * a)[0]) == pytest.approx((2.0, 4.0))
+
+def test_vector_array_sub():
+    a = Vector2Array([Vector2(5, 5)])
+    assert tuple((a - Vector2(1, 2))[0]) == pytest.approx((4.0, 3.0))
+
+def test_vector_array_length_mismatch():
+    with pytest.raises(ValueError):
+        Vector3Array(2) + Vector3Array(3)
+
+def test_vector_array_dot():
+    a = Vector3Array([Vector3(1, 2, 3), Vector3(1, 0, 0)])
+    b = Vector3Array([Vector3(4, -5, 6), Vector3(0, 1, 0)])
+    assert list(a.dot(b)) == pytest.approx([12.0, 0.0])
+
+def test_vector_array_cross():
+    a = Vector3Array([Vector3(1, 0, 0)])
+    c = a.cross(Vector3(0, 1, 0))
+    assert tuple(c[0]) == pytest.approx((0.0, 0.0, 1.0))
+
+def test_vector_array_length():
+    a = Vector3Array([Vector3(1, 2, 2), Vector3(0, 3, 4)])
+    assert list(a.length()) == pytest.approx([3.0, 5.0])
+    assert list(a.length_squared()) == pytest.approx([9.0, 25.0])
+
+def test_vector_array_normalize():
+    a = Vector3Array([Vector3(2, 0, 0), Vector3(0, 0, 0)])
+    a.normalize()
+    assert tuple(a[0]) == pytest.approx((1.0, 0.0, 0.0))
+    assert tuple(a[1]) == pytest.approx((0.0, 0.0, 0.0))
+
+def test_vector_array_interpolate():
+    a = Vector4Array([Vector4(0, 0, 0, 0)])
+    b = Vector4Array([Vector4(2, 4, 6, 8)])
+    c = a.interpolate(b, 0.5)
+    assert tuple(c[0]) == pytest.approx((1.0, 2.0, 3.0, 4.0))
+
+def test_vector_array_copy():
+    a = Vector2Array([Vector2(1, 2)])
+    b = a.copy()
+    b[0] = Vector2(3, 4)
+    assert tuple(a[0]) == pytest.approx((1.0, 2.0))
+
+def test_vector_array_reinit_rejected():
+    a = Vector3Array([Vector3(1, 2, 3), Vector3(4, 5, 6)])
+    view = a[1:]
+    exported = memoryview(a)
+
+    with pytest.raises(RuntimeError):
+        a.__init__(100)
+    with pytest.raises(RuntimeError):
+        view.__init__([Vector3(0, 0, 0)])
+
+    assert len(a) == 2
+    assert tuple(view[0]) == pytest.approx((4.0, 5.0, 6.0))
+    assert exported.nbytes == 2 * 3 * 4